@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Reading the netCDF forcing with get_timestep and with the ForcingReader
+
+Random hourly forcing files are written for a size x size grid in a
+temporary directory and read back one timestep at a time with
+ipysnobal.get_timestep, then a block at a time with the ForcingReader with
+and without the read ahead. The reader keeps the float32 files in single
+precision, the float64 case converts every block as the reader used to.
+With --work each block is followed by that many seconds of busy work per
+timestep to stand in for the model.
+
+    python benchmarks/bench_forcing.py [--nsteps 480] [--size 200]
+        [--block-size 24] [--work 0.002]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+
+import netCDF4 as nc
+import numpy as np
+
+from pysnobal import ipysnobal
+from pysnobal.forcing import FORCING_MAP, ForcingReader
+
+
+def write_files(path, nsteps, shape):
+    start = datetime(2017, 1, 1)
+    rng = np.random.RandomState(0)
+    force = {}
+    for f in FORCING_MAP:
+        fname = os.path.join(path, f + '.nc')
+        ds = nc.Dataset(fname, 'w')
+        ds.createDimension('time', None)
+        ds.createDimension('y', shape[0])
+        ds.createDimension('x', shape[1])
+        ds.createVariable('time', 'f', ('time',))
+        ds.createVariable(f, 'f', ('time', 'y', 'x'))
+        ds.variables['time'].units = 'hours since %s' % start
+        ds.variables['time'].calendar = 'standard'
+        ds.variables['time'][:] = np.arange(nsteps + 1)
+        for i in range(nsteps + 1):
+            ds.variables[f][i] = rng.uniform(0, 10, shape).astype(np.float32)
+        ds.close()
+        force[f] = nc.Dataset(fname)
+
+    date_time = [start + timedelta(hours=i) for i in range(nsteps + 1)]
+    return force, date_time
+
+
+def busy(seconds):
+    t0 = perf_counter()
+    while perf_counter() - t0 < seconds:
+        pass
+
+
+def run_get_timestep(force, date_time, block_size, work):
+    t0 = perf_counter()
+    for i, t in enumerate(date_time):
+        ipysnobal.get_timestep(force, t)
+        busy(work)
+    return perf_counter() - t0, None
+
+
+def run_reader(force, date_time, block_size, work, prefetch, widen=False):
+    reader = ForcingReader(force, date_time, block_size=block_size,
+                           prefetch=prefetch)
+    t0 = perf_counter()
+    nbytes = 0
+    with reader:
+        for j, block in reader:
+            if widen:
+                block = {key: value.astype(np.float64)
+                         for key, value in block.items()}
+            nbytes = max(nbytes, sum(v.nbytes for v in block.values()))
+            busy(work * (len(block['S_n']) - 1))
+    stats = reader.stats()
+    stats['block_mb'] = nbytes / 1e6
+    return perf_counter() - t0, stats
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    p.add_argument('--nsteps', type=int, default=480)
+    p.add_argument('--size', type=int, default=200)
+    p.add_argument('--block-size', type=int, default=24)
+    p.add_argument('--work', type=float, default=0.0,
+                   help='seconds of model work per timestep')
+    args = p.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    try:
+        force, date_time = write_files(tmp, args.nsteps,
+                                       (args.size, args.size))
+        cases = [
+            ('get_timestep', run_get_timestep, ()),
+            ('reader', run_reader, (False,)),
+            ('reader, prefetch', run_reader, (True,)),
+            ('reader, float64', run_reader, (True, True)),
+        ]
+        print('{} timesteps, {}x{} grid, {} s work per timestep'.format(
+            args.nsteps, args.size, args.size, args.work))
+        for name, func, extra in cases:
+            t, stats = func(force, date_time, args.block_size, args.work,
+                            *extra)
+            line = '{:>18s}: {:8.3f} s {:10.1f} steps/s'.format(
+                name, t, args.nsteps / t)
+            if stats is not None:
+                line += (' {:8.1f} MB/s read, {:6.3f} s stalled, {:7.1f} MB '
+                         'block').format(stats['throughput'],
+                                         stats['stall_time'],
+                                         stats['block_mb'])
+            print(line)
+        ipysnobal.close_files(force)
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Time to read the point model's text input files
+
+The hourly test_data_point forcing is repeated to nyears of records and
+read with the old pd.read_csv(sep=None, engine='python'), with
+pysnobal.load_table without the cache and with load_table from its .npy
+cache.
+
+    python benchmarks/bench_loader.py [--nyears 10] [--repeat 3]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from pysnobal import pysnobal
+
+TEST_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                         'test_data_point', 'snobal.data.input.short')
+
+
+def best(f, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = perf_counter()
+        f()
+        times.append(perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    p.add_argument('--nyears', type=int, default=10)
+    p.add_argument('--repeat', type=int, default=3)
+    args = p.parse_args()
+
+    data = np.loadtxt(TEST_DATA)
+    nrecords = args.nyears * 8760
+    data = np.resize(data, (nrecords, data.shape[1]))
+
+    tmp = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmp, 'snobal.data.input')
+        np.savetxt(filename, data, fmt='%.2f', delimiter='\t')
+        print('{} records, {:.1f} MB'.format(
+            nrecords, os.path.getsize(filename) / 1e6))
+
+        def python_engine():
+            pd.read_csv(filename, sep=None, header=None, engine='python')
+
+        def c_engine():
+            pysnobal.load_table(filename, 6, cache=False)
+
+        def cached():
+            pysnobal.load_table(filename, 6)
+
+        # write the cache before timing it
+        cached()
+
+        for name, f in [('read_csv python', python_engine),
+                        ('load_table', c_engine),
+                        ('load_table cached', cached)]:
+            print('{:>18s} {:8.3f} s'.format(name, best(f, args.repeat)))
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Size and write time of em.nc and snow.nc for different output layouts
+
+A smooth synthetic snowpack on a size x size grid is written for nsteps
+hourly output timesteps with the OutputWriter for the old (6, 10, 10)
+chunks and for the chunks from output_encoding with and without zlib
+compression and int16 packing. The bytes on disk, the write time and the
+time to read the time series at one pixel are reported for each layout.
+
+    python benchmarks/bench_output.py [--nsteps 48] [--size 500]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+
+import netCDF4 as nc
+import numpy as np
+
+from pysnobal import ipysnobal
+from pysnobal.c_snobal import snobal
+from pysnobal.output import OutputWriter
+
+LAYOUTS = [
+    ('(6, 10, 10)', {'chunks': (6, 10, 10)}),
+    ('auto', {}),
+    ('auto, zlib', {'compression': 4}),
+    ('auto, zlib, int16', {'compression': 4, 'packing': True}),
+]
+
+
+def states(nsteps, shape):
+    """
+    A snowpack that varies smoothly in space and time
+    """
+    y, x = np.meshgrid(np.linspace(0, 1, shape[0]),
+                       np.linspace(0, 1, shape[1]), indexing='ij')
+    base = np.sin(3 * x) * np.cos(2 * y)
+    for i in range(nsteps):
+        d = np.cos(2 * np.pi * i / 24)
+        s = {key: np.zeros(shape) for key in snobal.STATE_FIELDS}
+        s.update(z_s=1 + base, z_s_l=0.75 + base, rho=300 + 50 * base,
+                 m_s=300 * (1 + base), h2o=base ** 2,
+                 h2o_sat=0.1 * base ** 2,
+                 T_s_0=263 + 5 * d * base, T_s_l=265 + base, T_s=264 + base,
+                 R_n_bar=100 * d * base, H_bar=20 * base, L_v_E_bar=-10 * d,
+                 G_bar=2 * base, M_bar=base, delta_Q_bar=50 * d,
+                 E_s_sum=0.01 * base, melt_sum=d * base ** 2,
+                 ro_pred_sum=base ** 2, cc_s=-1e6 * (1 + base))
+        yield s
+
+
+def run(location, output, nsteps, shape):
+    start = datetime(2017, 1, 1)
+    options = {'output': dict(output, location=location),
+               'time': {'start_date': start}}
+    ipysnobal.output_files(options, {'x': np.arange(shape[1]),
+                                     'y': np.arange(shape[0])})
+
+    t0 = perf_counter()
+    with OutputWriter(options['output']['em'],
+                      options['output']['snow']) as writer:
+        for i, s in enumerate(states(nsteps, shape)):
+            writer.write(s, start + timedelta(hours=i + 1))
+    options['output']['em'].close()
+    options['output']['snow'].close()
+    write_time = perf_counter() - t0
+
+    nbytes = sum(os.path.getsize(os.path.join(location, f))
+                 for f in ['em.nc', 'snow.nc'])
+
+    t0 = perf_counter()
+    ds = nc.Dataset(os.path.join(location, 'snow.nc'))
+    for v in ['thickness', 'specific_mass', 'temp_surf']:
+        ds.variables[v][:, shape[0] // 2, shape[1] // 2]
+    ds.close()
+    read_time = perf_counter() - t0
+
+    return nbytes, write_time, read_time
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    p.add_argument('--nsteps', type=int, default=48)
+    p.add_argument('--size', type=int, default=500)
+    args = p.parse_args()
+
+    shape = (args.size, args.size)
+    print('{} output timesteps, {}x{} grid'.format(args.nsteps, *shape))
+    print('{:>18s} {:>10s} {:>10s} {:>12s}'.format(
+        'layout', 'MB', 'write s', 'point read s'))
+
+    tmp = tempfile.mkdtemp()
+    try:
+        for k, (name, output) in enumerate(LAYOUTS):
+            location = os.path.join(tmp, str(k))
+            os.mkdir(location)
+            nbytes, write_time, read_time = run(location, output,
+                                                args.nsteps, shape)
+            print('{:>18s} {:10.1f} {:10.3f} {:12.4f}'.format(
+                name, nbytes / 1e6, write_time, read_time))
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
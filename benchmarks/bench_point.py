@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Throughput of the C model on the test_data_point forcing
+
+The hourly forcing in test_data_point/snobal.data.input.short is run from an
+initial snowpack, with a snowfall every 50 hours when it's cold, for a single
+point and for the point copied over a small grid. The grid is run one data
+timestep per call (SnobalGrid.step) and in blocks (SnobalGrid.run_block).
+
+    python benchmarks/bench_point.py [--nsteps 8759] [--size 32]
+        [--nthreads 1] [--repeat 3] [--sat-table] [--layout full]
+"""
+
+import argparse
+import os
+from time import perf_counter
+
+import numpy as np
+
+from pysnobal.c_snobal import snobal
+
+FREEZE = 273.16
+
+TEST_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                         'test_data_point', 'snobal.data.input.short')
+
+MH = {'z_u': 5.0, 'z_t': 5.0, 'z_g': 0.5}
+PARAMS = {'relative_heights': False, 'max_h2o_vol': 0.01, 'max_z_s_0': 0.25}
+TSTEP_INFO = [
+    {'level': 0, 'output': 2, 'threshold': None, 'time_step': 3600.0,
+     'intervals': None},
+    {'level': 1, 'output': 0, 'threshold': 60.0, 'time_step': 3600.0,
+     'intervals': 1},
+    {'level': 2, 'output': 0, 'threshold': 10.0, 'time_step': 900.0,
+     'intervals': 4},
+    {'level': 3, 'output': 0, 'threshold': 1.0, 'time_step': 60.0,
+     'intervals': 15},
+]
+
+
+def point_forcing(nsteps):
+    """
+    Forcing as a dict of (nsteps + 1,) arrays in Kelvin
+    """
+    data = np.loadtxt(TEST_DATA)[:nsteps + 1]
+    force = {key: data[:, j].copy()
+             for j, key in enumerate(snobal.FORCING_FIELDS)}
+
+    i = np.arange(len(data))
+    force['m_pp'] = np.where((i % 50 == 0) & (force['T_a'] < 0), 5.0, 0.0)
+    force['percent_snow'] = np.ones(len(data))
+    force['rho_snow'] = 100.0 * np.ones(len(data))
+    force['T_pp'] = np.minimum(force['T_a'], 0.0)
+
+    for key in ['T_a', 'T_g', 'T_pp']:
+        force[key] += FREEZE
+
+    return force
+
+
+def init_state(shape):
+    return {
+        'elevation': 2061.0 * np.ones(shape),
+        'z_0': 0.005 * np.ones(shape),
+        'z_s': 1.0 * np.ones(shape),
+        'rho': 300.0 * np.ones(shape),
+        'T_s_0': (FREEZE - 3.0) * np.ones(shape),
+        'T_s_l': (FREEZE - 5.0) * np.ones(shape),
+        'T_s': (FREEZE - 4.0) * np.ones(shape),
+    }
+
+
+def run_step(force, shape, nthreads, layout='full', params=PARAMS):
+    grid = snobal.SnobalGrid(init_state(shape), TSTEP_INFO, MH, params,
+                             nthreads=nthreads, layout=layout)
+    records = [{key: np.full(shape, value[i]) for key, value in force.items()}
+               for i in range(len(force['S_n']))]
+    t0 = perf_counter()
+    for i in range(len(records) - 1):
+        grid.step(records[i], records[i + 1], int(i == 0))
+    return perf_counter() - t0, grid
+
+
+def run_block(force, shape, nthreads, layout='full', params=PARAMS,
+              block_size=24):
+    grid = snobal.SnobalGrid(init_state(shape), TSTEP_INFO, MH, params,
+                             nthreads=nthreads, layout=layout)
+    block = {key: np.ascontiguousarray(
+        np.broadcast_to(value[:, None, None], (len(value),) + shape))
+        for key, value in force.items()}
+    nsteps = len(force['S_n']) - 1
+    t0 = perf_counter()
+    for i in range(0, nsteps, block_size):
+        grid.run_block({key: value[i:i + block_size + 1]
+                        for key, value in block.items()},
+                       first_step=int(i == 0))
+    return perf_counter() - t0, grid
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    p.add_argument('--nsteps', type=int, default=8759)
+    p.add_argument('--size', type=int, default=32,
+                   help='grid is size x size copies of the point')
+    p.add_argument('--nthreads', type=int, default=1)
+    p.add_argument('--repeat', type=int, default=3)
+    p.add_argument('--sat-table', action='store_true',
+                   help='use the tabulated saturation vapor pressures')
+    p.add_argument('--layout', choices=snobal.LAYOUTS, default='full',
+                   help='layout of the model state')
+    args = p.parse_args()
+
+    params = dict(PARAMS, sat_table=args.sat_table)
+
+    force = point_forcing(args.nsteps)
+    nsteps = len(force['S_n']) - 1
+    shape = (args.size, args.size)
+
+    cases = [('point, step', run_step, (1, 1)),
+             ('grid, step', run_step, shape),
+             ('grid, run_block', run_block, shape)]
+
+    print('{} data timesteps, {} threads, {} state{}'.format(
+        nsteps, args.nthreads, args.layout,
+        ', sat table' if args.sat_table else ''))
+    for name, func, sz in cases:
+        best = min(func(force, sz, args.nthreads, args.layout, params)[0]
+                   for _ in range(args.repeat))
+        npix = int(np.prod(sz))
+        print('{:>16s} {:>9s}: {:8.3f} s {:12.0f} pixel steps/s'.format(
+            name, '{}x{}'.format(*sz), best, npix * nsteps / best))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Accuracy and speed of the single precision build against double
+
+The test_data_point forcing is run at the point and over a synthetic grid
+with the double (snobal) and single precision (snobal_single) builds of
+libsnobal. The grid is the mixed snowpacks of bench_schedule with the
+precipitation and elevation varied over the pixels. For SWE, melt and
+runoff the maximum and mean absolute differences of the single from the
+double run over all of the output timesteps are reported, with the time of
+each run and the speedup.
+
+    python benchmarks/bench_precision.py [--nsteps 8759] [--size 32]
+        [--grid-steps 2000] [--nthreads 1] [--repeat 3]
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+from pysnobal.c_snobal import engine
+
+from bench_point import MH, PARAMS, TSTEP_INFO, init_state, point_forcing
+from bench_schedule import mixed_state
+
+# the outputs compared and their names in the report
+COMPARED = [('m_s', 'SWE'), ('melt_sum', 'melt'), ('ro_pred_sum', 'runoff')]
+
+
+def run(precision, init, block, nthreads, repeat):
+    """
+    Run the block from the initial state with the build for precision
+
+    Returns:
+        dict of the compared outputs at every data timestep, and the
+        shortest time of the repeats (s)
+    """
+
+    nsteps = len(block['S_n']) - 1
+    shape = np.shape(block['S_n'])[1:]
+    times = []
+    for _ in range(repeat):
+        grid = engine(precision).SnobalGrid(init, TSTEP_INFO, MH, PARAMS,
+                                            nthreads=nthreads)
+        outputs = {key: np.zeros((nsteps,) + shape) for key, _ in COMPARED}
+        t0 = perf_counter()
+        rt = grid.run_block(block, outputs, first_step=1)
+        times.append(perf_counter() - t0)
+        if rt != -1:
+            raise RuntimeError('snobal {} failed at pixel {}'.format(
+                precision, rt))
+    return outputs, min(times)
+
+
+def compare(init, block, nthreads=1, repeat=1):
+    """
+    Deviation of the single precision run from the double
+
+    Returns:
+        dict of (max, mean) absolute deviation for each of COMPARED, and
+        the double and single precision times (s)
+    """
+
+    double, t_double = run('double', init, block, nthreads, repeat)
+    single, t_single = run('single', init, block, nthreads, repeat)
+    deviation = {}
+    for key, _ in COMPARED:
+        diff = np.abs(single[key] - double[key])
+        deviation[key] = (diff.max(), diff.mean())
+    return deviation, t_double, t_single
+
+
+def report(name, deviation, t_double, t_single):
+    print('{}: double {:.3f} s, single {:.3f} s, speedup {:.2f}'.format(
+        name, t_double, t_single, t_double / t_single))
+    for key, label in COMPARED:
+        print('    {:<7s} max {:.3e}  mean {:.3e} kg/m^2'.format(
+            label, *deviation[key]))
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    p.add_argument('--nsteps', type=int, default=8759,
+                   help='data timesteps of the point run')
+    p.add_argument('--size', type=int, default=32)
+    p.add_argument('--grid-steps', type=int, default=2000,
+                   help='data timesteps of the grid run')
+    p.add_argument('--nthreads', type=int, default=1)
+    p.add_argument('--repeat', type=int, default=3)
+    args = p.parse_args()
+
+    force = point_forcing(args.nsteps)
+    block = {key: value.reshape(-1, 1, 1) for key, value in force.items()}
+    report('point', *compare(init_state((1, 1)), block, args.nthreads,
+                             args.repeat))
+
+    shape = (args.size, args.size)
+    force = point_forcing(args.grid_steps)
+    block = {key: value[:, None, None] * np.ones(shape)
+             for key, value in force.items()}
+    rng = np.random.RandomState(0)
+    block['m_pp'] *= rng.uniform(0.5, 1.5, shape)
+    init = mixed_state(shape)
+    init['elevation'] += rng.uniform(-200, 200, shape)
+    report('{}x{} grid'.format(*shape),
+           *compare(init, block, args.nthreads, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
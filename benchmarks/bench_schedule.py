@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Schedules and thread counts for a grid of mixed snowpacks
+
+The test_data_point forcing is run over a grid where a third of the pixels
+are bare ground, a third have a deep snowpack and a third a thin one that
+the model divides down to the small timestep, in bands of rows so that the
+cost isn't spread evenly over the pixel order. The grid is spun up for a
+few blocks so the cost of each pixel is known, then pysnobal.autotune times
+every schedule, chunk size and thread count and reports the speedup.
+
+    python benchmarks/bench_schedule.py [--size 128] [--nsteps 6]
+        [--spinup 48] [--max-threads 8]
+"""
+
+import argparse
+
+import numpy as np
+
+from pysnobal.autotune import autotune, thread_counts
+from pysnobal.c_snobal import snobal
+
+from bench_point import MH, PARAMS, TSTEP_INFO, init_state, point_forcing
+
+
+def mixed_state(shape):
+    """
+    Bare ground, deep and thin snowpacks in bands of rows
+    """
+
+    init = init_state(shape)
+    band = np.arange(shape[0]) * 3 // shape[0]
+    z_s = np.choose(band, [0.0, 1.5, 0.02])[:, None] * np.ones(shape)
+    init['z_s'] = z_s
+    init['rho'] = np.where(z_s > 0, init['rho'], 0.0)
+    return init
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    p.add_argument('--size', type=int, default=128)
+    p.add_argument('--nsteps', type=int, default=6,
+                   help='data timesteps in each trial')
+    p.add_argument('--spinup', type=int, default=48)
+    p.add_argument('--max-threads', type=int, default=None)
+    args = p.parse_args()
+
+    shape = (args.size, args.size)
+    force = point_forcing(args.spinup + args.nsteps)
+    block = {key: value[:, None, None] * np.ones(shape)
+             for key, value in force.items()}
+
+    # no snowfall on the bare ground
+    block['m_pp'][:, :args.size // 3, :] = 0
+
+    grid = snobal.SnobalGrid(mixed_state(shape), TSTEP_INFO, MH, PARAMS)
+    grid.run_block({k: v[:args.spinup + 1] for k, v in block.items()},
+                   first_step=1)
+    cost = grid.cost[grid.cost > 0]
+    print('{} active pixels, cost {} to {} run timesteps per data '
+          'timestep'.format(grid.n_active, cost.min(), cost.max()))
+
+    trial = {k: v[args.spinup:] for k, v in block.items()}
+    tuning = autotune(grid.output_rec, TSTEP_INFO, MH, PARAMS, trial,
+                      threads=thread_counts(args.max_threads), first_step=0)
+    print(tuning.report())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Cold start time of the pysnobal modules and the pysnobal command
+
+Each import and command is run in a new Python process, as a pool worker
+or a station run would be, and timed from the start of the process to its
+exit. The bare interpreter and numpy are timed for reference, and for each
+import whether it loaded pandas or netCDF4.
+
+    python benchmarks/bench_startup.py [--repeat 10]
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+from time import perf_counter
+
+import numpy as np
+
+MODULES = ['numpy', 'pysnobal.c_snobal.snobal', 'pysnobal.pysnobal',
+           'pysnobal.stations', 'pysnobal.sweep', 'pysnobal.ipysnobal']
+
+# the heavy imports that the modules above should leave out
+HEAVY = ['pandas', 'netCDF4']
+
+
+def start_time(cmd, repeat):
+    """
+    Wall times (s) of running cmd in a new process repeat times
+    """
+
+    times = []
+    for _ in range(repeat):
+        t0 = perf_counter()
+        subprocess.run(cmd, check=True, stdout=subprocess.PIPE)
+        times.append(perf_counter() - t0)
+    return np.array(times)
+
+
+def loaded(module):
+    """
+    The HEAVY modules that are loaded by importing module
+    """
+
+    code = 'import sys, {}; print(" ".join(m for m in {!r} ' \
+        'if m in sys.modules))'.format(module, HEAVY)
+    out = subprocess.run([sys.executable, '-c', code], check=True,
+                         stdout=subprocess.PIPE, universal_newlines=True)
+    return out.stdout.split()
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    p.add_argument('--repeat', type=int, default=10)
+    args = p.parse_args()
+
+    cases = [('python', [sys.executable, '-c', 'pass'], None)]
+    for module in MODULES:
+        cases.append(('import ' + module,
+                      [sys.executable, '-c', 'import ' + module], module))
+    cases.append(('python -m pysnobal.cli --help',
+                  [sys.executable, '-m', 'pysnobal.cli', '--help'], None))
+    if shutil.which('pysnobal'):
+        cases.append(('pysnobal --help', ['pysnobal', '--help'], None))
+
+    print('{:<40s} {:>9s} {:>11s}  {}'.format(
+        'start', 'min (ms)', 'median (ms)', 'loaded'))
+    for name, cmd, module in cases:
+        times = 1000 * start_time(cmd, args.repeat)
+        heavy = ' '.join(loaded(module)) or '-' if module else ''
+        print('{:<40s} {:9.1f} {:11.1f}  {}'.format(
+            name, times.min(), np.median(times), heavy))
+
+
+if __name__ == '__main__':
+    main()
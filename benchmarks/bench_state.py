@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Memory of the model state in the full and compact layouts
+
+Prints the bytes per field of a grid with npixels pixels in each layout,
+then runs the bench_point grid in blocks in both layouts to compare the
+throughput and the largest difference in the diagnostic fields.
+
+    python benchmarks/bench_state.py [--npixels 10000000] [--nsteps 2000]
+        [--size 32] [--repeat 3]
+"""
+
+import argparse
+
+import numpy as np
+
+from bench_point import point_forcing, run_block
+from pysnobal.c_snobal import snobal
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    p.add_argument('--npixels', type=int, default=10000000)
+    p.add_argument('--nsteps', type=int, default=2000)
+    p.add_argument('--size', type=int, default=32)
+    p.add_argument('--repeat', type=int, default=3)
+    args = p.parse_args()
+
+    nbytes = {layout: snobal.state_nbytes(args.npixels, layout)
+              for layout in snobal.LAYOUTS}
+    print('{} pixels'.format(args.npixels))
+    print('{:>14s} {:>8s} {:>10s} {:>8s} {:>10s}'.format(
+        'field', 'full', 'MB', 'compact', 'MB'))
+    for key in snobal.STATE_FIELDS:
+        print('{:>14s} {:>8s} {:10.1f} {:>8s} {:10.1f}'.format(
+            key, np.dtype(snobal.state_dtype(key)).name,
+            nbytes['full'][key] / 1e6,
+            np.dtype(snobal.state_dtype(key, 'compact')).name,
+            nbytes['compact'][key] / 1e6))
+    total = {layout: sum(value.values()) for layout, value in nbytes.items()}
+    print('{:>14s} {:>8s} {:10.1f} {:>8s} {:10.1f}'.format(
+        'total', '', total['full'] / 1e6, '', total['compact'] / 1e6))
+
+    force = point_forcing(args.nsteps)
+    nsteps = len(force['S_n']) - 1
+    shape = (args.size, args.size)
+    grids = {}
+    print('\n{} data timesteps, {}x{} grid'.format(nsteps, *shape))
+    for layout in snobal.LAYOUTS:
+        times = []
+        for _ in range(args.repeat):
+            t, grids[layout] = run_block(force, shape, 1, layout)
+            times.append(t)
+        best = min(times)
+        print('{:>8s}: {:8.3f} s {:12.0f} pixel steps/s'.format(
+            layout, best, np.prod(shape) * nsteps / best))
+
+    full, compact = grids['full'], grids['compact']
+    same = all(np.array_equal(full[key], compact[key])
+               for key in snobal.STATE_FIELDS
+               if key not in snobal.DIAGNOSTIC_FIELDS)
+    diff = max(np.max(np.abs(full[key] - compact[key]))
+               for key in snobal.DIAGNOSTIC_FIELDS)
+    print('prognostic fields identical: {}, largest diagnostic '
+          'difference {:.3g}'.format(same, diff))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Throughput of the vectorized energy balance in pysnobal.vector
+
+The energy balance terms are computed for a set of random snowcovers with
+pysnobal.vector.e_bal and with the C core through snobal.e_bal. The C
+reference loops over the pixels in Cython so it includes the cost of
+filling a snobal_state_t for each pixel. The warm start case starts hle1
+from the Obukhov lengths of a run with slightly different temperatures,
+as it would be from the previous sub-timestep.
+
+    python benchmarks/bench_vector.py [--npix 10000 100000] [--repeat 3]
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+from pysnobal import vector
+from pysnobal.c_snobal import snobal
+
+
+def random_state(n, seed=0):
+    """
+    n pixels with two layer snowcovers
+    """
+    rng = np.random.RandomState(seed)
+    z_s = rng.uniform(0.3, 2.0, n)
+    T_a = rng.uniform(250.0, 285.0, n)
+    return {
+        'snowcover': np.ones(n, dtype=int),
+        'layer_count': 2 * np.ones(n, dtype=int),
+        'S_n': rng.uniform(0.0, 600.0, n),
+        'I_lw': rng.uniform(150.0, 350.0, n),
+        'T_a': T_a,
+        'e_a': rng.uniform(0.3, 1.0, n) * vector.satw(T_a),
+        'u': rng.uniform(0.5, 10.0, n),
+        'T_g': rng.uniform(272.0, 276.0, n),
+        'P_a': rng.uniform(70000.0, 90000.0, n),
+        'T_s_0': rng.uniform(250.0, 273.16, n),
+        'T_s_l': rng.uniform(250.0, 273.0, n),
+        'rho': rng.uniform(100.0, 500.0, n),
+        'z_s': z_s,
+        'z_s_0': 0.25 * np.ones(n),
+        'z_s_l': z_s - 0.25,
+        'z_0': 0.005,
+        'z_u': 5.0,
+        'z_T': 5.0,
+        'z_g': 0.5,
+        'relative_hts': 0,
+        'precip_now': (rng.rand(n) < 0.3).astype(int),
+        'm_rain': rng.uniform(0.0, 2.0, n),
+        'm_snow': rng.uniform(0.0, 5.0, n),
+        'T_rain': rng.uniform(273.16, 276.0, n),
+        'T_snow': rng.uniform(260.0, 273.16, n),
+        'time_step': 3600.0,
+    }
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    p.add_argument('--npix', type=int, nargs='+', default=[10000, 100000])
+    p.add_argument('--repeat', type=int, default=3)
+    args = p.parse_args()
+
+    for npix in args.npix:
+        s = random_state(npix)
+        prev = dict(s, T_a=s['T_a'] - 0.3, T_s_0=s['T_s_0'] - 0.2)
+        warm = dict(s, lo=vector.e_bal(prev, diagnostics=True)['lo'])
+        for name, func, state in [('vector.e_bal', vector.e_bal, s),
+                                  ('warm start', vector.e_bal, warm),
+                                  ('snobal.e_bal', snobal.e_bal, s)]:
+            best = np.inf
+            for _ in range(args.repeat):
+                t0 = perf_counter()
+                func(state)
+                best = min(best, perf_counter() - t0)
+            print('{:>14s} {:>8d} pixels: {:8.4f} s {:12.0f} pixels/s'.format(
+                name, npix, best, npix / best))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Pick the number of threads and the schedule for a grid from a short trial
+
+The cost of a pixel varies from nothing for bare ground to 60 or more run
+timesteps per data timestep for a thin snowpack, so the best way to share
+the pixels between the threads and the number of threads that still pays
+off depend on the grid and the snowpack. autotune runs a few data
+timesteps of the forcing with each combination of threads, schedule and
+chunk size and times them.
+
+Each trial runs the block twice on a fresh SnobalGrid from the same
+initial state, the first run records the cost of each pixel for the
+'cost' and 'balanced' schedules and warms up the caches, only the second
+is timed. The grid that is tuned isn't changed until Tuning.apply.
+"""
+
+import os
+from time import perf_counter
+
+from .c_snobal import engine, snobal
+
+CHUNK_SIZES = (10, 100, 1000)
+
+
+def thread_counts(max_threads=None):
+    """
+    The numbers of threads to try, the powers of two up to max_threads and
+    max_threads itself
+
+    Args:
+        max_threads: the most threads to try, the number of CPUs if None
+    """
+
+    if max_threads is None:
+        max_threads = os.cpu_count() or 1
+    threads = []
+    n = 1
+    while n < max_threads:
+        threads.append(n)
+        n *= 2
+    threads.append(max_threads)
+    return threads
+
+
+class Tuning(object):
+    """
+    The trial times and the fastest settings
+
+    Attributes:
+        results: list of dicts of nthreads, schedule, chunk_size and time
+            (s) for each trial
+        best: the dict from results with the shortest time
+    """
+
+    def __init__(self, results):
+        self.results = results
+        self.best = min(results, key=lambda r: r['time'])
+
+    def speedup(self):
+        """
+        The speedup of the fastest trial for each number of threads over
+        the fastest with one thread, or with the fewest threads tried
+
+        Returns:
+            list of (nthreads, time, speedup)
+        """
+
+        fastest = {}
+        for r in self.results:
+            n = r['nthreads']
+            if n not in fastest or r['time'] < fastest[n]:
+                fastest[n] = r['time']
+        base = fastest[min(fastest)]
+        return [(n, fastest[n], base / fastest[n]) for n in sorted(fastest)]
+
+    def report(self):
+        """
+        Table of the trials and the speedup curve
+        """
+
+        lines = ['{:>8s} {:>9s} {:>6s} {:>10s}'.format(
+            'threads', 'schedule', 'chunk', 'time (s)')]
+        for r in self.results:
+            chunk = '-' if r['schedule'] == 'balanced' else r['chunk_size']
+            lines.append('{:>8d} {:>9s} {:>6} {:10.4f}'.format(
+                r['nthreads'], r['schedule'], chunk, r['time']))
+
+        lines.append('')
+        lines.append('{:>8s} {:>10s} {:>8s} {:>11s}'.format(
+            'threads', 'time (s)', 'speedup', 'efficiency'))
+        for n, time, speedup in self.speedup():
+            lines.append('{:>8d} {:10.4f} {:8.2f} {:11.2f}'.format(
+                n, time, speedup, speedup / n))
+
+        best = self.best
+        lines.append('best: {} threads, {} schedule, chunk size {}'.format(
+            best['nthreads'], best['schedule'], best['chunk_size']))
+        return '\n'.join(lines)
+
+    def apply(self, grid):
+        """
+        Set the fastest number of threads, schedule and chunk size on a
+        SnobalGrid
+        """
+
+        grid.nthreads = self.best['nthreads']
+        grid.schedule = self.best['schedule']
+        grid.chunk_size = self.best['chunk_size']
+
+
+def trial(init, tstep_info, mh, params, block, nthreads, schedule,
+          chunk_size, first_step=1, layout='full', members=0,
+          precision='double'):
+    """
+    Time a block of the model with the given settings
+
+    Returns:
+        the wall time of the second run of the block (s)
+    """
+
+    grid = engine(precision).SnobalGrid(
+        init, tstep_info, mh, params, nthreads, layout=layout,
+        schedule=schedule, chunk_size=chunk_size, members=members)
+    state = {key: grid[key].copy() for key in snobal.STATE_FIELDS}
+
+    grid.run_block(block, first_step=first_step)
+    for key, value in state.items():
+        grid[key][...] = value
+
+    t0 = perf_counter()
+    rt = grid.run_block(block, first_step=first_step)
+    time = perf_counter() - t0
+    if rt != -1:
+        raise RuntimeError('snobal failed at pixel {} in the trial'.format(rt))
+    return time
+
+
+def autotune(init, tstep_info, mh, params, block, threads=None,
+             schedules=None, chunk_sizes=CHUNK_SIZES, nsteps=None,
+             first_step=1, layout='full', members=0, precision='double'):
+    """
+    Time the model with each combination of threads, schedule and chunk
+    size on a block of the forcing
+
+    Args:
+        init: model state to start the trials from, as for SnobalGrid,
+            e.g. the output_rec of the grid that is tuned
+        tstep_info: time step information
+        mh: measurement heights
+        params: model parameters
+        block: forcing block as for SnobalGrid.run_block
+        threads: numbers of threads to try, see thread_counts
+        schedules: schedules to try, all of snobal.SCHEDULES if None
+        chunk_sizes: chunk sizes to try with the dynamic schedules
+        nsteps: only use the first nsteps data timesteps of the block
+        first_step: 1 if the snowpack should be initialized
+        layout: layout of the state, see snobal.state_dtype
+        members: number of ensemble members, see snobal.SnobalGrid
+        precision: precision of the libsnobal build, see c_snobal.engine
+
+    Returns:
+        Tuning
+    """
+
+    if threads is None:
+        threads = thread_counts()
+    if schedules is None:
+        schedules = snobal.SCHEDULES
+    if nsteps is not None:
+        block = {key: value[:nsteps + 1] for key, value in block.items()}
+
+    results = []
+    for n in threads:
+        for schedule in schedules:
+            # the balanced schedule doesn't use chunks
+            chunks = chunk_sizes[:1] if schedule == 'balanced' \
+                else chunk_sizes
+            for chunk_size in chunks:
+                time = trial(init, tstep_info, mh, params, block, n,
+                             schedule, chunk_size, first_step, layout,
+                             members, precision)
+                results.append({'nthreads': n, 'schedule': schedule,
+                                'chunk_size': chunk_size, 'time': time})
+
+    return Tuning(results)
@@ -2,3 +2,30 @@
 # import lib
 # import ipysnobal
 from . import snobal
+
+# precision of the libsnobal build the model runs in, see engine
+PRECISIONS = ('double', 'single')
+
+
+def engine(precision='double'):
+    """
+    The snobal module built for a precision
+
+    The single precision build (snobal_single) has the same interface and
+    takes and returns the same arrays, only the snowpack state and the
+    energy and mass balance are float inside of libsnobal.
+
+    Args:
+        precision: 'double' or 'single'
+
+    Returns:
+        snobal or snobal_single
+    """
+
+    if precision not in PRECISIONS:
+        raise ValueError('precision must be one of {}'.format(
+            ', '.join(PRECISIONS)))
+    if precision == 'single':
+        from . import snobal_single
+        return snobal_single
+    return snobal
@@ -381,21 +381,26 @@ extern int	budyer2(double zu, double zt, double z0, double t, double t0,
 			double *h, double *le);
 extern double	dew_point(double e);
 extern double	dew_pointp(double e, double tol);
-extern double	efcon(double k, double t, double p);
-extern double	evap(double le, double ts);
-extern double	heat_stor(double cp, double spm, double tdif);
-extern int      hle1(double press, double ta, double ts, double za,
-		     double ea, double es, double zq, double u, double zu,
-		     double z0, double *h, double *le, double *e);
+extern real_t	efcon(real_t k, real_t t, real_t p, int table);
+extern real_t	evap(real_t le, real_t ts);
+extern real_t	heat_stor(real_t cp, real_t spm, real_t tdif);
+extern int      hle1(real_t press, real_t ta, real_t ts, real_t za,
+		     real_t ea, real_t es, real_t zq, real_t u, real_t zu,
+		     real_t z0, real_t *h, real_t *le, real_t *e);
+extern int      hle1_iter(real_t press, real_t ta, real_t ts, real_t za,
+		     real_t ea, real_t es, real_t zq, real_t u, real_t zu,
+		     real_t z0, int table, real_t *h, real_t *le, real_t *e,
+		     real_t *l_ob, int *niter);
 extern double   psychrom(double tdry, double twet, double press);
 extern double   wetbulb(double ta, double dpt, double press);
 extern double   ri_no(double z2, double z1, double t2, double t1,
 		      double u2, double u1);
-extern double	sati(double tk);
+extern void	init_sat_table(void);
+extern real_t	sati(real_t tk, int table);
 extern double	sati_mod(double tk);
-extern double	satw(double tk);
-extern double	ssxfr(double  k1, double  k2, double  t1, double  t2,
-		      double  d1, double  d2);
+extern real_t	satw(real_t tk, int table);
+extern real_t	ssxfr(real_t  k1, real_t  k2, real_t  t1, real_t  t2,
+		      real_t  d1, real_t  d2);
 
 /* ------------------------------------------------------------------------ */
 
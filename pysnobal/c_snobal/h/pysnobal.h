@@ -98,8 +98,58 @@ typedef struct {
 	double* E_s_sum;
 	double* melt_sum;
 	double* ro_pred_sum;
+
+	/*
+	 * The compact state, used for a field when its pointer above is NULL.
+	 * The mask and layer count are bytes and the averages and sums, which
+	 * don't feed back into the model, are single precision.
+	 */
+	unsigned char* masked_c;
+	signed char* layer_count_c;
+	float* R_n_bar_c;
+	float* H_bar_c;
+	float* L_v_E_bar_c;
+	float* G_bar_c;
+	float* G_0_bar_c;
+	float* M_bar_c;
+	float* delta_Q_bar_c;
+	float* delta_Q_0_bar_c;
+	float* E_s_sum_c;
+	float* melt_sum_c;
+	float* ro_pred_sum_c;
+
+	/*
+	 * Pixels of an ensemble member, 0 if there's one member.  The
+	 * members of an ensemble are npix pixels apart and share the static
+	 * fields, the mask, elevation and z_0 only have npix values.
+	 */
+	int npix;
 } OUTPUT_REC_ARR;
 
+/*
+ * Index of the static fields of a for pixel n
+ */
+#define STATIC_INDEX(a, n) \
+	((a)->npix > 0 ? (n) % (a)->npix : (n))
+
+/*
+ * Value of field f at index n of a, from the full or the compact buffer
+ */
+#define STATE_GET(a, f, n) \
+	((a)->f != NULL ? (a)->f[n] : (a)->f##_c[n])
+
+/*
+ * Set field f at index n of a to v in the buffer that isn't NULL, if both
+ * are NULL the field isn't stored
+ */
+#define STATE_SET(a, f, n, v) \
+	do { \
+		if ((a)->f != NULL) \
+			(a)->f[n] = (v); \
+		else if ((a)->f##_c != NULL) \
+			(a)->f##_c[n] = (v); \
+	} while (0)
+
 typedef struct {
 	double* S_n;
 	double* I_lw;
@@ -111,8 +161,31 @@ typedef struct {
 	double* percent_snow;
 	double* rho_snow;
 	double* T_pp;
+
+	/*
+	 * Single precision forcing, used for a field when its pointer above
+	 * is NULL, e.g. straight from a float32 netCDF file.  The values are
+	 * widened to double as each pixel is loaded.
+	 */
+	float* S_n_f;
+	float* I_lw_f;
+	float* T_a_f;
+	float* e_a_f;
+	float* u_f;
+	float* T_g_f;
+	float* m_pp_f;
+	float* percent_snow_f;
+	float* rho_snow_f;
+	float* T_pp_f;
 } INPUT_REC_ARR;
 
+/*
+ * Forcing field f at index n of a as a double, from the double or the
+ * single precision buffer
+ */
+#define INPUT_GET(a, f, n) \
+	((a)->f != NULL ? (a)->f[n] : (double) (a)->f##_f[n])
+
 
 typedef struct {
 	double z_u;
@@ -121,16 +194,54 @@ typedef struct {
 	int relative_heights;
 	double max_h2o_vol;
 	double max_z_s_0;
+	int sat_table;		/* saturation vapor pressures from the
+				   tables, see init_sat_table */
+	int hle1_warm_start;	/* start hle1 from the last Obukhov
+				   length, see _h_le.c */
+	double* z_u_arr;	/* heights by pixel, NULL to use z_u, ... */
+	double* z_T_arr;
+	double* z_g_arr;
+	double* P_a_arr;	/* air pressure by static pixel, NULL to
+				   compute it from the elevation */
+	double* max_h2o_vol_arr;	/* parameters by pixel, NULL to use */
+	double* max_z_s_0_arr;		/* max_h2o_vol and max_z_s_0	*/
 } PARAMS;
 
+/*
+ * first_step of call_snobal_block: zero the averages and sums on the first
+ * data timestep of the block (FIRST_STEP) or on every data timestep
+ * (EVERY_STEP), as iSnobal does
+ */
+#define FIRST_STEP	1
+#define EVERY_STEP	2
+
+/*
+ * How the active pixels are shared between the threads, see call_snobal
+ */
+#define SCHED_DYNAMIC	0	/* chunks in pixel order, handed out dynamically */
+#define SCHED_COST	1	/* chunks heaviest first by cost, dynamically	 */
+#define SCHED_BALANCED	2	/* a static range of equal cost for each thread  */
+
+#define MAX_COST	1023	/* cost the pixels are sorted by is capped here	 */
+
+typedef struct {
+	int type;		/* SCHED_DYNAMIC, SCHED_COST or SCHED_BALANCED	*/
+	int chunk;		/* chunk size of the dynamic schedules		*/
+	int* cost;		/* run timesteps per data timestep of each pixel
+				   in the last call, NULL to not keep them	*/
+	int* work;		/* N ints of workspace for SCHED_COST		*/
+	int* hle1_iter;		/* hle1 iterations of each pixel in the last
+				   call, NULL to not keep them			*/
+} SCHEDULE;
+
 /* ------------------------------------------------------------------------- */
 
 /*
  *  Routines that are part of isnobal program.
  */
 
-//extern int call_snobal(int N, int nthreads, int first_step, TSTEP_REC tstep_info[4], OUTPUT_REC** output_rec, INPUT_REC_ARR* input1, INPUT_REC_ARR* input2, PARAMS params, OUTPUT_REC_ARR* output1);
-extern int call_snobal(int N, int nthreads, int first_step, TSTEP_REC tstep_info[4], INPUT_REC_ARR* input1, INPUT_REC_ARR* input2, PARAMS params, OUTPUT_REC_ARR* output1);
+extern int call_snobal(int N, int nthreads, int first_step, int compact, TSTEP_REC tstep_info[4], INPUT_REC_ARR* input1, INPUT_REC_ARR* input2, PARAMS params, OUTPUT_REC_ARR* output1, int* pixels, int* n_active, SCHEDULE* sched, SNOBAL_COUNTS* counts);
+extern int call_snobal_block(int N, int nthreads, int first_step, int compact, int nsteps, TSTEP_REC tstep_info[4], INPUT_REC_ARR* inputs, PARAMS params, OUTPUT_REC_ARR* output1, int* output_index, OUTPUT_REC_ARR* outputs, int* pixels, int* n_active, SCHEDULE* sched, SNOBAL_COUNTS* counts);
 
 //extern	void	assign_buffers (int masked, int n, int output, OUTPUT_REC **output_rec);
 //extern	void	buffers        (void);
@@ -176,10 +287,4 @@ extern	int		nstep;		/* #  of data timesteps		     */
 extern	int		nDigits;	/* #  of digits in suffixes of images*/
 extern	bool_t		restart;	/* restart flag			     */
 
-/* model variables */
-
-
-extern double elevation;
-//#pragma omp threadprivate(elevation)
-
 #endif /* _ISNOBAL_H_ */
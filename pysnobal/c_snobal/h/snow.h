@@ -106,11 +106,12 @@
  * Library functions.
  */
 
-extern double	g_snow(double rho1, double rho2, double ts1, double ts2,
-		       double ds1, double ds2, double pa);
-extern double	g_soil(double rho, double tsno, double tg, double ds,
-		       double dg, double pa);
-extern double	new_tsno(double spm, double t0, double ccon);
+extern int	g_snow(real_t rho1, real_t rho2, real_t ts1, real_t ts2,
+		       real_t ds1, real_t ds2, real_t pa, int table,
+		       real_t *g);
+extern int	g_soil(real_t rho, real_t tsno, real_t tg, real_t ds,
+		       real_t dg, real_t pa, int table, real_t *g);
+extern real_t	new_tsno(real_t spm, real_t t0, real_t ccon);
 
 /* ------------------------------------------------------------------------ */
 
@@ -61,4 +61,21 @@ typedef FPIXEL  fpixel_t;
 #define FPIXEL_MAX	FLT_MAX
 #define FPIXEL_MIN	(-(FLT_MAX))
 
+/* ------------------------------------------------------------------------- */
+
+/*
+ *  Floating-point type of the snowpack state and the energy and mass
+ *  balance.  The library is built in single precision with SNOBAL_SINGLE
+ *  (and -fsingle-precision-constant), where <tgmath.h> picks the float
+ *  versions of the math functions.  The clock and the arrays passed in
+ *  from Python are double either way.
+ */
+
+#ifdef SNOBAL_SINGLE
+#include <tgmath.h>
+typedef float   real_t;
+#else
+typedef double  real_t;
+#endif
+
 #endif  /* IPW_TYPES_H */
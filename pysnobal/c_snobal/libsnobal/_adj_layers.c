@@ -6,7 +6,7 @@
 **      #include "_snobal.h"
 **
 **      void
-**	_adj_layers(void);
+**	_adj_layers(snobal_state_t *s);
 **
 ** DESCRIPTION
 **      This routine adjusts the layers of the snowcover because the
@@ -17,10 +17,10 @@
 **	increase in the snowcover's depth, its temperature and cold content
 **	are initialized. 
 **
-** GLOBAL VARIABLES READ
+** STATE VARIABLES READ
 **	layer_count
 **
-** GLOBAL VARIABLES MODIFIED
+** STATE VARIABLES MODIFIED
 **	cc_s
 **	cc_s_0
 **	cc_s_l
@@ -44,7 +44,7 @@
 #include "_snobal.h"
 
 void
-_adj_layers(void)
+_adj_layers(snobal_state_t *s)
 {
 	int prev_layer_count;	/* previous # of layers, if change in depth */
 
@@ -65,56 +65,56 @@ _adj_layers(void)
 	 *	   2	   -->	   1
 	 *	   2	   -->	   2	(no change)
 	 */
-	prev_layer_count = layer_count;  /* must be > 0 */
-	_calc_layers();
+	prev_layer_count = s->layer_count;  /* must be > 0 */
+	_calc_layers(s);
 
-	if (layer_count == 0) {
+	if (s->layer_count == 0) {
 		/*
 		 *  1 or 2 layers --> 0 layers
 		 */
-		rho = 0.0;
+		s->rho = 0.0;
 
 		/*
 		 *  If mass > 0, then it must be below threshold.
 		 *  So turn this little bit of mass into water.
 		 */
-		if (m_s > 0.0)
-			h2o_total += m_s;
+		if (s->m_s > 0.0)
+			s->h2o_total += s->m_s;
 
-		m_s   = cc_s   = 0.0;
-		m_s_0 = cc_s_0 = 0.0;
+		s->m_s   = s->cc_s   = 0.0;
+		s->m_s_0 = s->cc_s_0 = 0.0;
 
 		/*
 		 *  Note: Snow temperatures are set to MIN_SNOW_TEMP
 		 *	  (as degrees K) instead of 0 K to keep quantization
 		 *	  range in output image smaller.
 		 */
-		T_s = T_s_0 = MIN_SNOW_TEMP + FREEZE;
+		s->T_s = s->T_s_0 = MIN_SNOW_TEMP + FREEZE;
 
 		if (prev_layer_count == 2) {
-			m_s_l = cc_s_l = 0.0;
-			T_s_l = MIN_SNOW_TEMP + FREEZE;
+			s->m_s_l = s->cc_s_l = 0.0;
+			s->T_s_l = MIN_SNOW_TEMP + FREEZE;
 		}
-		h2o_vol = h2o = h2o_max = h2o_sat = 0.0;
+		s->h2o_vol = s->h2o = s->h2o_max = s->h2o_sat = 0.0;
 	}
  
 	else {
-		_layer_mass();
+		_layer_mass(s);
 
-		if ((prev_layer_count == 1) && (layer_count == 2)) {
+		if ((prev_layer_count == 1) && (s->layer_count == 2)) {
 			/*
 			 *  1 layer --> 2 layers, add lower layer
 			 */
-			T_s_l = T_s;
-			cc_s_l = _cold_content(T_s_l, m_s_l);
+			s->T_s_l = s->T_s;
+			s->cc_s_l = _cold_content(s->T_s_l, s->m_s_l);
 			}
 
-		else if ((prev_layer_count == 2) && (layer_count == 1)) {
+		else if ((prev_layer_count == 2) && (s->layer_count == 1)) {
 			/*
 			 *  2 layers --> 1 layer, remove lower layer
 			 */
-			T_s_l = MIN_SNOW_TEMP + FREEZE;
-			cc_s_l = 0.0;
+			s->T_s_l = MIN_SNOW_TEMP + FREEZE;
+			s->cc_s_l = 0.0;
 		}
 	}
 
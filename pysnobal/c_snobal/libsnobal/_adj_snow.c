@@ -7,8 +7,9 @@
  **
  **      void
  **	_adj_snow(
- **	    double delta_z_s,	|* change in snowcover's depth *|
- **	    double delta_m_s)	|* change is snowcover's mass *|
+ **	    snobal_state_t *s,
+ **	    real_t delta_z_s,	|* change in snowcover's depth *|
+ **	    real_t delta_m_s)	|* change is snowcover's mass *|
  **
  ** DESCRIPTION
  **      This routine adjusts the snowcover for a change in its depth or
@@ -23,9 +24,9 @@
  **	density is clipped at the maximum, and the depth re-adjusted
  **	accordingly.
  **
- ** GLOBAL VARIABLES READ
+ ** STATE VARIABLES READ
  **
- ** GLOBAL VARIABLES MODIFIED
+ ** STATE VARIABLES MODIFIED
  **	m_s
  **	rho
  **	z_s
@@ -46,29 +47,30 @@
 
 void
 _adj_snow(
-		double	delta_z_s,	/* change in snowcover's depth */
-		double	delta_m_s)	/* change is snowcover's mass */
+		snobal_state_t *s,
+		real_t	delta_z_s,	/* change in snowcover's depth */
+		real_t	delta_m_s)	/* change is snowcover's mass */
 {
 	/*
 	 *  Update depth, mass, and then recompute density.
 	 */
-	z_s += delta_z_s;
-	m_s += delta_m_s;
+	s->z_s += delta_z_s;
+	s->m_s += delta_m_s;
 
-	if (z_s != 0.0) {
-		rho = m_s / z_s;
+	if (s->z_s != 0.0) {
+		s->rho = s->m_s / s->z_s;
 	} else {
-		rho = 0;
+		s->rho = 0;
 	}
 
 	/*
 	 *  Clip density at maxium density if necessary.
 	 */
-	if (rho > MAX_SNOW_DENSITY)
+	if (s->rho > MAX_SNOW_DENSITY)
 	{
-		rho = MAX_SNOW_DENSITY;
-		z_s = m_s / rho;
-		_adj_layers();
+		s->rho = MAX_SNOW_DENSITY;
+		s->z_s = s->m_s / s->rho;
+		_adj_layers(s);
 	}
 	else	
 	{
@@ -76,12 +78,12 @@ _adj_snow(
 		 *  If a change in depth, adjust the layers' depths and masses.
 		 */
 		if (delta_z_s != 0.0)
-			_adj_layers();
+			_adj_layers(s);
 		else
 			/*
 			 *  Just a change in the snowcover's mass, so update the
 			 *  layers' masses.
 			 */
-			_layer_mass();
+			_layer_mass(s);
 	}
 }
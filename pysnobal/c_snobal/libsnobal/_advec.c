@@ -6,13 +6,13 @@
 **      #include "_snobal.h"
 **
 **      void
-**	_advec(void)
+**	_advec(snobal_state_t *s)
 **
 ** DESCRIPTION
 **      This routine calculates the advected energy for a 2-layer snowcover
 **	if there's precipitation for the current timestep.
 **      
-** GLOBAL VARIABLES READ
+** STATE VARIABLES READ
 **	m_rain
 **	m_snow
 **	precip_now
@@ -21,7 +21,7 @@
 **	T_snow
 **	time_step
 **
-** GLOBAL VARIABLES MODIFIED
+** STATE VARIABLES MODIFIED
 **	M
 */
 
@@ -30,13 +30,13 @@
 #include	"envphys.h"
 
 void
-_advec(void)
+_advec(snobal_state_t *s)
 {
-	if (precip_now) {
-		M = (heat_stor(CP_WATER(T_rain), m_rain, (T_rain - T_s_0)) +
-		     heat_stor(CP_ICE(T_snow), m_snow, (T_snow - T_s_0)))
- 		    / time_step;
+	if (s->precip_now) {
+		s->M = (heat_stor(CP_WATER(s->T_rain), s->m_rain, (s->T_rain - s->T_s_0)) +
+		     heat_stor(CP_ICE(s->T_snow), s->m_snow, (s->T_snow - s->T_s_0)))
+ 		    / s->time_step;
 	}
 	else
-		M = 0.0;
+		s->M = 0.0;
 }
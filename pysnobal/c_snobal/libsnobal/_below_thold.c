@@ -7,7 +7,8 @@
 **
 **      int
 **	_below_thold(
-**	    double  threshold)	|* current timestep's threshold for a 
+**	    snobal_state_t *s,
+**	    real_t  threshold)	|* current timestep's threshold for a 
 **				   layer's mass *|
 **
 ** DESCRIPTION
@@ -19,13 +20,13 @@
 **
 **		0	All layers' masses are greater than the threshold.
 **
-** GLOBAL VARIABLES READ
+** STATE VARIABLES READ
 **	layer_count
 **	m_s
 **	m_s_0
 **	m_s_l
 **
-** GLOBAL VARIABLES MODIFIED
+** STATE VARIABLES MODIFIED
 */
 
 //#include        "ipw.h"
@@ -34,13 +35,14 @@
 
 int
 _below_thold(
-	double	threshold)	/* current timestep's threshold for a 
+		snobal_state_t *s,
+	real_t	threshold)	/* current timestep's threshold for a 
 				   layer's mass */
 {
-	if (layer_count == 0)
+	if (s->layer_count == 0)
 		return 0;
-	if (layer_count == 1)
-		return (m_s < threshold);
+	if (s->layer_count == 1)
+		return (s->m_s < threshold);
 	else  /* layer_count == 2 */
-		return ((m_s_0 < threshold) || (m_s_l < threshold));
+		return ((s->m_s_0 < threshold) || (s->m_s_l < threshold));
 }
@@ -6,7 +6,7 @@
 **      #include "_snobal.h"
 **
 **      void
-**	_calc_layers(void);
+**	_calc_layers(snobal_state_t *s);
 **
 ** DESCRIPTION
 **      This routine determines the # of layers in the snowcover based its
@@ -19,14 +19,14 @@
 **	the surface layer is the whole snowcover, and there's no lower
 **	layer.
 **
-** GLOBAL VARIABLES READ
+** STATE VARIABLES READ
 **	m_s
 **	max_z_s_0
 **	rho
 **	tstep_info
 **	z_s
 **
-** GLOBAL VARIABLES MODIFIED
+** STATE VARIABLES MODIFIED
 **	layer_count
 **	z_s
 **	z_s_0
@@ -37,40 +37,40 @@
 #include "_snobal.h"
 
 void
-_calc_layers(void)
+_calc_layers(snobal_state_t *s)
 {
-	if (m_s <= tstep_info[SMALL_TSTEP].threshold) {
+	if (s->m_s <= s->tstep_info[SMALL_TSTEP].threshold) {
 		/*
 		 *  Less than minimum layer mass, so treat as no snowcover.
 		 */
-		layer_count = 0;
-		z_s = z_s_0 = z_s_l = 0.0;
+		s->layer_count = 0;
+		s->z_s = s->z_s_0 = s->z_s_l = 0.0;
 	}
-	else if (z_s < max_z_s_0) {
+	else if (s->z_s < s->max_z_s_0) {
 		/*
 		 *  Not enough depth for surface layer and the lower layer,
 		 *  so just 1 layer: surface layer.
 		 */
-		layer_count = 1;
-		z_s_0 = z_s;
-		z_s_l = 0.0;
+		s->layer_count = 1;
+		s->z_s_0 = s->z_s;
+		s->z_s_l = 0.0;
 	}
 	else {
 		/*
 		 *  Enough depth for both layers.
 		 */
-		layer_count = 2;
-		z_s_0 = max_z_s_0;
-		z_s_l = z_s - z_s_0;
+		s->layer_count = 2;
+		s->z_s_0 = s->max_z_s_0;
+		s->z_s_l = s->z_s - s->z_s_0;
 
 		/*
 		 *  However, make sure there's enough MASS for the lower
 		 *  layer.  If not, then there's only 1 layer.
 		 */
-		if (z_s_l * rho < tstep_info[SMALL_TSTEP].threshold) {
-			layer_count = 1;
-			z_s_0 = z_s;
-			z_s_l = 0.0;
+		if (s->z_s_l * s->rho < s->tstep_info[SMALL_TSTEP].threshold) {
+			s->layer_count = 1;
+			s->z_s_0 = s->z_s;
+			s->z_s_l = 0.0;
 		}
 	}
 }
@@ -5,10 +5,10 @@
 ** SYNOPSIS
 **      #include "_snobal.h"
 **
-**      double
+**      real_t
 **	_cold_content(
-**	    double  temp,		|* temperature of layer *|
-**	    double  mass)		|* specific mass of layer *|
+**	    real_t  temp,		|* temperature of layer *|
+**	    real_t  mass)		|* specific mass of layer *|
 **
 ** DESCRIPTION
 **      This routine calculates the cold content for a layer (i.e., the
@@ -23,10 +23,10 @@
 #include        "_snobal.h"
 #include        "envphys.h"
 
-double
+real_t
 _cold_content(
-	double	temp,		/* temperature of layer */
-	double	mass)		/* specific mass of layer */
+	real_t	temp,		/* temperature of layer */
+	real_t	mass)		/* specific mass of layer */
 {
 	if (temp < FREEZE)
 	 	return heat_stor(CP_ICE(temp), mass, (temp - FREEZE));
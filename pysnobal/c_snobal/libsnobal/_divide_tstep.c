@@ -7,6 +7,7 @@
  **
  **	int
  **	_divide_tstep(
+ **	    snobal_state_t *s;
  **	    TSTEP_REC *tstep;	|* record of timestep to be divided *|
  **
  ** DESCRIPTION
@@ -30,13 +31,13 @@
  **		smaller timesteps.  An message explaining the error has
  **		been stored with the 'usrerr' routine.
  **
- ** GLOBAL VARIABLES READ
+ ** STATE VARIABLES READ
  **	layer_count
  **	precip_now
  **	ro_data
  **	tstep_info
  **
- ** GLOBAL VARIABLES MODIFIED
+ ** STATE VARIABLES MODIFIED
  */
 
 //#include	"ipw.h"
@@ -44,6 +45,7 @@
 
 int
 _divide_tstep(
+		snobal_state_t *s,
 		TSTEP_REC *tstep)	/* record of timestep to be divided */
 {
 	int	    next_level; 	/* # of next level of timestep */
@@ -54,28 +56,29 @@ _divide_tstep(
 	PRECIP_REC *next_lvl_precip;	/* -> precip data of next level */
 	int	    i;			/* loop index */
 
+	s->counts.divide_tstep[tstep->level]++;
 
 	/*
 	 *  Fetch the record for the timestep at the next level.
 	 */
 
 	next_level = tstep->level + 1;
-	next_lvl_tstep = &tstep_info[next_level]; // + next_level;
+	next_lvl_tstep = &s->tstep_info[next_level]; // + next_level;
 
 //	printf("Current %i, next %i\n", tstep->level, next_lvl_tstep->level);
 
-	curr_lvl_deltas = input_deltas + tstep->level;
-	next_lvl_deltas = input_deltas + next_level;
+	curr_lvl_deltas = s->input_deltas + tstep->level;
+	next_lvl_deltas = s->input_deltas + next_level;
 
-	curr_lvl_precip = precip_info + tstep->level;
-	next_lvl_precip = precip_info + next_level;
+	curr_lvl_precip = s->precip_info + tstep->level;
+	next_lvl_precip = s->precip_info + next_level;
 
 	/*
 	 *  If this is the first time this new level has been used during
 	 *  the current data timestep, then calculate its input deltas
 	 *  and precipitation values.
 	 */
-	if (! computed[next_level]) {
+	if (! s->computed[next_level]) {
 		next_lvl_deltas->S_n  = curr_lvl_deltas->S_n /
 				next_lvl_tstep->intervals;
 		next_lvl_deltas->I_lw = curr_lvl_deltas->I_lw /
@@ -88,11 +91,11 @@ _divide_tstep(
 				next_lvl_tstep->intervals;
 		next_lvl_deltas->T_g  = curr_lvl_deltas->T_g /
 				next_lvl_tstep->intervals;
-		if (ro_data)
+		if (s->ro_data)
 			next_lvl_deltas->ro = curr_lvl_deltas->ro /
 			next_lvl_tstep->intervals;
 
-		if (precip_now) {
+		if (s->precip_now) {
 			next_lvl_precip->m_pp   = curr_lvl_precip->m_pp /
 					next_lvl_tstep->intervals;
 			next_lvl_precip->m_rain = curr_lvl_precip->m_rain /
@@ -103,7 +106,7 @@ _divide_tstep(
 					next_lvl_tstep->intervals;
 		}
 
-		computed[next_level] = TRUE;
+		s->computed[next_level] = TRUE;
 	}
 
 	/*
@@ -111,12 +114,12 @@ _divide_tstep(
 	 *  below their mass threshold, or run the model for them.
 	 */
 	for (i = 0; i < next_lvl_tstep->intervals; i++) {
-		if ((next_level != SMALL_TSTEP) && _below_thold(next_lvl_tstep->threshold)) {
-			if (! _divide_tstep(next_lvl_tstep))
+		if ((next_level != SMALL_TSTEP) && _below_thold(s, next_lvl_tstep->threshold)) {
+			if (! _divide_tstep(s, next_lvl_tstep))
 				return FALSE;
 		}
 		else {
-			if (! _do_tstep(next_lvl_tstep))
+			if (! _do_tstep(s, next_lvl_tstep))
 				return FALSE;
 		}
 	}
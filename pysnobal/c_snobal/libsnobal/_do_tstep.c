@@ -7,6 +7,7 @@
  **
  **      int
  **	_do_tstep(
+ **	    snobal_state_t *s;
  **	    TSTEP_REC *tstep;  |* timestep's record *|
  **
  ** DESCRIPTION
@@ -41,7 +42,7 @@
  **	FALSE	An error occured, and a message explaining the error has
  **		been stored with the 'usrerr' routine.
  **
- ** GLOBAL VARIABLES READ
+ ** STATE VARIABLES READ
  **	delta_Q
  **	delta_Q_0
  **	E_s
@@ -58,7 +59,7 @@
  **	ro_predict
  **	run_no_snow
  **
- ** GLOBAL VARIABLES MODIFIED
+ ** STATE VARIABLES MODIFIED
  **	current_time
  **	curr_time_hrs
  **	delta_Q_0_bar
@@ -104,83 +105,87 @@
 
 int
 _do_tstep(
+		snobal_state_t *s,
 		TSTEP_REC *tstep)  /* timestep's record */
 {
-	time_step = tstep->time_step;
+	s->counts.do_tstep[tstep->level]++;
+
+	s->time_step = tstep->time_step;
 //	printf("%f - %i - %f - %f\n", current_time/3600.0, tstep->level, time_step, m_s);
 
-	if (precip_now) {
-		m_precip = precip_info[tstep->level].m_pp;
-		m_rain   = precip_info[tstep->level].m_rain;
-		m_snow   = precip_info[tstep->level].m_snow;
-		z_snow   = precip_info[tstep->level].z_snow;
+	if (s->precip_now) {
+		s->m_precip = s->precip_info[tstep->level].m_pp;
+		s->m_rain   = s->precip_info[tstep->level].m_rain;
+		s->m_snow   = s->precip_info[tstep->level].m_snow;
+		s->z_snow   = s->precip_info[tstep->level].z_snow;
 	}
 
-	h2o_total = 0.0;
+	s->h2o_total = 0.0;
 
 	/*
 	 *  Is there a snowcover?
 	 */
-	snowcover = (layer_count > 0);
+	s->snowcover = (s->layer_count > 0);
 
 	/*
 	 *  Calculate energy transfer terms
 	 */
-	if (! _e_bal())
+	if (! _e_bal(s))
 		return FALSE;
 
 	/*
 	 *  Adjust mass and calculate runoff
 	 */
-	_mass_bal();
+	if (! _mass_bal(s))
+		return FALSE;
 
 	/*
 	 *  Update the averages for the energy terms and the totals for mass
 	 *  changes since the last output.
 	 */
-	if (time_since_out > 0.0) {
-		R_n_bar       = TIME_AVG(R_n_bar, 	time_since_out,
-				R_n, 		time_step);
-		H_bar         = TIME_AVG(H_bar, 	time_since_out,
-				H, 		time_step);
-		L_v_E_bar     = TIME_AVG(L_v_E_bar, 	time_since_out,
-				L_v_E, 	time_step);
-		G_bar         = TIME_AVG(G_bar, 	time_since_out,
-				G, 		time_step);
-		M_bar         = TIME_AVG(M_bar, 	time_since_out,
-				M, 		time_step);
-		delta_Q_bar   = TIME_AVG(delta_Q_bar,	time_since_out,
-				delta_Q, 	time_step);
-		G_0_bar       = TIME_AVG(G_0_bar, 	time_since_out,
-				G_0, 		time_step);
-		delta_Q_0_bar = TIME_AVG(delta_Q_0_bar, time_since_out,
-				delta_Q_0, 	time_step);
-
-		E_s_sum     += E_s;
-		melt_sum    += melt;
-		ro_pred_sum += ro_predict;
-
-		time_since_out += time_step;
+	if (s->time_since_out > 0.0) {
+		s->R_n_bar       = TIME_AVG(s->R_n_bar, 	s->time_since_out,
+				s->R_n, 		s->time_step);
+		s->H_bar         = TIME_AVG(s->H_bar, 	s->time_since_out,
+				s->H, 		s->time_step);
+		s->L_v_E_bar     = TIME_AVG(s->L_v_E_bar, 	s->time_since_out,
+				s->L_v_E, 	s->time_step);
+		s->G_bar         = TIME_AVG(s->G_bar, 	s->time_since_out,
+				s->G, 		s->time_step);
+		s->M_bar         = TIME_AVG(s->M_bar, 	s->time_since_out,
+				s->M, 		s->time_step);
+		s->delta_Q_bar   = TIME_AVG(s->delta_Q_bar,	s->time_since_out,
+				s->delta_Q, 	s->time_step);
+		s->G_0_bar       = TIME_AVG(s->G_0_bar, 	s->time_since_out,
+				s->G_0, 		s->time_step);
+		s->delta_Q_0_bar = TIME_AVG(s->delta_Q_0_bar, s->time_since_out,
+				s->delta_Q_0, 	s->time_step);
+
+		s->E_s_sum     += s->E_s;
+		s->melt_sum    += s->melt;
+		s->ro_pred_sum += s->ro_predict;
+
+		s->time_since_out += s->time_step;
 	}
 	else {
-		R_n_bar = R_n;
-		H_bar = H;
-		L_v_E_bar = L_v_E;
-		G_bar = G;
-		M_bar = M;
-		delta_Q_bar = delta_Q;
-		G_0_bar = G_0;
-		delta_Q_0_bar = delta_Q_0;
-
-		E_s_sum     = E_s;
-		melt_sum    = melt;
-		ro_pred_sum = ro_predict;
-
-		time_since_out = time_step;
+		s->R_n_bar = s->R_n;
+		s->H_bar = s->H;
+		s->L_v_E_bar = s->L_v_E;
+		s->G_bar = s->G;
+		s->M_bar = s->M;
+		s->delta_Q_bar = s->delta_Q;
+		s->G_0_bar = s->G_0;
+		s->delta_Q_0_bar = s->delta_Q_0;
+
+		s->E_s_sum     = s->E_s;
+		s->melt_sum    = s->melt;
+		s->ro_pred_sum = s->ro_predict;
+
+		s->time_since_out = s->time_step;
 	}
 
 	/* increment time */
-	current_time += time_step;
+	s->current_time += s->time_step;
 
 //	if (tstep->output & WHOLE_TSTEP) {
 //		(*out_func)();
@@ -191,14 +196,14 @@ _do_tstep(
 	/*
 	 *  Update the model's input parameters
 	 */
-	S_n  += input_deltas[tstep->level].S_n;
-	I_lw += input_deltas[tstep->level].I_lw;
-	T_a  += input_deltas[tstep->level].T_a;
-	e_a  += input_deltas[tstep->level].e_a;
-	u    += input_deltas[tstep->level].u;
-	T_g  += input_deltas[tstep->level].T_g;
-	if (ro_data)
-		ro += input_deltas[tstep->level].ro;
+	s->S_n  += s->input_deltas[tstep->level].S_n;
+	s->I_lw += s->input_deltas[tstep->level].I_lw;
+	s->T_a  += s->input_deltas[tstep->level].T_a;
+	s->e_a  += s->input_deltas[tstep->level].e_a;
+	s->u    += s->input_deltas[tstep->level].u;
+	s->T_g  += s->input_deltas[tstep->level].T_g;
+	if (s->ro_data)
+		s->ro += s->input_deltas[tstep->level].ro;
 
 	return TRUE;
 }
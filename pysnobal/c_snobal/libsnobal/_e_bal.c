@@ -6,7 +6,7 @@
  **      #include "_snobal.h"
  **
  **      int
- **	_e_bal(void)
+ **	_e_bal(snobal_state_t *s)
  **
  ** DESCRIPTION
  **      Calculates point energy budget for 2-layer snowcover.
@@ -18,9 +18,9 @@
  **	FALSE	An error occured, and a message explaining the error has
  **		been stored with the 'usrerr' routine.
  **
- ** GLOBAL VARIABLES READ
+ ** STATE VARIABLES READ
  **
- ** GLOBAL VARIABLES MODIFIED
+ ** STATE VARIABLES MODIFIED
  **
  */
 
@@ -29,58 +29,63 @@
 #include        "snow.h"
 
 int    
-_e_bal(void)
+_e_bal(snobal_state_t *s)
 {
-	if (snowcover) {
+	if (s->snowcover) {
 
 		/**	calculate energy xfer terms  **/
 
 		/*      calculate net radiation */
 
-		_net_rad();
+		_net_rad(s);
 
 		/*      calculate H & L_v_E  (and E as well)       */
 
-		if (! _h_le())
+		if (! _h_le(s))
 			return FALSE;
 
 		/*      calculate G & G_0(conduction/diffusion heat xfr)    */
 
-		if (layer_count == 1) {
-			G = g_soil (rho, T_s_0, T_g, z_s_0, z_g, P_a);
-			G_0 = G;
+		if (s->layer_count == 1) {
+			if (! g_soil (s->rho, s->T_s_0, s->T_g, s->z_s_0, s->z_g, s->P_a,
+					s->sat_table, &s->G))
+				return FALSE;
+			s->G_0 = s->G;
 		}
 		else {  /*  layer_count == 2  */
-			G = g_soil (rho, T_s_l, T_g, z_s_l, z_g, P_a);
-			G_0 = g_snow (rho, rho, T_s_0, T_s_l, z_s_0, z_s_l,
-					P_a);
+			if (! g_soil (s->rho, s->T_s_l, s->T_g, s->z_s_l, s->z_g, s->P_a,
+					s->sat_table, &s->G))
+				return FALSE;
+			if (! g_snow (s->rho, s->rho, s->T_s_0, s->T_s_l, s->z_s_0,
+					s->z_s_l, s->P_a, s->sat_table, &s->G_0))
+				return FALSE;
 		}
 
 		/*      calculate advection     */
 
-		_advec();
+		_advec(s);
 
 		/*      sum E.B. terms  */
 
 		/* surface energy budget */
-		delta_Q_0 = R_n + H + L_v_E + G_0 + M;
+		s->delta_Q_0 = s->R_n + s->H + s->L_v_E + s->G_0 + s->M;
 
 		/* total snowpack energy budget */
-		if (layer_count == 1)
-			delta_Q = delta_Q_0;
+		if (s->layer_count == 1)
+			s->delta_Q = s->delta_Q_0;
 		else  /* layer_count == 2 */
-			delta_Q = delta_Q_0 + G - G_0;
+			s->delta_Q = s->delta_Q_0 + s->G - s->G_0;
 	}
 	else {
-		R_n = 0.0;
+		s->R_n = 0.0;
 
-		H = L_v_E = E = 0.0;
+		s->H = s->L_v_E = s->E = 0.0;
 
-		G = G_0 = 0.0;
+		s->G = s->G_0 = 0.0;
 
-		M = 0.0;
+		s->M = 0.0;
 
-		delta_Q = delta_Q_0 = 0.0;
+		s->delta_Q = s->delta_Q_0 = 0.0;
 	}
 
 	return TRUE;
@@ -1,8 +1,30 @@
 #ifndef _ENVPHYS_H
 #define _ENVPHYS_H
 
-extern void	_bdinit(double z, double z0, double t, double t0,
-			double q, double q0, double u, double u0,
-			double *ustar, double *tstar, double *qstar);
+extern void	_bdinit(real_t z, real_t z0, real_t t, real_t t0,
+			real_t q, real_t q0, real_t u, real_t u0,
+			real_t *ustar, real_t *tstar, real_t *qstar);
+
+/*
+ *  Tabulated saturation vapor pressures, see sat_table.c
+ */
+
+#define SAT_TABLE_MIN	150.0	/* first temperature in the tables (K) */
+#define SAT_TABLE_MAX	350.0	/* last temperature in the tables (K) */
+#define SAT_TABLE_STEP	0.1	/* temperature step (K) */
+#define SAT_TABLE_N	2001	/* # of temperatures in the tables */
+
+/*
+ *  Is tk within the tables, with the points for the cubic on either side?
+ */
+#define SAT_TABLE_IN(tk)	\
+		(((tk) >= SAT_TABLE_MIN + SAT_TABLE_STEP) && \
+				((tk) < SAT_TABLE_MAX - 2 * SAT_TABLE_STEP))
+
+extern real_t	_sati_table[SAT_TABLE_N];
+extern real_t	_satw_table[SAT_TABLE_N];
+
+extern real_t	_sat_table(const real_t *table, real_t tk);
+extern real_t	_sati_ice(real_t tk);
 
 #endif  /* _ENVPHYS_H */
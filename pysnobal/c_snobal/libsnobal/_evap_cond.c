@@ -6,7 +6,7 @@
  **      #include "_snobal.h"
  **
  **      void
- **	_evap_cond(void)
+ **	_evap_cond(snobal_state_t *s)
  **
  ** DESCRIPTION
  **      Calculates mass lost or gained by evaporation/condensation
@@ -16,7 +16,7 @@
  **      vaporization to sublimation (0.882); Half the ice lost as evap
  **      is assumed to be lost depth; the rest reduces the density;
  **
- ** GLOBAL VARIABLES READ
+ ** STATE VARIABLES READ
  **	E
  **	layer_count
  **	P_a
@@ -27,7 +27,7 @@
  **	time_step
  **	z_g
  **
- ** GLOBAL VARIABLES MODIFIED
+ ** STATE VARIABLES MODIFIED
  **	E_s h2o_total
  **
  **	(and those variables modified by "_adj_snow")
@@ -40,93 +40,95 @@
 #define VAP_SUB (2.501 / 2.835) /* ratio vaporization to sublimatin */
 
 int
-_evap_cond(void)
+_evap_cond(snobal_state_t *s)
 {
-	double  E_s_0;          /* mass of evaporation to air (kg/m^2) */
-	double  E_s_l;          /* mass of evaporation to soil (kg/m^2) */
-	double  E_l;		/* mass flux by evap/cond to soil (kg/m^2/s) */
-	double  e_g;            /* soil vapor press */
-	double  e_s_l;          /* lower snow layer's vapor press */
-	double  k;              /* soil diffusion coef */
-	double  prev_h2o_tot;	/* previous value of h2o_total variable */
-	double  q_delta;        /* difference between snow & soil spec hum's */
-	double  q_g;            /* soil spec hum */
-	double  q_s_l;          /* lower snow layer's spec hum */
-	double  rho_air;        /* air density */
-	double  T_bar;          /* snow-soil mean temp */
+	real_t  E_s_0;          /* mass of evaporation to air (kg/m^2) */
+	real_t  E_s_l;          /* mass of evaporation to soil (kg/m^2) */
+	real_t  E_l;		/* mass flux by evap/cond to soil (kg/m^2/s) */
+	real_t  e_g;            /* soil vapor press */
+	real_t  e_s_l;          /* lower snow layer's vapor press */
+	real_t  k;              /* soil diffusion coef */
+	real_t  prev_h2o_tot;	/* previous value of h2o_total variable */
+	real_t  q_delta;        /* difference between snow & soil spec hum's */
+	real_t  q_g;            /* soil spec hum */
+	real_t  q_s_l;          /* lower snow layer's spec hum */
+	real_t  rho_air;        /* air density */
+	real_t  T_bar;          /* snow-soil mean temp */
 
 	/*      calculate evaporation or condensation   */
 
 	/*
 	 *  If no snow on ground at start of timestep, then just exit.
 	 */
-	if (!snowcover) {
-		E_s = 0.0;
+	if (!s->snowcover) {
+		s->E_s = 0.0;
 		return TRUE;
 	}
 //	printf("-ev Tsl %f Ts0 %f Tg %f-", T_s_l, T_s_0, T_g);
 	/*
 	 *  Total mass change due to evap/cond at surface during timestep
 	 */
-	E_s_0 = E * time_step;
+	E_s_0 = s->E * s->time_step;
 
 	/*
 	 *  Adjust total h2o for evaporative losses
 	 */
-	prev_h2o_tot = h2o_total;
+	prev_h2o_tot = s->h2o_total;
 
-	if (h2o_total > 0.0) {
-		h2o_total += (E_s_0 * VAP_SUB);
-		if (h2o_total <= 0.0)
-			h2o_total = 0.0;
+	if (s->h2o_total > 0.0) {
+		s->h2o_total += (E_s_0 * VAP_SUB);
+		if (s->h2o_total <= 0.0)
+			s->h2o_total = 0.0;
 	}
 
 	/*
 	 *  Determine total mass change due to evap/cond at soil
 	 */
-	if (layer_count == 0) 
+	if (s->layer_count == 0) 
 		E_s_l = 0.0;
 	else {
-		if (layer_count == 2) {
-			e_s_l = sati(T_s_l);
+		if (s->layer_count == 2) {
+			e_s_l = sati(s->T_s_l, s->sat_table);
 			if (e_s_l == FALSE)
 				return FALSE;
-			T_bar = (T_g + T_s_l) / 2.0;
+			T_bar = (s->T_g + s->T_s_l) / 2.0;
 		}
 		else {  /* layer_count == 1 */
-			e_s_l = sati(T_s_0);
+			e_s_l = sati(s->T_s_0, s->sat_table);
 			if (e_s_l == FALSE)
 				return FALSE;
-			T_bar = (T_g + T_s_0) / 2.0;
+			T_bar = (s->T_g + s->T_s_0) / 2.0;
 		}
 
-		q_s_l = SPEC_HUM(e_s_l, P_a);
-		e_g = sati(T_g);
-		q_g = SPEC_HUM(e_g, P_a);
+		q_s_l = SPEC_HUM(e_s_l, s->P_a);
+		e_g = sati(s->T_g, s->sat_table);
+		if (e_g == FALSE)
+			return FALSE;
+		q_g = SPEC_HUM(e_g, s->P_a);
 		q_delta = q_g - q_s_l;
-		rho_air = GAS_DEN(P_a, MOL_AIR, T_bar);
-		k = DIFFUS(P_a, T_bar);
+		rho_air = GAS_DEN(s->P_a, MOL_AIR, T_bar);
+		k = DIFFUS(s->P_a, T_bar);
 
-		E_l = EVAP(rho_air, k, q_delta, z_g);
+		E_l = EVAP(rho_air, k, q_delta, s->z_g);
 
 		/* total mass of evap/cond for time step */
-		E_s_l = E_l * time_step;
+		E_s_l = E_l * s->time_step;
 
 		/** adjust h2o_total for evaporative losses **/
-		if (h2o_total > 0.0) {
-			h2o_total += (E_s_l * VAP_SUB);
-			if (h2o_total <= 0.0)
-				h2o_total = 0.0;
+		if (s->h2o_total > 0.0) {
+			s->h2o_total += (E_s_l * VAP_SUB);
+			if (s->h2o_total <= 0.0)
+				s->h2o_total = 0.0;
 		}
 	}
 
-	E_s = E_s_0 + E_s_l;
+	s->E_s = E_s_0 + E_s_l;
 
 	/*      adj mass and depth for evap/cond        */
 
-	if (layer_count > 0)
-		_adj_snow( ((E_s + (prev_h2o_tot - h2o_total)) / rho) / 2.0,
-				E_s);
+	if (s->layer_count > 0)
+		_adj_snow(s,  ((s->E_s + (prev_h2o_tot - s->h2o_total)) / s->rho) / 2.0,
+				s->E_s);
 
 	return TRUE;
 }
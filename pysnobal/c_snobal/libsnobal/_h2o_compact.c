@@ -6,7 +6,7 @@
  **      #include "_snobal.h"
  **
  **      void
- **	_h2o_compact(void)
+ **	_h2o_compact(snobal_state_t *s)
  **
  ** DESCRIPTION
  **	This routine compacts or densifies the snowcover based on the
@@ -41,12 +41,12 @@
  **      		0	B: 5 %			     1.0
  **
  **
- ** GLOBAL VARIABLES READ
+ ** STATE VARIABLES READ
  **	m_rain
  **	m_s
  **	melt
  **
- ** GLOBAL VARIABLES MODIFIED
+ ** STATE VARIABLES MODIFIED
  **	rho
  **
  */
@@ -69,31 +69,31 @@
 
 
 void
-_h2o_compact(void)
+_h2o_compact(snobal_state_t *s)
 {	
-	double  A;		/* difference between maximum & current
+	real_t  A;		/* difference between maximum & current
 				   densities */
-	double	h2o_added;	/* ratio of mass of liquid H2O added from
+	real_t	h2o_added;	/* ratio of mass of liquid H2O added from
 			   	   melting and rain to mass of snowcover */
 
 	/*
 	 *  If the snow is already at or above the maximum density due
 	 *  compaction by liquid H2O, then just leave.
 	 */
-	if ((!snowcover) || (rho > MAX_DENSITY))
+	if ((!s->snowcover) || (s->rho > MAX_DENSITY))
 		return;
 
-	A = MAX_DENSITY - rho;
-	if (precip_now)
-		h2o_added = (melt + m_rain) / m_s;
+	A = MAX_DENSITY - s->rho;
+	if (s->precip_now)
+		h2o_added = (s->melt + s->m_rain) / s->m_s;
 	else
-		h2o_added = melt / m_s;
+		h2o_added = s->melt / s->m_s;
 	if (h2o_added > 0.000001) {
-		rho += A / (1 + B/h2o_added);
+		s->rho += A / (1 + B/h2o_added);
 
 		/*
 		 *  Adjust the snowcover for this new density.
 		 */
-		_new_density();
+		_new_density(s);
 	}
 }
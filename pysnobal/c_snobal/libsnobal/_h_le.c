@@ -6,63 +6,84 @@
  **      #include "_snobal.h"
  **
  **      int
- **	_h_le(void)
+ **	_h_le(snobal_state_t *s)
  **
  ** DESCRIPTION
  **      Calculates point turbulent transfer (H and L_v_E) for a 2-layer
  **	snowcover.
  **
- ** GLOBAL VARIABLES READ
+ **	With hle1_warm_start in the state hle1 starts from the Obukhov length
+ **	of the previous run timestep in the data timestep instead of from
+ **	neutral stability.  The solution is the same to within the
+ **	convergence threshold of hle1 in fewer iterations.
  **
- ** GLOBAL VARIABLES MODIFIED
+ ** STATE VARIABLES READ
+ **	hle1_warm_start
+ **	lo
+ **
+ ** STATE VARIABLES MODIFIED
+ **	lo
  **
  */
 
+#include	<math.h>
 //#include        "ipw.h"
 #include        "_snobal.h"
 #include        "envphys.h"
 
 int
-_h_le(void)
+_h_le(snobal_state_t *s)
 {
-	double  e_s;
-	double	sat_vp;
-	double	rel_z_T;  /* relative z_T (temperature measurement
+	real_t  e_s;
+	real_t	sat_vp;
+	real_t	rel_z_T;  /* relative z_T (temperature measurement
 			     height) above snow surface */
-	double	rel_z_u;  /* relative z_u (windspeed measurement
+	real_t	rel_z_u;  /* relative z_u (windspeed measurement
 			     height) above snow surface */
+	real_t	l_ob;	  /* Obukhov length for hle1 */
+	int	ier;	  /* return code of hle1 */
+	int	iter;	  /* hle1 iterations */
 
 	/* calculate saturation vapor pressure */
 	//	printf("-Ts0 %f Ta %f-", T_s_0, T_a);
-	e_s = sati(T_s_0);
+	e_s = sati(s->T_s_0, s->sat_table);
 	if (e_s == FALSE)
 		return FALSE;
 
 
 	/*** error check for bad vapor pressures ***/
 
-	sat_vp = sati(T_a);
+	sat_vp = sati(s->T_a, s->sat_table);
 	if (sat_vp == FALSE)
 		return FALSE;
-	if (e_a > sat_vp) {
-		e_a = sat_vp;
+	if (s->e_a > sat_vp) {
+		s->e_a = sat_vp;
 	}
 
 	/* determine relative measurement heights */
-	if (relative_hts) {
-		rel_z_T = z_T;
-		rel_z_u = z_u;
+	if (s->relative_hts) {
+		rel_z_T = s->z_T;
+		rel_z_u = s->z_u;
 	} else {
-		rel_z_T = z_T - z_s;
-		rel_z_u = z_u - z_s;
+		rel_z_T = s->z_T - s->z_s;
+		rel_z_u = s->z_u - s->z_s;
 	}
 
 	/* calculate H & L_v_E */
 
-	if (hle1 (P_a, T_a, T_s_0, rel_z_T, e_a, e_s, rel_z_T, u,
-			rel_z_u, z_0, &H, &L_v_E, &E) != 0) {
+	l_ob = s->hle1_warm_start ? s->lo : HUGE_VAL;
+	ier = hle1_iter(s->P_a, s->T_a, s->T_s_0, rel_z_T, s->e_a, e_s, rel_z_T,
+			s->u, rel_z_u, s->z_0, s->sat_table, &s->H, &s->L_v_E,
+			&s->E, &l_ob, &iter);
+	s->lo = l_ob;
+	s->counts.hle1_calls++;
+	s->counts.hle1_iter += iter;
+	if (ier == -1)
+		s->counts.hle1_fail++;
+
+	if (ier != 0) {
 //		usrerr("hle1 did not converge\nP_a %f, T_a %f, T_s_0 %f\nrelative z_T %f, e_a %f, e_s %f\nu %f, relative z_u %f, z_0 %f\n", P_a, T_a, T_s_0, rel_z_T, e_a, e_s, u, rel_z_u, z_0);
-		fprintf(stderr, "hle1 did not converge\nP_a %f, T_a %f, T_s_0 %f\nrelative z_T %f, e_a %f, e_s %f\nu %f, relative z_u %f, z_0 %f\n", P_a, T_a, T_s_0, rel_z_T, e_a, e_s, u, rel_z_u, z_0);
+		fprintf(stderr, "hle1 did not converge\nP_a %f, T_a %f, T_s_0 %f\nrelative z_T %f, e_a %f, e_s %f\nu %f, relative z_u %f, z_0 %f\n", s->P_a, s->T_a, s->T_s_0, rel_z_T, s->e_a, e_s, s->u, rel_z_u, s->z_0);
 
 		return FALSE;
 	}
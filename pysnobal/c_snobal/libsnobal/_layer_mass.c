@@ -6,20 +6,20 @@
 **      #include "_snobal.h"
 **
 **      void
-**	_layer_mass(void)
+**	_layer_mass(snobal_state_t *s)
 **
 ** DESCRIPTION
 **      This routine computes the specific mass for each snow layer in
 **	the snowcover.  A layer's mass is based its depth and the
 **	average snowcover density.
 **
-** GLOBAL VARIABLES READ
+** STATE VARIABLES READ
 **	layer_count
 **	rho
 **	z_s_0
 **	z_s_l
 **
-** GLOBAL VARIABLES MODIFIED
+** STATE VARIABLES MODIFIED
 **	m_s_0
 **	m_s_l
 */
@@ -28,17 +28,17 @@
 #include "_snobal.h"
 
 void
-_layer_mass(void)
+_layer_mass(snobal_state_t *s)
 {
-	if (layer_count == 0) {
-		m_s_0 = 0.0;
-		m_s_l = 0.0;
+	if (s->layer_count == 0) {
+		s->m_s_0 = 0.0;
+		s->m_s_l = 0.0;
 	}
 	else {  /* layer_count is 1 or 2 */
-		m_s_0 = rho * z_s_0;
-		if (layer_count == 2)
-			m_s_l = rho * z_s_l;
+		s->m_s_0 = s->rho * s->z_s_0;
+		if (s->layer_count == 2)
+			s->m_s_l = s->rho * s->z_s_l;
 		else
-			m_s_l = 0.0;
+			s->m_s_l = 0.0;
 	}
 }
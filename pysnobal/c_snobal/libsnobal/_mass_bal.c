@@ -5,16 +5,23 @@
  ** SYNOPSIS
  **      #include "_snobal.h"
  **
- **      void
- **	_mass_bal(void)
+ **      int
+ **	_mass_bal(snobal_state_t *s)
  **
  ** DESCRIPTION
  **      Calculates the point mass budget for 2-layer energy budget snowmelt
  **	model.  It then solves for new snow temperatures.
  **
- ** GLOBAL VARIABLES READ
+ ** RETURN VALUE
  **
- ** GLOBAL VARIABLES MODIFIED
+ **	TRUE	The calculations were completed.
+ **
+ **	FALSE	An error occured, and a message explaining the error has
+ **		been stored with the 'usrerr' routine.
+ **
+ ** STATE VARIABLES READ
+ **
+ ** STATE VARIABLES MODIFIED
  **
  */
 
@@ -23,50 +30,52 @@
 #include        "snow.h"
 
 int
-_mass_bal(void)
+_mass_bal(snobal_state_t *s)
 {
 	/***    adjust mass and calc. runoff    ***/
 
 	/*	age snow by compacting snow due to time passing */
-	_time_compact();
+	_time_compact(s);
 
 	/*	process precipitation event */
-	_precip();
+	_precip(s);
 
 	/*      calculate melt or freezing and adjust cold content */
 
-	_snowmelt();
+	_snowmelt(s);
 
 	/*      calculate evaporation and adjust snowpack       */
 
-	if(! _evap_cond())
+	if(! _evap_cond(s))
 		return FALSE;
 
 
 	/*	compact snow due to H2O generated (melt & rain) */
-	_h2o_compact();
+	_h2o_compact(s);
 
 	/*      calculate runoff, and adjust snowcover */
 
-	_runoff();
+	_runoff(s);
 
 	/*
 	 *  adjust layer temps if there was a snowcover at start of thes
 	 *  timestep and there's still snow on the ground
 	 */
-	if (snowcover) {
-		if (layer_count == 1) {
-			T_s_0 = new_tsno (m_s_0, T_s_0, cc_s_0);
-			T_s = T_s_0;
+	if (s->snowcover) {
+		if (s->layer_count == 1) {
+			s->T_s_0 = new_tsno (s->m_s_0, s->T_s_0, s->cc_s_0);
+			s->T_s = s->T_s_0;
 		}
-		else if (layer_count == 2) {
-			if (isothermal)
-				T_s = T_s_l = T_s_0 = FREEZE;
+		else if (s->layer_count == 2) {
+			if (s->isothermal)
+				s->T_s = s->T_s_l = s->T_s_0 = FREEZE;
 			else {
-				T_s_0 = new_tsno (m_s_0, T_s_0, cc_s_0);
-				T_s_l = new_tsno (m_s_l, T_s_l, cc_s_l);
-				T_s = new_tsno (m_s, T_s, cc_s);
+				s->T_s_0 = new_tsno (s->m_s_0, s->T_s_0, s->cc_s_0);
+				s->T_s_l = new_tsno (s->m_s_l, s->T_s_l, s->cc_s_l);
+				s->T_s = new_tsno (s->m_s, s->T_s, s->cc_s);
 			}
 		}
 	}
+
+	return TRUE;
 }
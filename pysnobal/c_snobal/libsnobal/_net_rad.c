@@ -7,19 +7,19 @@
 **	#include "_snobal.h"
 **
 **      void
-**	_net_rad(void)
+**	_net_rad(snobal_state_t *s)
 **
 ** DESCRIPTION
 **      Calculates net allwave radiation from the net solar radiation
 **	incoming thermal/longwave radiation, and the snow surface
 **	temperature.
 **
-** GLOBAL VARIABLES READ
+** STATE VARIABLES READ
 **	I_lw
 **	S_n
 **	T_s_0
 **
-** GLOBAL VARIABLES MODIFIED
+** STATE VARIABLES MODIFIED
 **	R_n
 */
 
@@ -31,7 +31,7 @@
 #include "radiation.h"
 
 void
-_net_rad(void)
+_net_rad(snobal_state_t *s)
 {
-	R_n = S_n + (SNOW_EMISSIVITY * (I_lw - STEF_BOLTZ * pow(T_s_0, 4)));
+	s->R_n = s->S_n + (SNOW_EMISSIVITY * (s->I_lw - STEF_BOLTZ * pow(s->T_s_0, 4)));
 }
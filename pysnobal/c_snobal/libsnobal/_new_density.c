@@ -6,17 +6,17 @@
 **      #include "_snobal.h"
 **
 **      void
-**	_new_density(void)
+**	_new_density(snobal_state_t *s)
 **
 ** DESCRIPTION
 **      This routine adjusts the snowcover's depth for a new density.  The
 **	layers are also adjusted accordingly.
 **
-** GLOBAL VARIABLES READ
+** STATE VARIABLES READ
 **	m_s	
 **	rho
 **
-** GLOBAL VARIABLES MODIFIED
+** STATE VARIABLES MODIFIED
 **	z_s
 **
 **	(and those variables modified by "_adj_layers")
@@ -26,9 +26,9 @@
 #include "_snobal.h"
 
 void
-_new_density(void)
+_new_density(snobal_state_t *s)
 {
-	z_s = m_s / rho;
+	s->z_s = s->m_s / s->rho;
 
-	_adj_layers();
+	_adj_layers(s);
 }
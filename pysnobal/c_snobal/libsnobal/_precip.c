@@ -6,7 +6,7 @@
  **	#include "_snobal.h"
  **
  **      void
- **	_precip(void)
+ **	_precip(snobal_state_t *s)
  **
  ** DESCRIPTION
  **      This routine processes a precipitation event, i.e., the current
@@ -14,7 +14,7 @@
  **	determines if the precip is rain or snow which increases the
  **	snowcover.
  **
- ** GLOBAL VARIABLES READ
+ ** STATE VARIABLES READ
  **	h2o_sat_snow
  **	m_rain
  **	m_precip
@@ -25,7 +25,7 @@
  **	T_snow
  **	z_snow
  **
- ** GLOBAL VARIABLES MODIFIED
+ ** STATE VARIABLES MODIFIED
  **	h2o
  **	h2o_sat
  **	h2o_total
@@ -40,40 +40,40 @@
 #include "_snobal.h"
 
 void
-_precip(void)
+_precip(snobal_state_t *s)
 {
-	double	h2o_vol_snow;	/* liquid water content of new snowfall as
+	real_t	h2o_vol_snow;	/* liquid water content of new snowfall as
 				   volume ratio */
 
-	if (precip_now) {
-		if (snowcover) {
+	if (s->precip_now) {
+		if (s->snowcover) {
 			/*
 			 *  Adjust snowcover's depth and mass by snowfall's
 			 *  depth and the total precipitation mass.
 			 */
-			_adj_snow(z_snow, m_precip);
+			_adj_snow(s, s->z_snow, s->m_precip);
 
 			/*
 			 *  Determine the additional liquid water that's in
 			 *  the snowfall, and then add its mass to liquid
 			 *  water in the whole snowcover.
 			 */
-			h2o_vol_snow = h2o_sat_snow * max_h2o_vol;
-			h2o += H2O_LEFT(z_snow, rho_snow, h2o_vol_snow);
+			h2o_vol_snow = s->h2o_sat_snow * s->max_h2o_vol;
+			s->h2o += H2O_LEFT(s->z_snow, s->rho_snow, h2o_vol_snow);
 		}
 		else {
 			/*
 			 *  Use snowfall, if any, to setup a new snowcover.
 			 */
-			if (m_snow > 0.0) {
-				z_s = z_snow;
-				rho = rho_snow;
-				T_s = T_snow;
-				T_s_0 = T_snow;
-				T_s_l = T_snow;
-				h2o_sat = h2o_sat_snow;
+			if (s->m_snow > 0.0) {
+				s->z_s = s->z_snow;
+				s->rho = s->rho_snow;
+				s->T_s = s->T_snow;
+				s->T_s_0 = s->T_snow;
+				s->T_s_l = s->T_snow;
+				s->h2o_sat = s->h2o_sat_snow;
 
-				init_snow();
+				init_snow(s);
 			}
 		}
 
@@ -81,11 +81,11 @@ _precip(void)
 		 *  Add rainfall and water in the snowcover to total
 		 *  liquid water.
 		 */
-		h2o_total += h2o + m_rain;
+		s->h2o_total += s->h2o + s->m_rain;
 	}
 	else
 		/*
 		 *  Add water in the snowcover to total liquid water.
 		 */
-		h2o_total += h2o;
+		s->h2o_total += s->h2o;
 }
@@ -6,19 +6,19 @@
  **      #include "_snobal.h"
  **
  **      void
- **	_runoff(void)
+ **	_runoff(snobal_state_t *s)
  **
  ** DESCRIPTION
  **      Calculates runoff for point energy budget 2-layer snowmelt model
  **
- ** GLOBAL VARIABLES READ
+ ** STATE VARIABLES READ
  **	h2o_total
  **	layer_count
  **	snowcover
  **	max_h2o_vol
  **	z_s
  **
- ** GLOBAL VARIABLES MODIFIED
+ ** STATE VARIABLES MODIFIED
  **	h2o
  **	h2o_max
  **	h2o_sat
@@ -32,10 +32,10 @@
 #include        "snow.h"
 
 void
-_runoff(void)
+_runoff(snobal_state_t *s)
 {
-	double	m_s_dry;	/* snowcover's mass without liquid H2O */
-	double	rho_dry;	/* snow density without liquid H2O */
+	real_t	m_s_dry;	/* snowcover's mass without liquid H2O */
+	real_t	rho_dry;	/* snow density without liquid H2O */
 
 	/* calculate runoff */
 
@@ -43,8 +43,8 @@ _runoff(void)
 	 *  If no snow on ground at start of timestep or no layers currently,
 	 *  then all water (e.g., rain) is runoff.
 	 */
-	if ((!snowcover) || (layer_count == 0)) {
-		ro_predict = h2o_total;
+	if ((!s->snowcover) || (s->layer_count == 0)) {
+		s->ro_predict = s->h2o_total;
 		return;
 	}
 
@@ -52,28 +52,28 @@ _runoff(void)
 	 *  Determine the snow density without any water, and the maximum
 	 *  liquid water the snow can hold.
 	 */
-	m_s_dry = m_s - h2o_total;
-	rho_dry = m_s_dry / z_s;
-	h2o_max = H2O_LEFT(z_s, rho_dry, max_h2o_vol);
+	m_s_dry = s->m_s - s->h2o_total;
+	rho_dry = m_s_dry / s->z_s;
+	s->h2o_max = H2O_LEFT(s->z_s, rho_dry, s->max_h2o_vol);
 
 	/*
 	 *  Determine runoff, and water left in the snow
 	 */
-	if (h2o_total > h2o_max) {
-		ro_predict = h2o_total - h2o_max;
-		h2o = h2o_max;
-		h2o_sat = 1.0;
-		h2o_vol = max_h2o_vol;
+	if (s->h2o_total > s->h2o_max) {
+		s->ro_predict = s->h2o_total - s->h2o_max;
+		s->h2o = s->h2o_max;
+		s->h2o_sat = 1.0;
+		s->h2o_vol = s->max_h2o_vol;
 
 		/*
 		 *  Update the snowcover's mass for the loss of runoff.
 		 */
-		_adj_snow(0.0, -ro_predict);
+		_adj_snow(s, 0.0, -s->ro_predict);
 	}
 	else {
-		ro_predict = 0.0;
-		h2o = h2o_total;
-		h2o_sat = h2o / h2o_max;
-		h2o_vol = h2o_sat * max_h2o_vol;
+		s->ro_predict = 0.0;
+		s->h2o = s->h2o_total;
+		s->h2o_sat = s->h2o / s->h2o_max;
+		s->h2o_vol = s->h2o_sat * s->max_h2o_vol;
 	}
 }
@@ -17,55 +17,26 @@
  *  Private routines in the snobal library.
  */
 
-extern void         _adj_layers	(void);
-extern void	      _adj_snow	(double delta_z_s, double delta_m_s);
-extern void              _advec	(void);
-extern int	   _below_thold	(double threshold);
-extern void        _calc_layers	(void);
-extern double	  _cold_content	(double temp, double mass);
-extern int	  _divide_tstep	(TSTEP_REC * tstep);
-extern int	      _do_tstep	(TSTEP_REC * tstep);
-extern int               _e_bal	(void);
-extern int          _evap_cond (void);
-extern void        _h2o_compact (void);
-extern int      	  _h_le (void);
-extern void         _layer_mass (void);
-extern int            _mass_bal (void);
-extern void            _net_rad (void);
-extern void        _new_density (void);
-extern void         _open_files (void);
-extern void             _precip (void);
-extern void             _runoff (void);
-extern void           _snowmelt (void);
-extern void       _time_compact (void);
-
-/* ------------------------------------------------------------------------ */
-
-/*
- *  Global variables that are private (internal) to the snobal library.
- */
-
-extern	INPUT_REC input_deltas[4];	/* deltas for climate-input parameters
-					   over each timestep */
-
-typedef struct {
-		double	  m_pp;		/* total precipitation mass (kg/m^2) */
-		double	  m_rain;	/* mass of rain in precip (kg/m^2) */
-		double	  m_snow;	/*  "   "  snow "     "   (kg/m^2) */
-		double	  z_snow;	/* depth of snow in   "   (m) */
-	} PRECIP_REC;
-
-extern  PRECIP_REC precip_info[4];	/* array of precip info adjusted for
-					   each timestep */
-
-extern	int  computed[4];		/* array of flags for each timestep;
-					   TRUE if computed values for input
-					   deltas and precip arrays */
-
-extern	double  h2o_sat_snow;   /* snowfall's % of liquid H2O saturation */
-extern	int	isothermal;	/* melting? */
-extern	int     snowcover;      /* snow on gnd at start of current timestep? */
-
-#pragma omp threadprivate(input_deltas, precip_info, computed, h2o_sat_snow, isothermal, snowcover)
+extern void         _adj_layers	(snobal_state_t *s);
+extern void	      _adj_snow	(snobal_state_t *s, real_t delta_z_s,
+				 real_t delta_m_s);
+extern void              _advec	(snobal_state_t *s);
+extern int	   _below_thold	(snobal_state_t *s, real_t threshold);
+extern void        _calc_layers	(snobal_state_t *s);
+extern real_t	  _cold_content	(real_t temp, real_t mass);
+extern int	  _divide_tstep	(snobal_state_t *s, TSTEP_REC * tstep);
+extern int	      _do_tstep	(snobal_state_t *s, TSTEP_REC * tstep);
+extern int               _e_bal	(snobal_state_t *s);
+extern int          _evap_cond (snobal_state_t *s);
+extern void        _h2o_compact (snobal_state_t *s);
+extern int      	  _h_le (snobal_state_t *s);
+extern void         _layer_mass (snobal_state_t *s);
+extern int            _mass_bal (snobal_state_t *s);
+extern void            _net_rad (snobal_state_t *s);
+extern void        _new_density (snobal_state_t *s);
+extern void             _precip (snobal_state_t *s);
+extern void             _runoff (snobal_state_t *s);
+extern void           _snowmelt (snobal_state_t *s);
+extern void       _time_compact (snobal_state_t *s);
 
 #endif /* _PRIV_SNOBAL_H_ */
@@ -6,7 +6,7 @@
 **      #include "_snobal.h"
 **
 **      void
-**	_time_compact(void)
+**	_time_compact(snobal_state_t *s)
 **
 ** DESCRIPTION
 **	This routine replaces the original simple gravety compaction routine
@@ -89,10 +89,10 @@
 **	rho_n = rho + ((PTM + POC) * rho)
 **	zs_n = SWE / rho_n
 **
-** GLOBAL VARIABLES READ
+** STATE VARIABLES READ
 **	time_step, T_s, m_s, rho
 **
-** GLOBAL VARIABLES MODIFIED
+** STATE VARIABLES MODIFIED
 **	rho
 **
 */
@@ -129,19 +129,19 @@
 	 *  seconds in an hour
 	 */
 void
-_time_compact(void)
+_time_compact(snobal_state_t *s)
 {
-	double	c11;	/* temperature metamorphism coefficient (Anderson, 1976) */
-	double	Tz;	/* Freezing temperature (K) */
-	double	d_rho_m;
-	double	d_rho_c;
-	double	rate;
+	real_t	c11;	/* temperature metamorphism coefficient (Anderson, 1976) */
+	real_t	Tz;	/* Freezing temperature (K) */
+	real_t	d_rho_m;
+	real_t	d_rho_c;
+	real_t	rate;
 
 	/*
 	 *  If the snow is already at or above the maximum density due to
 	 *  compaction, then just leave.
 	 */
-	if ((!snowcover) || (rho >= RMX))
+	if ((!s->snowcover) || (s->rho >= RMX))
 		return;
 
 	Tz = FREEZE;
@@ -150,34 +150,34 @@ _time_compact(void)
 	 *  Calculate rate which compaction will be applied per time step.
 	 *  Rate will be adjusted as time step varies.
 	 */
-	if (m_s >= SWE_MAX)
+	if (s->m_s >= SWE_MAX)
 		rate = 1.0;
 	else {
-		rate = R1 * cos((PI * m_s) / SWE_MAX) + R2;
-		rate = rate / (time_step / hour);
+		rate = R1 * cos((PI * s->m_s) / SWE_MAX) + R2;
+		rate = rate / (s->time_step / hour);
 	}
 
 	/** Proportional Destructive Temperature Metamorphism (d_rho_m) **/
 
-	if (rho < 100)
+	if (s->rho < 100)
 		c11 = 1.0;
 	else
-		c11 = exp(-0.046 * (rho - 100));
+		c11 = exp(-0.046 * (s->rho - 100));
 
-	d_rho_m = 0.01 * c11 * exp(-0.04 * (Tz - T_s));
+	d_rho_m = 0.01 * c11 * exp(-0.04 * (Tz - s->T_s));
 	d_rho_m /= rate;
 
 	/** Proportional Overburden Compaction (d_rho_c) **/
 
-	d_rho_c = (0.026 * exp(-0.08 * (Tz - T_s)) * m_s * exp(-21.0 * (rho / water)));
+	d_rho_c = (0.026 * exp(-0.08 * (Tz - s->T_s)) * s->m_s * exp(-21.0 * (s->rho / water)));
 	d_rho_c /= rate;
 
 	/**	Compute New snow density	**/
 
-	rho = rho + ((d_rho_m + d_rho_c) * rho);
+	s->rho = s->rho + ((d_rho_m + d_rho_c) * s->rho);
 
         /*
 	 *  Adjust the snowcover for this new density.
 	 */
-	_new_density();
+	_new_density(s);
 }
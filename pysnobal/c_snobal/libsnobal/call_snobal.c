@@ -11,250 +11,824 @@
 #include "envphys.h"
 #include "pysnobal.h"
 
+/*
+ * State fields that are carried between data timesteps, in the order of
+ * OUTPUT_REC_ARR.  Every field has a member of the same name in
+ * snobal_state_t.  The fields in COMPACT_VARS can also be in the compact
+ * buffers of OUTPUT_REC_ARR, see STATE_GET and STATE_SET.  z_0 doesn't
+ * change and is a static field, see load_pixel and store_pixel.
+ */
+#define STATE_VARS \
+	X(current_time) X(time_since_out) X(rho) X(T_s_0) X(T_s_l) \
+	X(T_s) X(h2o_sat) X(h2o_max) X(h2o_vol) X(h2o) X(h2o_total) \
+	X(cc_s_0) X(cc_s_l) X(cc_s) X(m_s_0) X(m_s_l) X(m_s) \
+	X(z_s_0) X(z_s_l) X(z_s)
+
+#define COMPACT_VARS \
+	X(layer_count) X(R_n_bar) X(H_bar) X(L_v_E_bar) X(G_bar) \
+	X(G_0_bar) X(M_bar) X(delta_Q_bar) X(delta_Q_0_bar) X(E_s_sum) \
+	X(melt_sum) X(ro_pred_sum)
+
+/*
+ * Are the averages and sums zeroed on data timestep t of a block?
+ */
+#define ZERO_SUMS(first_step, t) \
+	(((first_step) == EVERY_STEP) || ((first_step) && ((t) == 0)))
+
+/*
+ * Recompute the layers from the snowpack state before a data timestep,
+ * the averages and sums are zeroed on the first timestep
+ */
+static void
+next_tstep (
+		snobal_state_t *s,
+		int first_step)
+{
+	init_snow(s);
+
+	if (first_step) {
+		s->R_n_bar = 0.0;
+		s->H_bar = 0.0;
+		s->L_v_E_bar = 0.0;
+		s->G_bar = 0.0;
+		s->G_0_bar = 0.0;
+		s->M_bar = 0.0;
+		s->delta_Q_bar = 0.0;
+		s->delta_Q_0_bar = 0.0;
+		s->E_s_sum = 0.0;
+		s->melt_sum = 0.0;
+		s->ro_pred_sum = 0.0;
+	}
+}
+
+/*
+ * Set the measurement heights of pixel n in s for the heights that vary by
+ * pixel
+ */
+static void
+load_heights (
+		snobal_state_t *s,
+		PARAMS *params,
+		int n)
+{
+	if (params->z_u_arr != NULL)
+		s->z_u = params->z_u_arr[n];
+	if (params->z_T_arr != NULL)
+		s->z_T = params->z_T_arr[n];
+	if (params->z_g_arr != NULL)
+		s->z_g = params->z_g_arr[n];
+}
+
+/*
+ * Load the state of pixel n into s and establish the conditions for the
+ * snowpack.  The static fields and the heights are at the static index of
+ * the pixel, the parameters that vary by pixel are at n.
+ */
+static void
+load_pixel (
+		snobal_state_t *s,
+		OUTPUT_REC_ARR* output1,
+		PARAMS *params,
+		int n,
+		int first_step)
+{
+	int i = STATIC_INDEX(output1, n);
+
+	s->current_time = output1->current_time[n];
+	s->time_since_out = output1->time_since_out[n];
+
+	s->z_0 = output1->z_0[i];
+	s->z_s = output1->z_s[n];
+	s->rho = output1->rho[n];
+
+	s->T_s_0 = output1->T_s_0[n];
+	s->T_s_l = output1->T_s_l[n];
+	s->T_s = output1->T_s[n];
+	s->h2o_sat = output1->h2o_sat[n];
+
+#define X(f)	s->f = STATE_GET(output1, f, n);
+	COMPACT_VARS
+#undef X
+
+	/* set air pressure from site elev */
+	if (params->P_a_arr != NULL)
+		s->P_a = params->P_a_arr[i];
+	else
+		s->P_a = HYSTAT(SEA_LEVEL, STD_AIRTMP, STD_LAPSE, (output1->elevation[i] / 1000.0),
+				GRAVITY, MOL_AIR);
+
+	load_heights(s, params, i);
+	if (params->max_h2o_vol_arr != NULL)
+		s->max_h2o_vol = params->max_h2o_vol_arr[n];
+	if (params->max_z_s_0_arr != NULL)
+		s->max_z_s_0 = params->max_z_s_0_arr[n];
+
+	next_tstep(s, first_step);
+}
+
+/*
+ * Store the state in s at index i of the buffers in out, buffers that are
+ * NULL are skipped.  z_0 is only written to buffers that aren't shared by
+ * the members of an ensemble.
+ */
+static void
+store_pixel (
+		snobal_state_t *s,
+		OUTPUT_REC_ARR* out,
+		int i)
+{
+	if ((out->z_0 != NULL) && (out->npix == 0))
+		out->z_0[i] = s->z_0;
+#define X(f)	if (out->f != NULL) out->f[i] = s->f;
+	STATE_VARS
+#undef X
+#define X(f)	STATE_SET(out, f, i, s->f);
+	COMPACT_VARS
+#undef X
+}
+
+/*
+ * Copy the state at index n of output1 to index i of the buffers in out
+ */
+static void
+copy_pixel (
+		OUTPUT_REC_ARR* output1,
+		int n,
+		OUTPUT_REC_ARR* out,
+		int i)
+{
+	if ((out->z_0 != NULL) && (out->npix == 0))
+		out->z_0[i] = output1->z_0[STATIC_INDEX(output1, n)];
+#define X(f)	if (out->f != NULL) out->f[i] = output1->f[n];
+	STATE_VARS
+#undef X
+#define X(f)	STATE_SET(out, f, i, STATE_GET(output1, f, n));
+	COMPACT_VARS
+#undef X
+}
+
+/*
+ * Load input records r1 and r2 of pixel data at offsets i1 and i2 into s,
+ * the precipitation is taken from i1.  Single precision forcing is
+ * widened to double here.
+ */
+static void
+load_inputs (
+		snobal_state_t *s,
+		INPUT_REC_ARR* input1,
+		int i1,
+		INPUT_REC_ARR* input2,
+		int i2)
+{
+	s->input_rec1.I_lw = INPUT_GET(input1, I_lw, i1);
+	s->input_rec1.T_a  = INPUT_GET(input1, T_a, i1);
+	s->input_rec1.e_a  = INPUT_GET(input1, e_a, i1);
+	s->input_rec1.u    = INPUT_GET(input1, u, i1);
+	s->input_rec1.T_g  = INPUT_GET(input1, T_g, i1);
+	s->input_rec1.S_n  = INPUT_GET(input1, S_n, i1);
+
+	s->input_rec2.I_lw = INPUT_GET(input2, I_lw, i2);
+	s->input_rec2.T_a  = INPUT_GET(input2, T_a, i2);
+	s->input_rec2.e_a  = INPUT_GET(input2, e_a, i2);
+	s->input_rec2.u    = INPUT_GET(input2, u, i2);
+	s->input_rec2.T_g  = INPUT_GET(input2, T_g, i2);
+	s->input_rec2.S_n  = INPUT_GET(input2, S_n, i2);
+
+	// precip inputs
+	s->m_pp         = INPUT_GET(input1, m_pp, i1);
+	s->percent_snow = INPUT_GET(input1, percent_snow, i1);
+	s->rho_snow     = INPUT_GET(input1, rho_snow, i1);
+	s->T_pp         = INPUT_GET(input1, T_pp, i1);
+
+	s->precip_now = 0;
+	if (s->m_pp > 0)
+		s->precip_now = 1;
+}
+
+/*
+ * Set up a model state with the timestep info and the parameters, each
+ * thread runs its pixels through its own state
+ */
+static void
+init_state (
+		snobal_state_t *s,
+		TSTEP_REC tstep[4],
+		PARAMS params)
+{
+	memset(s, 0, sizeof(snobal_state_t));
+
+	s->tstep_info = tstep;
+
+	// pull out the parameters
+	s->z_u = params.z_u;
+	s->z_T = params.z_T;
+	s->z_g = params.z_g;
+	s->relative_hts = params.relative_heights;
+	s->max_z_s_0 = params.max_z_s_0;
+	s->max_h2o_vol = params.max_h2o_vol;
+	s->sat_table = params.sat_table;
+	s->hle1_warm_start = params.hle1_warm_start;
+}
+
+/*
+ * Add the counts of a thread's state to the total
+ */
+static void
+add_counts (
+		SNOBAL_COUNTS *total,
+		SNOBAL_COUNTS *c)
+{
+	int i;
+
+	for (i = 0; i < 4; i++) {
+		total->divide_tstep[i] += c->divide_tstep[i];
+		total->do_tstep[i] += c->do_tstep[i];
+	}
+	total->hle1_calls += c->hle1_calls;
+	total->hle1_iter += c->hle1_iter;
+	total->hle1_fail += c->hle1_fail;
+}
+
+/*
+ * Order the pixel indices in pixels as the active pixels, then the bare
+ * ground pixels and then the masked pixels.  A pixel is bare ground when it
+ * has no snow at the start of the nsteps data timesteps and there is no
+ * precipitation during them, the model only has to do the bookkeeping for
+ * these (see bare_ground).  If compact is FALSE every pixel that isn't
+ * masked is active.
+ *
+ * Returns the number of active pixels, n_bare is set to the number of bare
+ * ground pixels.
+ */
+static int
+active_pixels (
+		int N,
+		int nsteps,
+		int compact,
+		INPUT_REC_ARR* inputs,
+		OUTPUT_REC_ARR* output1,
+		int* pixels,
+		int* n_bare)
+{
+	int n, t;
+	int n_active = 0;
+	int n_masked = 0;
+
+	for (n = 0; n < N; n++) {
+		if (STATE_GET(output1, masked, STATIC_INDEX(output1, n)) != 1) {
+			n_masked++;
+			pixels[N - n_masked] = n;
+			continue;
+		}
+		if (!compact || (output1->z_s[n] > 0.0)) {
+			pixels[n_active++] = n;
+			continue;
+		}
+		for (t = 0; t < nsteps; t++) {
+			if (INPUT_GET(inputs, m_pp, t * N + n) > 0.0) {
+				pixels[n_active++] = n;
+				break;
+			}
+		}
+	}
+
+	/* the bare ground pixels fill the gap */
+	*n_bare = 0;
+	for (n = 0; n < N; n++) {
+		if ((STATE_GET(output1, masked, STATIC_INDEX(output1, n)) != 1) ||
+				(output1->z_s[n] > 0.0))
+			continue;
+		for (t = 0; t < nsteps; t++) {
+			if (INPUT_GET(inputs, m_pp, t * N + n) > 0.0)
+				break;
+		}
+		if (compact && (t == nsteps))
+			pixels[n_active + (*n_bare)++] = n;
+	}
+
+	return n_active;
+}
+
+/*
+ * Bookkeeping for one data timestep of bare ground pixel n with no
+ * precipitation.  This gives the same state as do_data_tstep: the snowcover
+ * is set to no snow as in init_snow, all the energy and mass terms are
+ * zero, so the averages are weighted down and the sums don't change for
+ * each of the normal run timesteps.
+ */
+static void
+bare_ground (
+		OUTPUT_REC_ARR* output1,
+		int n,
+		int first_step,
+		TSTEP_REC tstep[4])
+{
+	int i, k;
+	double dt = tstep[NORMAL_TSTEP].time_step;
+	double tso = output1->time_since_out[n];
+	double f;
+	double bar[8];
+	double E_s_sum, melt_sum, ro_pred_sum;
+
+	STATE_SET(output1, layer_count, n, 0);
+	output1->z_s[n] = output1->z_s_0[n] = output1->z_s_l[n] = 0.0;
+	output1->rho[n] = 0.0;
+	output1->m_s[n] = output1->cc_s[n] = 0.0;
+	output1->m_s_0[n] = output1->cc_s_0[n] = 0.0;
+	output1->m_s_l[n] = output1->cc_s_l[n] = 0.0;
+	output1->T_s[n] = output1->T_s_0[n] = output1->T_s_l[n] = MIN_SNOW_TEMP + FREEZE;
+	output1->h2o_vol[n] = output1->h2o[n] = output1->h2o_max[n] = 0.0;
+	output1->h2o_sat[n] = output1->h2o_total[n] = 0.0;
+
+	/* the averages and sums are worked on in double precision whatever
+	   the layout of the state */
+	bar[0] = STATE_GET(output1, R_n_bar, n);
+	bar[1] = STATE_GET(output1, H_bar, n);
+	bar[2] = STATE_GET(output1, L_v_E_bar, n);
+	bar[3] = STATE_GET(output1, G_bar, n);
+	bar[4] = STATE_GET(output1, M_bar, n);
+	bar[5] = STATE_GET(output1, delta_Q_bar, n);
+	bar[6] = STATE_GET(output1, G_0_bar, n);
+	bar[7] = STATE_GET(output1, delta_Q_0_bar, n);
+	E_s_sum = STATE_GET(output1, E_s_sum, n);
+	melt_sum = STATE_GET(output1, melt_sum, n);
+	ro_pred_sum = STATE_GET(output1, ro_pred_sum, n);
+
+	if (first_step) {
+		memset(bar, 0, sizeof(bar));
+		E_s_sum = melt_sum = ro_pred_sum = 0.0;
+	}
+
+	for (i = 0; i < tstep[NORMAL_TSTEP].intervals; i++) {
+		if (tso > 0.0) {
+			/* TIME_AVG with a value of 0 */
+			f = tso + dt;
+			for (k = 0; k < 8; k++)
+				bar[k] = bar[k] * tso / f;
+			tso += dt;
+		}
+		else {
+			memset(bar, 0, sizeof(bar));
+			E_s_sum = melt_sum = ro_pred_sum = 0.0;
+			tso = dt;
+		}
+		output1->current_time[n] += dt;
+	}
+
+	STATE_SET(output1, R_n_bar, n, bar[0]);
+	STATE_SET(output1, H_bar, n, bar[1]);
+	STATE_SET(output1, L_v_E_bar, n, bar[2]);
+	STATE_SET(output1, G_bar, n, bar[3]);
+	STATE_SET(output1, M_bar, n, bar[4]);
+	STATE_SET(output1, delta_Q_bar, n, bar[5]);
+	STATE_SET(output1, G_0_bar, n, bar[6]);
+	STATE_SET(output1, delta_Q_0_bar, n, bar[7]);
+	STATE_SET(output1, E_s_sum, n, E_s_sum);
+	STATE_SET(output1, melt_sum, n, melt_sum);
+	STATE_SET(output1, ro_pred_sum, n, ro_pred_sum);
+
+	output1->time_since_out[n] = tso;
+}
+
+/*
+ * The run timesteps done so far by a thread, the cost of a pixel is the
+ * difference over its data timesteps
+ */
+static long
+run_tsteps (
+		SNOBAL_COUNTS *c)
+{
+	return c->do_tstep[NORMAL_TSTEP] + c->do_tstep[MEDIUM_TSTEP] +
+		c->do_tstep[SMALL_TSTEP];
+}
+
+/*
+ * Keep the cost of pixel n, the run timesteps per data timestep rounded up
+ */
+static void
+set_cost (
+		SCHEDULE *sched,
+		int n,
+		long tsteps,
+		int nsteps)
+{
+	if ((sched != NULL) && (sched->cost != NULL))
+		sched->cost[n] = (int) ((tsteps + nsteps - 1) / nsteps);
+}
+
+/*
+ * Keep the hle1 iterations of pixel n
+ */
+static void
+set_hle1_iter (
+		SCHEDULE *sched,
+		int n,
+		long iter)
+{
+	if ((sched != NULL) && (sched->hle1_iter != NULL))
+		sched->hle1_iter[n] = (int) iter;
+}
+
+/*
+ * The cost of the pixel at k in pixels to weigh the balanced ranges, one
+ * more than its cost so the pixels that haven't run yet count
+ */
+static long
+weight (
+		SCHEDULE *sched,
+		int* pixels,
+		int k)
+{
+	if (sched->cost == NULL)
+		return 1;
+	return (long) sched->cost[pixels[k]] + 1;
+}
+
+/*
+ * Sort the first n_active pixels heaviest first by the cost of the last
+ * call.  A counting sort with the cost capped at MAX_COST, it's stable so
+ * pixels of the same cost stay in pixel order.
+ */
+static void
+order_by_cost (
+		int n_active,
+		int* pixels,
+		SCHEDULE *sched)
+{
+	int k, c;
+	int start[MAX_COST + 2];
+
+	if (sched->cost == NULL)
+		return;
+
+	memset(start, 0, sizeof(start));
+	for (k = 0; k < n_active; k++) {
+		c = sched->cost[pixels[k]];
+		start[(c > MAX_COST) ? MAX_COST : c]++;
+	}
+
+	/* the highest cost goes first */
+	for (c = MAX_COST, k = 0; c >= 0; c--) {
+		start[MAX_COST + 1] = start[c];
+		start[c] = k;
+		k += start[MAX_COST + 1];
+	}
+
+	for (k = 0; k < n_active; k++) {
+		c = sched->cost[pixels[k]];
+		c = (c > MAX_COST) ? MAX_COST : c;
+		sched->work[start[c]++] = pixels[k];
+	}
+	memcpy(pixels, sched->work, n_active * sizeof(int));
+}
+
+/*
+ * The range of the first n_active pixels that thread t of nt runs with the
+ * balanced schedule.  Each thread finds the same boundaries from the sum of
+ * the weights, so the ranges follow each other and cover every pixel.
+ */
+static void
+balanced_range (
+		int n_active,
+		int* pixels,
+		SCHEDULE *sched,
+		int t,
+		int nt,
+		int* k0,
+		int* k1)
+{
+	int k;
+	long total = 0;
+	long sum = 0;
+	long lo, hi;
+
+	for (k = 0; k < n_active; k++)
+		total += weight(sched, pixels, k);
+	lo = total * t / nt;
+	hi = total * (t + 1) / nt;
+
+	*k0 = *k1 = n_active;
+	for (k = 0; k < n_active; k++) {
+		if ((sum >= lo) && (*k0 == n_active))
+			*k0 = k;
+		if (sum >= hi) {
+			*k1 = k;
+			break;
+		}
+		sum += weight(sched, pixels, k);
+	}
+}
+
+/*
+ * Keep the lowest pixel that failed in error
+ */
+static void
+first_error (
+		int *error,
+		int n)
+{
+#pragma omp critical
+	{
+		if ((*error == -1) || (n < *error))
+			*error = n;
+	}
+}
+
+/*
+ * Run a data timestep for pixel n.  Returns FALSE if the model failed.
+ */
+static int
+run_pixel (
+		snobal_state_t *s,
+		int n,
+		int first_step,
+		INPUT_REC_ARR* input1,
+		INPUT_REC_ARR* input2,
+		PARAMS* params,
+		OUTPUT_REC_ARR* output1,
+		SCHEDULE* sched)
+{
+	int ok = 1;
+	long tsteps = run_tsteps(&s->counts);
+	long iter = s->counts.hle1_iter;
+
+	/* initialize the state for the 'snobal' library
+	   for each pass since the routine 'do_data_tstep'
+	   modifies it */
+	load_pixel(s, output1, params, n, first_step);
+	load_inputs(s, input1, n, input2, n);
+
+	/* run model on data for this pixel */
+	if (! do_data_tstep(s)) {
+		fprintf(stderr, "Error at pixel %i\n", n);
+		ok = 0;
+	}
+
+	/* assign data to output buffers */
+	store_pixel(s, output1, n);
+
+	set_cost(sched, n, run_tsteps(&s->counts) - tsteps, 1);
+	set_hle1_iter(sched, n, s->counts.hle1_iter - iter);
+
+	return ok;
+}
+
+/*
+ * Run the nsteps data timesteps of a block for pixel n, see
+ * call_snobal_block.  Returns FALSE if the model failed, the pixel stops
+ * at the timestep of the failure.
+ */
+static int
+run_pixel_block (
+		snobal_state_t *s,
+		int N,
+		int n,
+		int first_step,
+		int nsteps,
+		INPUT_REC_ARR* inputs,
+		PARAMS* params,
+		OUTPUT_REC_ARR* output1,
+		int* output_index,
+		OUTPUT_REC_ARR* outputs,
+		SCHEDULE* sched)
+{
+	int t;
+	int ok = 1;
+	long tsteps = run_tsteps(&s->counts);
+	long iter = s->counts.hle1_iter;
+
+	/* the pixel's state stays in s for the block */
+	load_pixel(s, output1, params, n, ZERO_SUMS(first_step, 0));
+
+	for (t = 0; t < nsteps; t++) {
+
+		if (t > 0)
+			next_tstep(s, ZERO_SUMS(first_step, t));
+
+		load_inputs(s, inputs, t * N + n, inputs, (t + 1) * N + n);
+
+		if (! do_data_tstep(s)) {
+			fprintf(stderr, "Error at pixel %i, timestep %i\n", n, t);
+			ok = 0;
+			break;
+		}
+
+		if (output_index[t] >= 0) {
+			store_pixel(s, outputs, output_index[t] * N + n);
+			s->time_since_out = 0.0;
+		}
+	}
+
+	store_pixel(s, output1, n);
+
+	set_cost(sched, n, run_tsteps(&s->counts) - tsteps, nsteps);
+	set_hle1_iter(sched, n, s->counts.hle1_iter - iter);
+
+	return ok;
+}
+
+/*
+ * call_snobal runs one data timestep for every pixel.
+ *
+ * nthreads is the number of OpenMP threads, 0 for the OpenMP default.  The
+ * active pixels are shared between the threads as given by sched (see
+ * SCHEDULE), NULL for chunks of 100 in pixel order.  The cost of each
+ * pixel, the number of run timesteps it took, is kept in sched->cost for
+ * SCHED_COST and SCHED_BALANCED to use in the next call, and its hle1
+ * iterations in sched->hle1_iter.  A pixel with a
+ * thin snowcover can take 60 run timesteps for a data timestep while bare
+ * ground takes none.
+ *
+ * Returns -1 on success or the index of the first pixel that failed.
+ *
+ * If counts isn't NULL the work done is added to it.
+ */
 int call_snobal (
 		int N,
 		int nthreads,
 		int first_step,
+		int compact,
 		TSTEP_REC tstep[4],
-		//OUTPUT_REC** output_rec,
 		INPUT_REC_ARR* input1,
 		INPUT_REC_ARR* input2,
 		PARAMS params,
-		OUTPUT_REC_ARR* output1
+		OUTPUT_REC_ARR* output1,
+		int* pixels,
+		int* n_active,
+		SCHEDULE* sched,
+		SNOBAL_COUNTS* counts
 )
 {
-	int n;
-	//	double current_time, time_since_out;
-	//	double data_tstep;
-
-
-	// Some debuging stuff
-	//	printf("%i\n", tstep_info[1].level);
-	//		printf("%f - %f - %f - %f - %f - %f\n", input1->S_n[0], input1->I_lw[0], input1->T_a[0], input1->e_a[0], input1->u[0], input1->T_g[0]);
-	//	printf ("%i -- %f\n", N, output_rec[0]->elevation);
+	int k, k0, k1;
+	int n_bare;
+	int error = -1;
+	int type = (sched == NULL) ? SCHED_DYNAMIC : sched->type;
+	int chunk = ((sched == NULL) || (sched->chunk < 1)) ? 100 : sched->chunk;
+	snobal_state_t s;
 
 	/* set threads */
-	if (nthreads != 1) {
+	if (nthreads > 0) {
 		omp_set_num_threads(nthreads); 	// Use N threads for all consecutive parallel regions
 	}
 
-	// for some reason, C compiler doen't let you threadprivate the tstep since it's already created.
-	// Therefore, we need to create a pointer to it, apply threadprivate, then copy in the data from the input
-	//	static TSTEP_REC *tstep_info;
-#pragma omp threadprivate(tstep_info)
-	for (n = 0; n < 4; n++)
-		tstep_info[n] = tstep[n];
-
-	//	data_tstep = tstep_info[DATA_TSTEP].time_step;
+	*n_active = active_pixels(N, 1, compact, input1, output1, pixels, &n_bare);
+	if (type == SCHED_COST)
+		order_by_cost(*n_active, pixels, sched);
 
-	// pull out the parameters
-	z_u = params.z_u;
-	z_T = params.z_T;
-	z_g = params.z_g;
-	relative_hts = params.relative_heights;
-	max_z_s_0 = params.max_z_s_0;
-	max_h2o_vol = params.max_h2o_vol;
-
-	//	printf("%i -- %i -- %f -- %f\n", tstep_info[0].level, tstep_info[0].time_step, tstep_info[0].intervals, tstep_info[0].threshold);
-	//	printf("%i -- %i -- %f -- %f\n", tstep_info[1].level, tstep_info[1].time_step, tstep_info[1].intervals, tstep_info[1].threshold);
-	//	printf("%i -- %i -- %f -- %f\n", tstep_info[2].level, tstep_info[2].time_step, tstep_info[2].intervals, tstep_info[2].threshold);
-	//	printf("%i -- %i -- %f -- %f\n", tstep_info[3].level, tstep_info[3].time_step, tstep_info[3].intervals, tstep_info[3].threshold);
-
-//#pragma omp parallel shared(output_rec, input1, input2, first_step)
-#pragma omp parallel shared(output1, input1, input2, first_step)\
-		private(n) \
-		copyin(tstep_info, z_u, z_T, z_g, relative_hts, max_z_s_0, max_h2o_vol)
+#pragma omp parallel shared(output1, input1, input2, first_step, error, pixels, n_active, n_bare)\
+		private(k, k0, k1, s)
 	{
-#pragma omp for schedule(dynamic, 100)
-		for (n = 0; n < N; n++) {
-
-			//if (output_rec[n]->masked == 1) {
-			if (output1->masked[n] == 1) {
-
-				/* initialize some global variables for
-			   'snobal' library for each pass since
-			   the routine 'do_data_tstep' modifies them */
-
-				current_time = output1->current_time[n];//output_rec[n]->current_time;
-				time_since_out = output1->time_since_out[n];//output_rec[n]->time_since_out;
-
-				// get the input records
-				input_rec1.I_lw = input1->I_lw[n];
-				input_rec1.T_a  = input1->T_a[n];
-				input_rec1.e_a  = input1->e_a[n];
-				input_rec1.u    = input1->u[n];
-				input_rec1.T_g  = input1->T_g[n];
-				input_rec1.S_n  = input1->S_n[n];
-
-				input_rec2.I_lw = input2->I_lw[n];
-				input_rec2.T_a  = input2->T_a[n];
-				input_rec2.e_a  = input2->e_a[n];
-				input_rec2.u    = input2->u[n];
-				input_rec2.T_g  = input2->T_g[n];
-				input_rec2.S_n  = input2->S_n[n];
-
-
-				// precip inputs
-				m_pp         = input1->m_pp[n];
-				percent_snow = input1->percent_snow[n];
-				rho_snow     = input1->rho_snow[n];
-				T_pp         = input1->T_pp[n];
-
-				precip_now = 0;
-				if (m_pp > 0)
-					precip_now = 1;
-
-
-				/* extract data from I/O buffers */
-				double elevation    = output1->elevation[n];//output_rec[n]->elevation;
-
-				z_0 = output1->z_0[n];//z_0	     	 = output_rec[n]->z_0;
-				z_s = output1->z_s[n];//z_s          = output_rec[n]->z_s;
-				rho	     	 = output1->rho[n];//output_rec[n]->rho;
-
-				T_s_0	     = output1->T_s_0[n];//output_rec[n]->T_s_0;
-				T_s_l	     = output1->T_s_l[n];//output_rec[n]->T_s_l;
-				T_s	         = output1->T_s[n];//output_rec[n]->T_s;
-				h2o_sat	     = output1->h2o_sat[n];//output_rec[n]->h2o_sat;
-				layer_count  = output1->layer_count[n];//output_rec[n]->layer_count;
-
-				R_n_bar	     = output1->R_n_bar[n];//output_rec[n]->R_n_bar;
-				H_bar	     = output1->H_bar[n];//output_rec[n]->H_bar;
-				L_v_E_bar    = output1->L_v_E_bar[n];//output_rec[n]->L_v_E_bar;
-				G_bar	     = output1->G_bar[n];//output_rec[n]->G_bar;
-				M_bar	     = output1->M_bar[n];//output_rec[n]->M_bar;
-				delta_Q_bar  = output1->delta_Q_bar[n];//output_rec[n]->delta_Q_bar;
-				E_s_sum      = output1->E_s_sum[n];//output_rec[n]->E_s_sum;
-				melt_sum     = output1->melt_sum[n];//output_rec[n]->melt_sum;
-				ro_pred_sum  = output1->ro_pred_sum[n];//output_rec[n]->ro_pred_sum;
-
-				/* establish conditions for snowpack */
-				if (first_step == 1) {
-					init_snow();
-					R_n_bar	     = 0.0;
-					H_bar	     = 0.0;
-					L_v_E_bar    = 0.0;
-					G_bar	     = 0.0;
-					M_bar	     = 0.0;
-					delta_Q_bar  = 0.0;
-					E_s_sum      = 0.0;
-					melt_sum     = 0.0;
-					ro_pred_sum  = 0.0;
-				} else {
-					init_snow();
-					// pull the rest of the snowpack information out of the structure
-					// z_s_0 = output1->z_s_0[n];//z_s_0		= output_rec[n]->z_s_0;
-					// z_s_l		= output1->z_s_l[n];//output_rec[n]->z_s_l;
-					// m_s			= output1->m_s[n];//output_rec[n]->m_s;
-					// m_s_0		= output1->m_s_0[n];//output_rec[n]->m_s_0;
-					// m_s_l		= output1->m_s_l[n];//output_rec[n]->m_s_l;
-					// cc_s		= output1->cc_s[n];//output_rec[n]->cc_s;
-					// cc_s_0		= output1->cc_s_0[n];//output_rec[n]->cc_s_0;
-					// cc_s_l		= output1->cc_s_l[n];//output_rec[n]->cc_s_l;
-					// h2o_vol		= output1->h2o_vol[n];//output_rec[n]->h2o_vol;
-					// h2o			= output1->h2o[n];//output_rec[n]->h2o;
-					// h2o_max		= output1->h2o_max[n];//output_rec[n]->h2o_max;
-					// h2o_total	= output1->h2o_total[n];//output_rec[n]->h2o_total;
-				}
-
-				//				printf("Mass %f\n", m_s);
-
-				/* set air pressure from site elev */
-
-				// P_a = HYSTAT(SEA_LEVEL, STD_AIRTMP, STD_LAPSE, (output_rec[n]->elevation / 1000.0),
-				// 		GRAVITY, MOL_AIR);
-				P_a = HYSTAT(SEA_LEVEL, STD_AIRTMP, STD_LAPSE, (output1->elevation[n] / 1000.0),
-						GRAVITY, MOL_AIR);
-
-				/* run model on data for this pixel */
-				//printf("m_s = %f, rho = %f\n", m_s, rho);
-				if (! do_data_tstep())
-					fprintf(stderr, "Error at pixel %i", n);
-				//printf("m_s = %f, rho = %f, N = %d, n=%d\n", m_s, rho, N, n);
-				/* assign data to output buffers */
-				//			current_time += data_tstep;
-				// output_rec[n]->current_time = current_time;
-				// output_rec[n]->time_since_out = time_since_out;
-				//
-				// //			output_rec[n]->elevation = elevation;
-				// output_rec[n]->z_0 = z_0;
-				// output_rec[n]->rho = rho;
-				// output_rec[n]->T_s_0 = T_s_0;
-				// output_rec[n]->T_s_l = T_s_l;
-				// output_rec[n]->T_s = T_s;
-				// output_rec[n]->h2o_sat = h2o_sat;
-				// output_rec[n]->h2o_max = h2o_max;
-				// output_rec[n]->h2o = h2o;
-				// output_rec[n]->h2o_vol = h2o_vol;
-				// output_rec[n]->h2o_total = h2o_total;
-				// output_rec[n]->layer_count = layer_count;
-				// output_rec[n]->cc_s_0 = cc_s_0;
-				// output_rec[n]->cc_s_l = cc_s_l;
-				// output_rec[n]->cc_s = cc_s;
-				// output_rec[n]->m_s_0 = m_s_0;
-				// output_rec[n]->m_s_l = m_s_l;
-				// output_rec[n]->m_s = m_s;
-				// output1->z_0[n] = z_0;//output_rec[n]->z_s_0 = z_s_0;
-				// output_rec[n]->z_s_l = z_s_l;
-				// output1->z_s_0[n] = z_s_0;//output_rec[n]->z_s = z_s;
-				//
-				// output_rec[n]->R_n_bar = R_n_bar;
-				// output_rec[n]->H_bar = H_bar;
-				// output_rec[n]->L_v_E_bar = L_v_E_bar;
-				// output_rec[n]->G_bar = G_bar;
-				// output_rec[n]->G_0_bar = G_0_bar;
-				// output_rec[n]->M_bar = M_bar;
-				// output_rec[n]->delta_Q_bar = delta_Q_bar;
-				// output_rec[n]->delta_Q_0_bar = delta_Q_0_bar;
-				// output_rec[n]->E_s_sum = E_s_sum;
-				// output_rec[n]->melt_sum = melt_sum;
-				// output_rec[n]->ro_pred_sum = ro_pred_sum;
-
-				output1->current_time[n] = current_time;
-				output1->time_since_out[n] = time_since_out;
-
-				// output1->elevation[n] = elevation;
-				output1->rho[n] = rho;
-				output1->T_s_0[n] = T_s_0;
-				output1->T_s_l[n] = T_s_l;
-				output1->T_s[n] = T_s;
-				output1->h2o_sat[n] = h2o_sat;
-				output1->h2o_max[n] = h2o_max;
-				output1->h2o[n] = h2o;
-				output1->h2o_vol[n] = h2o_vol;
-				output1->h2o_total[n] = h2o_total;
-				output1->layer_count[n] = layer_count;
-				output1->cc_s_0[n] = cc_s_0;
-				output1->cc_s_l[n] = cc_s_l;
-				output1->cc_s[n] = cc_s;
-				output1->m_s_0[n] = m_s_0;
-				output1->m_s_l[n] = m_s_l;
-				output1->m_s[n] = m_s;
-				output1->z_0[n] = z_0;//output_rec[n]->z_s_0 = z_s_0;
-				output1->z_s_l[n] = z_s_l;
-				output1->z_s_0[n] = z_s_0;//output_rec[n]->z_s = z_s;
-				output1->z_s[n] = z_s;//output_rec[n]->z_s = z_s;
-
-				output1->R_n_bar[n] = R_n_bar;
-				output1->H_bar[n] = H_bar;
-				output1->L_v_E_bar[n] = L_v_E_bar;
-				output1->G_bar[n] = G_bar;
-				output1->G_0_bar[n] = G_0_bar;
-				output1->M_bar[n] = M_bar;
-				output1->delta_Q_bar[n] = delta_Q_bar;
-				output1->delta_Q_0_bar[n] = delta_Q_0_bar;
-				output1->E_s_sum[n] = E_s_sum;
-				output1->melt_sum[n] = melt_sum;
-				output1->ro_pred_sum[n] = ro_pred_sum;
+		init_state(&s, tstep, params);
+
+		if (type == SCHED_BALANCED) {
+			balanced_range(*n_active, pixels, sched, omp_get_thread_num(),
+					omp_get_num_threads(), &k0, &k1);
+
+			/* the ranges are from the costs before any are updated */
+#pragma omp barrier
+			for (k = k0; k < k1; k++) {
+				if (! run_pixel(&s, pixels[k], first_step, input1, input2,
+						&params, output1, sched))
+					first_error(&error, pixels[k]);
 			}
-		}  /* for loop on grid */
+		}
+		else {
+#pragma omp for schedule(dynamic, chunk) nowait
+			for (k = 0; k < *n_active; k++) {
+				if (! run_pixel(&s, pixels[k], first_step, input1, input2,
+						&params, output1, sched))
+					first_error(&error, pixels[k]);
+			}
+		}
+
+#pragma omp for schedule(static) nowait
+		for (k = *n_active; k < *n_active + n_bare; k++) {
+			bare_ground(output1, pixels[k], first_step, tstep);
+			set_cost(sched, pixels[k], 0, 1);
+			set_hle1_iter(sched, pixels[k], 0);
+		}
+
+		if (counts != NULL) {
+#pragma omp critical
+			add_counts(counts, &s.counts);
+		}
 	}
 
+	return error;
+
+}
 
+/*
+ * call_snobal_block runs nsteps data timesteps for every pixel in one
+ * parallel region.
+ *
+ * The forcing in inputs has nsteps + 1 records of N pixels, record t starts
+ * at t * N.  The precipitation for data timestep t is taken from record t.
+ *
+ * The averages and sums are zeroed on the first data timestep if
+ * first_step is FIRST_STEP and on every data timestep if it's EVERY_STEP.
+ *
+ * After data timestep t, if output_index[t] >= 0 the state is written to
+ * record output_index[t] of the buffers in outputs and the time since the
+ * last output is reset.  Buffers in outputs that are NULL are not written.
+ *
+ * Only the pixels that have snow or precipitation in the block run the
+ * model, see active_pixels.  They are shared between the threads as in
+ * call_snobal, the cost of a pixel is its run timesteps per data timestep
+ * in the block.
+ *
+ * The state in output1 is updated at the end of the block.  Returns -1 on
+ * success or the index of the first pixel that failed.  A pixel that fails
+ * stops at the timestep of the failure.
+ *
+ * If counts isn't NULL the work done in the block is added to it.
+ */
+int call_snobal_block (
+		int N,
+		int nthreads,
+		int first_step,
+		int compact,
+		int nsteps,
+		TSTEP_REC tstep[4],
+		INPUT_REC_ARR* inputs,
+		PARAMS params,
+		OUTPUT_REC_ARR* output1,
+		int* output_index,
+		OUTPUT_REC_ARR* outputs,
+		int* pixels,
+		int* n_active,
+		SCHEDULE* sched,
+		SNOBAL_COUNTS* counts
+)
+{
+	int k, k0, k1, n, t;
+	int n_bare;
+	int error = -1;
+	int type = (sched == NULL) ? SCHED_DYNAMIC : sched->type;
+	int chunk = ((sched == NULL) || (sched->chunk < 1)) ? 100 : sched->chunk;
+	snobal_state_t s;
 
+	/* set threads */
+	if (nthreads > 0) {
+		omp_set_num_threads(nthreads);
+	}
 
+	*n_active = active_pixels(N, nsteps, compact, inputs, output1, pixels, &n_bare);
+	if (type == SCHED_COST)
+		order_by_cost(*n_active, pixels, sched);
 
+#pragma omp parallel shared(output1, inputs, outputs, output_index, first_step, error, pixels, n_active, n_bare)\
+		private(k, k0, k1, n, t, s)
+	{
+		init_state(&s, tstep, params);
+
+		if (type == SCHED_BALANCED) {
+			balanced_range(*n_active, pixels, sched, omp_get_thread_num(),
+					omp_get_num_threads(), &k0, &k1);
+
+			/* the ranges are from the costs before any are updated */
+#pragma omp barrier
+			for (k = k0; k < k1; k++) {
+				n = pixels[k];
+				if (! run_pixel_block(&s, N, n, first_step, nsteps, inputs,
+						&params, output1, output_index, outputs, sched))
+					first_error(&error, n);
+			}
+		}
+		else {
+#pragma omp for schedule(dynamic, chunk) nowait
+			for (k = 0; k < *n_active; k++) {
+				n = pixels[k];
+				if (! run_pixel_block(&s, N, n, first_step, nsteps, inputs,
+						&params, output1, output_index, outputs, sched))
+					first_error(&error, n);
+			}  /* for loop on active pixels */
+		}
+
+		/* bare ground and masked pixels, masked pixels keep their
+		   state in the outputs */
+#pragma omp for schedule(static)
+		for (k = *n_active; k < N; k++) {
+			n = pixels[k];
+			for (t = 0; t < nsteps; t++) {
+				if (k < *n_active + n_bare)
+					bare_ground(output1, n, ZERO_SUMS(first_step, t), tstep);
+				if (output_index[t] >= 0) {
+					copy_pixel(output1, n, outputs, output_index[t] * N + n);
+					if (k < *n_active + n_bare)
+						output1->time_since_out[n] = 0.0;
+				}
+			}
+			set_cost(sched, n, 0, 1);
+			set_hle1_iter(sched, n, 0);
+		}
+
+		if (counts != NULL) {
+#pragma omp critical
+			add_counts(counts, &s.counts);
+		}
+	}
 
-	return -1;
+	return error;
 
 }
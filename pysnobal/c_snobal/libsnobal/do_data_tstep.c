@@ -6,7 +6,7 @@
  **	#include "snobal.h"
  **
  **	int
- **	do_data_tstep(void)
+ **	do_data_tstep(snobal_state_t *s)
  **
  ** DESCRIPTION
  **	This routine performs the model's calculations for 1 data timestep
@@ -48,7 +48,7 @@
  **	FALSE	An error occured, and a message explaining the error has
  **		been stored with the 'usrerr' routine.
  **
- ** GLOBAL VARIABLES READ
+ ** STATE VARIABLES READ
  **	e_a
  **	I_lw
  **	in_rec
@@ -68,30 +68,25 @@
  **	u
  **	z_snow_data
  **
- ** GLOBAL VARIABLES MODIFIED
+ ** STATE VARIABLES MODIFIED
+ **	lo
  **	precip_now
  **	stop_no_snow
  */
 
+#include <math.h>
 #include <omp.h>
 //#include	"ipw.h"
 #include        "envphys.h"
 #include        "_snobal.h"
 
 int
-do_data_tstep(void)
+do_data_tstep(snobal_state_t *s)
 {
-	//	static PRECIP_REC *pp_info    = precip_info;
+	PRECIP_REC *pp_info = s->precip_info;
 	/* precip info for data timestep */
-	//	static TSTEP_REC  *data_tstep = tstep_info;
+	TSTEP_REC  *data_tstep = s->tstep_info;
 	/* timestep info for data timestep */
-	static PRECIP_REC *pp_info;
-#pragma omp threadprivate(pp_info)
-	pp_info = precip_info;
-
-	static TSTEP_REC *data_tstep;
-#pragma omp threadprivate(data_tstep)
-	data_tstep = tstep_info;
 
 //	printf("%i -- %i -- %f -- %f\n", tstep_info[0].level, tstep_info[0].time_step, tstep_info[0].intervals, tstep_info[0].threshold);
 //	printf("%i -- %i -- %f -- %f\n", tstep_info[1].level, tstep_info[1].time_step, tstep_info[1].intervals, tstep_info[1].threshold);
@@ -105,17 +100,23 @@ do_data_tstep(void)
 
 	int	level;			/* loop index */
 
+	/*
+	 *  hle1 isn't warm started across data timesteps, so the results
+	 *  don't depend on how the data timesteps are run.
+	 */
+	s->lo = HUGE_VAL;
+
 	/*
 	 *  Copy values from first input record into global variables.
 	 */
-	S_n  = input_rec1.S_n;
-	I_lw = input_rec1.I_lw;
-	T_a  = input_rec1.T_a;
-	e_a  = input_rec1.e_a;
-	u    = input_rec1.u  ;
-	T_g  = input_rec1.T_g;
-	if (ro_data)
-		ro = input_rec1.ro;
+	s->S_n  = s->input_rec1.S_n;
+	s->I_lw = s->input_rec1.I_lw;
+	s->T_a  = s->input_rec1.T_a;
+	s->e_a  = s->input_rec1.e_a;
+	s->u    = s->input_rec1.u  ;
+	s->T_g  = s->input_rec1.T_g;
+	if (s->ro_data)
+		s->ro = s->input_rec1.ro;
 
 	//	printf("%f - %f - %f - %f - %f - %f\n", S_n, I_lw, T_a, e_a, u, T_g);
 	//	printf("%f\n", max_h2o_vol);
@@ -125,26 +126,26 @@ do_data_tstep(void)
 	 *  Compute deltas for the climate input parameters over
 	 *  the data timestep.
 	 */
-	input_deltas[DATA_TSTEP].S_n  = input_rec2.S_n  - input_rec1.S_n;
-	input_deltas[DATA_TSTEP].I_lw = input_rec2.I_lw - input_rec1.I_lw;
-	input_deltas[DATA_TSTEP].T_a  = input_rec2.T_a  - input_rec1.T_a;
-	input_deltas[DATA_TSTEP].e_a  = input_rec2.e_a  - input_rec1.e_a;
-	input_deltas[DATA_TSTEP].u    = input_rec2.u    - input_rec1.u;
-	input_deltas[DATA_TSTEP].T_g  = input_rec2.T_g  - input_rec1.T_g;
-	if (ro_data)
-		input_deltas[DATA_TSTEP].ro = input_rec2.ro - input_rec1.ro;
+	s->input_deltas[DATA_TSTEP].S_n  = s->input_rec2.S_n  - s->input_rec1.S_n;
+	s->input_deltas[DATA_TSTEP].I_lw = s->input_rec2.I_lw - s->input_rec1.I_lw;
+	s->input_deltas[DATA_TSTEP].T_a  = s->input_rec2.T_a  - s->input_rec1.T_a;
+	s->input_deltas[DATA_TSTEP].e_a  = s->input_rec2.e_a  - s->input_rec1.e_a;
+	s->input_deltas[DATA_TSTEP].u    = s->input_rec2.u    - s->input_rec1.u;
+	s->input_deltas[DATA_TSTEP].T_g  = s->input_rec2.T_g  - s->input_rec1.T_g;
+	if (s->ro_data)
+		s->input_deltas[DATA_TSTEP].ro = s->input_rec2.ro - s->input_rec1.ro;
 
 	/*
 	 *  If there is precipitation, then compute the amount of rain &
 	 *  snow in it.
 	 */
-	if (precip_now) {
-		pp_info->m_pp   = m_pp;
-		pp_info->m_snow = percent_snow * m_pp;
-		pp_info->m_rain = m_pp - pp_info->m_snow;
+	if (s->precip_now) {
+		pp_info->m_pp   = s->m_pp;
+		pp_info->m_snow = s->percent_snow * s->m_pp;
+		pp_info->m_rain = s->m_pp - pp_info->m_snow;
 		if (pp_info->m_snow > 0.0) {
-			if (rho_snow > 0.0)
-				pp_info->z_snow = pp_info->m_snow / rho_snow;
+			if (s->rho_snow > 0.0)
+				pp_info->z_snow = pp_info->m_snow / s->rho_snow;
 			else {
 				//				usrerr("rho_snow is <= 0.0 with %_snow > 0.0");
 				fprintf(stderr, "rho_snow is <= 0.0 with %_snow > 0.0");
@@ -158,22 +159,22 @@ do_data_tstep(void)
 		 *  Mixed snow and rain
 		 */
 		if ((pp_info->m_snow > 0.0) && (pp_info->m_rain > 0.0)) {
-			T_snow = FREEZE;
-			h2o_sat_snow = 1.0;
-			T_rain = T_pp;
+			s->T_snow = FREEZE;
+			s->h2o_sat_snow = 1.0;
+			s->T_rain = s->T_pp;
 		}
 
 		/*
 		 *  Snow only
 		 */
 		else if (pp_info->m_snow > 0.0) {
-			if (T_pp < FREEZE) {		/* Cold snow */
-				T_snow = T_pp;
-				h2o_sat_snow = 0.0;
+			if (s->T_pp < FREEZE) {		/* Cold snow */
+				s->T_snow = s->T_pp;
+				s->h2o_sat_snow = 0.0;
 			}
 			else {				/* Warm snow */
-				T_snow = FREEZE;
-				h2o_sat_snow = 1.0;
+				s->T_snow = FREEZE;
+				s->h2o_sat_snow = 1.0;
 			}
 		}
 
@@ -181,7 +182,7 @@ do_data_tstep(void)
 		 *  Rain only
 		 */
 		else if (pp_info->m_rain > 0.0) {
-			T_rain = T_pp;
+			s->T_rain = s->T_pp;
 		}
 	}
 
@@ -189,10 +190,10 @@ do_data_tstep(void)
 	 *  Clear the 'computed' flag at the other timestep levels.
 	 */
 	for (level = NORMAL_TSTEP; level <= SMALL_TSTEP; level++)
-		computed[level] = FALSE;
+		s->computed[level] = FALSE;
 
 	/*
 	 *  Divide the data timestep into normal run timesteps.
 	 */
-	return _divide_tstep(data_tstep);
+	return _divide_tstep(s, data_tstep);
 }
@@ -1,17 +1,24 @@
 //#include	"ipw.h"
 #include	"envphys.h"
 
-double
+/*
+ * Effective thermal conductivity of a layer with the vapor diffusion.
+ *
+ * Returns 0 (FALSE) if the saturation vapor pressure can't be found for
+ * the temperature, see sati.
+ */
+real_t
 efcon(
-	double	k,	/* layer thermal conductivity (J/(m K sec)) */
-	double	t,	/* layer temperature (K)		    */
-	double	p)	/* air pressure (Pa)  			    */
+	real_t	k,	/* layer thermal conductivity (J/(m K sec)) */
+	real_t	t,	/* layer temperature (K)		    */
+	real_t	p,	/* air pressure (Pa)  			    */
+	int	table)	/* use the sati tables?			    */
 {
-	double	etc;
-	double	de;
-	double	lh;
-	double	e;
-	double	q;
+	real_t	etc;
+	real_t	de;
+	real_t	lh;
+	real_t	e;
+	real_t	q;
 
 	/*	calculate effective layer diffusion
 		(see Anderson, 1976, pg. 32)		*/
@@ -26,7 +33,9 @@ efcon(
 		lh = LH_SUB(t);
 
 	/*	set mixing ratio from layer temp.	*/
-	e = sati(t);
+	e = sati(t, table);
+	if (e == 0.0)
+		return (0.0);
 	q = MIX_RATIO(e, p);
 
 	/*	calculate effective layer conductivity	*/
@@ -1,13 +1,13 @@
 //#include "ipw.h"
 #include "envphys.h"
 
-double
+real_t
 evap(
-	double	le,	/* latent heat transfer (W/m**2) */
-	double	ts)	/* surface temperature (K)       */
+	real_t	le,	/* latent heat transfer (W/m**2) */
+	real_t	ts)	/* surface temperature (K)       */
 {
-	double	rate;
-	double	lh;
+	real_t	rate;
+	real_t	lh;
 
 	if(ts > FREEZE)
 		lh = LH_VAP(ts);
@@ -1,36 +1,43 @@
 //#include "ipw.h"
 #include "snow.h"
 
-double
+/*
+ * Heat transfer by conduction and diffusion between two snow layers, in
+ * *g.  Returns FALSE if either conductivity couldn't be found, see efcon.
+ */
+int
 g_snow(
-	double	rho1,	/* upper snow layer's density (kg/m^3)	*/
-	double	rho2,	/* lower  "     "        "    (kg/m^3)	*/
-	double	ts1,	/* upper snow layer's temperature (K)	*/
-	double	ts2,	/* lower  "     "         "       (K)	*/
-	double	ds1,	/* upper snow layer's thickness (m)	*/
-	double	ds2,	/* lower  "     "         "     (m)	*/
-	double	pa)	/* air pressure (Pa)			*/
+	real_t	rho1,	/* upper snow layer's density (kg/m^3)	*/
+	real_t	rho2,	/* lower  "     "        "    (kg/m^3)	*/
+	real_t	ts1,	/* upper snow layer's temperature (K)	*/
+	real_t	ts2,	/* lower  "     "         "       (K)	*/
+	real_t	ds1,	/* upper snow layer's thickness (m)	*/
+	real_t	ds2,	/* lower  "     "         "     (m)	*/
+	real_t	pa,	/* air pressure (Pa)			*/
+	int	table,	/* use the sati tables?			*/
+	real_t	*g)	/* -> heat transfer (W/m^2)		*/
 {
-	double	kcs1;
-	double	kcs2;
-	double	k_s1;
-	double	k_s2;
-	double	g;
+	real_t	kcs1;
+	real_t	kcs2;
+	real_t	k_s1;
+	real_t	k_s2;
 
 
 /*	calculate G	*/
 	if (ts1 == ts2)
-		g = 0.0;
+		*g = 0.0;
 	else {
 	/*	set snow conductivity	*/
 		kcs1 = KTS(rho1);
 		kcs2 = KTS(rho2);
-		k_s1 = efcon(kcs1, ts1, pa);
-		k_s2 = efcon(kcs2, ts2, pa);
+		k_s1 = efcon(kcs1, ts1, pa, table);
+		k_s2 = efcon(kcs2, ts2, pa, table);
+		if ((k_s1 == 0.0) || (k_s2 == 0.0))
+			return (FALSE);
 
 	/*	calculate g	*/
-		g = ssxfr(k_s1, k_s2, ts1, ts2, ds1, ds2);
+		*g = ssxfr(k_s1, k_s2, ts1, ts2, ds1, ds2);
 	}
 
-	return (g);
+	return (TRUE);
 }
@@ -1,19 +1,25 @@
 //#include "ipw.h"
 #include "snow.h"
 
-double
+/*
+ * Heat transfer by conduction and diffusion between the soil and the
+ * snow layer above it, in *g.  Returns FALSE if either conductivity
+ * couldn't be found, see efcon.
+ */
+int
 g_soil(
-		double	rho,	/* snow layer's density (kg/m^3)	     */
-		double	tsno,	/* snow layer's temperature (K)		     */
-		double	tg,	/* soil temperature (K)			     */
-		double	ds,	/* snow layer's thickness (m)		     */
-		double	dg,	/* dpeth of soil temperature measurement (m) */
-		double	pa)	/* air pressure (Pa)			     */
+		real_t	rho,	/* snow layer's density (kg/m^3)	     */
+		real_t	tsno,	/* snow layer's temperature (K)		     */
+		real_t	tg,	/* soil temperature (K)			     */
+		real_t	ds,	/* snow layer's thickness (m)		     */
+		real_t	dg,	/* dpeth of soil temperature measurement (m) */
+		real_t	pa,	/* air pressure (Pa)			     */
+		int	table,	/* use the sati tables?			     */
+		real_t	*g)	/* -> heat transfer (W/m^2)		     */
 {
-	double	k_g;
-	double	kcs;
-	double	k_s;
-	double	g;
+	real_t	k_g;
+	real_t	kcs;
+	real_t	k_s;
 
 	/*	check tsno	*/
 	if (tsno > FREEZE) {
@@ -27,14 +33,16 @@ g_soil(
 	/***	based on heat flux data from RMSP			***/
 	/***	note: Kt should be passed as an argument		***/
 	/***	k_g = efcon(KT_WETSAND, tg, pa);			***/
-	k_g = efcon(KT_MOISTSAND, tg, pa);
+	k_g = efcon(KT_MOISTSAND, tg, pa, table);
 
 	/*	calculate G	*/
 	/*	set snow conductivity	*/
 	kcs = KTS(rho);
-	k_s = efcon(kcs, tsno, pa);
+	k_s = efcon(kcs, tsno, pa, table);
+	if ((k_g == 0.0) || (k_s == 0.0))
+		return (FALSE);
 
-	g = ssxfr(k_s, k_g, tsno, tg, ds, dg);
+	*g = ssxfr(k_s, k_g, tsno, tg, ds, dg);
 
-	return (g);
+	return (TRUE);
 }
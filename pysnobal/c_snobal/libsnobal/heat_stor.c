@@ -1,13 +1,13 @@
 //#include "ipw.h"
 #include "envphys.h"
 
-double
+real_t
 heat_stor(
-	double	cp,	/* specific heat of layer (J/kg K) */
-	double	spm,	/* layer specific mass (kg/m^2)    */
-	double	tdif)	/* temperature change (K)          */
+	real_t	cp,	/* specific heat of layer (J/kg K) */
+	real_t	spm,	/* layer specific mass (kg/m^2)    */
+	real_t	tdif)	/* temperature change (K)          */
 {
-	double	stor;
+	real_t	stor;
 
 	stor = cp * spm * tdif;
 
@@ -24,13 +24,13 @@
  *		SV	latent heat flux
  */
 
-static double
+static real_t
 psi(
-		double	zeta,		/* z/lo				*/
+		real_t	zeta,		/* z/lo				*/
 		int	code)		/* which psi function? (see above) */
 {
-	double	x;		/* height function variable	*/
-	double	result;
+	real_t	x;		/* height function variable	*/
+	real_t	result;
 
 	if (zeta > 0) {		/* stable */
 		if (zeta > 1)
@@ -56,7 +56,7 @@ psi(
 		default: /* shouldn't reach */
 //			bug("psi-function code not of these: SM, SH, SV");
 			fprintf(stderr, "psi-function code not of these: SM, SH, SV");
-			exit(EXIT_FAILURE);
+			result = 0;
 		}
 	}
 
@@ -69,46 +69,61 @@ psi(
 
 /* ----------------------------------------------------------------------- */
 
+/*
+ * hle1 that also returns the number of iterations on the Obukhov length
+ * in niter.  The iteration starts from the Obukhov length in *l_ob, e.g.
+ * the solution of the previous run timestep, or from neutral stability if
+ * it isn't finite.  The solution is returned in *l_ob, HUGE_VAL for
+ * neutral stability.  With table TRUE the saturation vapor pressures are
+ * taken from the tables, see sat_table.c.
+ */
 int
-hle1(
-		double	press,	/* air pressure (Pa)			*/
-		double	ta,	/* air temperature (K) at height za	*/
-		double	ts,	/* surface temperature (K)		*/
-		double	za,	/* height of air temp measurement (m)	*/
-		double	ea,	/* vapor pressure (Pa) at height zq	*/
-		double	es,	/* vapor pressure (Pa) at surface	*/
-		double	zq,	/* height of spec hum measurement (m)	*/
-		double	u,	/* wind speed (m/s) at height zu	*/
-		double	zu,	/* height of wind speed measurement (m)	*/
-		double	z0,	/* roughness length (m)			*/
+hle1_iter(
+		real_t	press,	/* air pressure (Pa)			*/
+		real_t	ta,	/* air temperature (K) at height za	*/
+		real_t	ts,	/* surface temperature (K)		*/
+		real_t	za,	/* height of air temp measurement (m)	*/
+		real_t	ea,	/* vapor pressure (Pa) at height zq	*/
+		real_t	es,	/* vapor pressure (Pa) at surface	*/
+		real_t	zq,	/* height of spec hum measurement (m)	*/
+		real_t	u,	/* wind speed (m/s) at height zu	*/
+		real_t	zu,	/* height of wind speed measurement (m)	*/
+		real_t	z0,	/* roughness length (m)			*/
+		int	table,	/* use the sati and satw tables?	*/
 
 		/* output variables */
 
-		double *h,	/* sens heat flux (+ to surf) (W/m^2)	*/
-		double *le,	/* latent heat flux (+ to surf) (W/m^2)	*/
-		double *e)	/* mass flux (+ to surf) (kg/m^2/s)	*/
+		real_t *h,	/* sens heat flux (+ to surf) (W/m^2)	*/
+		real_t *le,	/* latent heat flux (+ to surf) (W/m^2)	*/
+		real_t *e,	/* mass flux (+ to surf) (kg/m^2/s)	*/
+		real_t *l_ob,	/* Obukhov length (m), start & solution	*/
+		int    *niter)	/* # of iterations			*/
 {
-	double	ah = AH;
-	double	av = AV;
-	double	cp = CP_AIR;
-	double	d0;	/* displacement height (eq. 5.3)	*/
-	double	dens;	/* air density				*/
-	double	diff;	/* difference between guesses		*/
-	double	factor;
-	double	g = GRAVITY;
-	double	k = VON_KARMAN;
-	double	last;	/* last guess at lo			*/
-	double	lo;	/* Obukhov stability length (eq. 4.25)	*/
-	double	ltsh;	/* log ((za-d0)/z0)			*/
-	double	ltsm;	/* log ((zu-d0)/z0)			*/
-	double	ltsv;	/* log ((zq-d0)/z0)			*/
-	double	qa;	/* specific humidity at height zq	*/
-	double	qs;	/* specific humidity at surface		*/
-	double	ustar;	/* friction velocity (eq. 4.34')	*/
-	double	xlh;	/* latent heat of vap/subl		*/
+	real_t	ah = AH;
+	real_t	av = AV;
+	real_t	cp = CP_AIR;
+	real_t	d0;	/* displacement height (eq. 5.3)	*/
+	real_t	dens;	/* air density				*/
+	real_t	ea_sat;	/* saturation vapor pressure at ta	*/
+	real_t	es_sat;	/* saturation vapor pressure at ts	*/
+	real_t	diff;	/* difference between guesses		*/
+	real_t	factor;
+	real_t	g = GRAVITY;
+	real_t	k = VON_KARMAN;
+	real_t	last;	/* last guess at lo			*/
+	real_t	lo;	/* Obukhov stability length (eq. 4.25)	*/
+	real_t	ltsh;	/* log ((za-d0)/z0)			*/
+	real_t	ltsm;	/* log ((zu-d0)/z0)			*/
+	real_t	ltsv;	/* log ((zq-d0)/z0)			*/
+	real_t	qa;	/* specific humidity at height zq	*/
+	real_t	qs;	/* specific humidity at surface		*/
+	real_t	ustar;	/* friction velocity (eq. 4.34')	*/
+	real_t	xlh;	/* latent heat of vap/subl		*/
 	int	ier;	/* return error code			*/
 	int	iter;	/* iteration counter			*/
 
+	*niter = 0;
+
 	/*
 	 * check for bad input
 	 */
@@ -143,21 +158,27 @@ hle1(
 	}
 
 	/* vapor pressures can't exceed saturation */
+	es_sat = sati(ts, table);
+	ea_sat = satw(ta, table);
+	if (es_sat == FALSE || ea_sat == FALSE) {
+		ier = -2;
+		return (ier);
+	}
 	/* if way off stop */
-	if ((es - 25.0) > sati(ts) || (ea - 25.0) > satw(ta)) {
+	if ((es - 25.0) > es_sat || (ea - 25.0) > ea_sat) {
 //		usrerr ("vp > sat; es=%f\tessat=%f\tea=%f\teasat=%f",
 //				es, sati(ts), ea, sati(ta));
 		fprintf(stderr, "vp > sat; es=%f\tessat=%f\tea=%f\teasat=%f",
-				es, sati(ts), ea, sati(ta));
+				es, es_sat, ea, ea_sat);
 		ier = -2;
 		return (ier);
 	}
 	/* else fix them up */
-	if (es > sati(ts)) {
-		es = sati(ts);
+	if (es > es_sat) {
+		es = es_sat;
 	}
-	if (ea > satw(ta)) {
-		ea = satw(ta);
+	if (ea > ea_sat) {
+		ea = ea_sat;
 	}
 
 	/*
@@ -203,6 +224,19 @@ hle1(
 	factor = k * ustar * dens;
 	*e = (qa - qs) * factor * av / ltsv;
 	*h = (ta - ts) * factor * cp * ah / ltsh;
+	lo = HUGE_VAL;
+
+	/*
+	 * warm start, the fluxes from the starting stability length
+	 */
+
+	if (ta != ts && isfinite(*l_ob)) {
+		lo = *l_ob;
+		ustar = k * u / (ltsm - psi(zu/lo, SM));
+		factor = k * ustar * dens;
+		*e = (qa - qs) * factor * av / (ltsv - psi(zq/lo, SV));
+		*h = (ta - ts) * factor * ah * cp / (ltsh - psi(za/lo, SH));
+	}
 
 	/*
 	 * if not neutral stability, iterate on Obukhov stability
@@ -212,10 +246,9 @@ hle1(
 	iter = 0;
 	if (ta != ts) {
 
-		lo = HUGE_VAL;
-
 		do {
 			last = lo;
+			(*niter)++;
 
 			/*
 			 * Eq 4.25, but no minus sign as we define
@@ -261,6 +294,7 @@ hle1(
 	}
 
 	ier = (iter >= ITMAX)? -1 : 0;
+	*l_ob = lo;
 
 	xlh = LH_VAP(ts);
 	if (ts <= FREEZE)
@@ -273,3 +307,31 @@ hle1(
 
 	return (ier);
 }
+
+/* ----------------------------------------------------------------------- */
+
+int
+hle1(
+		real_t	press,	/* air pressure (Pa)			*/
+		real_t	ta,	/* air temperature (K) at height za	*/
+		real_t	ts,	/* surface temperature (K)		*/
+		real_t	za,	/* height of air temp measurement (m)	*/
+		real_t	ea,	/* vapor pressure (Pa) at height zq	*/
+		real_t	es,	/* vapor pressure (Pa) at surface	*/
+		real_t	zq,	/* height of spec hum measurement (m)	*/
+		real_t	u,	/* wind speed (m/s) at height zu	*/
+		real_t	zu,	/* height of wind speed measurement (m)	*/
+		real_t	z0,	/* roughness length (m)			*/
+
+		/* output variables */
+
+		real_t *h,	/* sens heat flux (+ to surf) (W/m^2)	*/
+		real_t *le,	/* latent heat flux (+ to surf) (W/m^2)	*/
+		real_t *e)	/* mass flux (+ to surf) (kg/m^2/s)	*/
+{
+	real_t	l_ob = HUGE_VAL;
+	int	niter;
+
+	return hle1_iter(press, ta, ts, za, ea, es, zq, u, zu, z0, FALSE, h, le,
+			e, &l_ob, &niter);
+}
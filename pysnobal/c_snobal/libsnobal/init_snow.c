@@ -6,7 +6,7 @@
 **      #include "snobal.h"
 **
 **      void
-**	init_snow(void)
+**	init_snow(snobal_state_t *s)
 **
 ** DESCRIPTION
 **      This routine initializes the properties for the snowcover.  It
@@ -25,7 +25,7 @@
 **		max_h2o_vol	maximum liquid h2o content as volume ratio:
 **				    V_water/(V_snow - V_ice) (unitless)
 **
-** GLOBAL VARIABLES READ
+** STATE VARIABLES READ
 **	h2o_sat
 **	layer_count
 **	m_s_0
@@ -37,7 +37,7 @@
 **	T_s_l
 **	z_s
 **
-** GLOBAL VARIABLES MODIFIED
+** STATE VARIABLES MODIFIED
 **	cc_s
 **	cc_s_0
 **	cc_s_l
@@ -61,34 +61,34 @@
 #include "snow.h"
 
 void
-init_snow(void)
+init_snow(snobal_state_t *s)
 {
-	double	rho_dry;	/* snow density without H2O */
+	real_t	rho_dry;	/* snow density without H2O */
 
-	m_s = rho * z_s;
+	s->m_s = s->rho * s->z_s;
 
-	_calc_layers();
+	_calc_layers(s);
 
-	if (layer_count == 0) {
+	if (s->layer_count == 0) {
 		/*
 		 *  If mass > 0, then it must be below threshold.
 		 *  So turn this little bit of mass into water.
 		 */
-		if (m_s > 0.0)
-			h2o_total += m_s;
+		if (s->m_s > 0.0)
+			s->h2o_total += s->m_s;
 
-		rho = 0.0;
-		m_s   = cc_s   = 0.0;
-		m_s_0 = cc_s_0 = 0.0;
-		m_s_l = cc_s_l = 0.0;
+		s->rho = 0.0;
+		s->m_s   = s->cc_s   = 0.0;
+		s->m_s_0 = s->cc_s_0 = 0.0;
+		s->m_s_l = s->cc_s_l = 0.0;
 
 		/*
 		 *  Note: Snow temperatures are set to MIN_SNOW_TEMP
 		 *	  (as degrees K) instead of 0 K to keep quantization
 		 *	  range in output image smaller.
 		 */
-		T_s = T_s_0 = T_s_l = MIN_SNOW_TEMP + FREEZE;
-		h2o_vol = h2o = h2o_max = h2o_sat = 0.0;
+		s->T_s = s->T_s_0 = s->T_s_l = MIN_SNOW_TEMP + FREEZE;
+		s->h2o_vol = s->h2o = s->h2o_max = s->h2o_sat = 0.0;
 
 	}
 
@@ -96,30 +96,30 @@ init_snow(void)
 		/*
 		 *  Compute specific mass for each layer.
 		 */
-		_layer_mass();
+		_layer_mass(s);
 
-		cc_s_0 = _cold_content(T_s_0, m_s_0);
+		s->cc_s_0 = _cold_content(s->T_s_0, s->m_s_0);
 
-		if (layer_count == 2) {
-			cc_s_l = _cold_content(T_s_l, m_s_l);
+		if (s->layer_count == 2) {
+			s->cc_s_l = _cold_content(s->T_s_l, s->m_s_l);
 		}
 		else {
-			T_s_l = MIN_SNOW_TEMP + FREEZE;
-			cc_s_l = 0.0;
+			s->T_s_l = MIN_SNOW_TEMP + FREEZE;
+			s->cc_s_l = 0.0;
 		}
 
 		/*
 		 *  Compute liquid water content as volume ratio, and
 		 *  snow density without water.
 		 */
-		h2o_vol = h2o_sat * max_h2o_vol;
-		rho_dry = DRY_SNO_RHO(rho, h2o_vol);
+		s->h2o_vol = s->h2o_sat * s->max_h2o_vol;
+		rho_dry = DRY_SNO_RHO(s->rho, s->h2o_vol);
 
 		/*
 		 *  Determine maximum liquid water content (as specific mass)
 		 *  and the actual liquid water content (as specific mass).
 		 */
-		h2o_max = H2O_LEFT(z_s, rho_dry, max_h2o_vol);
-		h2o = h2o_sat * h2o_max;
+		s->h2o_max = H2O_LEFT(s->z_s, rho_dry, s->max_h2o_vol);
+		s->h2o = s->h2o_sat * s->h2o_max;
 	}
 }
@@ -1,15 +1,15 @@
 //#include "ipw.h"
 #include "snow.h"
 
-double
+real_t
 new_tsno(
-	double	spm,	/* layer's specific mass (kg/m^2) 	 */
-	double	t0,	/* layer's last temperature (K) 	 */
-	double	ccon)	/* layer's adjusted cold content (J/m^2) */
+	real_t	spm,	/* layer's specific mass (kg/m^2) 	 */
+	real_t	t0,	/* layer's last temperature (K) 	 */
+	real_t	ccon)	/* layer's adjusted cold content (J/m^2) */
 {
-	double	tsno;
-	double	cp;
-	double	tdif;
+	real_t	tsno;
+	real_t	cp;
+	real_t	tdif;
 
 	cp = CP_ICE(t0);
 
@@ -0,0 +1,61 @@
+/*
+ * sat_table.c - tabulated saturation vapor pressures for sati and satw
+ *
+ * The saturation vapor pressures over ice and water are tabulated every
+ * SAT_TABLE_STEP K from SAT_TABLE_MIN to SAT_TABLE_MAX and interpolated
+ * with a cubic through the four nearest points. Outside of the table
+ * sati and satw use the formulas.
+ *
+ * sati and satw only use the tables when their table argument is TRUE,
+ * which the model takes from the sat_table of its state.  init_sat_table
+ * must be called before then.
+ */
+
+#include "envphys.h"
+#include "_envphys.h"
+
+real_t	_sati_table[SAT_TABLE_N];	/* over ice, also above freezing */
+real_t	_satw_table[SAT_TABLE_N];	/* over water */
+
+static int filled = FALSE;
+
+/*
+ * Fill the tables, the first call fills them and later calls do nothing.
+ * It must not be called while a model that uses the tables is running.
+ */
+void
+init_sat_table(void)
+{
+	int	i;
+	real_t	tk;
+
+	if (filled)
+		return;
+
+	for (i = 0; i < SAT_TABLE_N; i++) {
+		tk = SAT_TABLE_MIN + i * SAT_TABLE_STEP;
+		_sati_table[i] = _sati_ice(tk);
+		_satw_table[i] = satw(tk, FALSE);
+	}
+	filled = TRUE;
+}
+
+/*
+ * Cubic (4 point Lagrange) interpolation in table for tk, which must be
+ * SAT_TABLE_IN
+ */
+real_t
+_sat_table(
+		const real_t *table,
+		real_t	tk)
+{
+	real_t	x = (tk - SAT_TABLE_MIN) / SAT_TABLE_STEP;
+	int	i = (int) x;
+	real_t	t = x - i;
+	const real_t *y = table + i - 1;
+
+	return	- y[0] * t * (t - 1) * (t - 2) / 6
+		+ y[1] * (t + 1) * (t - 1) * (t - 2) / 2
+		- y[2] * (t + 1) * t * (t - 2) / 2
+		+ y[3] * (t + 1) * t * (t - 1) / 6;
+}
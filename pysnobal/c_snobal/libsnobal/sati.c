@@ -3,37 +3,61 @@
 
 //#include "ipw.h"
 #include "envphys.h"
-
-double
+#include "_envphys.h"
+
+/*
+ * Saturation vapor pressure (Pa) over ice, over water above freezing.
+ * With table TRUE it's interpolated in the tables, see sat_table.c.
+ *
+ * Returns 0 (FALSE) after printing a message if the temperature is bad,
+ * so that the caller can fail the pixel instead of stopping the run.
+ */
+real_t
 sati(
-		double  tk)		/* air temperature (K)	*/
+		real_t  tk,		/* air temperature (K)	*/
+		int	table)		/* use the tables?	*/
 {
-	double  l10;
-	double  x;
+	real_t  x;
 
 	if (tk <= 0.) {
 		fprintf(stderr, "tk=%f\n, less than zero", tk);
-//		assert(tk > 0.);
-		exit(EXIT_FAILURE);
+		return(0.0);
 	}
 
 	if (tk > FREEZE) {
-		x = satw(tk);
+		x = satw(tk, table);
 		return(x);
 	}
 
-	errno = 0;
-	l10 = log(1.e1);
+	if (table && SAT_TABLE_IN(tk))
+		return(_sat_table(_sati_table, tk));
 
-	x = pow(1.e1,-9.09718*((FREEZE/tk)-1.) - 3.56654*log(FREEZE/tk)/l10 +
-			8.76793e-1*(1.-(tk/FREEZE)) + log(6.1071)/l10);
+	errno = 0;
+	x = _sati_ice(tk);
 
 	if (errno) {
 		perror("sati: bad return from log or pow");
-		exit(EXIT_FAILURE);
-//		syserr();
-//		error("sati: bad return from log or pow");
+		return(0.0);
 	}
 
+	return(x);
+}
+
+/*
+ * The formula for the saturation vapor pressure (Pa) over ice, without
+ * the checks on the temperature
+ */
+real_t
+_sati_ice(
+		real_t  tk)		/* air temperature (K)	*/
+{
+	real_t  l10;
+	real_t  x;
+
+	l10 = log(1.e1);
+
+	x = pow(1.e1,-9.09718*((FREEZE/tk)-1.) - 3.56654*log(FREEZE/tk)/l10 +
+			8.76793e-1*(1.-(tk/FREEZE)) + log(6.1071)/l10);
+
 	return(x*1.e2);
 }
@@ -3,20 +3,31 @@
 
 //#include "ipw.h"
 #include "envphys.h"
-
-double
+#include "_envphys.h"
+
+/*
+ * Saturation vapor pressure (Pa) over water.  With table TRUE it's
+ * interpolated in the tables, see sat_table.c.
+ *
+ * Returns 0 (FALSE) after printing a message if the temperature is bad,
+ * so that the caller can fail the pixel instead of stopping the run.
+ */
+real_t
 satw(
-		double  tk)		/* air temperature (K)		*/
+		real_t  tk,		/* air temperature (K)		*/
+		int	table)		/* use the tables?		*/
 {
-	double  x;
-	double  l10;
+	real_t  x;
+	real_t  l10;
 
 	if (tk <= 0.) {
 		fprintf(stderr, "tk=%f\n, less than zero", tk);
-//		assert(tk > 0.);
-		exit(EXIT_FAILURE);
+		return(0.0);
 	}
 
+	if (table && SAT_TABLE_IN(tk))
+		return(_sat_table(_satw_table, tk));
+
 	errno = 0;
 	l10 = log(1.e1);
 
@@ -28,10 +39,8 @@ satw(
 	x = pow(1.e1,x);
 
 	if (errno) {
-		perror("sati: bad return from log or pow");
-		exit(EXIT_FAILURE);
-//		syserr();
-//		error("satw: bad return from log or pow");
+		perror("satw: bad return from log or pow");
+		return(0.0);
 	}
 
 	return(x);
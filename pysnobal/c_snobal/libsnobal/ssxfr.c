@@ -1,16 +1,16 @@
 //#include "ipw.h"
 #include "envphys.h"
 
-double
+real_t
 ssxfr(
-	double	k1,	/* layer 1's thermal conductivity (J / (m K sec))  */
-	double	k2,	/* layer 2's    "         "                        */
-	double	t1,	/* layer 1's average layer temperature (K)	   */
-	double	t2,	/* layer 2's    "      "        "         	   */
-	double	d1,     /* layer 1's thickness (m)			   */
-	double	d2)     /* layer 2's    "       "			   */
+	real_t	k1,	/* layer 1's thermal conductivity (J / (m K sec))  */
+	real_t	k2,	/* layer 2's    "         "                        */
+	real_t	t1,	/* layer 1's average layer temperature (K)	   */
+	real_t	t2,	/* layer 2's    "      "        "         	   */
+	real_t	d1,     /* layer 1's thickness (m)			   */
+	real_t	d2)     /* layer 2's    "       "			   */
 {
-	double	xfr;
+	real_t	xfr;
 
 	xfr = 2.0 * (k1 * k2 * (t2 - t1)) / ((k2 * d1) + (k1 * d2));
 
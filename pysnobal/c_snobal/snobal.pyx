@@ -7,11 +7,16 @@ import cython
 from cython.parallel import prange, parallel
 import numpy as np
 cimport numpy as np
+from time import perf_counter, process_time, thread_time
+from types import MappingProxyType
+
+from pysnobal.timing import RunStats
 
 from libc.stdlib cimport abort, calloc, malloc
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
 
 from libc.stdlib cimport free
+from libc.string cimport memset
 from cpython cimport PyObject, Py_INCREF
 
 
@@ -19,16 +24,7 @@ from cpython cimport PyObject, Py_INCREF
 # _always_ do that, or you will have segfaults
 np.import_array()
 
-cdef extern from "time.h":
-    ctypedef unsigned long clock_t
-    cdef clock_t clock()
-    cdef enum:
-        CLOCKS_PER_SEC
-
 cdef extern from "snobal.h":
-    void init_snow();
-    int do_data_tstep();
-
     ctypedef struct INPUT_REC:
         double S_n;
         double I_lw;
@@ -38,9 +34,6 @@ cdef extern from "snobal.h":
         double T_g;
         double ro;
 
-    INPUT_REC  input_rec1;
-    INPUT_REC  input_rec2;
-
     ctypedef struct TSTEP_REC:
         int level;
         double time_step;
@@ -48,56 +41,98 @@ cdef extern from "snobal.h":
         double threshold;
         int output;
 
-    cdef TSTEP_REC tstep_info[4]
-
-    int precip_now;
-    double m_pp;
-    double percent_snow;
-    double rho_snow;
-    double T_pp;
-
-    int layer_count;
-    double elevation;
-    double z_0;
-    double rho;
-    double T_s;
-    double T_s_0;
-    double T_s_l;
-    double h2o_sat;
-    double h2o;
-    double h2o_max;
-    double P_a;
-    double m_s;
-    double m_s_0;
-    double m_s_l;
-    double cc_s;
-    double cc_s_0;
-    double cc_s_l;
-    double z_s;
-    double z_s_0;
-    double z_s_l;
-
-    double R_n_bar;
-    double H_bar;
-    double L_v_E_bar;
-    double G_bar;
-    double G_0_bar;
-    double M_bar;
-    double delta_Q_bar;
-    double delta_Q_0_bar;
-    double E_s_sum;
-    double melt_sum;
-    double ro_pred_sum;
-
-    double current_time;
-    double time_since_out;
-
-    int relative_hts;
-    double z_g;
-    double z_u;
-    double z_T;
-    double max_h2o_vol;
-    double max_z_s_0;
+    ctypedef struct SNOBAL_COUNTS:
+        long divide_tstep[4];
+        long do_tstep[4];
+        long hle1_calls;
+        long hle1_iter;
+        long hle1_fail;
+
+    ctypedef struct snobal_state_t:
+        TSTEP_REC *tstep_info;
+
+        INPUT_REC input_rec1;
+        INPUT_REC input_rec2;
+
+        int precip_now;
+        double m_pp;
+        double percent_snow;
+        double rho_snow;
+        double T_pp;
+
+        int layer_count;
+        double z_0;
+        double rho;
+        double T_s;
+        double T_s_0;
+        double T_s_l;
+        double h2o_sat;
+        double h2o;
+        double h2o_max;
+        double P_a;
+        double m_s;
+        double m_s_0;
+        double m_s_l;
+        double cc_s;
+        double cc_s_0;
+        double cc_s_l;
+        double z_s;
+        double z_s_0;
+        double z_s_l;
+
+        double R_n_bar;
+        double H_bar;
+        double L_v_E_bar;
+        double G_bar;
+        double G_0_bar;
+        double M_bar;
+        double delta_Q_bar;
+        double delta_Q_0_bar;
+        double E_s_sum;
+        double melt_sum;
+        double ro_pred_sum;
+
+        double current_time;
+        double time_since_out;
+
+        int relative_hts;
+        double z_g;
+        double z_u;
+        double z_T;
+        double max_h2o_vol;
+        double max_z_s_0;
+        int sat_table;
+        int hle1_warm_start;
+
+        double time_step;
+        int snowcover;
+        double S_n;
+        double I_lw;
+        double T_a;
+        double e_a;
+        double u;
+        double T_g;
+        double m_rain;
+        double m_snow;
+        double T_rain;
+        double T_snow;
+
+        double R_n;
+        double H;
+        double L_v_E;
+        double E;
+        double G;
+        double G_0;
+        double M;
+        double delta_Q;
+        double delta_Q_0;
+        double lo;
+
+    void init_snow(snobal_state_t *s);
+    int do_data_tstep(snobal_state_t *s);
+
+cdef extern from "libsnobal/_snobal.h":
+    int _e_bal(snobal_state_t *s);
 
 
 cdef extern from "envphys.h":
@@ -107,6 +142,9 @@ cdef extern from "envphys.h":
     cdef double GRAVITY;
     cdef double MOL_AIR;
     cdef double HYSTAT(double pb, double tb, double L, double h, double g, double m);
+    double c_sati "sati"(double tk, int table);
+    double c_satw "satw"(double tk, int table);
+    void init_sat_table();
 
 # ctypedef struct OUTPUT_REC:
 #         int masked;
@@ -133,7 +171,8 @@ cdef extern from "envphys.h":
 
 cdef extern from "pysnobal.h":
     #cdef int call_snobal(int N, int nthreads, int first_step, TSTEP_REC tstep_info[4], OUTPUT_REC** output_rec, INPUT_REC_ARR* input1, INPUT_REC_ARR* input2, PARAMS params, OUTPUT_REC_ARR* output1);
-    cdef int call_snobal(int N, int nthreads, int first_step, TSTEP_REC tstep_info[4], INPUT_REC_ARR* input1, INPUT_REC_ARR* input2, PARAMS params, OUTPUT_REC_ARR* output1);
+    cdef int call_snobal(int N, int nthreads, int first_step, int compact, TSTEP_REC tstep_info[4], INPUT_REC_ARR* input1, INPUT_REC_ARR* input2, PARAMS params, OUTPUT_REC_ARR* output1, int* pixels, int* n_active, SCHEDULE* sched, SNOBAL_COUNTS* counts) nogil;
+    cdef int call_snobal_block(int N, int nthreads, int first_step, int compact, int nsteps, TSTEP_REC tstep_info[4], INPUT_REC_ARR* inputs, PARAMS params, OUTPUT_REC_ARR* output1, int* output_index, OUTPUT_REC_ARR* outputs, int* pixels, int* n_active, SCHEDULE* sched, SNOBAL_COUNTS* counts) nogil;
 
     ctypedef struct OUTPUT_REC:
         int masked;
@@ -208,6 +247,20 @@ cdef extern from "pysnobal.h":
         double* E_s_sum;
         double* melt_sum;
         double* ro_pred_sum;
+        unsigned char* masked_c;
+        signed char* layer_count_c;
+        float* R_n_bar_c;
+        float* H_bar_c;
+        float* L_v_E_bar_c;
+        float* G_bar_c;
+        float* G_0_bar_c;
+        float* M_bar_c;
+        float* delta_Q_bar_c;
+        float* delta_Q_0_bar_c;
+        float* E_s_sum_c;
+        float* melt_sum_c;
+        float* ro_pred_sum_c;
+        int npix;
 
     ctypedef struct INPUT_REC_ARR:
         double* S_n;
@@ -220,6 +273,16 @@ cdef extern from "pysnobal.h":
         double* percent_snow;
         double* rho_snow;
         double* T_pp;
+        float* S_n_f;
+        float* I_lw_f;
+        float* T_a_f;
+        float* e_a_f;
+        float* u_f;
+        float* T_g_f;
+        float* m_pp_f;
+        float* percent_snow_f;
+        float* rho_snow_f;
+        float* T_pp_f;
 
     ctypedef struct PARAMS:
         double z_u;
@@ -228,359 +291,989 @@ cdef extern from "pysnobal.h":
         int relative_heights;
         double max_h2o_vol;
         double max_z_s_0;
+        int sat_table;
+        int hle1_warm_start;
+        double* z_u_arr;
+        double* z_T_arr;
+        double* z_g_arr;
+        double* P_a_arr;
+        double* max_h2o_vol_arr;
+        double* max_z_s_0_arr;
+
+    ctypedef struct SCHEDULE:
+        int type;
+        int chunk;
+        int* cost;
+        int* work;
+        int* hle1_iter;
+
+
+
+# Fields of the model state (OUTPUT_REC_ARR). The mask and layer_count are
+# integers in the C structure, all the others are doubles
+STATE_FIELDS = ('mask', 'elevation', 'z_0', 'rho', 'T_s_0', 'T_s_l', 'T_s',
+                'cc_s_0', 'cc_s_l', 'cc_s', 'm_s', 'm_s_0', 'm_s_l', 'z_s',
+                'z_s_0', 'z_s_l', 'h2o_sat', 'layer_count', 'h2o', 'h2o_max',
+                'h2o_vol', 'h2o_total', 'R_n_bar', 'H_bar', 'L_v_E_bar',
+                'G_bar', 'G_0_bar', 'M_bar', 'delta_Q_bar', 'delta_Q_0_bar',
+                'E_s_sum', 'melt_sum', 'ro_pred_sum', 'current_time',
+                'time_since_out')
+INT_FIELDS = ('mask', 'layer_count')
+
+# The time averages and sums of the energy and mass terms, they are only
+# accumulated and don't feed back into the model
+DIAGNOSTIC_FIELDS = ('R_n_bar', 'H_bar', 'L_v_E_bar', 'G_bar', 'G_0_bar',
+                     'M_bar', 'delta_Q_bar', 'delta_Q_0_bar', 'E_s_sum',
+                     'melt_sum', 'ro_pred_sum')
+
+# Layouts of the model state. The compact layout keeps the mask and
+# layer_count as bytes and the diagnostic fields in single precision, the
+# fields that the model carries between timesteps stay in double precision
+# so the snowpack is the same in both layouts.
+LAYOUTS = ('full', 'compact')
+COMPACT_DTYPES = dict([('mask', np.uint8), ('layer_count', np.int8)] +
+                      [(f, np.float32) for f in DIAGNOSTIC_FIELDS])
+
+# Fields that don't change during a run, the members of an ensemble share
+# them
+STATIC_FIELDS = ('mask', 'elevation', 'z_0')
+
+# Fields that can be written to the output buffers of SnobalGrid.run_block,
+# the mask and elevation don't change during a run
+OUTPUT_FIELDS = tuple(f for f in STATE_FIELDS if f not in ('mask', 'elevation'))
+
+# How the active pixels are shared between the threads: chunks in pixel
+# order, chunks heaviest first by the run timesteps each pixel took in the
+# last call, or a range of pixels of the same total cost for each thread.
+# The order matches SCHED_DYNAMIC, SCHED_COST and SCHED_BALANCED.
+SCHEDULES = ('dynamic', 'cost', 'balanced')
+
+# first_step of SnobalGrid.run_block to zero the time averages and sums on
+# every data timestep of the block, as iSnobal does, instead of only the
+# first. Matches EVERY_STEP in pysnobal.h.
+EVERY_STEP = 2
+
+# Forcing that is interpolated over the data timestep and the precipitation
+# which is only taken from the start of the data timestep
+FORCING_FIELDS = ('S_n', 'I_lw', 'T_a', 'e_a', 'u', 'T_g')
+PRECIP_FIELDS = ('m_pp', 'percent_snow', 'rho_snow', 'T_pp')
+
+
+def state_dtype(field, layout='full'):
+    """
+    Return the NumPy dtype the C model uses for a state field
 
+    Args:
+        field: state field
+        layout: 'full' or 'compact', see LAYOUTS
+    """
+    if layout not in LAYOUTS:
+        raise ValueError('Unknown state layout {}, use one of {}'.format(
+            layout, ', '.join(LAYOUTS)))
+    if layout == 'compact' and field in COMPACT_DTYPES:
+        return COMPACT_DTYPES[field]
+    return np.int32 if field in INT_FIELDS else np.float64
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-# https://github.com/cython/cython/wiki/tutorials-NumpyPointerToC
-def do_tstep_grid(input1, input2, output_rec, tstep_rec, mh, params, int first_step=1, int nthreads=1):
+def state_nbytes(shape, layout='full', members=0):
     """
-    Do the timestep given the inputs, model state, and measurement heights
-    There is no first_step value since the snow state records were already
-    pulled in an initialized. Therefore only the values need to be pulled
-    out before calling 'init_snow()'
+    Memory used by the model state of a grid
+
+    Args:
+        shape: shape of the grid or the number of pixels
+        layout: 'full' or 'compact', see LAYOUTS
+        members: number of ensemble members, 0 for a single run. The
+            members share the STATIC_FIELDS.
+
+    Returns:
+        dict of the number of bytes for each state field
     """
-    #cdef int N = len(output_rec['elevation'])
-    cdef int N = (output_rec['elevation']).size
-    cdef int n
-    shp = output_rec['elevation'].shape
-    # timing stuff
-    cdef clock_t start1, end1, start2, end2, start3, end3
-    cdef double cpu_time_used1, cpu_time_used2, cpu_time_used3
+    N = int(np.prod(shape))
+    K = max(1, members)
+    return {key: N * (1 if key in STATIC_FIELDS else K) *
+            np.dtype(state_dtype(key, layout)).itemsize
+            for key in STATE_FIELDS}
 
-    # measurement heights and parameters
-    cdef PARAMS c_params
-    c_params.z_u = mh['z_u']
-    c_params.z_T = mh['z_t']
-    c_params.z_g = mh['z_g']
-    c_params.relative_heights = int(params['relative_heights'])
-    c_params.max_h2o_vol = params['max_h2o_vol']
-    c_params.max_z_s_0 = params['max_z_s_0']
-#
 
+def output_steps(int nsteps, int output_frequency=1, int step_offset=0):
+    """
+    Data timesteps of a block that are output
+
+    Args:
+        nsteps: number of data timesteps in the block
+        output_frequency: output every output_frequency data timesteps
+        step_offset: number of data timesteps run before the block
+
+    Returns:
+        array of the indices in the block of the data timesteps that are
+        output, the output for index t is at the end of data timestep t
+    """
+    if output_frequency < 1:
+        raise ValueError('output_frequency must be at least 1')
+    t = np.arange(nsteps)
+    return t[(step_offset + t + 1) % output_frequency == 0]
 
-#     cdef TSTEP_REC tstep_info[4]
-#     cdef TSTEP_REC **tstep_info = <TSTEP_REC**> PyMem_Malloc(4 * sizeof(TSTEP_REC*));
-#     for n in range(N):
-#         tstep_info[n] = <TSTEP_REC *>PyMem_Malloc(sizeof(TSTEP_REC))
-#         tstep_info[n].level = n
 
+cdef void _set_tstep(TSTEP_REC *tstep, tstep_rec):
+    """
+    Fill the TSTEP_REC array from the time step info dicts
+    """
     for i in range(len(tstep_rec)):
-        tstep_info[i].level = int(tstep_rec[i]['level'])
+        tstep[i].level = int(tstep_rec[i]['level'])
         if tstep_rec[i]['time_step'] is not None:
-            tstep_info[i].time_step = tstep_rec[i]['time_step']
+            tstep[i].time_step = tstep_rec[i]['time_step']
         if tstep_rec[i]['intervals'] is not None:
-            tstep_info[i].intervals = int(tstep_rec[i]['intervals'])
+            tstep[i].intervals = int(tstep_rec[i]['intervals'])
         if tstep_rec[i]['threshold'] is not None:
-            tstep_info[i].threshold = tstep_rec[i]['threshold']
-        tstep_info[i].output = int(tstep_rec[i]['output'])
+            tstep[i].threshold = tstep_rec[i]['threshold']
+        tstep[i].output = int(tstep_rec[i]['output'])
 
-    # start1 = clock()
-    cdef OUTPUT_REC_ARR output1_c
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_z_0
-    output1_z_0 = np.ascontiguousarray(output_rec['z_0'], dtype=np.float64)
-    output1_c.z_0 = &output1_z_0[0,0]
+cdef PARAMS _set_params(mh, params):
+    """
+    Measurement heights and parameters for the C model, heights that vary
+    by pixel are set with _bind_heights and parameters with _bind_params.
+    With sat_table in params the model takes the saturation vapor pressures
+    from the tables in libsnobal/sat_table.c, with hle1_warm_start it starts
+    hle1 from the Obukhov length of the last run timestep.
+    """
+    cdef PARAMS c_params
+    c_params.z_u = mh['z_u'] if np.ndim(mh['z_u']) == 0 else 0.0
+    c_params.z_T = mh['z_t'] if np.ndim(mh['z_t']) == 0 else 0.0
+    c_params.z_g = mh['z_g'] if np.ndim(mh['z_g']) == 0 else 0.0
+    c_params.relative_heights = int(params['relative_heights'])
+    c_params.max_h2o_vol = params['max_h2o_vol'] \
+        if np.ndim(params['max_h2o_vol']) == 0 else 0.0
+    c_params.max_z_s_0 = params['max_z_s_0'] \
+        if np.ndim(params['max_z_s_0']) == 0 else 0.0
+    c_params.sat_table = bool(params.get('sat_table', False))
+    if c_params.sat_table:
+        init_sat_table()
+    c_params.hle1_warm_start = bool(params.get('hle1_warm_start', False))
+    c_params.z_u_arr = NULL
+    c_params.z_T_arr = NULL
+    c_params.z_g_arr = NULL
+    c_params.P_a_arr = NULL
+    c_params.max_h2o_vol_arr = NULL
+    c_params.max_z_s_0_arr = NULL
+    return c_params
+
+
+cdef dict _bind_heights(PARAMS *c_params, mh, int N):
+    """
+    Point the PARAMS at the measurement heights in mh that are arrays with a
+    value for each of the N pixels, e.g. for a grid of stations. The
+    returned dict holds the references and must be kept until the C call
+    is finished.
+    """
+    arr = {}
+    for key in ('z_u', 'z_t', 'z_g'):
+        if np.ndim(mh[key]) == 0:
+            arr[key] = None
+            continue
+        arr[key] = np.ascontiguousarray(mh[key], dtype=np.float64)
+        if arr[key].size != N:
+            raise ValueError('Measurement height {} has {} values, the model '
+                             'has {} pixels'.format(key, arr[key].size, N))
+
+    c_params.z_u_arr = _dptr(arr['z_u'])
+    c_params.z_T_arr = _dptr(arr['z_t'])
+    c_params.z_g_arr = _dptr(arr['z_g'])
+    return arr
+
+
+cdef dict _bind_params(PARAMS *c_params, params, int N):
+    """
+    Point the PARAMS at max_h2o_vol and max_z_s_0 in params that are arrays
+    with a value for each of the N pixels, e.g. for a parameter sweep. The
+    returned dict holds the references and must be kept until the C call
+    is finished.
+    """
+    arr = {}
+    for key in ('max_h2o_vol', 'max_z_s_0'):
+        if np.ndim(params[key]) == 0:
+            arr[key] = None
+            continue
+        arr[key] = np.ascontiguousarray(params[key], dtype=np.float64)
+        if arr[key].size != N:
+            raise ValueError('Parameter {} has {} values, the model has {} '
+                             'pixels'.format(key, arr[key].size, N))
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_z_s_0
-    output1_z_s_0 = np.ascontiguousarray(output_rec['z_s_0'], dtype=np.float64)
-    output1_c.z_s_0 = &output1_z_s_0[0,0]
+    c_params.max_h2o_vol_arr = _dptr(arr['max_h2o_vol'])
+    c_params.max_z_s_0_arr = _dptr(arr['max_z_s_0'])
+    return arr
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_current_time
-    output1_current_time = np.ascontiguousarray(output_rec['current_time'], dtype=np.float64)
-    output1_c.current_time = &output1_current_time[0,0]
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_time_since_out
-    output1_time_since_out = np.ascontiguousarray(output_rec['time_since_out'], dtype=np.float64)
-    output1_c.time_since_out = &output1_time_since_out[0,0]
+cdef inline double* _dptr(arr):
+    if arr is None:
+        return NULL
+    return <double*> np.PyArray_DATA(arr)
 
-    cdef np.ndarray[int, mode="c", ndim=2] output1_masked
-    output1_masked = np.ascontiguousarray(output_rec['mask'], dtype=np.int32)
-    output1_c.masked = &output1_masked[0,0]
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_elevation
-    output1_elevation = np.ascontiguousarray(output_rec['elevation'], dtype=np.float64)
-    output1_c.elevation = &output1_elevation[0,0]
+cdef inline float* _fptr(arr):
+    if arr is None:
+        return NULL
+    return <float*> np.PyArray_DATA(arr)
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_z_s_l
-    output1_z_s_l = np.ascontiguousarray(output_rec['z_s_l'], dtype=np.float64)
-    output1_c.z_s_l = &output1_z_s_l[0,0]
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_z_s
-    output1_z_s = np.ascontiguousarray(output_rec['z_s'], dtype=np.float64)
-    output1_c.z_s = &output1_z_s[0,0]
+cdef inline int* _iptr(arr):
+    if arr is None:
+        return NULL
+    return <int*> np.PyArray_DATA(arr)
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_rho
-    output1_rho = np.ascontiguousarray(output_rec['rho'], dtype=np.float64)
-    output1_c.rho = &output1_rho[0,0]
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_T_s_0
-    output1_T_s_0 = np.ascontiguousarray(output_rec['T_s_0'], dtype=np.float64)
-    output1_c.T_s_0 = &output1_T_s_0[0,0]
+cdef dict _counts(SNOBAL_COUNTS *c, int nsteps, int n_active):
+    """
+    The counters of a call to C as a dict, see pysnobal.timing.COUNTERS
+    """
+    counts = {'data_tsteps': nsteps, 'active_pixels': n_active,
+              'hle1_calls': c.hle1_calls, 'hle1_iter': c.hle1_iter,
+              'hle1_fail': c.hle1_fail}
+    for i in range(3):
+        counts['divide_tstep_%d' % i] = c.divide_tstep[i]
+        counts['do_tstep_%d' % (i + 1)] = c.do_tstep[i + 1]
+    return counts
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_T_s_l
-    output1_T_s_l = np.ascontiguousarray(output_rec['T_s_l'], dtype=np.float64)
-    output1_c.T_s_l = &output1_T_s_l[0,0]
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_T_s
-    output1_T_s = np.ascontiguousarray(output_rec['T_s'], dtype=np.float64)
-    output1_c.T_s = &output1_T_s[0,0]
+cdef inline void* _vptr(arr, dtype):
+    # NULL unless arr is of type dtype, for the fields that can be full or
+    # compact
+    if arr is None or arr.dtype != dtype:
+        return NULL
+    return np.PyArray_DATA(arr)
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_cc_s_0
-    output1_cc_s_0 = np.ascontiguousarray(output_rec['cc_s_0'], dtype=np.float64)
-    output1_c.cc_s_0 = &output1_cc_s_0[0,0]
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_cc_s_l
-    output1_cc_s_l = np.ascontiguousarray(output_rec['cc_s_l'], dtype=np.float64)
-    output1_c.cc_s_l = &output1_cc_s_l[0,0]
+cdef void _bind_output(OUTPUT_REC_ARR *out, rec):
+    """
+    Point the OUTPUT_REC_ARR at the arrays in rec, which must be C
+    contiguous and of the type given by state_dtype for either layout. The
+    fields in COMPACT_DTYPES are bound to the full or the compact pointer
+    by their type. Fields that are None are set to NULL.
+    """
+    out.masked = <int*> _vptr(rec['mask'], np.int32)
+    out.masked_c = <unsigned char*> _vptr(rec['mask'], np.uint8)
+    out.current_time = _dptr(rec['current_time'])
+    out.time_since_out = _dptr(rec['time_since_out'])
+    out.elevation = _dptr(rec['elevation'])
+    out.z_0 = _dptr(rec['z_0'])
+    out.rho = _dptr(rec['rho'])
+    out.T_s_0 = _dptr(rec['T_s_0'])
+    out.T_s_l = _dptr(rec['T_s_l'])
+    out.T_s = _dptr(rec['T_s'])
+    out.h2o_sat = _dptr(rec['h2o_sat'])
+    out.h2o_max = _dptr(rec['h2o_max'])
+    out.h2o = _dptr(rec['h2o'])
+    out.h2o_vol = _dptr(rec['h2o_vol'])
+    out.h2o_total = _dptr(rec['h2o_total'])
+    out.layer_count = <int*> _vptr(rec['layer_count'], np.int32)
+    out.layer_count_c = <signed char*> _vptr(rec['layer_count'], np.int8)
+    out.cc_s_0 = _dptr(rec['cc_s_0'])
+    out.cc_s_l = _dptr(rec['cc_s_l'])
+    out.cc_s = _dptr(rec['cc_s'])
+    out.m_s_0 = _dptr(rec['m_s_0'])
+    out.m_s_l = _dptr(rec['m_s_l'])
+    out.m_s = _dptr(rec['m_s'])
+    out.z_s_0 = _dptr(rec['z_s_0'])
+    out.z_s_l = _dptr(rec['z_s_l'])
+    out.z_s = _dptr(rec['z_s'])
+    out.R_n_bar = <double*> _vptr(rec['R_n_bar'], np.float64)
+    out.R_n_bar_c = <float*> _vptr(rec['R_n_bar'], np.float32)
+    out.H_bar = <double*> _vptr(rec['H_bar'], np.float64)
+    out.H_bar_c = <float*> _vptr(rec['H_bar'], np.float32)
+    out.L_v_E_bar = <double*> _vptr(rec['L_v_E_bar'], np.float64)
+    out.L_v_E_bar_c = <float*> _vptr(rec['L_v_E_bar'], np.float32)
+    out.G_bar = <double*> _vptr(rec['G_bar'], np.float64)
+    out.G_bar_c = <float*> _vptr(rec['G_bar'], np.float32)
+    out.G_0_bar = <double*> _vptr(rec['G_0_bar'], np.float64)
+    out.G_0_bar_c = <float*> _vptr(rec['G_0_bar'], np.float32)
+    out.M_bar = <double*> _vptr(rec['M_bar'], np.float64)
+    out.M_bar_c = <float*> _vptr(rec['M_bar'], np.float32)
+    out.delta_Q_bar = <double*> _vptr(rec['delta_Q_bar'], np.float64)
+    out.delta_Q_bar_c = <float*> _vptr(rec['delta_Q_bar'], np.float32)
+    out.delta_Q_0_bar = <double*> _vptr(rec['delta_Q_0_bar'], np.float64)
+    out.delta_Q_0_bar_c = <float*> _vptr(rec['delta_Q_0_bar'], np.float32)
+    out.E_s_sum = <double*> _vptr(rec['E_s_sum'], np.float64)
+    out.E_s_sum_c = <float*> _vptr(rec['E_s_sum'], np.float32)
+    out.melt_sum = <double*> _vptr(rec['melt_sum'], np.float64)
+    out.melt_sum_c = <float*> _vptr(rec['melt_sum'], np.float32)
+    out.ro_pred_sum = <double*> _vptr(rec['ro_pred_sum'], np.float64)
+    out.ro_pred_sum_c = <float*> _vptr(rec['ro_pred_sum'], np.float32)
+    out.npix = 0
+
+
+def _forcing_array(value):
+    """
+    The forcing as a C contiguous array, float32 forcing stays in single
+    precision and is widened in C, anything else is converted to float64
+    """
+    arr = np.asarray(value)
+    if arr.dtype == np.float32:
+        return np.ascontiguousarray(arr)
+    return np.ascontiguousarray(arr, dtype=np.float64)
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_cc_s
-    output1_cc_s = np.ascontiguousarray(output_rec['cc_s'], dtype=np.float64)
-    output1_c.cc_s = &output1_cc_s[0,0]
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_m_s_0
-    output1_m_s_0 = np.ascontiguousarray(output_rec['m_s_0'], dtype=np.float64)
-    output1_c.m_s_0 = &output1_m_s_0[0,0]
+cdef void _set_input(INPUT_REC_ARR *inp, dict arr):
+    """
+    Point the INPUT_REC_ARR at the float64 or float32 arrays in arr, the
+    fields that are None or not in arr are set to NULL
+    """
+    d = {}
+    f = {}
+    for key in FORCING_FIELDS + PRECIP_FIELDS:
+        value = arr.get(key)
+        single = value is not None and value.dtype == np.float32
+        d[key] = None if single else value
+        f[key] = value if single else None
+
+    inp.S_n = _dptr(d['S_n'])
+    inp.I_lw = _dptr(d['I_lw'])
+    inp.T_a = _dptr(d['T_a'])
+    inp.e_a = _dptr(d['e_a'])
+    inp.u = _dptr(d['u'])
+    inp.T_g = _dptr(d['T_g'])
+    inp.m_pp = _dptr(d['m_pp'])
+    inp.percent_snow = _dptr(d['percent_snow'])
+    inp.rho_snow = _dptr(d['rho_snow'])
+    inp.T_pp = _dptr(d['T_pp'])
+
+    inp.S_n_f = _fptr(f['S_n'])
+    inp.I_lw_f = _fptr(f['I_lw'])
+    inp.T_a_f = _fptr(f['T_a'])
+    inp.e_a_f = _fptr(f['e_a'])
+    inp.u_f = _fptr(f['u'])
+    inp.T_g_f = _fptr(f['T_g'])
+    inp.m_pp_f = _fptr(f['m_pp'])
+    inp.percent_snow_f = _fptr(f['percent_snow'])
+    inp.rho_snow_f = _fptr(f['rho_snow'])
+    inp.T_pp_f = _fptr(f['T_pp'])
+
+
+cdef dict _bind_input(INPUT_REC_ARR *inp, forcing, int N, bint precip):
+    """
+    Point the INPUT_REC_ARR at C contiguous float64 or float32 versions of
+    the forcing. Arrays that are already contiguous float64 or float32 are
+    used without a copy. The returned dict holds the references and must be
+    kept until the C call is finished.
+    """
+    flds = FORCING_FIELDS + PRECIP_FIELDS if precip else FORCING_FIELDS
+    arr = {}
+    for key in flds:
+        arr[key] = _forcing_array(forcing[key])
+        if arr[key].size != N:
+            raise ValueError('Forcing {} has {} values, the model has {} '
+                             'pixels'.format(key, arr[key].size, N))
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_m_s_l
-    output1_m_s_l = np.ascontiguousarray(output_rec['m_s_l'], dtype=np.float64)
-    output1_c.m_s_l = &output1_m_s_l[0,0]
+    _set_input(inp, arr)
+    return arr
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_m_s
-    output1_m_s = np.ascontiguousarray(output_rec['m_s'], dtype=np.float64)
-    output1_c.m_s = &output1_m_s[0,0]
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_h2o_sat
-    output1_h2o_sat = np.ascontiguousarray(output_rec['h2o_sat'], dtype=np.float64)
-    output1_c.h2o_sat = &output1_h2o_sat[0,0]
+cdef dict _bind_block(INPUT_REC_ARR *inp, forcing, int N, int nsteps):
+    """
+    Point the INPUT_REC_ARR at a block of forcing with nsteps + 1 records
+    along the first axis, float64 or float32 as for _bind_input. The
+    precipitation is only needed for the first nsteps records. The returned
+    dict holds the references and must be kept until the C call is
+    finished.
+    """
+    arr = {}
+    for key in FORCING_FIELDS + PRECIP_FIELDS:
+        arr[key] = _forcing_array(forcing[key])
+        if key in PRECIP_FIELDS and arr[key].size == nsteps * N:
+            continue
+        if arr[key].size != (nsteps + 1) * N:
+            raise ValueError('Forcing {} has {} values, expected {} records '
+                             'of {} pixels'.format(key, arr[key].size,
+                                                   nsteps + 1, N))
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_h2o_max
-    output1_h2o_max = np.ascontiguousarray(output_rec['h2o_max'], dtype=np.float64)
-    output1_c.h2o_max = &output1_h2o_max[0,0]
+    _set_input(inp, arr)
+    return arr
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_h2o
-    output1_h2o = np.ascontiguousarray(output_rec['h2o'], dtype=np.float64)
-    output1_c.h2o = &output1_h2o[0,0]
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_h2o_vol
-    output1_h2o_vol = np.ascontiguousarray(output_rec['h2o_vol'], dtype=np.float64)
-    output1_c.h2o_vol = &output1_h2o_vol[0,0]
+cdef dict _bind_block_output(OUTPUT_REC_ARR *out, outputs, int N, int nout):
+    """
+    Point the OUTPUT_REC_ARR at the caller's output buffers, fields that
+    aren't in outputs are set to NULL. The buffers are written in place so
+    they must be C contiguous, of the type given by state_dtype for either
+    layout and hold at least nout records.
+    """
+    rec = {key: None for key in STATE_FIELDS}
+    for key, buf in outputs.items():
+        if key not in OUTPUT_FIELDS:
+            raise ValueError('{} is not an output field'.format(key))
+        dtypes = [np.dtype(state_dtype(key, layout)) for layout in LAYOUTS]
+        if not isinstance(buf, np.ndarray) or buf.dtype not in dtypes or \
+                not buf.flags['C_CONTIGUOUS'] or not buf.flags['WRITEABLE']:
+            raise ValueError('Output buffer {} must be a writeable C '
+                             'contiguous {} array'.format(
+                                 key, ' or '.join(sorted(set(
+                                     d.name for d in dtypes)))))
+        if buf.size < nout * N:
+            raise ValueError('Output buffer {} has {} values, need {} records '
+                             'of {} pixels'.format(key, buf.size, nout, N))
+        rec[key] = buf
+
+    _bind_output(out, rec)
+    return rec
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_h2o_total
-    output1_h2o_total = np.ascontiguousarray(output_rec['h2o_total'], dtype=np.float64)
-    output1_c.h2o_total = &output1_h2o_total[0,0]
 
-    cdef np.ndarray[int, mode="c", ndim=2] output1_layer_count
-    output1_layer_count = np.ascontiguousarray(output_rec['layer_count'], dtype=np.int32)
-    output1_c.layer_count = &output1_layer_count[0,0]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+# https://github.com/cython/cython/wiki/tutorials-NumpyPointerToC
+def do_tstep_grid(input1, input2, output_rec, tstep_rec, mh, params, int first_step=1, int nthreads=1, stats=None):
+    """
+    Do the timestep given the inputs, model state, and measurement heights
+    There is no first_step value since the snow state records were already
+    pulled in an initialized. Therefore only the values need to be pulled
+    out before calling 'init_snow()'
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_R_n_bar
-    output1_R_n_bar = np.ascontiguousarray(output_rec['R_n_bar'], dtype=np.float64)
-    output1_c.R_n_bar = &output1_R_n_bar[0,0]
+    The model state is copied to C contiguous arrays and back for every
+    call, use SnobalGrid to keep the state between timesteps. The state is
+    copied back also when a pixel fails, as the fields of output_rec that
+    are already C contiguous are changed in place either way. The GIL is
+    released while the model runs. If stats is a pysnobal.timing.RunStats
+    the time of each phase and the counters are added to it.
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_H_bar
-    output1_H_bar = np.ascontiguousarray(output_rec['H_bar'], dtype=np.float64)
-    output1_c.H_bar = &output1_H_bar[0,0]
+    Returns -1 if successful, otherwise the index of the first pixel that
+    failed.
+    """
+    cdef SNOBAL_COUNTS counts
+    memset(&counts, 0, sizeof(SNOBAL_COUNTS))
+    t0, c0 = perf_counter(), thread_time()
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_L_v_E_bar
-    output1_L_v_E_bar = np.ascontiguousarray(output_rec['L_v_E_bar'], dtype=np.float64)
-    output1_c.L_v_E_bar = &output1_L_v_E_bar[0,0]
+    cdef int N = (output_rec['elevation']).size
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_G_bar
-    output1_G_bar = np.ascontiguousarray(output_rec['G_bar'], dtype=np.float64)
-    output1_c.G_bar = &output1_G_bar[0,0]
+    cdef TSTEP_REC tstep_c[4]
+    _set_tstep(tstep_c, tstep_rec)
+    cdef PARAMS c_params = _set_params(mh, params)
+    heights = _bind_heights(&c_params, mh, N)
+    param_arr = _bind_params(&c_params, params, N)
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_G_0_bar
-    output1_G_0_bar = np.ascontiguousarray(output_rec['G_0_bar'], dtype=np.float64)
-    output1_c.G_0_bar = &output1_G_0_bar[0,0]
+    # model state, arrays that are already C contiguous are not copied
+    rec = {key: np.ascontiguousarray(output_rec[key], dtype=state_dtype(key))
+           for key in STATE_FIELDS}
+    cdef OUTPUT_REC_ARR output1_c
+    _bind_output(&output1_c, rec)
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_M_bar
-    output1_M_bar = np.ascontiguousarray(output_rec['M_bar'], dtype=np.float64)
-    output1_c.M_bar = &output1_M_bar[0,0]
+    cdef INPUT_REC_ARR input1_c
+    cdef INPUT_REC_ARR input2_c
+    in1 = _bind_input(&input1_c, input1, N, True)
+    in2 = _bind_input(&input2_c, input2, N, False)
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_delta_Q_bar
-    output1_delta_Q_bar = np.ascontiguousarray(output_rec['delta_Q_bar'], dtype=np.float64)
-    output1_c.delta_Q_bar = &output1_delta_Q_bar[0,0]
+    pixels = np.zeros(N, dtype=np.int32)
+    cdef int* pixels_c = _iptr(pixels)
+    cdef int n_active
+    cdef int rt
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_delta_Q_0_bar
-    output1_delta_Q_0_bar = np.ascontiguousarray(output_rec['delta_Q_0_bar'], dtype=np.float64)
-    output1_c.delta_Q_0_bar = &output1_delta_Q_0_bar[0,0]
+    t1, c1, p1 = perf_counter(), thread_time(), process_time()
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_E_s_sum
-    output1_E_s_sum = np.ascontiguousarray(output_rec['E_s_sum'], dtype=np.float64)
-    output1_c.E_s_sum = &output1_E_s_sum[0,0]
+    #------------------------------------------------------------------------------
+    # Call the model
+    with nogil:
+        rt = call_snobal(N, nthreads, first_step, 1, tstep_c, &input1_c,
+                         &input2_c, c_params, &output1_c, pixels_c, &n_active,
+                         NULL, &counts)
+
+    t2, c2, p2 = perf_counter(), thread_time(), process_time()
+    for key in STATE_FIELDS:
+        if key != 'mask' and rec[key] is not output_rec[key]:
+            output_rec[key][:] = rec[key]
+
+    if stats is not None:
+        stats.add('marshal', t1 - t0, c1 - c0)
+        stats.add('kernel', t2 - t1, p2 - p1)
+        stats.add('copy_back', perf_counter() - t2, thread_time() - c2)
+        stats.count(_counts(&counts, 1, n_active))
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_melt_sum
-    output1_melt_sum = np.ascontiguousarray(output_rec['melt_sum'], dtype=np.float64)
-    output1_c.melt_sum = &output1_melt_sum[0,0]
+    return rt
 
-    cdef np.ndarray[double, mode="c", ndim=2] output1_ro_pred_sum
-    output1_ro_pred_sum = np.ascontiguousarray(output_rec['ro_pred_sum'], dtype=np.float64)
-    output1_c.ro_pred_sum = &output1_ro_pred_sum[0,0]
 
-    # end1 = clock()
-    # cpu_time_used1 = (<double> (end1 - start1)) / CLOCKS_PER_SEC
-    # print('time 1 {}'.format(cpu_time_used1))
-    # start15 = clock()
-    #------------------------------------------------------------------------------
-    # PREPARE INPUT1 FOR C
+cdef class SnobalGrid:
+    """
+    Persistent grid model that keeps the model state on the C side between
+    data timesteps.
+
+    The model state is allocated once as C contiguous arrays and the
+    OUTPUT_REC_ARR for call_snobal is built once from it. The fields are
+    exposed through output_rec as zero-copy NumPy views that can be read for
+    output or changed in place, e.g. output_rec['time_since_out'][:] = 0.
+    The fields themselves can't be replaced as C holds pointers to them.
+    Each call to step only passes the new forcing pointers to call_snobal.
+
+    Only the active pixels, those with snow or precipitation, run the full
+    model. The bare ground pixels only need the time averages and current
+    time updated which is done over the whole array, n_active is the number
+    of active pixels in the last call.
+
+    The cost of a pixel is the number of run timesteps per data timestep it
+    took in the last call, from one for a deep snowpack to 60 or more for a
+    thin one that the model divides down to the small timestep, and zero
+    for bare ground. The schedule uses it to share the active pixels between
+    the threads: 'dynamic' hands out chunks of chunk_size pixels in pixel
+    order, 'cost' hands out the chunks heaviest first and 'balanced' gives
+    each thread a range of pixels of the same total cost. The results don't
+    depend on the schedule or the number of threads, see pysnobal.autotune
+    to pick them. The iterations each pixel took in hle1 in the last call
+    are in hle1_iter, see hle1_warm_start in params.
+
+    With members the grid runs an ensemble, the state has a leading member
+    axis, (members, ny, nx), and each member is run with its own forcing
+    in the same call. The STATIC_FIELDS, the measurement heights and the
+    air pressure from the elevation are (ny, nx) and shared by the members.
+    The air pressure is computed from the elevation once, when the grid is
+    made.
+
+    The time spent binding the arrays (marshal) and in the C model (kernel)
+    and the counters of the work done in C are kept for each call in
+    last_stats and summed over the calls in stats, both are
+    pysnobal.timing.RunStats.
+
+    The GIL is released while the model runs so other Python threads, e.g.
+    the ones producing the forcing, keep running. Separate grids can be
+    run at the same time from different threads, a grid can only run one
+    step or block at a time.
 
-    cdef INPUT_REC_ARR input1_c
+    Args:
+        init: dict of the initial model state, any field in STATE_FIELDS
+            that is not given is set to zero, except for the mask which is
+            set to one. Other keys (e.g. x and y) are ignored. For an
+            ensemble the fields that aren't static can be for every member
+            or a single grid that every member starts from.
+        tstep_rec: time step information
+        mh: measurement heights, each of z_u, z_t and z_g can be a scalar
+            or an array with a value for each pixel
+        params: model parameters, max_h2o_vol and max_z_s_0 can be a
+            scalar or an array of the grid shape, e.g. for a sweep of the
+            parameters. sat_table True takes the saturation vapor
+            pressures from the tables in libsnobal/sat_table.c, which is
+            faster and within 1e-9 of the formulas. hle1_warm_start
+            True starts hle1 from the Obukhov length of the last run
+            timestep, which takes fewer iterations for fluxes within the
+            convergence threshold of hle1.
+        nthreads: number of threads to use in call_snobal, 0 for the
+            OpenMP default
+        compact: only run the model for the active pixels, if False every
+            pixel in the mask runs the model
+        buffers: dict of C contiguous arrays of the grid shape and the
+            type from state_dtype to hold the state fields instead of
+            allocating them, e.g. in shared memory. They are filled from
+            init and updated in place.
+        layout: 'full' or 'compact', the layout of the state, see
+            state_dtype. The snowpack is the same in both, the compact
+            diagnostic fields are rounded to single precision after each
+            data timestep.
+        schedule: how the active pixels are shared between the threads,
+            one of SCHEDULES
+        chunk_size: number of pixels in a chunk of the dynamic schedules
+        members: number of ensemble members, 0 for a single run
+    """
+    cdef OUTPUT_REC_ARR output_c
+    cdef TSTEP_REC tstep_c[4]
+    cdef PARAMS params_c
+    cdef SCHEDULE sched_c
+    cdef dict _state
+    cdef readonly object output_rec
+    cdef readonly tuple shape
+    cdef readonly int N
+    cdef readonly int members
+    cdef readonly str layout
+    cdef public int nthreads
+    cdef public bint compact
+    cdef readonly int n_active
+    cdef readonly object stats
+    cdef readonly object last_stats
+    cdef np.ndarray _pixels
+    cdef np.ndarray _cost
+    cdef np.ndarray _work
+    cdef np.ndarray _hle1_iter
+    cdef np.ndarray _P_a
+    cdef dict _heights
+    cdef dict _params
+    cdef bint _running
+
+    def __init__(self, init, tstep_rec, mh, params, int nthreads=1,
+                 bint compact=True, buffers=None, layout='full',
+                 schedule='cost', int chunk_size=100, int members=0):
+
+        static_shape = np.shape(init['elevation'])
+        cdef int npix = int(np.prod(static_shape))
+        self.members = max(members, 0)
+        self.shape = (members,) + static_shape if members > 0 \
+            else static_shape
+        self.N = int(np.prod(self.shape))
+        state_dtype('mask', layout)     # raises for an unknown layout
+        self.layout = layout
+        self.nthreads = nthreads
+        self.compact = compact
+        self.n_active = 0
+        self.stats = RunStats()
+        self.last_stats = RunStats()
+        self._pixels = np.zeros(self.N, dtype=np.int32)
+        self._cost = np.zeros(self.N, dtype=np.int32)
+        self._work = np.zeros(self.N, dtype=np.int32)
+        self._hle1_iter = np.zeros(self.N, dtype=np.int32)
+        self.sched_c.cost = _iptr(self._cost)
+        self.sched_c.work = _iptr(self._work)
+        self.sched_c.hle1_iter = _iptr(self._hle1_iter)
+        self.schedule = schedule
+        self.chunk_size = chunk_size
+        self._running = False
+
+        self._state = {}
+        for key in STATE_FIELDS:
+            shape = static_shape if key in STATIC_FIELDS else self.shape
+            if buffers is not None and key in buffers:
+                arr = buffers[key]
+                dtype = np.dtype(state_dtype(key, layout))
+                if not isinstance(arr, np.ndarray) or \
+                        arr.shape != shape or arr.dtype != dtype or \
+                        not arr.flags['C_CONTIGUOUS']:
+                    raise ValueError('The buffer for {} must be a C '
+                                     'contiguous {} array of shape '
+                                     '{}'.format(key, dtype.name, shape))
+                if key not in init:
+                    arr[...] = 1 if key == 'mask' else 0
+            else:
+                arr = np.zeros(shape, dtype=state_dtype(key, layout))
+                if key == 'mask':
+                    arr[...] = 1
+            if key in init and init[key] is not arr:
+                arr[...] = init[key]
+            self._state[key] = arr
+
+        self.output_rec = MappingProxyType(self._state)
+        _bind_output(&self.output_c, self._state)
+        if members > 0:
+            self.output_c.npix = npix
+
+        _set_tstep(self.tstep_c, tstep_rec)
+        self.params_c = _set_params(mh, params)
+        self._heights = _bind_heights(&self.params_c, mh, npix)
+        self._params = _bind_params(&self.params_c, params, self.N)
+
+        # the air pressure only depends on the elevation
+        self._P_a = np.zeros(npix)
+        cdef double[::1] P_a = self._P_a
+        cdef double[::1] elevation = np.ascontiguousarray(
+            self._state['elevation'], dtype=np.float64).ravel()
+        cdef int i
+        for i in range(npix):
+            P_a[i] = HYSTAT(SEA_LEVEL, STD_AIRTMP, STD_LAPSE,
+                            elevation[i] / 1000.0, GRAVITY, MOL_AIR)
+        self.params_c.P_a_arr = _dptr(self._P_a)
+
+    def __getitem__(self, key):
+        return self._state[key]
+
+    @property
+    def schedule(self):
+        """
+        How the active pixels are shared between the threads, one of
+        SCHEDULES
+        """
+        return SCHEDULES[self.sched_c.type]
 
-    # convert the S_n to C
-    cdef np.ndarray[double, mode="c", ndim=2] input1_Sn
-    input1_Sn = np.ascontiguousarray(input1['S_n'], dtype=np.float64)
-    input1_c.S_n = &input1_Sn[0,0]
-
-    # convert the I_lw to C
-    cdef np.ndarray[double, mode="c", ndim=2] input1_I_lw
-    input1_I_lw = np.ascontiguousarray(input1['I_lw'], dtype=np.float64)
-    input1_c.I_lw = &input1_I_lw[0,0]
-
-    # convert the T_a to C
-    cdef np.ndarray[double, mode="c", ndim=2] input1_Ta
-    input1_Ta = np.ascontiguousarray(input1['T_a'], dtype=np.float64)
-    input1_c.T_a = &input1_Ta[0,0] # For some reason this isn't needed, most likely b/c numpy has already allocated it    input1_c.T_a = <double *> PyMem_Malloc(N * sizeof(double))
-
-    # convert the e_a to C
-    cdef np.ndarray[double, mode="c", ndim=2] input1_e_a
-    input1_e_a = np.ascontiguousarray(input1['e_a'], dtype=np.float64)
-    input1_c.e_a = &input1_e_a[0,0]
-
-    # convert the u to C
-    cdef np.ndarray[double, mode="c", ndim=2] input1_u
-    input1_u = np.ascontiguousarray(input1['u'], dtype=np.float64)
-    input1_c.u = &input1_u[0,0]
-
-    # convert the T_g to C
-    cdef np.ndarray[double, mode="c", ndim=2] input1_T_g
-    input1_T_g = np.ascontiguousarray(input1['T_g'], dtype=np.float64)
-    input1_c.T_g = &input1_T_g[0,0]
-
-    # convert the m_pp to C
-    cdef np.ndarray[double, mode="c", ndim=2] input1_m_pp
-    input1_m_pp = np.ascontiguousarray(input1['m_pp'], dtype=np.float64)
-    input1_c.m_pp = &input1_m_pp[0,0]
-
-    # convert the percent_snow to C
-    cdef np.ndarray[double, mode="c", ndim=2] input1_percent_snow
-    input1_percent_snow = np.ascontiguousarray(input1['percent_snow'], dtype=np.float64)
-    input1_c.percent_snow = &input1_percent_snow[0,0]
-
-    # convert the rho_snow to C
-    cdef np.ndarray[double, mode="c", ndim=2] input1_rho_snow
-    input1_rho_snow = np.ascontiguousarray(input1['rho_snow'], dtype=np.float64)
-    input1_c.rho_snow = &input1_rho_snow[0,0]
-
-    # convert the T_pp to C
-    cdef np.ndarray[double, mode="c", ndim=2] input1_T_pp
-    input1_T_pp = np.ascontiguousarray(input1['T_pp'], dtype=np.float64)
-    input1_c.T_pp = &input1_T_pp[0,0]
+    @schedule.setter
+    def schedule(self, value):
+        if value not in SCHEDULES:
+            raise ValueError('schedule must be one of {}'.format(
+                ', '.join(SCHEDULES)))
+        self.sched_c.type = SCHEDULES.index(value)
 
+    @property
+    def chunk_size(self):
+        """
+        Number of pixels in a chunk of the dynamic schedules
+        """
+        return self.sched_c.chunk
 
-    #------------------------------------------------------------------------------
-    # PREPARE INPUT2 FOR C
+    @chunk_size.setter
+    def chunk_size(self, int value):
+        if value < 1:
+            raise ValueError('chunk_size must be at least 1')
+        self.sched_c.chunk = value
 
-    cdef INPUT_REC_ARR input2_c
+    @property
+    def cost(self):
+        """
+        Run timesteps per data timestep of each pixel in the last call,
+        zero for bare ground and masked pixels
+        """
+        return self._cost.reshape(self.shape)
 
-    # convert the S_n to C
-    cdef np.ndarray[double, mode="c", ndim=2] input2_Sn
-    input2_Sn = np.ascontiguousarray(input2['S_n'], dtype=np.float64)
-    input2_c.S_n = &input2_Sn[0,0]
-
-    # convert the I_lw to C
-    cdef np.ndarray[double, mode="c", ndim=2] input2_I_lw
-    input2_I_lw = np.ascontiguousarray(input2['I_lw'], dtype=np.float64)
-    input2_c.I_lw = &input2_I_lw[0,0]
-
-    # convert the T_a to C
-    cdef np.ndarray[double, mode="c", ndim=2] input2_Ta
-    input2_Ta = np.ascontiguousarray(input2['T_a'], dtype=np.float64)
-    input2_c.T_a = &input2_Ta[0,0]
-
-    # convert the e_a to C
-    cdef np.ndarray[double, mode="c", ndim=2] input2_e_a
-    input2_e_a = np.ascontiguousarray(input2['e_a'], dtype=np.float64)
-    input2_c.e_a = &input2_e_a[0,0]
-
-    # convert the u to C
-    cdef np.ndarray[double, mode="c", ndim=2] input2_u
-    input2_u = np.ascontiguousarray(input2['u'], dtype=np.float64)
-    input2_c.u = &input2_u[0,0]
-
-    # convert the T_g to C
-    cdef np.ndarray[double, mode="c", ndim=2] input2_T_g
-    input2_T_g = np.ascontiguousarray(input2['T_g'], dtype=np.float64)
-    input2_c.T_g = &input2_T_g[0,0]
-
-    # timing stuff
-    # end15 = clock()
-    # cpu_time_used15 = (<double> (end15 - start15)) / CLOCKS_PER_SEC
-    # print('time 1.5 {}'.format(cpu_time_used15))
-    # start2 = clock()
+    @property
+    def hle1_iter(self):
+        """
+        Iterations on the Obukhov length in hle1 of each pixel in the last
+        call, zero for bare ground and masked pixels
+        """
+        return self._hle1_iter.reshape(self.shape)
+
+    @property
+    def nbytes(self):
+        """
+        Memory used by the model state in bytes
+        """
+        return sum(arr.nbytes for arr in self._state.values())
+
+    cdef void _acquire(self) except *:
+        # called with the GIL held so the check and set can't be interleaved
+        if self._running:
+            raise RuntimeError('SnobalGrid is already running in another '
+                               'thread')
+        self._running = True
+
+    cdef void _record(self, double t0, double marshal_cpu, double t1,
+                      double p1, double t2, double p2,
+                      SNOBAL_COUNTS *counts, int nsteps):
+        # the marshal runs from t0 to t1 and the kernel from t1 to t2, p1
+        # and p2 are the process CPU times
+        last = RunStats()
+        last.add('marshal', t1 - t0, marshal_cpu)
+        last.add('kernel', t2 - t1, p2 - p1)
+        last.count(_counts(counts, nsteps, self.n_active))
+        self.last_stats = last
+        self.stats.merge(last)
+
+    def step(self, input1, input2, int first_step=0):
+        """
+        Run the model for one data timestep, the state is updated in place
+
+        Args:
+            input1: forcing dict at the start of the data timestep
+            input2: forcing dict at the end of the data timestep
+            first_step: 1 if the snowpack should be initialized
+
+        Returns:
+            -1 if successful, otherwise the index of the first pixel that
+            failed
+        """
+        cdef SNOBAL_COUNTS counts
+        memset(&counts, 0, sizeof(SNOBAL_COUNTS))
+        t0, c0 = perf_counter(), thread_time()
+
+        cdef INPUT_REC_ARR input1_c
+        cdef INPUT_REC_ARR input2_c
+        in1 = _bind_input(&input1_c, input1, self.N, True)
+        in2 = _bind_input(&input2_c, input2, self.N, False)
+
+        cdef int* pixels_c = _iptr(self._pixels)
+        cdef int rt
+
+        self._acquire()
+        t1, c1, p1 = perf_counter(), thread_time(), process_time()
+        try:
+            with nogil:
+                rt = call_snobal(self.N, self.nthreads, first_step,
+                                 self.compact, self.tstep_c, &input1_c,
+                                 &input2_c, self.params_c, &self.output_c,
+                                 pixels_c, &self.n_active, &self.sched_c,
+                                 &counts)
+        finally:
+            self._running = False
+        self._record(t0, c1 - c0, t1, p1, perf_counter(), process_time(),
+                     &counts, 1)
 
-    #------------------------------------------------------------------------------
-    # Call the model
-    # rt = call_snobal(N, nthreads, first_step, tstep_info, out_c, &input1_c, &input2_c, c_params, &output1_c)
-    rt = call_snobal(N, nthreads, first_step, tstep_info, &input1_c, &input2_c, c_params, &output1_c)
-    if rt != -1:
         return rt
 
-    # end2 = clock()
-    # cpu_time_used2 = (<double> (end2 - start2)) / CLOCKS_PER_SEC
-    # print('time 2 {}'.format(cpu_time_used2))
-    # start3 = clock()
-
-    cdef np.npy_intp shp_np[2]
-    shp_np[:] = (shp[0], shp[1])
-    output_rec['z_0'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.z_0)
-    output_rec['z_s_0'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.z_s_0)
-
-    output_rec['current_time'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.current_time)
-    output_rec['time_since_out'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.time_since_out)
-
-    output_rec['elevation'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.elevation)
-    output_rec['rho'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.rho)
-    output_rec['T_s_0'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.T_s_0)
-    output_rec['T_s_l'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.T_s_l)
-    output_rec['T_s'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.T_s)
-    output_rec['h2o_sat'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.h2o_sat)
-    output_rec['h2o_max'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.h2o_max)
-    output_rec['h2o'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.h2o)
-    output_rec['h2o_vol'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.h2o_vol)
-    output_rec['h2o_total'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.h2o_total)
-    output_rec['layer_count'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_INT32, output1_c.layer_count)
-    output_rec['cc_s_0'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.cc_s_0)
-    output_rec['cc_s_l'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.cc_s_l)
-    output_rec['cc_s'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.cc_s)
-    output_rec['m_s_0'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.m_s_0)
-    output_rec['m_s_l'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.m_s_l)
-    output_rec['m_s'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.m_s)
-    output_rec['z_s_l'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.z_s_l)
-    output_rec['z_s'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.z_s)
-
-    output_rec['R_n_bar'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.R_n_bar)
-    output_rec['H_bar'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.H_bar)
-    output_rec['L_v_E_bar'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.L_v_E_bar)
-    output_rec['G_bar'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.G_bar)
-    output_rec['G_0_bar'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.G_0_bar)
-    output_rec['M_bar'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.M_bar)
-    output_rec['delta_Q_bar'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.delta_Q_bar)
-    output_rec['delta_Q_0_bar'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.delta_Q_0_bar)
-    output_rec['E_s_sum'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.E_s_sum)
-    output_rec['melt_sum'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.melt_sum)
-    output_rec['ro_pred_sum'][:] = np.PyArray_SimpleNewFromData(2, shp_np, np.NPY_FLOAT64, output1_c.ro_pred_sum)
-
-    # end3 = clock()
-    # cpu_time_used3 = (<double> (end3 - start3)) / CLOCKS_PER_SEC
-    # print('time 3 {}'.format(cpu_time_used3))
+    def run_block(self, forcing, outputs=None, int output_frequency=1,
+                  int first_step=0, int step_offset=0):
+        """
+        Run the model for a block of data timesteps in one call. Each pixel
+        is advanced through all the timesteps of the block in one parallel
+        region, the state is updated in place at the end of the block.
+
+        At the output frequency the state is written to the output buffers
+        and time_since_out is reset, see output_steps for the timesteps
+        that are output. Masked pixels are written with their unchanged
+        state.
+
+        Args:
+            forcing: dict of forcing arrays with nsteps + 1 records along
+                the first axis, i.e. (nsteps + 1, y, x). The precipitation
+                fields are taken at the start of each data timestep and can
+                have nsteps records. float32 arrays are passed to C as they
+                are and widened for each pixel, other types are converted
+                to float64.
+            outputs: dict of state field to output buffer, (nout, y, x) with
+                nout the number of output timesteps in the block. The
+                buffers must be C contiguous and of the type given by
+                state_dtype.
+            output_frequency: output every output_frequency data timesteps
+            first_step: 1 if the snowpack should be initialized on the first
+                timestep of the block, EVERY_STEP to zero the averages and
+                sums on every timestep of the block
+            step_offset: number of data timesteps run before this block,
+                the output frequency is counted from the start of the run
+
+        Returns:
+            -1 if successful, otherwise the index of the first pixel that
+            failed
+        """
+        cdef SNOBAL_COUNTS counts
+        memset(&counts, 0, sizeof(SNOBAL_COUNTS))
+        t0, c0 = perf_counter(), thread_time()
+
+        cdef int nsteps = len(forcing['S_n']) - 1
+        if nsteps < 1:
+            raise ValueError('The forcing block needs at least two records')
+
+        cdef INPUT_REC_ARR inputs_c
+        inp = _bind_block(&inputs_c, forcing, self.N, nsteps)
+
+        index = np.full(nsteps, -1, dtype=np.int32)
+        steps = output_steps(nsteps, output_frequency, step_offset)
+        index[steps] = np.arange(len(steps), dtype=np.int32)
+
+        cdef OUTPUT_REC_ARR outputs_c
+        out = _bind_block_output(&outputs_c, outputs or {}, self.N, len(steps))
+
+        cdef int* index_c = _iptr(index)
+        cdef int* pixels_c = _iptr(self._pixels)
+        cdef int rt
+
+        self._acquire()
+        t1, c1, p1 = perf_counter(), thread_time(), process_time()
+        try:
+            with nogil:
+                rt = call_snobal_block(self.N, self.nthreads, first_step,
+                                       self.compact, nsteps, self.tstep_c,
+                                       &inputs_c, self.params_c,
+                                       &self.output_c, index_c, &outputs_c,
+                                       pixels_c, &self.n_active,
+                                       &self.sched_c, &counts)
+        finally:
+            self._running = False
+        self._record(t0, c1 - c0, t1, p1, perf_counter(), process_time(),
+                     &counts, nsteps)
 
-    return rt
+        return rt
 
 
 
 
+def e_bal(state):
+    """
+    Energy balance terms from the C core for each pixel, the reference for
+    pysnobal.vector.e_bal
+
+    Args:
+        state: dict of the model state with the fields in
+            pysnobal.vector.E_BAL_INPUTS, arrays or scalars that broadcast
+            together
+
+    Returns:
+        dict of the energy balance terms and the status, 0 if successful
+        and -1 where _e_bal failed
+    """
+    from pysnobal.vector import E_BAL_INPUTS, E_BAL_OUTPUTS
+
+    v = dict(zip(E_BAL_INPUTS, np.broadcast_arrays(
+        *[np.asarray(state[key]) for key in E_BAL_INPUTS])))
+    shape = v['snowcover'].shape
+    v = {key: value.ravel() for key, value in v.items()}
+
+    out = {key: np.zeros(shape) for key in E_BAL_OUTPUTS}
+    out['status'] = np.zeros(shape, dtype=np.int32)
+    o = {key: value.reshape(-1) for key, value in out.items()}
+
+    cdef snobal_state_t s
+    cdef int n
+    # the fields that aren't set below are zero, e.g. sat_table
+    memset(&s, 0, sizeof(s))
+    for n in range(o['status'].size):
+        s.snowcover = v['snowcover'][n]
+        s.layer_count = v['layer_count'][n]
+        s.S_n = v['S_n'][n]
+        s.I_lw = v['I_lw'][n]
+        s.T_a = v['T_a'][n]
+        s.e_a = v['e_a'][n]
+        s.u = v['u'][n]
+        s.T_g = v['T_g'][n]
+        s.P_a = v['P_a'][n]
+        s.T_s_0 = v['T_s_0'][n]
+        s.T_s_l = v['T_s_l'][n]
+        s.rho = v['rho'][n]
+        s.z_s = v['z_s'][n]
+        s.z_s_0 = v['z_s_0'][n]
+        s.z_s_l = v['z_s_l'][n]
+        s.z_0 = v['z_0'][n]
+        s.z_u = v['z_u'][n]
+        s.z_T = v['z_T'][n]
+        s.z_g = v['z_g'][n]
+        s.relative_hts = v['relative_hts'][n]
+        s.precip_now = v['precip_now'][n]
+        s.m_rain = v['m_rain'][n]
+        s.m_snow = v['m_snow'][n]
+        s.T_rain = v['T_rain'][n]
+        s.T_snow = v['T_snow'][n]
+        s.time_step = v['time_step'][n]
+        s.lo = np.inf
+
+        if not _e_bal(&s):
+            o['status'][n] = -1
+            continue
+
+        o['R_n'][n] = s.R_n
+        o['H'][n] = s.H
+        o['L_v_E'][n] = s.L_v_E
+        o['E'][n] = s.E
+        o['G'][n] = s.G
+        o['G_0'][n] = s.G_0
+        o['M'][n] = s.M
+        o['delta_Q'][n] = s.delta_Q
+        o['delta_Q_0'][n] = s.delta_Q_0
+
+    return out
+
+
+def sati(tk, table=False):
+    """
+    Saturation vapor pressure (Pa) over ice from the C core
+
+    Args:
+        tk: temperatures (K), array or scalar
+        table: True to interpolate in the tables of libsnobal/sat_table.c,
+            as a model with sat_table does, False for the formulas
+
+    Returns:
+        array of the vapor pressures, 0 where tk is not positive
+    """
+    if table:
+        init_sat_table()
+    tk = np.asarray(tk, dtype=np.float64)
+    out = np.empty_like(tk)
+    t = tk.reshape(-1)
+    o = out.reshape(-1)
+    cdef Py_ssize_t n
+    for n in range(t.size):
+        o[n] = c_sati(t[n], bool(table))
+    return out
+
+
+def satw(tk, table=False):
+    """
+    Saturation vapor pressure (Pa) over water from the C core
+
+    Args:
+        tk: temperatures (K), array or scalar
+        table: True to interpolate in the tables of libsnobal/sat_table.c,
+            as a model with sat_table does, False for the formulas
+
+    Returns:
+        array of the vapor pressures, 0 where tk is not positive
+    """
+    if table:
+        init_sat_table()
+    tk = np.asarray(tk, dtype=np.float64)
+    out = np.empty_like(tk)
+    t = tk.reshape(-1)
+    o = out.reshape(-1)
+    cdef Py_ssize_t n
+    for n in range(t.size):
+        o[n] = c_satw(t[n], bool(table))
+    return out
+
+
 # We need to build an array-wrapper class to deallocate our array when
 # the Python object is deleted.
 # From https://gist.github.com/GaelVaroquaux/1249305
@@ -630,6 +1323,10 @@ def initialize(params, tstep_info, sn, mh):
 
     return None
 
+# model state for do_tstep, kept between calls
+cdef snobal_state_t _point
+cdef TSTEP_REC _point_tstep[4]
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def do_tstep(input1, input2, output_rec, tstep_rec, mh, params, first_step=True):
@@ -641,17 +1338,18 @@ def do_tstep(input1, input2, output_rec, tstep_rec, mh, params, first_step=True)
     """
 
     cdef int N = len(output_rec['elevation'])
-#     cdef TSTEP_REC tstep_info[4]
+    global _point
 
+    _point.tstep_info = _point_tstep
     for i in range(len(tstep_rec)):
-        tstep_info[i].level = int(tstep_rec[i]['level'])
+        _point_tstep[i].level = int(tstep_rec[i]['level'])
         if tstep_rec[i]['time_step'] is not None:
-            tstep_info[i].time_step = tstep_rec[i]['time_step']
+            _point_tstep[i].time_step = tstep_rec[i]['time_step']
         if tstep_rec[i]['intervals'] is not None:
-            tstep_info[i].intervals = int(tstep_rec[i]['intervals'])
+            _point_tstep[i].intervals = int(tstep_rec[i]['intervals'])
         if tstep_rec[i]['threshold'] is not None:
-            tstep_info[i].threshold = tstep_rec[i]['threshold']
-        tstep_info[i].output = int(tstep_rec[i]['output'])
+            _point_tstep[i].threshold = tstep_rec[i]['threshold']
+        _point_tstep[i].output = int(tstep_rec[i]['output'])
 
 
 
@@ -677,74 +1375,71 @@ def do_tstep(input1, input2, output_rec, tstep_rec, mh, params, first_step=True)
         masked = output_rec['mask'][i,j]
         if masked:
 
-            # since snobal use global variables extensively, here is the ugly
-            # interface with Python
-            global current_time, time_since_out
-            global m_pp, percent_snow, rho_snow, T_pp, precip_now
-            global z_0, rho, T_s_0, T_s_l, T_s, h2o_sat, h2o_max, layer_count, P_a, h2o
-            global m_s_0, m_s_l, m_s, cc_s_0, cc_s_l, cc_s, z_s_0, z_s_l, z_s
-            global z_u, z_T, z_g, relative_heights, max_h2o_vol, max_z_s_0
-            global R_n_bar, H_bar, L_v_E_bar, G_bar, G_0_bar, M_bar, delta_Q_bar, delta_Q_0_bar
-            global E_s_sum, melt_sum, ro_pred_sum
+            # the state is kept in _point between calls, as snobal does
 
             # time variables
-            current_time = output_rec['current_time'][i,j]
-            time_since_out = output_rec['time_since_out'][i,j]
+            _point.current_time = output_rec['current_time'][i,j]
+            _point.time_since_out = output_rec['time_since_out'][i,j]
 
             # measurement heights and parameters
-            z_u = mh['z_u']
-            z_T = mh['z_t']
-            z_g = mh['z_g']
-            relative_heights = int(params['relative_heights'])
-            max_h2o_vol = params['max_h2o_vol']
-            max_z_s_0 = params['max_z_s_0']
+            _point.z_u = mh['z_u']
+            _point.z_T = mh['z_t']
+            _point.z_g = mh['z_g']
+            _point.relative_hts = int(params['relative_heights'])
+            _point.max_h2o_vol = params['max_h2o_vol']
+            _point.max_z_s_0 = params['max_z_s_0']
+            _point.sat_table = bool(params.get('sat_table', False))
+            if _point.sat_table:
+                init_sat_table()
+            _point.hle1_warm_start = bool(
+                params.get('hle1_warm_start', False))
 
             # get the input records
-            input_rec1.I_lw = input1['I_lw'][i,j]
-            input_rec1.T_a  = input1['T_a'][i,j]
-            input_rec1.e_a  = input1['e_a'][i,j]
-            input_rec1.u    = input1['u'][i,j]
-            input_rec1.T_g  = input1['T_g'][i,j]
-            input_rec1.S_n  = input1['S_n'][i,j]
-
-            input_rec2.I_lw = input2['I_lw'][i,j]
-            input_rec2.T_a  = input2['T_a'][i,j]
-            input_rec2.e_a  = input2['e_a'][i,j]
-            input_rec2.u    = input2['u'][i,j]
-            input_rec2.T_g  = input2['T_g'][i,j]
-            input_rec2.S_n  = input2['S_n'][i,j]
-
-            m_pp         = input1['m_pp'][i,j]
-            percent_snow = input1['percent_snow'][i,j]
-            rho_snow     = input1['rho_snow'][i,j]
-            T_pp         = input1['T_pp'][i,j]
-
-            precip_now = 0
-            if m_pp > 0:
-                precip_now = 1
+            _point.input_rec1.I_lw = input1['I_lw'][i,j]
+            _point.input_rec1.T_a  = input1['T_a'][i,j]
+            _point.input_rec1.e_a  = input1['e_a'][i,j]
+            _point.input_rec1.u    = input1['u'][i,j]
+            _point.input_rec1.T_g  = input1['T_g'][i,j]
+            _point.input_rec1.S_n  = input1['S_n'][i,j]
+
+            _point.input_rec2.I_lw = input2['I_lw'][i,j]
+            _point.input_rec2.T_a  = input2['T_a'][i,j]
+            _point.input_rec2.e_a  = input2['e_a'][i,j]
+            _point.input_rec2.u    = input2['u'][i,j]
+            _point.input_rec2.T_g  = input2['T_g'][i,j]
+            _point.input_rec2.S_n  = input2['S_n'][i,j]
+
+            _point.m_pp         = input1['m_pp'][i,j]
+            _point.percent_snow = input1['percent_snow'][i,j]
+            _point.rho_snow     = input1['rho_snow'][i,j]
+            _point.T_pp         = input1['T_pp'][i,j]
+
+            _point.precip_now = 0
+            if _point.m_pp > 0:
+                _point.precip_now = 1
 
             # get the model state
             elevation       = output_rec['elevation'][i,j]
-            z_0             = output_rec['z_0'][i,j]
-            z_s             = output_rec['z_s'][i,j]
-            rho             = output_rec['rho'][i,j]
-            T_s_0           = output_rec['T_s_0'][i,j]
-            T_s_l           = output_rec['T_s_l'][i,j]
-            T_s             = output_rec['T_s'][i,j]
-            h2o_sat         = output_rec['h2o_sat'][i,j]
-            layer_count     = output_rec['layer_count'][i,j]
-
-            R_n_bar         = output_rec['R_n_bar'][i,j]
-            H_bar           = output_rec['H_bar'][i,j]
-            L_v_E_bar       = output_rec['L_v_E_bar'][i,j]
-            G_bar           = output_rec['G_bar'][i,j]
-            G_0_bar         = output_rec['G_0_bar'][i,j]
-            M_bar           = output_rec['M_bar'][i,j]
-            delta_Q_bar     = output_rec['delta_Q_bar'][i,j]
-            delta_Q_0_bar   = output_rec['delta_Q_0_bar'][i,j]
-            E_s_sum         = output_rec['E_s_sum'][i,j]
-            melt_sum        = output_rec['melt_sum'][i,j]
-            ro_pred_sum     = output_rec['ro_pred_sum'][i,j]
+            _point.z_0             = output_rec['z_0'][i,j]
+            _point.z_s             = output_rec['z_s'][i,j]
+            _point.rho             = output_rec['rho'][i,j]
+            _point.T_s_0           = output_rec['T_s_0'][i,j]
+            _point.T_s_l           = output_rec['T_s_l'][i,j]
+            _point.T_s             = output_rec['T_s'][i,j]
+            _point.h2o_sat         = output_rec['h2o_sat'][i,j]
+            _point.layer_count     = output_rec['layer_count'][i,j]
+
+            _point.R_n_bar         = output_rec['R_n_bar'][i,j]
+            _point.H_bar           = output_rec['H_bar'][i,j]
+            _point.L_v_E_bar       = output_rec['L_v_E_bar'][i,j]
+            _point.G_bar           = output_rec['G_bar'][i,j]
+            _point.G_0_bar         = output_rec['G_0_bar'][i,j]
+            _point.M_bar           = output_rec['M_bar'][i,j]
+            _point.delta_Q_bar     = output_rec['delta_Q_bar'][i,j]
+            _point.delta_Q_0_bar   = output_rec['delta_Q_0_bar'][i,j]
+            _point.E_s_sum         = output_rec['E_s_sum'][i,j]
+            _point.melt_sum        = output_rec['melt_sum'][i,j]
+            _point.ro_pred_sum     = output_rec['ro_pred_sum'][i,j]
 
     #         print z_0
 
@@ -754,14 +1449,14 @@ def do_tstep(input1, input2, output_rec, tstep_rec, mh, params, first_step=True)
             # or there will be a slight descrepancy with isnobal. But with this,
             # there should be a descrepancy in isnobal as well
             if first_step:
-                init_snow()
+                init_snow(&_point)
 
             # set air pressure from site elev
-            P_a = HYSTAT(SEA_LEVEL, STD_AIRTMP, STD_LAPSE, (elevation / 1000.0),
+            _point.P_a = HYSTAT(SEA_LEVEL, STD_AIRTMP, STD_LAPSE, (elevation / 1000.0),
                 GRAVITY, MOL_AIR)
 
             # do_data_tstep.c
-            dt = do_data_tstep()
+            dt = do_data_tstep(&_point)
             if dt == 0:
                 rt = False
                 if N > 1:
@@ -769,40 +1464,39 @@ def do_tstep(input1, input2, output_rec, tstep_rec, mh, params, first_step=True)
                 else:
                     break
 
-            output_rec['current_time'][i,j] = current_time
-            output_rec['time_since_out'][i,j] = time_since_out
-
-            output_rec['elevation'][i,j] = elevation
-            output_rec['z_0'][i,j] = z_0
-            output_rec['rho'][i,j] = rho
-            output_rec['T_s_0'][i,j] = T_s_0
-            output_rec['T_s_l'][i,j] = T_s_l
-            output_rec['T_s'][i,j] = T_s
-            output_rec['h2o_sat'][i,j] = h2o_sat
-            output_rec['h2o_max'][i,j] = h2o_max
-            output_rec['h2o'][i,j] = h2o
-            output_rec['layer_count'][i,j] = layer_count
-            output_rec['cc_s_0'][i,j] = cc_s_0
-            output_rec['cc_s_l'][i,j] = cc_s_l
-            output_rec['cc_s'][i,j] = cc_s
-            output_rec['m_s_0'][i,j] = m_s_0
-            output_rec['m_s_l'][i,j] = m_s_l
-            output_rec['m_s'][i,j] = m_s
-            output_rec['z_s_0'][i,j] = z_s_0
-            output_rec['z_s_l'][i,j] = z_s_l
-            output_rec['z_s'][i,j] = z_s
-
-            output_rec['R_n_bar'][i,j] = R_n_bar
-            output_rec['H_bar'][i,j] = H_bar
-            output_rec['L_v_E_bar'][i,j] = L_v_E_bar
-            output_rec['G_bar'][i,j] = G_bar
-            output_rec['G_0_bar'][i,j] = G_0_bar
-            output_rec['M_bar'][i,j] = M_bar
-            output_rec['delta_Q_bar'][i,j] = delta_Q_bar
-            output_rec['delta_Q_0_bar'][i,j] = delta_Q_0_bar
-            output_rec['E_s_sum'][i,j] = E_s_sum
-            output_rec['melt_sum'][i,j] = melt_sum
-            output_rec['ro_pred_sum'][i,j] = ro_pred_sum
+            output_rec['current_time'][i,j] = _point.current_time
+            output_rec['time_since_out'][i,j] = _point.time_since_out
+
+            output_rec['z_0'][i,j] = _point.z_0
+            output_rec['rho'][i,j] = _point.rho
+            output_rec['T_s_0'][i,j] = _point.T_s_0
+            output_rec['T_s_l'][i,j] = _point.T_s_l
+            output_rec['T_s'][i,j] = _point.T_s
+            output_rec['h2o_sat'][i,j] = _point.h2o_sat
+            output_rec['h2o_max'][i,j] = _point.h2o_max
+            output_rec['h2o'][i,j] = _point.h2o
+            output_rec['layer_count'][i,j] = _point.layer_count
+            output_rec['cc_s_0'][i,j] = _point.cc_s_0
+            output_rec['cc_s_l'][i,j] = _point.cc_s_l
+            output_rec['cc_s'][i,j] = _point.cc_s
+            output_rec['m_s_0'][i,j] = _point.m_s_0
+            output_rec['m_s_l'][i,j] = _point.m_s_l
+            output_rec['m_s'][i,j] = _point.m_s
+            output_rec['z_s_0'][i,j] = _point.z_s_0
+            output_rec['z_s_l'][i,j] = _point.z_s_l
+            output_rec['z_s'][i,j] = _point.z_s
+
+            output_rec['R_n_bar'][i,j] = _point.R_n_bar
+            output_rec['H_bar'][i,j] = _point.H_bar
+            output_rec['L_v_E_bar'][i,j] = _point.L_v_E_bar
+            output_rec['G_bar'][i,j] = _point.G_bar
+            output_rec['G_0_bar'][i,j] = _point.G_0_bar
+            output_rec['M_bar'][i,j] = _point.M_bar
+            output_rec['delta_Q_bar'][i,j] = _point.delta_Q_bar
+            output_rec['delta_Q_0_bar'][i,j] = _point.delta_Q_0_bar
+            output_rec['E_s_sum'][i,j] = _point.E_s_sum
+            output_rec['melt_sum'][i,j] = _point.melt_sum
+            output_rec['ro_pred_sum'][i,j] = _point.ro_pred_sum
 
     return rt
 
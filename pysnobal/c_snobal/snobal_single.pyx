@@ -0,0 +1,9 @@
+"""
+The snobal wrapper built against libsnobal in single precision
+
+The same module as snobal, with the snowpack state and the energy and
+mass balance in float (see real_t in types.h). The arrays passed in and
+out are the same as for snobal.
+"""
+
+include "snobal.pyx"
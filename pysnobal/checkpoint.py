@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Checkpoints of the model state for restarting a run
+
+A checkpoint is a .npz file with every field of the model state and the
+run clock, the number of data timesteps that have been run and the time
+at the end of the last one. The file is written next to the old one and
+moved over it so a crash while writing leaves the last checkpoint intact.
+"""
+
+import os
+
+import numpy as np
+
+from .c_snobal import snobal
+
+# name of the checkpoint file in the output location
+CHECKPOINT_FILE = 'snobal_checkpoint.npz'
+
+
+def save_checkpoint(path, output_rec, step, date_time, compress=False):
+    """
+    Save the model state
+
+    Args:
+        path: .npz file to write
+        output_rec: dict of the model state, e.g. SnobalGrid.output_rec
+        step: number of data timesteps that have been run
+        date_time: time at the end of the last data timestep
+        compress: zip compress the arrays
+    """
+
+    import pandas as pd
+
+    arrays = {key: np.asarray(output_rec[key]) for key in snobal.STATE_FIELDS}
+    arrays['step'] = np.array(step, dtype=np.int64)
+    arrays['date_time'] = np.array(pd.Timestamp(date_time).isoformat())
+
+    # np.savez adds .npz to names without it
+    tmp = path + '.tmp.npz'
+    if compress:
+        np.savez_compressed(tmp, **arrays)
+    else:
+        np.savez(tmp, **arrays)
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path):
+    """
+    Load the model state from a checkpoint
+
+    Args:
+        path: .npz file from save_checkpoint
+
+    Returns:
+        dict of the model state, the number of data timesteps that have
+        been run and the time at the end of the last one
+    """
+
+    import pandas as pd
+
+    with np.load(path) as f:
+        missing = set(snobal.STATE_FIELDS) - set(f.files)
+        if missing:
+            raise ValueError('{} is missing the state fields {}'.format(
+                path, ', '.join(sorted(missing))))
+        state = {key: f[key] for key in snobal.STATE_FIELDS}
+        step = int(f['step'])
+        date_time = pd.Timestamp(str(f['date_time']))
+
+    return state, step, date_time
+
+
+def restart_index(date_time, step, checkpoint_time):
+    """
+    Check that a checkpoint belongs to the run
+
+    Args:
+        date_time: the model times, one per record
+        step: number of data timesteps run at the checkpoint
+        checkpoint_time: time of the checkpoint
+
+    Returns:
+        the record to restart from
+    """
+
+    import pandas as pd
+
+    if step < 0 or step >= len(date_time):
+        raise ValueError('The checkpoint at step {} is outside of the run '
+                         'with {} timesteps'.format(step, len(date_time) - 1))
+    t = pd.Timestamp(date_time[step])
+    if t.tz_localize(None) != checkpoint_time.tz_localize(None):
+        raise ValueError('The checkpoint is for {}, step {} of the run is '
+                         '{}'.format(checkpoint_time, step, t))
+    return step
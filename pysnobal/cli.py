@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+The pysnobal command
+
+Dispatches to the command line of a module, which is only imported once
+the command is known so that `pysnobal --help` and the commands that don't
+need them never load pandas or netCDF4.
+
+    pysnobal run config.ini [--restart [checkpoint.npz]]
+    pysnobal sweep sets.csv -s snow.properties.input ...
+    pysnobal stations sites.csv forcing.csv out.nc ...
+"""
+
+import argparse
+import importlib
+import sys
+
+# command: (module, function taking the rest of the arguments, help)
+COMMANDS = {
+    'run': ('pysnobal.ipysnobal', 'cli',
+            'run iPySnobal on a grid from a configuration file'),
+    'sweep': ('pysnobal.sweep', 'main',
+              'sweep the model parameters at a point'),
+    'stations': ('pysnobal.stations', 'main',
+                 'run the model at many stations at once'),
+}
+
+
+def main(argv=None):
+    """
+    Run a pysnobal command
+
+    Args:
+        argv: the command and its arguments, sys.argv[1:] if None
+    """
+
+    epilog = 'commands:\n' + '\n'.join(
+        '  {:<10s}{}'.format(name, command[2])
+        for name, command in COMMANDS.items())
+    p = argparse.ArgumentParser(
+        prog='pysnobal', epilog=epilog,
+        description='The Snobal mass and energy balance snow model',
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument('command', choices=list(COMMANDS), metavar='command',
+                   help='one of {}'.format(', '.join(COMMANDS)))
+    p.add_argument('args', nargs=argparse.REMAINDER,
+                   help='arguments of the command, see pysnobal command '
+                   '--help')
+    if argv is None:
+        argv = sys.argv[1:]
+        if argv and argv[0] in COMMANDS:
+            # the usage of the command is for pysnobal command
+            sys.argv[0] = 'pysnobal ' + argv[0]
+    args = p.parse_args(argv)
+
+    module, function, _ = COMMANDS[args.command]
+    return getattr(importlib.import_module(module), function)(args.args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming reader for the netCDF forcing files
+
+ipysnobal.get_timestep looks up the time index and reads one (y, x) slice
+per file for every timestep while the model waits. The ForcingReader here
+maps the model times to the indices in each file once, reads a block of
+timesteps per variable in one call and reads the next block in a
+background thread while the model runs the current one.
+
+The SMRF files are single precision. The inputs that are read as float32
+stay float32 all the way to the C kernel, which widens them for each
+pixel, only the temperatures are converted to K in float64.
+
+ForcingBuffers does the same for forcing that arrives one record at a
+time, the records go straight into one of two preallocated blocks.
+"""
+
+import logging
+import threading
+from time import perf_counter, thread_time
+
+import numpy as np
+
+from .pysnobal import C_TO_K
+from .timing import RunStats
+
+try:
+    from Queue import Queue, Full
+except ImportError:
+    from queue import Queue, Full
+
+# the forcing files and the snobal inputs they are read into
+FORCING_MAP = {'air_temp': 'T_a', 'net_solar': 'S_n', 'thermal': 'I_lw',
+               'vapor_pressure': 'e_a', 'wind_speed': 'u',
+               'soil_temp': 'T_g', 'precip_mass': 'm_pp',
+               'percent_snow': 'percent_snow', 'snow_density': 'rho_snow',
+               'precip_temp': 'T_pp'}
+
+# inputs in degrees C that the model needs in K
+CELSIUS = ['T_a', 'T_g', 'T_pp']
+
+# the netCDF library isn't thread safe and netCDF4 releases the GIL, the
+# reader and writer threads hold this lock for every netCDF call
+NC_LOCK = threading.Lock()
+
+
+def time_index(ds, date_time):
+    """
+    Index of each of the model times in a forcing file, the same as
+    nc.date2index with select='exact' but for all the times at once
+
+    Args:
+        ds: netCDF4.Dataset with a time variable
+        date_time: sequence of datetimes
+
+    Returns:
+        array of the indices into the time dimension of ds
+    """
+
+    import netCDF4 as nc
+
+    times = ds.variables['time']
+    calendar = getattr(times, 'calendar', 'standard')
+    t = nc.date2num([d.replace(tzinfo=None) for d in date_time],
+                    times.units, calendar)
+
+    lookup = {value: i for i, value in enumerate(np.asarray(times[:]))}
+    index = np.empty(len(t), dtype=np.int64)
+    for n, value in enumerate(np.atleast_1d(t)):
+        if value not in lookup:
+            raise ValueError('%s is not in %s' %
+                             (date_time[n], ds.filepath()))
+        index[n] = lookup[value]
+
+    return index
+
+
+class ForcingBuffers(object):
+    """
+    Two preallocated sets of forcing blocks for a producer that delivers
+    the forcing one record at a time, e.g. the SMRF queues
+
+    The records are written with put into the block being filled, the
+    inputs in CELSIUS are converted to K on the way in. block hands the
+    filled block to the model as C contiguous views, ready for
+    SnobalGrid.run_block, and switches to the other set. The last record of
+    a block is the first of the next, it is the only record that is copied.
+    The model can run a block while the next is filled, the block is valid
+    until the next call to block.
+
+    Args:
+        shape: (ny, nx) of the grid
+        block_size: number of data timesteps in a block
+        constant: dict of inputs that don't change over the run, e.g.
+            {'T_g': -2.5}, in the units of the producer. They are filled
+            once and put doesn't change them.
+    """
+
+    def __init__(self, shape, block_size, constant=None):
+
+        self.shape = tuple(shape)
+        self.block_size = block_size
+        self.constant = dict(constant or {})
+        self.nrecords = 0
+
+        self._buffers = []
+        for _ in range(2):
+            buf = {key: np.zeros((block_size + 1,) + self.shape)
+                   for key in FORCING_MAP.values()}
+            for key, value in self.constant.items():
+                buf[key][:] = value
+                if key in CELSIUS:
+                    buf[key] += C_TO_K
+            self._buffers.append(buf)
+        self._fill = 0
+
+    @property
+    def full(self):
+        """
+        True when the block has all of its records
+        """
+        return self.nrecords == self.block_size + 1
+
+    def put(self, record):
+        """
+        Add a record to the block
+
+        Args:
+            record: dict of snobal input to (ny, nx) array, the inputs in
+                CELSIUS are in C
+        """
+
+        if self.full:
+            raise ValueError('The forcing block already has {} '
+                             'records'.format(self.nrecords))
+
+        buf = self._buffers[self._fill]
+        for key, data in record.items():
+            if key in self.constant:
+                continue
+            if key in CELSIUS:
+                np.add(data, C_TO_K, out=buf[key][self.nrecords])
+            else:
+                np.copyto(buf[key][self.nrecords], data)
+        self.nrecords += 1
+
+    def block(self):
+        """
+        Hand over the records put so far and start the next block from the
+        last of them
+
+        Returns:
+            dict of the snobal inputs with shape (nrecords, ny, nx)
+        """
+
+        if self.nrecords < 2:
+            raise ValueError('The forcing block needs at least two records')
+
+        n = self.nrecords
+        block = {key: value[:n]
+                 for key, value in self._buffers[self._fill].items()}
+
+        self._fill = 1 - self._fill
+        for key, value in self._buffers[self._fill].items():
+            if key not in self.constant:
+                np.copyto(value[0], block[key][-1])
+        self.nrecords = 1
+
+        return block
+
+
+class ForcingReader(object):
+    """
+    Reads the forcing for the model a block of timesteps at a time
+
+    Iterating over the reader gives (j, block) for consecutive blocks of
+    block_size data timesteps, where block is a dict of the snobal inputs
+    with shape (nsteps + 1, ny, nx) for the records j to j + nsteps, ready
+    for SnobalGrid.run_block. The last record of a block is the first of
+    the next. With prefetch the next block is read in a background thread
+    while the caller runs the current one.
+
+    Args:
+        force: dict from ipysnobal.open_files, netCDF4.Datasets or arrays
+            for the inputs that are constant in time
+        date_time: the model times, one per record
+        point: (row, col) to only read a single point
+        tile: (rows, cols) slices to only read a tile of the grid
+        block_size: number of data timesteps in a block
+        prefetch: read ahead in a background thread
+        start: record to start from, e.g. for a restart
+    """
+
+    def __init__(self, force, date_time, point=None, block_size=24,
+                 prefetch=True, start=0, tile=None):
+
+        self.force = force
+        self.date_time = date_time
+        self.point = point
+        self.tile = tile
+        self.block_size = block_size
+        self.prefetch = prefetch
+        self.nsteps = len(date_time) - 1
+        self.start = start
+
+        # the variable name and the indices only need to be found once
+        self.variables = {}
+        self.index = {}
+        for f, ds in force.items():
+            if isinstance(ds, np.ndarray):
+                continue
+            v = list(set(ds.variables.keys()) -
+                     set(ds.dimensions.keys()))[0]
+            var = ds.variables[v]
+            var.set_auto_mask(False)
+            self.variables[f] = var
+            self.index[f] = time_index(ds, date_time)
+
+        self.nbytes = 0
+        self.timings = RunStats()
+        self.read_time = 0.0
+        self.stall_time = 0.0
+        self.nblocks = 0
+
+        self._thread = None
+        self._stop = threading.Event()
+
+        self._logger = logging.getLogger(__name__)
+
+    def read(self, start, stop):
+        """
+        Read the records start to stop - 1
+
+        Args:
+            start: first record
+            stop: one past the last record
+
+        Returns:
+            dict of the snobal inputs with shape (stop - start, ny, nx),
+            float32 if the file is and float64 for the temperatures and
+            the constant inputs
+        """
+
+        t0 = perf_counter()
+        c0 = thread_time()
+        block = {}
+        for f, value in self.force.items():
+            key = FORCING_MAP[f]
+
+            if f not in self.variables:
+                if self.point is not None:
+                    value = np.atleast_2d(value[self.point])
+                elif self.tile is not None:
+                    value = value[self.tile]
+                data = np.empty((stop - start,) + value.shape)
+                data[:] = value
+                block[key] = data
+                continue
+
+            idx = self.index[f][start:stop]
+            if np.all(np.diff(idx) == 1):
+                # contiguous in the file so one hyperslab
+                idx = slice(idx[0], idx[-1] + 1)
+            with NC_LOCK:
+                if self.tile is not None:
+                    data = self.variables[f][idx, self.tile[0],
+                                             self.tile[1]]
+                elif self.point is None:
+                    data = self.variables[f][idx, :]
+                else:
+                    data = self.variables[f][idx, self.point[0],
+                                             self.point[1]]
+            if self.point is not None:
+                data = data.reshape(-1, 1, 1)
+
+            self.nbytes += data.nbytes
+            if key in CELSIUS or data.dtype != np.float32:
+                block[key] = np.ascontiguousarray(data, dtype=np.float64)
+            else:
+                block[key] = np.ascontiguousarray(data)
+
+        for key in CELSIUS:
+            block[key] += C_TO_K
+
+        self.read_time += perf_counter() - t0
+        self.timings.add('read', perf_counter() - t0, thread_time() - c0)
+
+        return block
+
+    def blocks(self):
+        """
+        The (start, stop) records of each block
+        """
+        return [(j, min(j + self.block_size, self.nsteps) + 1)
+                for j in range(self.start, self.nsteps, self.block_size)]
+
+    def _put(self, queue, item):
+        """
+        Put item in the queue unless the reader is closed, returns False
+        if it was
+        """
+
+        while not self._stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _reader(self, queue):
+        """
+        Read the blocks into the queue, the exception if a read fails
+        """
+
+        try:
+            for start, stop in self.blocks():
+                if not self._put(queue, (start, self.read(start, stop))):
+                    return
+
+        except Exception as e:
+            self._put(queue, (None, e))
+
+    def __iter__(self):
+
+        if not self.prefetch:
+            for start, stop in self.blocks():
+                # the model waits for the whole read
+                t0 = perf_counter()
+                block = self.read(start, stop)
+                self.stall_time += perf_counter() - t0
+                self.nblocks += 1
+                yield start, block
+            return
+
+        # one block in the queue and one being read
+        queue = Queue(maxsize=1)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._reader, args=(queue,),
+                                        name='forcing_reader')
+        self._thread.daemon = True
+        self._thread.start()
+
+        try:
+            for _ in self.blocks():
+                t0 = perf_counter()
+                start, block = queue.get()
+                self.stall_time += perf_counter() - t0
+                if start is None:
+                    raise block
+                self.nblocks += 1
+                yield start, block
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Stop the read ahead thread
+        """
+
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def stats(self):
+        """
+        Read statistics
+
+        Returns:
+            dict with the MB read, the time spent reading (s), the read
+            throughput (MB/s), the time the model waited for the
+            forcing (s) and the number of blocks
+        """
+
+        mb = self.nbytes / 1e6
+        return {
+            'read_mb': mb,
+            'read_time': self.read_time,
+            'throughput': mb / self.read_time if self.read_time > 0 else 0.0,
+            'stall_time': self.stall_time,
+            'nblocks': self.nblocks,
+        }
+
+    def log_stats(self):
+        """
+        Log the read statistics
+        """
+
+        self._logger.info('Forcing read %(read_mb).1f MB in %(read_time).2f s '
+                          '(%(throughput).1f MB/s), waited %(stall_time).2f s '
+                          'over %(nblocks)d blocks' % self.stats())
+
+
+class EnsembleReader(ForcingReader):
+    """
+    Reads the forcing of each member of an ensemble a block at a time
+
+    The blocks are as for ForcingReader with a member axis after the
+    records, (nsteps + 1, members, ny, nx), ready for the run_block of a
+    SnobalGrid with members.
+
+    Args:
+        members: list of the force dict of each member, as for
+            ForcingReader
+        date_time: the model times, one per record
+        block_size: number of data timesteps in a block
+        prefetch: read ahead in a background thread
+        start: record to start from, e.g. for a restart
+    """
+
+    def __init__(self, members, date_time, block_size=24, prefetch=True,
+                 start=0):
+
+        super(EnsembleReader, self).__init__({}, date_time,
+                                             block_size=block_size,
+                                             prefetch=prefetch, start=start)
+        self.members = [ForcingReader(force, date_time,
+                                      block_size=block_size, prefetch=False,
+                                      start=start)
+                        for force in members]
+
+    def read(self, start, stop):
+        """
+        Read the records start to stop - 1 of every member
+
+        Returns:
+            dict of the snobal inputs with shape (stop - start, members,
+            ny, nx)
+        """
+
+        t0 = perf_counter()
+        c0 = thread_time()
+        blocks = [reader.read(start, stop) for reader in self.members]
+        block = {key: np.stack([b[key] for b in blocks], axis=1)
+                 for key in blocks[0]}
+
+        self.nbytes = sum(reader.nbytes for reader in self.members)
+        self.read_time += perf_counter() - t0
+        self.timings.add('read', perf_counter() - t0, thread_time() - c0)
+
+        return block
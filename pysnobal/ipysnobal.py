@@ -9,15 +9,21 @@ interpretation
 20160118 Scott Havens
 """
 
-from .c_snobal import snobal
+from .c_snobal import PRECISIONS, engine, snobal
+from .checkpoint import (CHECKPOINT_FILE, load_checkpoint, restart_index,
+                         save_checkpoint)
+from .forcing import (CELSIUS, FORCING_MAP, EnsembleReader, ForcingBuffers,
+                      ForcingReader)
+from .output import (EM_OUT, PACKED_FILL, SNOW_OUT, OutputWriter,
+                     output_encoding, pack_attributes)
+from .autotune import autotune
+from .tiled import TiledSnobal
+from .timing import RunStats
 import os
 import configparser
-import sys
 import os
 import numpy as np
-import pandas as pd
 from datetime import timedelta
-import netCDF4 as nc
 # import matplotlib.pyplot as plt
 # import progressbar
 from copy import copy
@@ -27,6 +33,7 @@ try:
 except:
     from queue import Queue, Empty, Full
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from time import time as _time
 import logging
 # from multiprocessing import Pool
@@ -53,7 +60,6 @@ DEFAULT_SMALL_TSTEP = 1.0
 WHOLE_TSTEP = 0x1  # output when tstep is not divided
 DIVIDED_TSTEP = 0x2  # output when timestep is divided
 
-
 def hrs2min(x): return x * 60
 def min2sec(x): return x * 60
 def SEC_TO_HR(x): return x / 3600.0
@@ -79,13 +85,13 @@ class MyParser(configparser.ConfigParser):
         return d
 
     def _make_lowercase(self, obj):
-        if hasattr(obj, 'iteritems'):
+        if isinstance(obj, dict):
             # dictionary
             ret = {}
-            for k, v in obj.iteritems():
+            for k, v in obj.items():
                 ret[self._make_lowercase(k)] = v
             return ret
-        elif isinstance(obj, basestring):
+        elif isinstance(obj, str):
             # string
             return obj.lower()
         elif hasattr(obj, '__iter__'):
@@ -161,6 +167,8 @@ def get_args(configFile):
     input arguements, i.e. rewrite the rest of getargs.c
     """
 
+    import pandas as pd
+
     # read the config file and store
     if not os.path.isfile(configFile):
         raise Exception(
@@ -262,10 +270,108 @@ def get_args(configFile):
         config['output']['out_filename'] = None
         config['inputs']['point'] = None
 
-    try:
-        config['output']['nthreads'] = int(config['output']['nthreads'])
-    except:
+    # an ensemble reads the forcing of each member from a directory with
+    # files of the same names as the inputs
+    members = config['inputs'].get('members')
+    if members:
+        config['inputs']['members'] = [m.strip() for m in members.split(',')
+                                       if m.strip()]
+    else:
+        config['inputs']['members'] = None
+
+    # number of threads for the model, auto to pick them from a trial of
+    # the first autotune_steps data timesteps, or the OpenMP default if
+    # it's empty. With tiles it's the number of threads in each worker.
+    nthreads = str(config['output'].get('nthreads') or '').strip().lower()
+    if nthreads == 'auto':
+        config['output']['nthreads'] = 'auto'
+    elif nthreads == '':
         config['output']['nthreads'] = None
+    else:
+        try:
+            config['output']['nthreads'] = int(nthreads)
+        except ValueError:
+            raise ValueError('nthreads must be an integer or auto, '
+                             'not {}'.format(nthreads))
+    config['output']['autotune_steps'] = int(
+        config['output'].get('autotune_steps', 2))
+
+    # how the active pixels are shared between the threads
+    config['output']['schedule'] = config['output'].get(
+        'schedule', 'cost').lower()
+    if config['output']['schedule'] not in snobal.SCHEDULES:
+        raise ValueError('schedule must be one of {}'.format(
+            ', '.join(snobal.SCHEDULES)))
+    config['output']['chunk_size'] = int(
+        config['output'].get('chunk_size', 100))
+
+    # number of data timesteps the model runs in one call
+    config['output']['block_size'] = int(
+        config['output'].get('block_size', 24))
+
+    # number of row tiles that are run in separate processes
+    config['output']['ntiles'] = int(config['output'].get('ntiles', 1))
+
+    # layout of the model state, compact keeps the diagnostic fields in
+    # single precision
+    config['output']['state_layout'] = config['output'].get(
+        'state_layout', 'full').lower()
+    if config['output']['state_layout'] not in snobal.LAYOUTS:
+        raise ValueError('state_layout must be one of {}'.format(
+            ', '.join(snobal.LAYOUTS)))
+
+    # precision of the libsnobal build, single is faster for screening
+    # runs but differs from double by rounding
+    config['output']['precision'] = config['output'].get(
+        'precision', 'double').lower()
+    if config['output']['precision'] not in PRECISIONS:
+        raise ValueError('precision must be one of {}'.format(
+            ', '.join(PRECISIONS)))
+
+    # take the saturation vapor pressures from tables instead of the
+    # formulas, faster and within 1e-9 of them
+    config['output']['sat_table'] = str(
+        config['output'].get('sat_table', False)).lower() == 'true'
+
+    # start hle1 from the Obukhov length of the last run timestep, fewer
+    # iterations for fluxes within the convergence threshold of hle1
+    config['output']['hle1_warm_start'] = str(
+        config['output'].get('hle1_warm_start', True)).lower() == 'true'
+
+    # number of output timesteps written at once and how often the output
+    # files are synced, 0 to only sync at the end of the run
+    config['output']['buffer_size'] = int(
+        config['output'].get('buffer_size', 24))
+    config['output']['sync_interval'] = int(
+        config['output'].get('sync_interval', 0))
+
+    # layout of em.nc and snow.nc, the chunks are picked from the grid size
+    # and output frequency unless they are given as time, y, x
+    chunks = config['output'].get('chunks', 'auto')
+    if chunks == 'auto':
+        config['output']['chunks'] = None
+    else:
+        config['output']['chunks'] = tuple(
+            [int(c) for c in chunks.split(',')])
+        if len(config['output']['chunks']) != 3:
+            raise ValueError('output chunks must be time, y, x')
+    config['output']['compression'] = int(
+        config['output'].get('compression', 0))
+    check_range(config['output']['compression'], 0, 9, 'compression level')
+    config['output']['shuffle'] = str(
+        config['output'].get('shuffle', True)).lower() == 'true'
+    config['output']['packing'] = str(
+        config['output'].get('packing', False)).lower() == 'true'
+
+    # save the model state every checkpoint_interval data timesteps, 0 to
+    # not save it, the checkpoints are only taken at the end of a block
+    config['output']['checkpoint_interval'] = int(
+        config['output'].get('checkpoint_interval', 0))
+    config['output']['checkpoint_file'] = config['output'].get(
+        'checkpoint_file',
+        os.path.join(config['output'].get('location', '.'), CHECKPOINT_FILE))
+    config['output']['checkpoint_compress'] = str(
+        config['output'].get('checkpoint_compress', False)).lower() == 'true'
 
     return config, point_run
 
@@ -344,6 +450,9 @@ def get_tstep_info(options, config):
     params['stop_no_snow'] = options['c']
     params['temps_in_C'] = options['K']
     params['relative_heights'] = options['relative_heights']
+    params['sat_table'] = config['output'].get('sat_table', False)
+    params['hle1_warm_start'] = config['output'].get('hle1_warm_start',
+                                                     False)
 
     return params, tstep_info
 
@@ -353,13 +462,16 @@ def open_files(options):
     Open the netCDF files for initial conditions and inputs
     - Reads in the initial_conditions file
         Required variables are x,y,z,z_0
-        The others z_s, rho, T_s_0, T_s, h2o_sat, mask can be specified
+        The others z_s, rho, T_s_0, T_s_l, T_s, h2o_sat, mask can be specified
         but will be set to default of 0's or 1's for mask
 
-    - Open the files for the inputs and store the file identifier
+    - Open the files for the inputs and store the file identifier, for an
+      ensemble force is a list of the files of each member
 
     """
 
+    import netCDF4 as nc
+
     # ------------------------------------------------------------------------------
     # get the initial conditions
     i = nc.Dataset(options['initial_conditions']['file'])
@@ -373,10 +485,10 @@ def open_files(options):
 
     # All other variables will be assumed zero if not present
     all_zeros = np.zeros_like(init['elevation'])
-    flds = ['z_s', 'rho', 'T_s_0', 'T_s', 'h2o_sat', 'mask']
+    flds = ['z_s', 'rho', 'T_s_0', 'T_s_l', 'T_s', 'h2o_sat', 'mask']
 
     for f in flds:
-        if i.variables.has_key(f):
+        if f in i.variables:
             init[f] = i.variables[f][:]         # read in the variables
         elif f == 'mask':
             # if no mask set all to ones so all will be ran
@@ -392,50 +504,119 @@ def open_files(options):
     # convert temperatures to K
     init['T_s'] += FREEZE
     init['T_s_0'] += FREEZE
+    init['T_s_l'] += FREEZE
 
     # ------------------------------------------------------------------------------
     # get the forcing data and open the file
+    members = options['inputs'].get('members')
+    if members:
+        force = [open_forcing(member_inputs(options['inputs'], member),
+                              init['elevation'])
+                 for member in members]
+    else:
+        force = open_forcing(options['inputs'], init['elevation'])
+
+    # print options['inputs']['precip_temp']
+    # print os.stat(options['inputs']['precip_temp']).st_size
+    # print force['precip_mass']['precip_mass'][950:960,:,:]
+
+    return init, force
+
+
+def open_forcing(inputs, elevation):
+    """
+    Open the forcing files
+
+    Args:
+        inputs: dict of the forcing file names
+        elevation: the grid elevation, for a constant soil temperature
+
+    Returns:
+        dict of the netCDF4.Datasets, or an array for a constant soil
+        temperature
+    """
+
+    import netCDF4 as nc
+
     force = {}
-    force['thermal'] = nc.Dataset(options['inputs']['thermal'], 'r')
-    force['air_temp'] = nc.Dataset(options['inputs']['air_temp'], 'r')
-    force['vapor_pressure'] = nc.Dataset(
-        options['inputs']['vapor_pressure'], 'r')
-    force['wind_speed'] = nc.Dataset(options['inputs']['wind_speed'], 'r')
-    force['net_solar'] = nc.Dataset(options['inputs']['net_solar'], 'r')
+    force['thermal'] = nc.Dataset(inputs['thermal'], 'r')
+    force['air_temp'] = nc.Dataset(inputs['air_temp'], 'r')
+    force['vapor_pressure'] = nc.Dataset(inputs['vapor_pressure'], 'r')
+    force['wind_speed'] = nc.Dataset(inputs['wind_speed'], 'r')
+    force['net_solar'] = nc.Dataset(inputs['net_solar'], 'r')
 
     # soil temp can either be distributed for set to a constant
     try:
-        force['soil_temp'] = nc.Dataset(options['inputs']['soil_temp'], 'r')
+        force['soil_temp'] = nc.Dataset(inputs['soil_temp'], 'r')
     except:
         force['soil_temp'] = float(
-            options['inputs']['soil_temp']) * np.ones_like(init['elevation'])
+            inputs['soil_temp']) * np.ones_like(elevation)
 
-    force['precip_mass'] = nc.Dataset(options['inputs']['precip_mass'], 'r')
-    force['percent_snow'] = nc.Dataset(options['inputs']['percent_snow'], 'r')
-    force['snow_density'] = nc.Dataset(options['inputs']['snow_density'], 'r')
-    force['precip_temp'] = nc.Dataset(options['inputs']['precip_temp'], 'r')
+    force['precip_mass'] = nc.Dataset(inputs['precip_mass'], 'r')
+    force['percent_snow'] = nc.Dataset(inputs['percent_snow'], 'r')
+    force['snow_density'] = nc.Dataset(inputs['snow_density'], 'r')
+    force['precip_temp'] = nc.Dataset(inputs['precip_temp'], 'r')
 
-    # print options['inputs']['precip_temp']
-    # print os.stat(options['inputs']['precip_temp']).st_size
-    # print force['precip_mass']['precip_mass'][950:960,:,:]
+    return force
 
-    return init, force
+
+def member_inputs(inputs, directory):
+    """
+    The forcing file names of an ensemble member, the files of the same
+    names as the inputs in the member's directory. A constant soil
+    temperature is the same for every member.
+    """
+
+    member = dict(inputs)
+    for f in FORCING_MAP:
+        value = inputs[f]
+        if f == 'soil_temp':
+            try:
+                float(value)
+                continue
+            except ValueError:
+                pass
+        member[f] = os.path.join(directory, os.path.basename(value))
+    return member
 
 
 def close_files(force):
 
+    if isinstance(force, list):
+        for member in force:
+            close_files(member)
+        return
+
     for f in force.keys():
         if not isinstance(force[f], np.ndarray):
             force[f].close()
 
 
-def output_files(options, init):
+def output_files(options, init, members=0):
     """
     Create the snow and em output netCDF file
+
+    Args:
+        options: the run options, the files are added to the output
+        init: the initial conditions with the x and y coordinates
+        members: number of ensemble members, the variables of an ensemble
+            are (time, member, y, x) with a chunk for each member
     """
 
-    # chunk size
-    cs = (6, 10, 10)
+    import netCDF4 as nc
+
+    # chunking, compression and packing
+    shape = (len(init['y']), len(init['x']))
+    time_step = options['time'].get('time_step', 60)
+    encoding, packed = output_encoding(options['output'], shape, time_step)
+    dtype = 'i2' if packed else 'f'
+    if packed:
+        encoding['fill_value'] = PACKED_FILL
+    if members:
+        chunks = encoding['chunksizes']
+        encoding['chunksizes'] = (chunks[0], 1) + tuple(chunks[1:])
+    data_dims = ('time', 'member', 'y', 'x') if members else \
+        ('time', 'y', 'x')
 
     # ------------------------------------------------------------------------------
     # EM netCDF
@@ -457,6 +638,10 @@ def output_files(options, init):
     em.createDimension('time', None)
     em.createDimension('y', len(init['y']))
     em.createDimension('x', len(init['x']))
+    if members:
+        em.createDimension('member', members)
+        em.createVariable('member', 'i4', ('member',))
+        em.variables['member'][:] = np.arange(members)
 
     # create some variables
     em.createVariable('time', 'f', dimensions[0])
@@ -474,7 +659,11 @@ def output_files(options, init):
     for i, v in enumerate(m['name']):
 
         #         em.createVariable(v, 'f', dimensions[:3], chunksizes=(6,10,10))
-        em.createVariable(v, 'f', dimensions[:3], chunksizes=cs)
+        em.createVariable(v, dtype, data_dims, **encoding)
+        if packed:
+            scale_factor, add_offset = pack_attributes(v)
+            setattr(em.variables[v], 'scale_factor', scale_factor)
+            setattr(em.variables[v], 'add_offset', add_offset)
         setattr(em.variables[v], 'units', m['units'][i])
         setattr(em.variables[v], 'description', m['description'][i])
 
@@ -501,6 +690,10 @@ def output_files(options, init):
     snow.createDimension('time', None)
     snow.createDimension('y', len(init['y']))
     snow.createDimension('x', len(init['x']))
+    if members:
+        snow.createDimension('member', members)
+        snow.createVariable('member', 'i4', ('member',))
+        snow.variables['member'][:] = np.arange(members)
 
     # create some variables
     snow.createVariable('time', 'f', dimensions[0])
@@ -517,29 +710,42 @@ def output_files(options, init):
     # snow image
     for i, v in enumerate(s['name']):
 
-        snow.createVariable(v, 'f', dimensions[:3], chunksizes=cs)
+        snow.createVariable(v, dtype, data_dims, **encoding)
 #         snow.createVariable(v, 'f', dimensions[:3])
+        if packed:
+            scale_factor, add_offset = pack_attributes(v)
+            setattr(snow.variables[v], 'scale_factor', scale_factor)
+            setattr(snow.variables[v], 'add_offset', add_offset)
         setattr(snow.variables[v], 'units', s['units'][i])
         setattr(snow.variables[v], 'description', s['description'][i])
 
     options['output']['snow'] = snow
 
 
+def open_output_files(options):
+    """
+    Open the snow and em output netCDF files from a run to append to them
+    """
+
+    import netCDF4 as nc
+
+    for f in ['em', 'snow']:
+        netcdfFile = os.path.join(options['output']['location'], f + '.nc')
+        if not os.path.isfile(netcdfFile):
+            raise Exception('Output file to restart does not exist --> %s' %
+                            netcdfFile)
+        options['output'][f] = nc.Dataset(netcdfFile, 'a')
+
+
 def output_timestep(s, tstep, options):
     """
     Output the model results for the current time step
     """
 
-    em_out = {'net_rad': 'R_n_bar', 'sensible_heat': 'H_bar', 'latent_heat': 'L_v_E_bar',
-              'snow_soil': 'G_bar', 'precip_advected': 'M_bar',
-              'sum_EB': 'delta_Q_bar', 'evaporation': 'E_s_sum',
-              'snowmelt': 'melt_sum', 'SWI': 'ro_pred_sum',
-              'cold_content': 'cc_s'}
-    snow_out = {'thickness': 'z_s', 'snow_density': 'rho',
-                'specific_mass': 'm_s', 'liquid_water': 'h2o',
-                'temp_surf': 'T_s_0', 'temp_lower': 'T_s_l',
-                'temp_snowcover': 'T_s', 'thickness_lower': 'z_s_l',
-                'water_saturation': 'h2o_sat'}
+    import netCDF4 as nc
+
+    em_out = EM_OUT
+    snow_out = SNOW_OUT
 
     # preallocate
 #     all_zeros = np.zeros(s['elevation'].shape)
@@ -552,10 +758,10 @@ def output_timestep(s, tstep, options):
 #     for index, si in np.ndenumerate(s):
 #
 #         if si is not None:
-    for key, value in em_out.iteritems():
+    for key, value in em_out.items():
         em[key] = copy(s[value])
 
-    for key, value in snow_out.iteritems():
+    for key, value in snow_out.items():
         snow[key] = copy(s[value])
 
     # convert from K to C
@@ -685,6 +891,8 @@ def get_timestep(force, tstep, point=None):
     place that time step into a dict
     """
 
+    import netCDF4 as nc
+
     inpt = {}
 
     # map function from these values to the ones requried by snobal
@@ -717,13 +925,16 @@ def get_timestep(force, tstep, point=None):
                               calendar=force[f].variables['time'].calendar,
                               select='exact')
 
-            # pull out the value
+            # pull out the value, single precision is passed to the model
+            # as it is except for the temperatures
             if point is None:
-                inpt[map_val[f]] = force[f].variables[v][t,
-                                                         :].astype(np.float64)
+                value = force[f].variables[v][t, :]
             else:
-                inpt[map_val[f]] = np.atleast_2d(
-                    force[f].variables[v][t, point[0], point[1]].astype(np.float64))
+                value = np.atleast_2d(
+                    force[f].variables[v][t, point[0], point[1]])
+            if map_val[f] in CELSIUS or value.dtype != np.float32:
+                value = value.astype(np.float64)
+            inpt[map_val[f]] = value
 
     # convert from C to K
     inpt['T_a'] += FREEZE
@@ -789,12 +1000,55 @@ def initialize(params, tstep_info, init):
     return s
 
 
-def main(configFile):
+def run_blocks(grid, reader, frequency, out_fields, first_step=1):
+    """
+    Run the grid over the forcing blocks from the reader
+
+    Args:
+        grid: snobal.SnobalGrid
+        reader: ForcingReader for the grid
+        frequency: output every frequency data timesteps
+        out_fields: state fields to output
+        first_step: 1 if the snowpack should be initialized on the first
+            timestep, snobal.EVERY_STEP to zero the averages and sums on
+            every timestep
+
+    Yields:
+        (j, nsteps, steps, outputs, rt) for each block, the block starts at
+        record j and has nsteps data timesteps, outputs are the
+        (len(steps), ny, nx) state at the output timesteps given by
+        snobal.output_steps, rt is -1 if successful, otherwise the first
+        pixel that failed
+    """
+
+    for j, block in reader:
+
+        nsteps = len(block['S_n']) - 1
+        steps = snobal.output_steps(nsteps, frequency, j)
+        outputs = {key: np.zeros((len(steps),) + grid.shape,
+                                 dtype=snobal.state_dtype(key, grid.layout))
+                   for key in out_fields}
+
+        rt = grid.run_block(block, outputs, frequency, first_step, j)
+        if first_step != snobal.EVERY_STEP:
+            first_step = 0
+
+        yield j, nsteps, steps, outputs, rt
+
+
+def main(configFile, restart=None):
     """
     mimic the main.c from the Snobal model
 
     Args:
         configFile: path to configuration file
+        restart: checkpoint to restart the run from, True for the
+            checkpoint_file in the configuration. The output is appended
+            to the em.nc and snow.nc from the run.
+
+    Returns:
+        pysnobal.timing.RunStats with the time spent in each phase of the
+        run and the counters from the model
     """
 
     # parse the input arguments
@@ -806,6 +1060,12 @@ def main(configFile):
     # open the files and read in data
     init, force = open_files(options)
 
+    # the members of an ensemble are run together over the grid
+    members = len(force) if isinstance(force, list) else 0
+    if members and (point_run or options['output']['ntiles'] > 1):
+        raise ValueError('An ensemble can only be run over the whole grid '
+                         'in one process')
+
     point = None
     if point_run:
         print('Running ipysnobal at a point...')
@@ -822,65 +1082,160 @@ def main(configFile):
 #     s = initialize(params, tstep_info, options['constants'], init)
     output_rec = initialize(params, tstep_info, init)
 
-    # create the output files
+    # the state and the clock of a restart come from the checkpoint
+    date_time = options['time']['date_time']
+    start_step = 0
+    if restart:
+        if point_run:
+            raise ValueError('Point runs can not be restarted')
+        if restart is True:
+            restart = options['output']['checkpoint_file']
+        state, step, checkpoint_time = load_checkpoint(restart)
+        if state['elevation'].shape != init['elevation'].shape:
+            raise ValueError('The checkpoint is for a {} grid, the run is '
+                             '{}'.format(state['elevation'].shape,
+                                         init['elevation'].shape))
+        start_step = restart_index(date_time, step, checkpoint_time)
+        output_rec.update(state)
+
+    # the model runs a block of data timesteps at a time, the forcing for
+    # the block includes the record at the start of the first timestep
+    block_size = options['output']['block_size']
+    frequency = 1 if point_run else options['output']['frequency']
+
+    # create the output files, the output is written in the background. A
+    # restart appends after the output from before the checkpoint.
+    writer = None
     if not point_run:
-        output_files(options, init)
+        start_index = None
+        if start_step > 0:
+            open_output_files(options)
+            start_index = len(snobal.output_steps(start_step, frequency))
+        else:
+            output_files(options, init, members)
+        writer = OutputWriter(options['output']['em'],
+                              options['output']['snow'],
+                              options['output']['buffer_size'],
+                              options['output']['sync_interval'],
+                              start_index=start_index)
 
     # loop through the input
     # do_data_tstep needs two input records so only go
     # to the last record-1
 
-    data_tstep = tstep_info[0]['time_step']
-    timeSinceOut = 0.0
-    start_step = 0  # if restart then it would be higher if this were iSnobal
-    step_time = start_step * data_tstep
-
-    output_rec['current_time'] = step_time * \
-        np.ones(output_rec['elevation'].shape)
-    output_rec['time_since_out'] = timeSinceOut * \
-        np.ones(output_rec['elevation'].shape)
+    if start_step == 0:
+        output_rec['current_time'][:] = 0.0
+        output_rec['time_since_out'][:] = 0.0
 
-    input1 = get_timestep(force, options['time']['date_time'][0], point)
-
-#     if point_run:
-#         input1 = {i: np.atleast_2d(input1[i][point]) for i in input1.keys()}
+    checkpoint_interval = 0 if point_run else \
+        options['output']['checkpoint_interval']
+    if point_run:
+        out_fields = snobal.OUTPUT_FIELDS
+    else:
+        out_fields = set(EM_OUT.values()) | set(SNOW_OUT.values())
+
+    # the model state is kept in the grid between timesteps, output_rec
+    # is a view of it. With tiles the grid is split over worker processes
+    # and output_rec is in shared memory.
+    # a point run replicates a Snobal point run, the grid zeroes the
+    # averages and sums on every data timestep as iSnobal does
+    first_step = int(start_step == 0) if point_run else snobal.EVERY_STEP
+    ntiles = 1 if point_run else options['output']['ntiles']
+    layout = options['output'].get('state_layout', 'full')
+    nbytes = snobal.state_nbytes(init['elevation'].shape, layout, members)
+    print('Model state {:.1f} MB ({} layout{})'.format(
+        sum(nbytes.values()) / 1e6, layout,
+        ', {} members'.format(members) if members else ''))
+    nthreads = options['output'].get('nthreads') or 0
+    schedule = options['output'].get('schedule', 'cost')
+    chunk_size = options['output'].get('chunk_size', 100)
+    precision = options['output'].get('precision', 'double')
+    reader = None
+    if ntiles > 1:
+        if nthreads == 'auto':
+            # the workers share the CPUs
+            nthreads = max(1, (os.cpu_count() or 1) // ntiles)
+            print('{} threads in each of the {} tiles'.format(nthreads,
+                                                             ntiles))
+        model = TiledSnobal(output_rec, tstep_info, options['constants'],
+                            params, force, date_time, ntiles, block_size,
+                            frequency, out_fields, nthreads, layout,
+                            schedule, chunk_size, precision)
+        blocks = model.blocks(start_step, first_step)
+    else:
+        # the forcing for the next block is read while the model runs
+        if members:
+            reader = EnsembleReader(force, date_time, block_size,
+                                    start=start_step)
+        else:
+            reader = ForcingReader(force, date_time, point, block_size,
+                                   start=start_step)
+
+        if nthreads == 'auto':
+            stop = min(start_step + options['output']['autotune_steps'],
+                       len(date_time) - 1) + 1
+            tuning = autotune(output_rec, tstep_info, options['constants'],
+                              params, reader.read(start_step, stop),
+                              first_step=first_step, layout=layout,
+                              members=members, precision=precision)
+            print(tuning.report())
+            nthreads = tuning.best['nthreads']
+            schedule = tuning.best['schedule']
+            chunk_size = tuning.best['chunk_size']
+
+        model = engine(precision).SnobalGrid(
+            output_rec, tstep_info, options['constants'], params, nthreads,
+            layout=layout, schedule=schedule, chunk_size=chunk_size,
+            members=members)
+        blocks = run_blocks(model, reader, frequency, out_fields,
+                            first_step)
+    output_rec = model.output_rec
 
     # pbar = progressbar.ProgressBar(max_value=len(options['time']['date_time']))
-    j = 1
-    first_step = 1
-    for tstep in options['time']['date_time'][1:]:
-        # for tstep in options['time']['date_time'][953:958]:
-
-        input2 = get_timestep(force, tstep, point)
-        # print output_rec
-
-        # this should replicate a Snobal point run but will not mimic the iSnobal results at the point
-        if point_run:
-            first_step = 0
-            if j == 1:
-                first_step = 1
-
-        rt = snobal.do_tstep_grid(input1, input2, output_rec, tstep_info,
-                                  options['constants'], params, first_step, nthreads=4)
-        #rt = snobal.do_tstep_grid(input1, input2, output_rec, tstep_info, options['constants'], params, first_step, nthreads=1)
-
-        if rt != -1:
-            print('ipysnobal error on time step %s, pixel %i' % (tstep, rt))
-            break
+    try:
+        for j, nsteps, steps, outputs, rt in blocks:
 
-        input1 = input2.copy()
+            if rt != -1:
+                print('ipysnobal error in time steps %s to %s, pixel %i' %
+                      (date_time[j + 1], date_time[j + nsteps], rt))
+                break
 
-        # output at the frequency and the last time step
-        if point_run:
-            output_timestep_point(output_rec, params)
+            # output at the frequency
+            for k, t in enumerate(steps):
+                out = {key: value[k] for key, value in outputs.items()}
+                if point_run:
+                    output_timestep_point(out, params)
+                else:
+                    writer.write(out, date_time[j + t + 1])
+
+            # the output up to the checkpoint has to be in the files
+            done = j + nsteps
+            if checkpoint_interval and \
+                    done // checkpoint_interval > j // checkpoint_interval:
+                writer.wait()
+                save_checkpoint(options['output']['checkpoint_file'],
+                                output_rec, done, date_time[done],
+                                options['output']['checkpoint_compress'])
+
+            # pbar.update(j + nsteps)
+
+    finally:
+        blocks.close()
+        if reader is not None:
+            reader.close()
+            reader.log_stats()
         else:
-            if (j % options['output']['frequency'] == 0) or (j == len(options['time']['date_time'])):
-                output_timestep(output_rec, tstep, options)
-                output_rec['time_since_out'] = np.zeros(
-                    output_rec['elevation'].shape)
+            model.close()
 
-        j += 1
-        # pbar.update(j)
+    stats = RunStats().merge(model.stats)
+    if reader is not None:
+        stats.merge(reader.timings)
+
+    if writer is not None:
+        writer.close()
+        stats.merge(writer.timings)
+        options['output']['em'].close()
+        options['output']['snow'].close()
 
     # pbar.finish()
 
@@ -890,19 +1245,25 @@ def main(configFile):
 #     app = MyApplication()
 #     app.run()
 
+    logging.getLogger(__name__).info('Run timings and counters\n%s' %
+                                     stats.summary())
+    return stats
+
 
 def open_init_files(options):
     """
     Open the netCDF files for initial conditions and inputs
     - Reads in the initial_conditions file
         Required variables are x,y,z,z_0
-        The others z_s, rho, T_s_0, T_s, h2o_sat, mask can be specified
+        The others z_s, rho, T_s_0, T_s_l, T_s, h2o_sat, mask can be specified
         but will be set to default of 0's or 1's for mask
 
     - Open the files for the inputs and store the file identifier
 
     """
 
+    import netCDF4 as nc
+
     # ------------------------------------------------------------------------------
     # get the initial conditions
     i = nc.Dataset(options['initial_conditions']['file'])
@@ -916,10 +1277,10 @@ def open_init_files(options):
 
     # All other variables will be assumed zero if not present
     all_zeros = np.zeros_like(init['elevation'])
-    flds = ['z_s', 'rho', 'T_s_0', 'T_s', 'h2o_sat', 'mask']
+    flds = ['z_s', 'rho', 'T_s_0', 'T_s_l', 'T_s', 'h2o_sat', 'mask']
 
     for f in flds:
-        if i.variables.has_key(f):
+        if f in i.variables:
             init[f] = i.variables[f][:]         # read in the variables
         elif f == 'mask':
             # if no mask set all to ones so all will be ran
@@ -935,6 +1296,7 @@ def open_init_files(options):
     # convert temperatures to K
     init['T_s'] += FREEZE
     init['T_s_0'] += FREEZE
+    init['T_s_l'] += FREEZE
 
     return init
 
@@ -992,10 +1354,25 @@ class QueueIsnobal(threading.Thread):
         self.params = params
         self.tstep_info = tstep_info
         self.init = init
-        self.output_rec = output_rec
         self.nx = nx
         self.ny = ny
 
+        # the model state is kept in the grid between timesteps
+        # with nthreads auto the grid is tuned on the first block
+        nthreads = options['output'].get('nthreads') or 0
+        self.autotune = nthreads == 'auto'
+        snobal_engine = engine(options['output'].get('precision', 'double'))
+        self.grid = snobal_engine.SnobalGrid(
+            output_rec, tstep_info, options['constants'], params,
+            nthreads=1 if self.autotune else nthreads,
+            layout=options['output'].get('state_layout', 'full'),
+            schedule=options['output'].get('schedule', 'cost'),
+            chunk_size=options['output'].get('chunk_size', 100))
+        self.output_rec = self.grid.output_rec
+
+        # the timings and counters of the run, set at the end of run
+        self.stats = RunStats()
+
         self._logger = logging.getLogger(__name__)
         self._logger.debug('Initialized iPySnobal thread')
 
@@ -1019,10 +1396,8 @@ class QueueIsnobal(threading.Thread):
         start_step = 0  # if restart then it would be higher if this were iSnobal
         step_time = start_step * data_tstep
 
-        self.output_rec['current_time'] = step_time * \
-            np.ones(self.output_rec['elevation'].shape)
-        self.output_rec['time_since_out'] = timeSinceOut * \
-            np.ones(self.output_rec['elevation'].shape)
+        self.output_rec['current_time'][:] = step_time
+        self.output_rec['time_since_out'][:] = timeSinceOut
 
         # map function from these values to the ones requried by snobal
         map_val = {'air_temp': 'T_a', 'net_solar': 'S_n', 'thermal': 'I_lw',
@@ -1031,91 +1406,148 @@ class QueueIsnobal(threading.Thread):
                    'percent_snow': 'percent_snow', 'snow_density': 'rho_snow',
                    'dew_point': 'T_pp'}
 
-        # get first timestep
-        input1 = {}
-        for v in force_variables:
-            if v in self.queue.keys():
-                # print v
-                data = self.queue[v].get(
-                    self.date_time[0], block=True, timeout=None)
-                if data is None:
-                    print(v)
-                    data = np.zeros((self.ny, self.nx))
-                    print('Error of no data from smrf to iSnobal')
-                    input1[map_val[v]] = data
-                else:
-                    input1[map_val[v]] = data
-            elif v != 'soil_temp':
-                print('Value not in keys: {}'.format(v))
-
-        # set ground temp
-        input1['T_g'] = -2.5*np.ones((self.ny, self.nx))
-
-        input1['T_a'] += FREEZE
-        input1['T_pp'] += FREEZE
-        input1['T_g'] += FREEZE
-
-        # tell queue we assigned all the variables
-        self.queue['isnobal'].put([self.date_time[0], True])
-        print('Finished initializing first timestep')
+        # the forcing is put straight into two preallocated blocks, the
+        # model runs one while the other is filled from the queues. The
+        # ground temperature doesn't come from smrf.
+        block_size = self.options['output']['block_size']
+        buffers = ForcingBuffers((self.ny, self.nx), block_size,
+                                 constant={'T_g': -2.5})
+        read_stats = RunStats()
 
-        #pbar = progressbar.ProgressBar(max_value=len(options['time']['date_time']))
-        j = 1
-        first_step = 1
-        for tstep in self.date_time[1:]:
-            # for tstep in options['time']['date_time'][953:958]:
-            # get the output variables then pass to the function
-            #print('Timestep: {}'.format(tstep))
-            input2 = {}
+        def get_input(tstep):
+            inpt = {}
             for v in force_variables:
                 if v in self.queue.keys():
-                    # print v
                     data = self.queue[v].get(tstep, block=True, timeout=None)
                     if data is None:
                         print(v)
                         data = np.zeros((self.ny, self.nx))
                         print('Error of no data from smrf to iSnobal')
-                        input2[map_val[v]] = data
-                    else:
-                        input2[map_val[v]] = data
-            # set ground temp
-            input2['T_g'] = -2.5*np.ones((self.ny, self.nx))
-            input2['T_a'] += FREEZE
-            input2['T_pp'] += FREEZE
-            input2['T_g'] += FREEZE
-
-            rt = snobal.do_tstep_grid(input1, input2, self.output_rec,
-                                      self.tstep_info, self.options['constants'],
-                                      self.params, first_step, nthreads=20)
+                    inpt[map_val[v]] = data
+                elif v != 'soil_temp':
+                    print('Value not in keys: {}'.format(v))
+            with read_stats.timer('read'):
+                buffers.put(inpt)
 
-            if rt != -1:
-                print('ipysnobal error on time step %s, pixel %i' % (tstep, rt))
-                break
+        # get first timestep
+        get_input(self.date_time[0])
 
-            input1 = input2.copy()
+        # tell queue we assigned all the variables
+        self.queue['isnobal'].put([self.date_time[0], True])
+        print('Finished initializing first timestep')
+
+        frequency = self.options['output']['frequency']
+        out_fields = set(EM_OUT.values()) | set(SNOW_OUT.values())
+        checkpoint_interval = self.options['output']['checkpoint_interval']
+
+        writer = OutputWriter(self.options['output']['em'],
+                              self.options['output']['snow'],
+                              self.options['output']['buffer_size'],
+                              self.options['output']['sync_interval'])
+
+        # the outputs of a block are written before the next one runs
+        nout = -(-block_size // frequency)
+        outputs = {key: np.zeros((nout,) + self.grid.shape,
+                                 dtype=snobal.state_dtype(key,
+                                                          self.grid.layout))
+                   for key in out_fields}
+
+        def finish(j, nsteps, steps, future):
+            """
+            Wait for the block to run and write its output, returns False
+            if the model failed
+            """
+
+            rt = future.result()
+            if rt != -1:
+                print('ipysnobal error in time steps %s to %s, pixel %i' %
+                      (self.date_time[j + 1], self.date_time[j + nsteps], rt))
+                return False
 
-            # output at the frequency and the last time step
-            if (j % self.options['output']['frequency'] == 0) or (j == len(self.options['time']['date_time'])):
-                output_timestep(self.output_rec, tstep, self.options)
-                self.output_rec['time_since_out'] = np.zeros(
-                    self.output_rec['elevation'].shape)
+            # output at the frequency
+            for k, t in enumerate(steps):
+                out = {key: value[k] for key, value in outputs.items()}
+                writer.write(out, self.date_time[j + t + 1])
 
-            j += 1
-            # pbar.update(j)
+            done = j + nsteps
+            if checkpoint_interval and \
+                    done // checkpoint_interval > j // checkpoint_interval:
+                writer.wait()
+                save_checkpoint(self.options['output']['checkpoint_file'],
+                                self.output_rec, done, self.date_time[done],
+                                self.options['output']['checkpoint_compress'])
 
-            # put the value into the output queue so clean knows it's done
-            self.queue['isnobal'].put([tstep, True])
+            # put the values into the output queue so clean knows it's done
+            for t in self.date_time[j + 1:j + nsteps + 1]:
+                self.queue['isnobal'].put([t, True])
 
-            #self._logger.debug('%s iSnobal run from queues' % tstep)
+            return True
 
+        #pbar = progressbar.ProgressBar(max_value=len(options['time']['date_time']))
+        j = 0
+        first_step = snobal.EVERY_STEP
+        running = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for tstep in self.date_time[1:]:
+                # get the output variables then pass to the function
+                get_input(tstep)
+                if not buffers.full and (tstep != self.date_time[-1]):
+                    continue
+
+                # the last block has to be done before its buffer is filled
+                if running is not None and not finish(*running):
+                    running = None
+                    break
+
+                block = buffers.block()
+                nsteps = len(block['S_n']) - 1
+                if self.autotune and j == 0:
+                    tuning = autotune(
+                        self.output_rec, self.tstep_info,
+                        self.options['constants'], self.params, block,
+                        nsteps=self.options['output'].get('autotune_steps'),
+                        layout=self.grid.layout,
+                        precision=self.options['output'].get('precision',
+                                                             'double'))
+                    self._logger.info('Autotune\n%s', tuning.report())
+                    tuning.apply(self.grid)
+                steps = snobal.output_steps(nsteps, frequency, j)
+                future = executor.submit(self.grid.run_block, block, outputs,
+                                         frequency, first_step, j)
+                running = (j, nsteps, steps, future)
+
+                j += nsteps
+                # pbar.update(j)
+
+                #self._logger.debug('%s iSnobal run from queues' % tstep)
+
+            if running is not None:
+                finish(*running)
+
+        writer.close()
+        self.stats = RunStats().merge(read_stats).merge(
+            self.grid.stats).merge(writer.timings)
+        self._logger.info('Run timings and counters\n%s' %
+                          self.stats.summary())
         # pbar.finish()
 
 
-if __name__ == "__main__":
+def cli(argv=None):
+    """
+    Run iPySnobal from the command line, see main
+    """
 
-    if len(sys.argv) == 1:
-        raise Exception('Configuration file must be specified')
-    else:
-        configFile = sys.argv[1]
+    import argparse
+
+    p = argparse.ArgumentParser(description='Run iPySnobal')
+    p.add_argument('configFile', help='configuration file')
+    p.add_argument('--restart', nargs='?', const=True, default=None,
+                   help='restart from a checkpoint, defaults to the '
+                   'checkpoint_file in the configuration')
+    args = p.parse_args(argv)
 
-    main(configFile)
+    main(args.configFile, args.restart)
+
+
+if __name__ == "__main__":
+    cli()
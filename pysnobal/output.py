@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""
+Buffered, asynchronous writer for the em.nc and snow.nc output files
+
+ipysnobal.output_timestep copies the output fields, searches the time
+axis for the index, writes each variable and syncs both files for every
+output timestep. The OutputWriter here copies the fields into a buffer of
+output timesteps, keeps track of the next time index and writes a full
+buffer as one hyperslab per variable from a background thread. The files
+are only synced every sync_interval output timesteps and when the writer
+is closed.
+"""
+
+import logging
+import threading
+from time import perf_counter, thread_time
+
+import numpy as np
+
+try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue
+
+from .forcing import NC_LOCK
+from .pysnobal import C_TO_K
+from .timing import RunStats
+
+# output variables in em.nc and snow.nc and the model state they come from
+EM_OUT = {'net_rad': 'R_n_bar', 'sensible_heat': 'H_bar',
+          'latent_heat': 'L_v_E_bar', 'snow_soil': 'G_bar',
+          'precip_advected': 'M_bar', 'sum_EB': 'delta_Q_bar',
+          'evaporation': 'E_s_sum', 'snowmelt': 'melt_sum',
+          'SWI': 'ro_pred_sum', 'cold_content': 'cc_s'}
+SNOW_OUT = {'thickness': 'z_s', 'snow_density': 'rho',
+            'specific_mass': 'm_s', 'liquid_water': 'h2o',
+            'temp_surf': 'T_s_0', 'temp_lower': 'T_s_l',
+            'temp_snowcover': 'T_s', 'thickness_lower': 'z_s_l',
+            'water_saturation': 'h2o_sat'}
+
+# output variables that are written in degrees C
+OUTPUT_CELSIUS = ['temp_surf', 'temp_lower', 'temp_snowcover']
+
+# range of each output variable when packed into int16
+PACKED_RANGE = {'net_rad': (-1000.0, 1000.0),
+                'sensible_heat': (-1000.0, 1000.0),
+                'latent_heat': (-1000.0, 1000.0),
+                'snow_soil': (-500.0, 500.0),
+                'precip_advected': (-500.0, 500.0),
+                'sum_EB': (-2000.0, 2000.0),
+                'evaporation': (-50.0, 50.0),
+                'snowmelt': (0.0, 500.0),
+                'SWI': (0.0, 500.0),
+                'cold_content': (-1.0e8, 0.0),
+                'thickness': (0.0, 50.0),
+                'snow_density': (0.0, 1000.0),
+                'specific_mass': (0.0, 20000.0),
+                'liquid_water': (0.0, 1000.0),
+                'temp_surf': (-80.0, 20.0),
+                'temp_lower': (-80.0, 20.0),
+                'temp_snowcover': (-80.0, 20.0),
+                'thickness_lower': (0.0, 50.0),
+                'water_saturation': (0.0, 100.0)}
+PACKED_FILL = -32768
+
+# bytes in an output chunk when the chunks aren't set
+CHUNK_BYTES = 2 ** 20
+
+
+def chunk_shape(shape, steps_per_day=24, chunk_bytes=CHUNK_BYTES,
+                itemsize=4):
+    """
+    Chunk shape for an output variable, a day of output timesteps by a
+    tile of about chunk_bytes that divides the grid evenly
+
+    Args:
+        shape: (ny, nx) of the grid
+        steps_per_day: output timesteps in a day
+        chunk_bytes: target size of a chunk
+        itemsize: bytes per value
+
+    Returns:
+        (time, y, x) chunk sizes
+    """
+
+    nt = int(max(1, min(steps_per_day, chunk_bytes // itemsize)))
+    n = max(1, int(np.sqrt(chunk_bytes / itemsize / nt)))
+
+    # spread the tiles evenly so the last one isn't mostly padding
+    chunks = [nt]
+    for size in shape:
+        ntiles = -(-size // n)
+        chunks.append(-(-size // ntiles))
+    return tuple(chunks)
+
+
+def pack_attributes(name):
+    """
+    scale_factor and add_offset to pack an output variable into int16
+    """
+
+    lo, hi = PACKED_RANGE[name]
+    scale_factor = (hi - lo) / (2 ** 16 - 2)
+    add_offset = (hi + lo) / 2
+    return scale_factor, add_offset
+
+
+def output_encoding(output, shape, time_step=60):
+    """
+    Keyword arguments to netCDF4.Dataset.createVariable for the output
+    variables from the output options
+
+    Args:
+        output: dict of the output options, with the optional keys
+            chunks: (time, y, x) chunk sizes, None to use chunk_shape
+            frequency: output frequency in data timesteps
+            compression: zlib level, 0 for no compression
+            shuffle: use the shuffle filter with compression
+            packing: pack the variables into int16
+        shape: (ny, nx) of the grid
+        time_step: data timestep (minutes)
+
+    Returns:
+        dict of the keyword arguments and whether the variables are
+        packed
+    """
+
+    chunks = output.get('chunks')
+    if chunks is None:
+        steps_per_day = 1440 // (time_step * output.get('frequency', 1))
+        chunks = chunk_shape(shape, steps_per_day,
+                             itemsize=2 if output.get('packing') else 4)
+    else:
+        chunks = (chunks[0], min(chunks[1], shape[0]),
+                  min(chunks[2], shape[1]))
+
+    kwargs = {'chunksizes': chunks}
+    level = output.get('compression', 0)
+    if level:
+        kwargs.update(zlib=True, complevel=level,
+                      shuffle=output.get('shuffle', True))
+
+    return kwargs, bool(output.get('packing', False))
+
+
+class OutputWriter(object):
+    """
+    Writes the model output to the em and snow netCDF files
+
+    Args:
+        em: netCDF4.Dataset for the energy and mass fluxes
+        snow: netCDF4.Dataset for the snowpack
+        buffer_size: number of output timesteps written at once
+        sync_interval: sync the files every sync_interval output timesteps,
+            None or 0 to only sync when closed
+        queue_size: number of full buffers waiting to be written before
+            write blocks
+        start_index: time index of the first output timestep, defaults to
+            the end of the time axis in snow
+    """
+
+    def __init__(self, em, snow, buffer_size=24, sync_interval=None,
+                 queue_size=2, start_index=None):
+
+        self.files = {'em': em, 'snow': snow}
+        self.fields = {'em': EM_OUT, 'snow': SNOW_OUT}
+        self.buffer_size = buffer_size
+        self.sync_interval = sync_interval
+
+        times = snow.variables['time']
+        self.units = times.units
+        self.calendar = getattr(times, 'calendar', 'standard')
+        self.index = len(times) if start_index is None else start_index
+
+        self.shape = snow.variables['thickness'].shape[1:]
+
+        # packed values outside of the range would wrap around
+        self.clip = {key: PACKED_RANGE[key]
+                     for f, ds in self.files.items()
+                     for key in self.fields[f]
+                     if ds.variables[key].dtype == np.int16}
+        self._buffer = None
+        self._n = 0
+
+        self.nsteps = 0
+        self.write_time = 0.0
+        self.stall_time = 0.0
+        self.timings = RunStats()
+        self._since_sync = 0
+        self._error = None
+
+        self._queue = Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._writer,
+                                        name='output_writer')
+        self._thread.daemon = True
+        self._thread.start()
+
+        self._logger = logging.getLogger(__name__)
+
+    def _new_buffer(self):
+        buf = {'time': np.zeros(self.buffer_size)}
+        for f, fields in self.fields.items():
+            buf[f] = {key: np.zeros((self.buffer_size,) + self.shape,
+                                    dtype=np.float32)
+                      for key in fields}
+        return buf
+
+    def write(self, s, tstep):
+        """
+        Add an output timestep
+
+        Args:
+            s: dict of the model state, as for output_timestep
+            tstep: datetime of the output timestep
+        """
+
+        import netCDF4 as nc
+
+        self._check()
+        if self._buffer is None:
+            self._buffer = self._new_buffer()
+
+        k = self._n
+        self._buffer['time'][k] = nc.date2num(tstep.replace(tzinfo=None),
+                                              self.units, self.calendar)
+        for f, fields in self.fields.items():
+            for key, value in fields.items():
+                if key in OUTPUT_CELSIUS:
+                    self._buffer[f][key][k] = s[value] - C_TO_K
+                else:
+                    self._buffer[f][key][k] = s[value]
+
+        self._n += 1
+        if self._n == self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Send the buffered output timesteps to the writer thread
+        """
+
+        if self._n == 0:
+            return
+
+        t0 = perf_counter()
+        self._queue.put((self.index, self._n, self._buffer))
+        self.stall_time += perf_counter() - t0
+
+        self.index += self._n
+        self._buffer = None
+        self._n = 0
+
+    def _writer(self):
+        """
+        Write the buffers from the queue until the None at close
+        """
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            if self._error is not None:
+                # keep taking buffers so that write doesn't block
+                self._queue.task_done()
+                continue
+
+            index, n, buf = item
+            try:
+                t0 = perf_counter()
+                c0 = thread_time()
+                for f, ds in self.files.items():
+                    with NC_LOCK:
+                        ds.variables['time'][index:index + n] = \
+                            buf['time'][:n]
+                    for key, value in buf[f].items():
+                        value = value[:n]
+                        if key in self.clip:
+                            value = np.clip(value, *self.clip[key])
+                        with NC_LOCK:
+                            ds.variables[key][index:index + n, :] = value
+
+                self.nsteps += n
+                self.timings.add('output', perf_counter() - t0,
+                                 thread_time() - c0)
+                self._since_sync += n
+                if self.sync_interval and \
+                        self._since_sync >= self.sync_interval:
+                    self._sync()
+                self.write_time += perf_counter() - t0
+
+            except Exception as e:
+                self._error = e
+
+            self._queue.task_done()
+
+    def _sync(self):
+        with self.timings.timer('sync'):
+            with NC_LOCK:
+                for ds in self.files.values():
+                    ds.sync()
+        self._since_sync = 0
+
+    def _check(self):
+        """
+        Raise the exception from the writer thread
+        """
+        if self._error is not None:
+            raise self._error
+
+    def wait(self):
+        """
+        Write the buffered output timesteps and wait until they are in the
+        files, e.g. before a checkpoint
+        """
+
+        self.flush()
+        self._queue.join()
+        self._check()
+        self._sync()
+
+    def close(self):
+        """
+        Write the buffered output timesteps, wait for the writer thread and
+        sync the files. The files are left open.
+        """
+
+        if self._thread is None:
+            return
+
+        self.flush()
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+        self._check()
+        self._sync()
+
+        self._logger.info('Wrote %d output timesteps in %.2f s, waited '
+                          '%.2f s' % (self.nsteps, self.write_time,
+                                      self.stall_time))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
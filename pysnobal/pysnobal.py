@@ -9,13 +9,14 @@ snobal -z 2061 -t 60 -m 0.01 -s snow.properties.input
 20160118 Scott Havens
 """
 
-from .c_snobal import snobal
+from .c_snobal import engine, snobal
 
+import glob
+import os
 import sys
 import getopt
 import numpy as np
-import pandas as pd
-import progressbar
+# import progressbar
 import traceback
 
 
@@ -100,6 +101,7 @@ def get_args(argv):
             c: continue run even when no snowcover,
             K: accept temperatures in degrees K,
             T: run timesteps' thresholds for a layer's mass (kg/m^2),
+            C: cache the parsed input files as .npy next to them,
         }
 
     To-do: take all the rest of the defualt and check ranges for the
@@ -141,16 +143,22 @@ def get_args(argv):
         'c': True,
         'K': True,
         'T': DEFAULT_NORMAL_THRESHOLD,
+        'C': True,
     }
 
     return options
 
 
-def parseOptions(options):
+def get_tstep_info(data_tstep_min, output='data'):
     """
-    Parse the options dict, set the default values if not specified
-    May need to divide tstep_info and params up into different
-    functions
+    Time step information for the model from the data timestep
+
+    Args:
+        data_tstep_min: data timestep (minutes)
+        output: when to output, data, normal or all
+
+    Returns:
+        list of the tstep_info dicts for the four timestep levels
     """
 
     # intialize the time step info
@@ -169,7 +177,6 @@ def parseOptions(options):
     # If it is greater than 1 hour, it must be a multiple of 1 hour, e.g.
     # 2 hours, 3 hours, etc.
 
-    data_tstep_min = options['t']
     check_range(data_tstep_min, 1.0, hrs2min(60), "input data's timestep")
     if ((data_tstep_min > 60) and (data_tstep_min % 60 != 0)):
         raise ValueError(
@@ -190,11 +197,11 @@ def parseOptions(options):
     tstep_info[SMALL_TSTEP]['intervals'] = int(med_tstep_min / small_tstep_min)
 
     # output
-    if options['O'] == 'data':
+    if output == 'data':
         tstep_info[DATA_TSTEP]['output'] = DIVIDED_TSTEP
-    elif options['O'] == 'normal':
+    elif output == 'normal':
         tstep_info[NORMAL_TSTEP]['output'] = WHOLE_TSTEP | DIVIDED_TSTEP
-    elif options['O'] == 'all':
+    elif output == 'all':
         tstep_info[NORMAL_TSTEP]['output'] = WHOLE_TSTEP
         tstep_info[MEDIUM_TSTEP]['output'] = WHOLE_TSTEP
         tstep_info[SMALL_TSTEP]['output'] = WHOLE_TSTEP
@@ -216,6 +223,19 @@ def parseOptions(options):
     tstep_info[MEDIUM_TSTEP]['threshold'] = DEFAULT_MEDIUM_THRESHOLD
     tstep_info[SMALL_TSTEP]['threshold'] = DEFAULT_SMALL_THRESHOLD
 
+    return tstep_info
+
+
+def parseOptions(options):
+    """
+    Parse the options dict, set the default values if not specified
+    May need to divide tstep_info and params up into different
+    functions
+    """
+
+    data_tstep_min = options['t']
+    tstep_info = get_tstep_info(data_tstep_min, options['O'])
+
     # get the rest of the parameters
     params = {}
 
@@ -232,51 +252,129 @@ def parseOptions(options):
     params['stop_no_snow'] = options['c']
     params['temps_in_C'] = options['K']
     params['relative_heights'] = False
+    params['cache'] = options.get('C', True)
 
     return params, tstep_info
 
 
+def cache_file(filename):
+    """
+    Name of the binary cache for a text input file, keyed on the size and
+    modification time of the file so that an edited file is parsed again
+    """
+
+    st = os.stat(filename)
+    head, tail = os.path.split(os.path.abspath(filename))
+    return os.path.join(head, '.%s.%d.%d.npy' % (tail, st.st_size,
+                                                 st.st_mtime_ns))
+
+
+def load_table(filename, ncols, cache=True):
+    """
+    Read a whitespace separated Snobal input file with the C parser
+
+    Args:
+        filename: input file, records of ncols numbers
+        ncols: number of columns
+        cache: keep the parsed values in a .npy file next to the input
+            file and read that instead while the file is unchanged
+
+    Returns:
+        (nrecords, ncols) array
+    """
+
+    if cache:
+        cached = cache_file(filename)
+        if os.path.isfile(cached):
+            data = np.load(cached)
+            if data.ndim == 2 and data.shape[1] == ncols:
+                return data
+
+    import pandas as pd
+    data = pd.read_csv(filename, sep=r'\s+', header=None,
+                       usecols=range(ncols), dtype=np.float64,
+                       engine='c').values
+    data = np.ascontiguousarray(data)
+
+    if cache:
+        # caches for older versions of the file are replaced
+        old = glob.glob(os.path.join(
+            os.path.dirname(cached),
+            '.%s.*.npy' % glob.escape(os.path.basename(filename))))
+        try:
+            tmp = cached + '.tmp.npy'
+            np.save(tmp, data)
+            os.replace(tmp, cached)
+            for f in old:
+                if f != cached:
+                    os.remove(f)
+        except OSError:
+            # a read only directory just isn't cached
+            pass
+
+    return data
+
+
+def clamp_rain_temp(m_pp, percent_snow, T_pp):
+    """
+    The precip temperature can't be below freezing if rain is present,
+    this is only in Snobal and not iSnobal
+
+    Args:
+        m_pp: precip mass (kg/m^2)
+        percent_snow: fraction of the precip mass that is snow
+        T_pp: precip temperature (K)
+
+    Returns:
+        array of T_pp with the rain at or above FREEZE
+    """
+
+    T_pp = np.asarray(T_pp, dtype=np.float64)
+    mass_rain = np.asarray(m_pp) * (1 - np.asarray(percent_snow))
+    return np.where((mass_rain > 0.0) & (T_pp < FREEZE), FREEZE, T_pp)
+
+
 def open_files(params):
     """
     Open and read the files
     """
 
+    import pandas as pd
+
+    cache = params.get('cache', True)
+
     # read the snow properties record
     sn_prop = ['time_s', 'z_s', 'rho', 'T_s_0', 'T_s', 'h2o_sat']
-    sn = pd.read_csv(params['sn_filename'], sep=' ',
-                     header=None, names=sn_prop, index_col='time_s')
+    sn = load_table(params['sn_filename'], len(sn_prop), cache)
 
     # since I haven't seen multiple snow records before,
     # change the snow record to a dict and only keep the first
     # or initial value
-    time_s = sn.iloc[0].name
-    sn = sn.iloc[0].to_dict()
-    sn['time_s'] = time_s
+    sn = dict(zip(sn_prop, sn[0]))
 
     # read the measurements height file
     ht_prop = ['time_z', 'z_u', 'z_t', 'z_0', 'z_g']
-    # , index_col='time_z')
-    mh = pd.read_csv(params['mh_filename'], sep=' ',
-                     header=None, names=ht_prop)
-    mh = mh.iloc[0].to_dict()
+    mh = load_table(params['mh_filename'], len(ht_prop), cache)
+    mh = dict(zip(ht_prop, mh[0]))
 
     # read the precipitation file
     ppt_prop = ['time_pp', 'm_pp', 'percent_snow', 'rho_snow', 'T_pp']
-    pr = pd.read_csv(params['pr_filename'], sep=None, header=None,
-                     names=ppt_prop, index_col='time_pp', engine='python')
+    pr = load_table(params['pr_filename'], len(ppt_prop), cache)
 
     # read the input file
     in_prop = ['S_n', 'I_lw', 'T_a', 'e_a', 'u', 'T_g']
-    force = pd.read_csv(params['in_filename'], sep=None,
-                        header=None, names=in_prop, engine='python')
+    force = load_table(params['in_filename'], len(in_prop), cache)
+
+    pr = {key: pr[:, i].copy() for i, key in enumerate(ppt_prop)}
+    force = {key: force[:, i].copy() for i, key in enumerate(in_prop)}
 
     # convert to Kelvin
     if params['temps_in_C']:
         sn['T_s_0'] += C_TO_K
         sn['T_s'] += C_TO_K
-        pr.T_pp += C_TO_K
-        force.T_a += C_TO_K
-        force.T_g += C_TO_K
+        pr['T_pp'] += C_TO_K
+        force['T_a'] += C_TO_K
+        force['T_g'] += C_TO_K
 
     # convert all to numpy arrays within the dict
     sn['z_0'] = mh['z_0']
@@ -286,13 +384,13 @@ def open_files(params):
     # check the ranges for the input values
 
     # check the precip, temp. cannot be below freezing if rain present
-    # This is only present in Snobal and not iSnobal
-    mass_rain = pr.m_pp * (1 - pr.percent_snow)
-    pr.T_pp[(mass_rain > 0.0) & (pr.T_pp < FREEZE)] = FREEZE
+    pr['T_pp'] = clamp_rain_temp(pr['m_pp'], pr['percent_snow'], pr['T_pp'])
 
-    # combine the precip and force
-    min_len = np.min([len(force), len(pr)])
-    force = pd.concat([force, pr], axis=1)
+    # combine the precip and force, the precip records are matched to
+    # the input records by time_pp
+    min_len = np.min([len(force['S_n']), len(pr['m_pp'])])
+    pr = pd.DataFrame(pr, columns=ppt_prop).set_index('time_pp')
+    force = pd.concat([pd.DataFrame(force, columns=in_prop), pr], axis=1)
     force = force[:min_len]
 
     # create the time steps for the forcing data
@@ -432,12 +530,98 @@ def output_timestep(output_rec, params):
         output_rec['time_since_out'][n] = 0
 
 
-def run(data):
+def run_point(forcing, init, params, tstep_info, mh, output_frequency=1,
+              fields=None, as_dataframe=False, precision='double'):
+    """
+    Run the model at a point for the whole forcing time series in one call
+    to the C core
+
+    Args:
+        forcing: dict of 1-D arrays of the forcing and precipitation
+            (snobal.FORCING_FIELDS and snobal.PRECIP_FIELDS) with nsteps + 1
+            records, temperatures in K
+        init: dict of the initial state, at least elevation, z_0, z_s, rho,
+            T_s_0 and T_s, temperatures in K. T_s_l defaults to T_s as
+            the snow properties file doesn't have it.
+        params: dict with max_h2o_vol, max_z_s_0 and relative_heights
+        tstep_info: time step information from parseOptions
+        mh: dict of the measurement heights z_u, z_t and z_g
+        output_frequency: output every output_frequency data timesteps
+        fields: state fields to output, defaults to snobal.OUTPUT_FIELDS
+        as_dataframe: return a pandas DataFrame
+        precision: precision of the libsnobal build, see c_snobal.engine
+
+    Returns:
+        dict of 1-D arrays of the state at the output timesteps, or a
+        DataFrame of them indexed by the data timestep
+    """
+
+    if fields is None:
+        fields = snobal.OUTPUT_FIELDS
+
+    nsteps = len(forcing['S_n']) - 1
+    state = {key: np.full((1, 1), value, dtype=snobal.state_dtype(key))
+             for key, value in init.items() if key in snobal.STATE_FIELDS}
+    state.setdefault('mask', np.ones((1, 1), dtype=np.int32))
+    state.setdefault('T_s_l', state['T_s'])
+
+    grid = engine(precision).SnobalGrid(state, tstep_info, mh, params)
+
+    # the time series are the (nsteps + 1, 1, 1) blocks for the grid
+    block = {key: np.ascontiguousarray(forcing[key],
+                                       dtype=np.float64).reshape(-1, 1, 1)
+             for key in snobal.FORCING_FIELDS + snobal.PRECIP_FIELDS}
+    steps = snobal.output_steps(nsteps, output_frequency)
+    outputs = {key: np.zeros((len(steps), 1, 1), dtype=snobal.state_dtype(key))
+               for key in fields}
+
+    rt = grid.run_block(block, outputs, output_frequency, first_step=1)
+    if rt != -1:
+        raise RuntimeError('snobal failed for the point run')
+
+    out = {key: value.reshape(-1) for key, value in outputs.items()}
+    if as_dataframe:
+        import pandas as pd
+        return pd.DataFrame(out, index=pd.Index(steps + 1, name='step'),
+                            columns=list(fields))
+    return out
+
+
+# fields and formats of the output file, in the order written
+OUT_FORMAT = [('current_time', '%g'), ('R_n_bar', '%.3f'),
+              ('H_bar', '%.3f'), ('L_v_E_bar', '%.3f'), ('G_bar', '%.3f'),
+              ('M_bar', '%.3f'), ('delta_Q_bar', '%.3f'),
+              ('G_0_bar', '%.3f'), ('delta_Q_0_bar', '%.3f'),
+              ('cc_s_0', '%.9e'), ('cc_s_l', '%.9e'), ('cc_s', '%.9e'),
+              ('E_s_sum', '%.8f'), ('melt_sum', '%.8f'),
+              ('ro_pred_sum', '%.8f'), ('z_s_0', '%.6f'), ('z_s_l', '%.6f'),
+              ('z_s', '%.6f'), ('rho', '%.3f'), ('m_s_0', '%.3f'),
+              ('m_s_l', '%.3f'), ('m_s', '%.3f'), ('h2o', '%.3f'),
+              ('T_s_0', '%.5f'), ('T_s_l', '%.5f'), ('T_s', '%.5f')]
+
+
+def output_point(out, f, temps_in_C=True):
     """
-    Acutally run the model
+    Write the output from run_point to a file in the format of
+    output_timestep
+
+    Args:
+        out: dict of the output arrays from run_point
+        f: open file to write to
+        temps_in_C: write the temperatures in C
     """
 
-# @profile
+    cols = []
+    for key, fmt in OUT_FORMAT:
+        value = out[key]
+        if key == 'current_time':
+            value = SEC_TO_HR(value)
+        elif key in ('T_s_0', 'T_s_l', 'T_s') and temps_in_C:
+            value = K_TO_C(value)
+        cols.append(value)
+
+    fmt = ','.join(fmt for key, fmt in OUT_FORMAT) + '\n'
+    f.write(''.join([fmt % row for row in zip(*cols)]))
 
 
 def main(argv):
@@ -451,68 +635,21 @@ def main(argv):
 
     # open the files and read in data
     sn, mh, force = open_files(params)
+    sn['elevation'] = options['z']
 
-    # initialize
-    sn['elevation'] = np.atleast_2d(np.array(options['z']))
-    output_rec = initialize(params, tstep_info, sn, mh)
-
-    # loop through the input
-    # do_data_tstep needs two input records so only go
-    # to the last record-1
-
-    it = force[:-1].iterrows()
-    index, input1 = next(it)    # this is the first input
-
-    # add the precip to the data Series
-#     input1 = pd.concat([in1, pr.loc[index]])
-    pbar = progressbar.ProgressBar(max_value=len(force)-1)
-    j = 0
-
-    data_tstep = tstep_info[0]['time_step']
-    timeSinceOut = 0.0
-    start_step = 0  # if restart then it would be higher if this were iSnobal
-    step_time = start_step * data_tstep
-
-    output_rec['current_time'] = step_time * \
-        np.ones(output_rec['elevation'].shape)
-    output_rec['time_since_out'] = timeSinceOut * \
-        np.ones(output_rec['elevation'].shape)
+    forcing = {key: force[key].values for key in force.columns}
 
-    for index, input2 in it:
+    try:
+        out = run_point(forcing, sn, params, tstep_info, mh,
+                        fields=[key for key, fmt in OUT_FORMAT])
+    except Exception as e:
+        traceback.print_exc()
+        print('pysnobal error')
+        print(e)
+        return
 
-        # add the precip to the data Series
-        #         input2 = pd.concat([in2, pr.loc[index]])
-
-        first_step = 0
-        if index == 1:
-            first_step = 1
-
-        try:
-            # call do_data_tstep()
-            snobal.do_tstep_grid(dict2np(input1.to_dict()), dict2np(
-                input2.to_dict()), output_rec, tstep_info, mh, params, first_step)
-#             s.do_data_tstep(dict2np(input1.to_dict()), dict2np(input2.to_dict()))
-
-            # output the results
-            output_timestep(output_rec, params)
-
-        except Exception as e:
-            traceback.print_exc()
-            print('pysnobal error on time step %f' %
-                  (output_rec['current_time'][0, 0]/3600.0))
-            print(e)
-            return
-#
-
-        # input2 becomes input1
-        input1 = input2.copy()
-
-        j += 1
-        pbar.update(j)
-
-    pbar.finish()
-
-    # output
+    # output the results
+    output_point(out, params['out_file'], params['temps_in_C'])
     params['out_file'].close()
 #     app = MyApplication()
 #     app.run()
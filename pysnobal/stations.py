@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Run the model at many stations at once
+
+Each station would otherwise be its own pysnobal run that reads its own
+files and pays the Python startup. Here the stations are the pixels of an
+N x 1 grid with their own measurement heights, the whole forcing time
+series goes to the C core in one call and the output for all the stations
+is written to one netCDF file with a station dimension.
+
+The sites table has a row per station with the columns station_id,
+elevation, z_0, z_u, z_t, z_g and the initial snow properties z_s, rho,
+T_s_0, T_s and h2o_sat, with an optional T_s_l. The forcing table is in
+the long format with a row per station and time, the columns station_id,
+time and the snobal.FORCING_FIELDS and snobal.PRECIP_FIELDS. Temperatures
+are in C in both tables.
+
+    python -m pysnobal.stations sites.csv forcing.csv out.nc [-t 60]
+"""
+
+import argparse
+import logging
+
+import numpy as np
+
+from .c_snobal import snobal
+from .pysnobal import (C_TO_K, DEFAULT_MAX_H2O_VOL, DEFAULT_MAX_Z_S_0,
+                       clamp_rain_temp, get_tstep_info)
+
+# columns of the sites table
+SITE_FIELDS = ['elevation', 'z_0', 'z_u', 'z_t', 'z_g', 'z_s', 'rho',
+               'T_s_0', 'T_s', 'h2o_sat']
+
+# columns of the tables in degrees C
+SITE_CELSIUS = ['T_s_0', 'T_s_l', 'T_s']
+FORCING_CELSIUS = ['T_a', 'T_g', 'T_pp']
+
+# state fields that are temperatures, written in degrees C
+OUTPUT_CELSIUS = ['T_s_0', 'T_s_l', 'T_s']
+
+
+def read_sites(path):
+    """
+    Read the sites table
+
+    Args:
+        path: csv file with a row for each station
+
+    Returns:
+        DataFrame indexed by station_id, temperatures in K
+    """
+
+    import pandas as pd
+
+    sites = pd.read_csv(path, dtype={'station_id': str})
+    missing = set(['station_id'] + SITE_FIELDS) - set(sites.columns)
+    if missing:
+        raise ValueError('{} is missing the columns {}'.format(
+            path, ', '.join(sorted(missing))))
+    if sites['station_id'].duplicated().any():
+        raise ValueError('{} has duplicate station_id'.format(path))
+
+    sites = sites.set_index('station_id')
+    for key in SITE_CELSIUS:
+        if key in sites:
+            sites[key] = sites[key] + C_TO_K
+    return sites
+
+
+def read_forcing(path):
+    """
+    Read the forcing table
+
+    Args:
+        path: csv file with a row per station and time
+
+    Returns:
+        DataFrame of the forcing, temperatures in K and the rain at or
+        above freezing as in pysnobal.open_files
+    """
+
+    import pandas as pd
+
+    forcing = pd.read_csv(path, dtype={'station_id': str},
+                          parse_dates=['time'])
+    for key in FORCING_CELSIUS:
+        forcing[key] = forcing[key] + C_TO_K
+    forcing['T_pp'] = clamp_rain_temp(forcing['m_pp'],
+                                      forcing['percent_snow'],
+                                      forcing['T_pp'])
+    return forcing
+
+
+def station_forcing(forcing, station_ids):
+    """
+    The forcing for the stations as blocks for SnobalGrid.run_block
+
+    Args:
+        forcing: DataFrame in the long format of read_forcing
+        station_ids: stations in the order of the grid rows
+
+    Returns:
+        dict of (ntimes, N, 1) arrays of the inputs and the times
+    """
+
+    forcing = forcing.set_index(['time', 'station_id']).sort_index()
+    if forcing.index.duplicated().any():
+        raise ValueError('The forcing has more than one record for a '
+                         'station and time')
+
+    times = forcing.index.levels[0]
+    block = {}
+    for key in snobal.FORCING_FIELDS + snobal.PRECIP_FIELDS:
+        value = forcing[key].unstack('station_id')
+        value = value.reindex(index=times, columns=list(station_ids))
+        if value.isnull().values.any():
+            bad = value.columns[value.isnull().any()]
+            raise ValueError('The forcing for {} is missing times or '
+                             'values'.format(', '.join(map(str, bad))))
+        block[key] = np.ascontiguousarray(
+            value.values, dtype=np.float64).reshape(len(times), -1, 1)
+
+    return block, times.to_pydatetime()
+
+
+def run_stations(sites, forcing, params, tstep_info, output_frequency=1,
+                 fields=None, nthreads=1):
+    """
+    Run the model at all the stations for the whole forcing time series
+
+    Args:
+        sites: DataFrame from read_sites
+        forcing: dict of (nsteps + 1, N, 1) arrays from station_forcing,
+            with the stations in the order of sites
+        params: dict with max_h2o_vol, max_z_s_0 and relative_heights
+        tstep_info: time step information from get_tstep_info
+        output_frequency: output every output_frequency data timesteps
+        fields: state fields to output, defaults to snobal.OUTPUT_FIELDS
+        nthreads: number of threads to use in call_snobal
+
+    Returns:
+        dict of (nout, N) arrays of the state at the output timesteps
+    """
+
+    if fields is None:
+        fields = snobal.OUTPUT_FIELDS
+
+    N = len(sites)
+    nsteps = forcing['S_n'].shape[0] - 1
+
+    init = {key: sites[key].values.reshape(N, 1).astype(np.float64)
+            for key in sites.columns if key in snobal.STATE_FIELDS}
+    init.setdefault('T_s_l', init['T_s'].copy())
+    mh = {key: sites[key].values for key in ['z_u', 'z_t', 'z_g']}
+
+    grid = snobal.SnobalGrid(init, tstep_info, mh, params, nthreads)
+
+    steps = snobal.output_steps(nsteps, output_frequency)
+    outputs = {key: np.zeros((len(steps), N, 1),
+                             dtype=snobal.state_dtype(key))
+               for key in fields}
+
+    rt = grid.run_block(forcing, outputs, output_frequency, first_step=1)
+    if rt != -1:
+        raise RuntimeError('snobal failed at station {}'.format(
+            sites.index[rt]))
+
+    return {key: value.reshape(len(steps), N) for key, value in
+            outputs.items()}
+
+
+def write_stations(path, out, station_ids, times, temps_in_C=True):
+    """
+    Write the output for the stations to a netCDF file with the dimensions
+    (time, station) and a station_id variable
+
+    Args:
+        path: netCDF file to create
+        out: dict of (nout, N) arrays from run_stations
+        station_ids: the N station ids
+        times: the nout datetimes of the output timesteps
+        temps_in_C: write the temperatures in C
+    """
+
+    import netCDF4 as nc
+
+    ds = nc.Dataset(path, 'w')
+    try:
+        ds.createDimension('time', None)
+        ds.createDimension('station', len(station_ids))
+
+        var = ds.createVariable('station_id', str, ('station',))
+        for n, station in enumerate(station_ids):
+            var[n] = str(station)
+
+        var = ds.createVariable('time', 'f8', ('time',))
+        var.units = 'hours since {}'.format(
+            times[0].strftime('%Y-%m-%d %H:%M'))
+        var.calendar = 'standard'
+        var[:] = nc.date2num(list(times), var.units, var.calendar)
+
+        for key, value in out.items():
+            # a chunk is the time series at a station
+            var = ds.createVariable(key, 'f4', ('time', 'station'),
+                                    chunksizes=(len(times), 1), zlib=True)
+            if temps_in_C and key in OUTPUT_CELSIUS:
+                value = value - C_TO_K
+            var[:] = value
+    finally:
+        ds.close()
+
+
+def main(argv=None):
+
+    p = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    p.add_argument('sites', help='csv of the station sites')
+    p.add_argument('forcing', help='csv of the station forcing')
+    p.add_argument('output', help='netCDF output file')
+    p.add_argument('-t', type=float, default=60,
+                   help='data timestep (minutes)')
+    p.add_argument('-f', type=int, default=1,
+                   help='output every f data timesteps')
+    p.add_argument('-m', type=float, default=DEFAULT_MAX_H2O_VOL,
+                   help='maximum liquid water content')
+    p.add_argument('-d', type=float, default=DEFAULT_MAX_Z_S_0,
+                   help='maximum active layer thickness (m)')
+    p.add_argument('-n', type=int, default=1, help='number of threads')
+    p.add_argument('-K', action='store_false', dest='temps_in_C',
+                   help='write the temperatures in K')
+    args = p.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    logger = logging.getLogger(__name__)
+
+    sites = read_sites(args.sites)
+    forcing, times = station_forcing(read_forcing(args.forcing), sites.index)
+    params = {'max_h2o_vol': args.m, 'max_z_s_0': args.d,
+              'relative_heights': False}
+
+    out = run_stations(sites, forcing, params, get_tstep_info(args.t),
+                       output_frequency=args.f, nthreads=args.n)
+
+    steps = snobal.output_steps(len(times) - 1, args.f)
+    write_stations(args.output, out, sites.index, times[steps + 1],
+                   args.temps_in_C)
+    logger.info('Ran %d stations for %d timesteps' %
+                (len(sites), len(times) - 1))
+
+
+if __name__ == '__main__':
+    main()
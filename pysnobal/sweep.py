@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+Sweep the model parameters at a point
+
+Calibrating max_h2o_vol, max_z_s_0 and the mass thresholds of the run
+timesteps at a site means running the same point forcing hundreds of
+times, and a run of pysnobal.main reads the input files again and writes
+a text file that is read right back. Here the forcing is read once and the
+parameter sets are the columns of a 1 x K grid. max_h2o_vol and max_z_s_0
+can vary by pixel in the C core, so the sets that share the thresholds are
+run together, in batches of columns that are spread over a pool of worker
+processes. Each worker gets the forcing once, when it starts.
+
+The result is a table of the parameter sets with summary metrics of the
+SWE (m_s): the peak, the data timestep of the peak, the melt out after the
+peak and the RMSE against a reference output in the format of
+snobal.original. No files are written.
+
+The sets table is a csv with a row per parameter set and any of the
+columns in SWEEP_FIELDS, the missing ones are taken from the options.
+
+    python -m pysnobal.sweep sets.csv -s snow.properties.input
+        -h inheight.input -p snobal.ppt.input -i snobal.data.input
+        -z 2061 [-t 60] [-r snobal.original] [-o metrics.csv] [-n 4]
+"""
+
+import argparse
+import copy
+import multiprocessing
+
+import numpy as np
+
+from .c_snobal import snobal
+from .pysnobal import (DEFAULT_MAX_H2O_VOL, DEFAULT_MAX_Z_S_0, FREEZE,
+                       MEDIUM_TSTEP, NORMAL_TSTEP, OUT_FORMAT, SMALL_TSTEP,
+                       get_tstep_info, open_files)
+
+# columns of the table of parameter sets
+THRESHOLDS = ['normal_threshold', 'medium_threshold', 'small_threshold']
+SWEEP_FIELDS = ['max_h2o_vol', 'max_z_s_0'] + THRESHOLDS
+
+# the timestep level of each threshold
+THRESHOLD_LEVELS = dict(zip(THRESHOLDS, [NORMAL_TSTEP, MEDIUM_TSTEP,
+                                         SMALL_TSTEP]))
+
+# the metrics of each set
+METRICS = ['peak_swe', 'peak_step', 'melt_out', 'rmse']
+
+# inputs of the workers, set once by _init_worker
+_worker = {}
+
+
+def parameter_sets(sets, params, tstep_info):
+    """
+    The table of parameter sets with every column of SWEEP_FIELDS
+
+    Args:
+        sets: DataFrame, dict of columns or list of dicts of the parameters
+        params: dict with the max_h2o_vol and max_z_s_0 for the sets
+            that don't have them
+        tstep_info: time step information with the thresholds for the
+            sets that don't have them
+
+    Returns:
+        DataFrame with a row per set
+    """
+
+    import pandas as pd
+
+    sets = pd.DataFrame(sets)
+    unknown = set(sets.columns) - set(SWEEP_FIELDS)
+    if unknown:
+        raise ValueError('Unknown parameters {}, the sweep is over '
+                         '{}'.format(', '.join(sorted(unknown)),
+                                     ', '.join(SWEEP_FIELDS)))
+
+    sets = sets.copy()
+    for key in ['max_h2o_vol', 'max_z_s_0']:
+        if key not in sets:
+            sets[key] = params[key]
+    for key, level in THRESHOLD_LEVELS.items():
+        if key not in sets:
+            sets[key] = tstep_info[level]['threshold']
+    return sets[SWEEP_FIELDS].astype(np.float64)
+
+
+def _init_worker(forcing, init, mh, params, tstep_info, fields,
+                 output_frequency, block_size, nthreads):
+    """
+    Keep the inputs of the sweep in the worker process
+    """
+
+    _worker.update(forcing=forcing, init=init, mh=mh, params=params,
+                   tstep_info=tstep_info, fields=fields,
+                   output_frequency=output_frequency, block_size=block_size,
+                   nthreads=nthreads)
+
+
+def _run_batch(batch):
+    """
+    Run a batch of parameter sets in a worker, see run_columns
+    """
+
+    return run_columns(batch=batch, **_worker)
+
+
+def run_columns(forcing, init, mh, params, tstep_info, batch, fields,
+                output_frequency=1, block_size=720, nthreads=1):
+    """
+    Run parameter sets with the same thresholds as the columns of a grid
+
+    Args:
+        forcing: dict of the 1-D forcing and precipitation time series
+        init: dict of the initial state at the point
+        mh: measurement heights
+        params: model parameters
+        tstep_info: time step information
+        batch: DataFrame of the parameter sets, all with the thresholds of
+            the first
+        fields: state fields to output
+        output_frequency: output every output_frequency data timesteps
+        block_size: number of data timesteps run in each call
+        nthreads: number of threads to use in call_snobal
+
+    Returns:
+        dict of (nout, K) arrays of the fields for the K sets
+    """
+
+    K = len(batch)
+    tstep_info = copy.deepcopy(tstep_info)
+    for key, level in THRESHOLD_LEVELS.items():
+        tstep_info[level]['threshold'] = batch[key].iloc[0]
+
+    params = dict(params)
+    params['max_h2o_vol'] = batch['max_h2o_vol'].values.reshape(1, K)
+    params['max_z_s_0'] = batch['max_z_s_0'].values.reshape(1, K)
+
+    state = {key: np.full((1, K), value, dtype=snobal.state_dtype(key))
+             for key, value in init.items() if key in snobal.STATE_FIELDS}
+    state.setdefault('T_s_l', state['T_s'])
+    grid = snobal.SnobalGrid(state, tstep_info, mh, params, nthreads)
+
+    nsteps = len(forcing['S_n']) - 1
+    outputs = {key: [] for key in fields}
+    for j in range(0, nsteps, block_size):
+        stop = min(j + block_size, nsteps)
+        block = {key: np.ascontiguousarray(np.broadcast_to(
+                     np.asarray(forcing[key][j:stop + 1],
+                                dtype=np.float64)[:, None, None],
+                     (stop - j + 1, 1, K)))
+                 for key in snobal.FORCING_FIELDS + snobal.PRECIP_FIELDS}
+
+        steps = snobal.output_steps(stop - j, output_frequency, j)
+        out = {key: np.zeros((len(steps), 1, K),
+                             dtype=snobal.state_dtype(key))
+               for key in fields}
+        rt = grid.run_block(block, out, output_frequency,
+                            first_step=int(j == 0), step_offset=j)
+        if rt != -1:
+            raise RuntimeError('snobal failed for the parameter set {} in '
+                               'data timesteps {} to {}'.format(
+                                   batch.index[rt], j + 1, stop))
+        for key, value in out.items():
+            outputs[key].append(value.reshape(-1, K))
+
+    return {key: np.concatenate(value) for key, value in outputs.items()}
+
+
+def run_sweep(forcing, init, mh, params, tstep_info, sets, fields=('m_s',),
+              output_frequency=1, batch_size=64, block_size=720, nprocs=1,
+              nthreads=1):
+    """
+    Run the model at a point for every parameter set
+
+    The sets with the same thresholds are run as the columns of one grid,
+    in batches of at most batch_size sets. With nprocs > 1 the batches are
+    run by a pool of spawned worker processes.
+
+    Args:
+        forcing: dict of the 1-D forcing and precipitation time series
+            (snobal.FORCING_FIELDS and snobal.PRECIP_FIELDS) with
+            nsteps + 1 records, temperatures in K
+        init: dict of the initial state at the point as for
+            pysnobal.run_point
+        mh: dict of the measurement heights z_u, z_t and z_g
+        params: dict with max_h2o_vol, max_z_s_0 and relative_heights
+        tstep_info: time step information from get_tstep_info
+        sets: the parameter sets, see parameter_sets
+        fields: state fields to output
+        output_frequency: output every output_frequency data timesteps
+        batch_size: most parameter sets run together in a grid
+        block_size: number of data timesteps run in each call
+        nprocs: number of worker processes
+        nthreads: number of threads in each grid
+
+    Returns:
+        the parameter sets from parameter_sets and a dict of (nout, K)
+        arrays of the fields with a column for each set
+    """
+
+    sets = parameter_sets(sets, params, tstep_info)
+    sets.index = np.arange(len(sets))
+
+    batches = []
+    for _, group in sets.groupby(THRESHOLDS, sort=False):
+        for i in range(0, len(group), batch_size):
+            batches.append(group.iloc[i:i + batch_size])
+
+    inputs = (forcing, init, mh, params, tstep_info, list(fields),
+              output_frequency, block_size, nthreads)
+    if nprocs > 1 and len(batches) > 1:
+        ctx = multiprocessing.get_context('spawn')
+        with ctx.Pool(min(nprocs, len(batches)), initializer=_init_worker,
+                      initargs=inputs) as pool:
+            results = pool.map(_run_batch, batches)
+    else:
+        _init_worker(*inputs)
+        try:
+            results = [_run_batch(batch) for batch in batches]
+        finally:
+            _worker.clear()
+
+    nsteps = len(forcing['S_n']) - 1
+    nout = len(snobal.output_steps(nsteps, output_frequency))
+    out = {key: np.zeros((nout, len(sets)), dtype=snobal.state_dtype(key))
+           for key in fields}
+    for batch, result in zip(batches, results):
+        for key, value in result.items():
+            out[key][:, batch.index] = value
+
+    return sets, out
+
+
+def read_reference(path, data_tstep_min=60, temps_in_C=True):
+    """
+    Read a point output file in the format of snobal.original
+
+    Args:
+        path: the output of snobal or pysnobal.output_point
+        data_tstep_min: data timestep (minutes)
+        temps_in_C: the temperatures in the file are in C
+
+    Returns:
+        DataFrame of the OUT_FORMAT fields indexed by the data timestep,
+        current_time in hours and temperatures in K
+    """
+
+    import pandas as pd
+
+    names = [key for key, fmt in OUT_FORMAT]
+    ref = pd.read_csv(path, sep=r'[\s,]+', header=None, names=names,
+                      engine='python')
+    if temps_in_C:
+        for key in ['T_s_0', 'T_s_l', 'T_s']:
+            ref[key] = ref[key] + FREEZE
+    step = ref['current_time'] * 60.0 / data_tstep_min
+    ref.index = pd.Index(step.round().astype(int), name='step')
+    return ref
+
+
+def sweep_metrics(sets, out, steps, reference=None, field='m_s'):
+    """
+    Summary metrics of the SWE of each parameter set
+
+    Args:
+        sets: DataFrame of the parameter sets from run_sweep
+        out: dict of (nout, K) arrays from run_sweep with field in it
+        steps: the data timestep of each output, counted from 1
+        reference: DataFrame from read_reference to compute the RMSE
+            against, over the steps that are in both
+        field: the field for the RMSE
+
+    Returns:
+        the sets with the METRICS columns, peak_swe (kg/m^2) and the data
+        timesteps of the peak and of the melt out, the first output with
+        no snow after the peak (-1 if the snow doesn't melt out), and the
+        RMSE of field (NaN without a reference)
+    """
+
+    swe = out['m_s']
+    steps = np.asarray(steps)
+    K = swe.shape[1]
+
+    peak = np.argmax(swe, axis=0)
+    after = (np.arange(len(swe))[:, None] > peak) & (swe <= 0)
+    melted = after.any(axis=0)
+    melt_out = np.where(melted, steps[np.argmax(after, axis=0)], -1)
+
+    rmse = np.full(K, np.nan)
+    if reference is not None:
+        common, i, j = np.intersect1d(steps, reference.index.values,
+                                      return_indices=True)
+        if len(common) > 0:
+            diff = out[field][i] - reference[field].values[j][:, None]
+            rmse = np.sqrt(np.mean(diff ** 2, axis=0))
+
+    metrics = sets.copy()
+    metrics['peak_swe'] = swe[peak, np.arange(K)]
+    metrics['peak_step'] = steps[peak]
+    metrics['melt_out'] = melt_out
+    metrics['rmse'] = rmse
+    return metrics
+
+
+def main(argv=None):
+
+    import pandas as pd
+
+    # -h is the measurement heights as for snobal
+    p = argparse.ArgumentParser(description=__doc__.split('\n')[1],
+                                add_help=False)
+    p.add_argument('--help', action='help',
+                   help='show this help message and exit')
+    p.add_argument('sets', help='csv of the parameter sets')
+    p.add_argument('-s', required=True, help='snow properties input file')
+    p.add_argument('-h', dest='mh', required=True,
+                   help='measurement heights input file')
+    p.add_argument('-p', required=True, help='precipitation input file')
+    p.add_argument('-i', required=True, help='input data file')
+    p.add_argument('-z', type=float, required=True,
+                   help='site elevation (m)')
+    p.add_argument('-t', type=float, default=60,
+                   help='data timestep (minutes)')
+    p.add_argument('-m', type=float, default=DEFAULT_MAX_H2O_VOL,
+                   help='maximum liquid water content')
+    p.add_argument('-d', type=float, default=DEFAULT_MAX_Z_S_0,
+                   help='maximum active layer thickness (m)')
+    p.add_argument('-r', help='reference output for the RMSE of the SWE')
+    p.add_argument('-o', help='csv for the metrics, printed if not given')
+    p.add_argument('-n', type=int, default=1,
+                   help='number of worker processes')
+    p.add_argument('-K', action='store_false', dest='temps_in_C',
+                   help='the temperatures in the files are in K')
+    args = p.parse_args(argv)
+
+    files = {'sn_filename': args.s, 'mh_filename': args.mh,
+             'pr_filename': args.p, 'in_filename': args.i,
+             'temps_in_C': args.temps_in_C}
+    sn, mh, force = open_files(files)
+    init = {key: value[0, 0] for key, value in sn.items()}
+    init['elevation'] = args.z
+    forcing = {key: force[key].values for key in force.columns}
+
+    params = {'max_h2o_vol': args.m, 'max_z_s_0': args.d,
+              'relative_heights': False}
+    sets, out = run_sweep(forcing, init, mh, params, get_tstep_info(args.t),
+                          pd.read_csv(args.sets), nprocs=args.n)
+
+    reference = None
+    if args.r:
+        reference = read_reference(args.r, args.t, args.temps_in_C)
+    steps = snobal.output_steps(len(forcing['S_n']) - 1) + 1
+    metrics = sweep_metrics(sets, out, steps, reference)
+
+    if args.o:
+        metrics.to_csv(args.o, index=False)
+    else:
+        print(metrics.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
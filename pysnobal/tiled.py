@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""
+Run the grid as tiles of rows in separate processes
+
+A single SnobalGrid is one process, the forcing reads, the output and the
+Python around each block wait on each other and on the GIL. Here the grid
+is split into tiles of whole rows, each run by a worker process with its
+own SnobalGrid and ForcingReader that only reads the tile's hyperslab of
+the forcing files. The model state and the output buffers for a block are
+in multiprocessing.shared_memory. A row tile of a C contiguous grid is
+itself C contiguous, so each worker's SnobalGrid runs directly on its rows
+of the shared state and the coordinator can write the output or save a
+checkpoint of the whole grid without copying it from the workers.
+
+The workers and the coordinator run a block at a time in lock step, the
+coordinator writes the output of a block before the workers run the next.
+The workers are spawned rather than forked, a forked OpenMP runtime hangs
+if the coordinator has already run the model, and attach to the shared
+memory by name.
+"""
+
+import multiprocessing
+import traceback
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .c_snobal import engine, snobal
+from .forcing import ForcingReader
+from .timing import RunStats
+
+
+def tile_rows(ny, ntiles):
+    """
+    Split the rows of a grid into tiles
+
+    Args:
+        ny: number of rows
+        ntiles: number of tiles, at most ny are used
+
+    Returns:
+        list of the row slices of the tiles
+    """
+
+    ntiles = max(1, min(ntiles, ny))
+    edges = np.linspace(0, ny, ntiles + 1).round().astype(int)
+    return [slice(edges[i], edges[i + 1]) for i in range(ntiles)]
+
+
+def _shared_array(shape, dtype, segments, name=None):
+    """
+    Array in a shared memory segment, a new one unless name is given. The
+    segment is added to segments so that it can be released.
+
+    Returns:
+        the array and (name, shape, dtype) to attach to it
+    """
+
+    dtype = np.dtype(dtype)
+    if name is None:
+        nbytes = max(1, int(np.prod(shape)) * dtype.itemsize)
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+    segments.append(shm)
+    arr = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    return arr, (shm.name, shape, dtype.str)
+
+
+def _tile_heights(mh, shape, rows):
+    """
+    The measurement heights for a tile, heights that vary by pixel are
+    cut to the tile
+    """
+
+    tile = dict(mh)
+    for key in ['z_u', 'z_t', 'z_g']:
+        if np.ndim(mh[key]) > 0:
+            tile[key] = np.reshape(mh[key], shape)[rows]
+    return tile
+
+
+def _worker(n, rows, state, outputs, files, date_time, tstep_info, mh,
+            params, block_size, frequency, nthreads, layout, schedule,
+            chunk_size, precision, commands, results):
+    """
+    Run the tile rows of the grid
+
+    Waits for (start, first_step) to run from the record start, after
+    each block puts (n, j, rt, stats, read) in results and waits for True
+    to run the next block or False to stop. stats are the timings and
+    counters of the block and read the timings of the forcing reads so far
+    as RunStats.as_dict. None stops the worker.
+    """
+
+    import netCDF4 as nc
+
+    segments = []
+    try:
+        state = {key: _shared_array(shape, dtype, segments, name)[0]
+                 for key, (name, shape, dtype) in state.items()}
+        outputs = {key: _shared_array(shape, dtype, segments, name)[0]
+                   for key, (name, shape, dtype) in outputs.items()}
+
+        # the worker opens its own forcing files
+        force = {f: nc.Dataset(value) if isinstance(value, str) else value
+                 for f, value in files.items()}
+
+        tile = {key: value[rows] for key, value in state.items()}
+        grid = engine(precision).SnobalGrid(
+            tile, tstep_info, mh, params, nthreads, buffers=tile,
+            layout=layout, schedule=schedule, chunk_size=chunk_size)
+        nrows = rows.stop - rows.start
+        offset = rows.start * grid.shape[1]
+
+    except Exception:
+        results.put((n, None, traceback.format_exc(), None, None))
+        return
+
+    while True:
+        cmd = commands.get()
+        if cmd is None:
+            break
+        if not isinstance(cmd, tuple):
+            # the stop for a run that failed in this worker
+            continue
+        start, first_step = cmd
+
+        try:
+            reader = ForcingReader(force, date_time, block_size=block_size,
+                                   start=start, tile=(rows, slice(None)))
+            with reader:
+                for j, block in reader:
+                    nsteps = len(block['S_n']) - 1
+                    steps = snobal.output_steps(nsteps, frequency, j)
+                    out = {key: np.zeros((len(steps), nrows, grid.shape[1]),
+                                         dtype=outputs[key].dtype)
+                           for key in outputs}
+
+                    rt = grid.run_block(block, out, frequency, first_step,
+                                        j)
+                    if first_step != snobal.EVERY_STEP:
+                        first_step = 0
+
+                    stats = RunStats().merge(grid.last_stats)
+                    with stats.timer('copy_back'):
+                        for key, value in out.items():
+                            outputs[key][:len(steps), rows] = value
+
+                    results.put((n, j, rt if rt == -1 else rt + offset,
+                                 stats.as_dict(), reader.timings.as_dict()))
+                    if not commands.get():
+                        break
+
+        except Exception:
+            results.put((n, None, traceback.format_exc(), None, None))
+
+    for ds in force.values():
+        if hasattr(ds, 'close'):
+            ds.close()
+
+    # the views have to go before the segments can be closed
+    del grid, tile, state, outputs
+    for shm in segments:
+        shm.close()
+
+
+class TiledSnobal(object):
+    """
+    Runs the model on a grid split into row tiles, each in its own process
+
+    Args:
+        init: dict of the initial model state, as for SnobalGrid
+        tstep_info: time step information
+        mh: measurement heights
+        params: model parameters
+        force: dict of the forcing, the netCDF file names (or
+            netCDF4.Datasets, which are reopened by the workers) or arrays
+            for the inputs that are constant in time
+        date_time: the model times, one per record
+        ntiles: number of tiles and worker processes
+        block_size: number of data timesteps in a block
+        frequency: output every frequency data timesteps
+        out_fields: state fields to output
+        nthreads: number of threads for call_snobal in each worker, 0 for
+            the OpenMP default
+        layout: 'full' or 'compact', the layout of the state and the
+            outputs, see snobal.state_dtype
+        schedule: how the active pixels of a tile are shared between the
+            worker's threads, see snobal.SCHEDULES
+        chunk_size: number of pixels in a chunk of the dynamic schedules
+        precision: precision of the libsnobal build the workers run, see
+            c_snobal.engine
+
+    last_stats has the timings and counters of the last block summed over
+    the tiles and stats the total, see SnobalGrid.stats. The wall time is
+    summed over the workers that run at the same time.
+    """
+
+    def __init__(self, init, tstep_info, mh, params, force, date_time,
+                 ntiles=2, block_size=24, frequency=1, out_fields=None,
+                 nthreads=1, layout='full', schedule='cost', chunk_size=100,
+                 precision='double'):
+
+        if out_fields is None:
+            out_fields = snobal.OUTPUT_FIELDS
+
+        self.shape = np.shape(init['elevation'])
+        self.date_time = date_time
+        self.block_size = block_size
+        self.frequency = frequency
+        self.layout = layout
+        self.tiles = tile_rows(self.shape[0], ntiles)
+        self._segments = []
+        self.last_stats = RunStats()
+        self._block_stats = RunStats()
+        self._read_stats = {}
+
+        # the state of the whole grid, the workers run their rows of it
+        self._state = {}
+        state = {}
+        for key in snobal.STATE_FIELDS:
+            arr, state[key] = _shared_array(
+                self.shape, snobal.state_dtype(key, layout), self._segments)
+            if key in init:
+                arr[...] = init[key]
+            else:
+                arr[...] = 1 if key == 'mask' else 0
+            self._state[key] = arr
+        self.output_rec = self._state
+
+        nout = -(-block_size // frequency)
+        self._outputs = {}
+        outputs = {}
+        for key in out_fields:
+            self._outputs[key], outputs[key] = _shared_array(
+                (nout,) + self.shape, snobal.state_dtype(key, layout),
+                self._segments)
+
+        files = {}
+        for f, value in force.items():
+            files[f] = value.filepath() if hasattr(value, 'filepath') \
+                else value
+
+        ctx = multiprocessing.get_context('spawn')
+        self._results = ctx.Queue()
+        self._commands = []
+        self._workers = []
+        for n, rows in enumerate(self.tiles):
+            commands = ctx.Queue()
+            p = ctx.Process(
+                target=_worker, name='snobal_tile_%d' % n,
+                args=(n, rows, state, outputs, files,
+                      date_time, tstep_info,
+                      _tile_heights(mh, self.shape, rows), params,
+                      block_size, frequency, nthreads, layout, schedule,
+                      chunk_size, precision, commands, self._results))
+            p.daemon = True
+            p.start()
+            self._commands.append(commands)
+            self._workers.append(p)
+
+    def _send(self, cmd):
+        for commands in self._commands:
+            commands.put(cmd)
+
+    def _collect(self, j):
+        """
+        Wait for all the workers to finish block j
+
+        Returns:
+            -1 if successful, otherwise the first pixel that failed
+        """
+
+        rt = -1
+        last = RunStats()
+        for _ in self._workers:
+            n, k, value, stats, read = self._results.get()
+            if k is None:
+                raise RuntimeError('snobal tile %d failed:\n%s' % (n, value))
+            if k != j:
+                raise RuntimeError('snobal tile %d ran block %d, expected '
+                                   '%d' % (n, k, j))
+            if value != -1 and (rt == -1 or value < rt):
+                rt = value
+            last.merge(stats)
+            self._read_stats[n] = read
+        self.last_stats = last
+        self._block_stats.merge(last)
+        return rt
+
+    @property
+    def stats(self):
+        """
+        Timings and counters of the run so far, including the forcing
+        reads in the workers
+        """
+
+        stats = RunStats().merge(self._block_stats)
+        for read in self._read_stats.values():
+            stats.merge(read)
+        return stats
+
+    def blocks(self, start=0, first_step=1):
+        """
+        Run the model from the record start a block at a time
+
+        Yields:
+            (j, nsteps, steps, outputs, rt) for each block, the block starts
+            at record j and has nsteps data timesteps, outputs are the
+            (len(steps), ny, nx) state at the output timesteps given by
+            snobal.output_steps, rt is -1 if successful, otherwise the
+            first pixel that failed. The outputs are only valid until the
+            next block is run.
+        """
+
+        nsteps_total = len(self.date_time) - 1
+        self._send((start, first_step))
+
+        finished = False
+        try:
+            for j in range(start, nsteps_total, self.block_size):
+                nsteps = min(j + self.block_size, nsteps_total) - j
+                rt = self._collect(j)
+                steps = snobal.output_steps(nsteps, self.frequency, j)
+                outputs = {key: value[:len(steps)]
+                           for key, value in self._outputs.items()}
+                yield j, nsteps, steps, outputs, rt
+
+                if rt != -1:
+                    break
+                self._send(True)
+            else:
+                finished = True
+        finally:
+            if not finished:
+                self._send(False)
+
+    def close(self):
+        """
+        Stop the workers and release the shared memory. The output_rec
+        is copied out of shared memory first.
+        """
+
+        if self._workers:
+            self._send(None)
+            for p in self._workers:
+                p.join()
+            self._workers = []
+
+        if self._segments:
+            self._state = {key: np.array(value)
+                           for key, value in self._state.items()}
+            self.output_rec = self._state
+            self._outputs = {}
+            for shm in self._segments:
+                shm.unlink()
+                try:
+                    shm.close()
+                except BufferError:
+                    # the caller still has a view of the outputs, the
+                    # memory is freed with the last view
+                    pass
+            self._segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Timing and work counters of a model run
+
+The engine, the forcing reader and the output writer each keep a
+RunStats with the wall and CPU time they spend in each phase of a run and
+the counters of the work done in C. SnobalGrid.last_stats is the RunStats
+of the last step or block and SnobalGrid.stats the total for the grid, the
+RunStats of the parts are merged for a summary at the end of a run.
+
+The phases are
+
+    read        reading the forcing
+    marshal     checking and binding the forcing and output arrays for C
+    kernel      the C model
+    copy_back   copying the state back to the caller's arrays
+    output      writing the output files
+    sync        syncing the output files to disk
+
+The CPU time of the kernel is the process CPU time, which includes all the
+OpenMP threads, the other phases use the CPU time of the thread that runs
+them.
+"""
+
+from contextlib import contextmanager
+from time import perf_counter, process_time, thread_time
+
+PHASES = ('read', 'marshal', 'kernel', 'copy_back', 'output', 'sync')
+
+# counters from C, the divided and run timesteps are by timestep level
+COUNTERS = ('data_tsteps', 'active_pixels', 'divide_tstep_0',
+            'divide_tstep_1', 'divide_tstep_2', 'do_tstep_1', 'do_tstep_2',
+            'do_tstep_3', 'hle1_calls', 'hle1_iter', 'hle1_fail')
+
+
+class RunStats(object):
+    """
+    Wall and CPU time by phase and counters of the work done
+
+    Attributes:
+        wall: dict of phase to wall time (s)
+        cpu: dict of phase to CPU time (s)
+        calls: dict of phase to the number of times it was timed
+        counts: dict of counter to value
+    """
+
+    def __init__(self):
+        self.wall = {}
+        self.cpu = {}
+        self.calls = {}
+        self.counts = {}
+
+    def add(self, phase, wall, cpu=0.0, calls=1):
+        """
+        Add time to a phase
+        """
+
+        self.wall[phase] = self.wall.get(phase, 0.0) + wall
+        self.cpu[phase] = self.cpu.get(phase, 0.0) + cpu
+        self.calls[phase] = self.calls.get(phase, 0) + calls
+
+    @contextmanager
+    def timer(self, phase, process=False):
+        """
+        Time the body of the with statement as phase
+
+        Args:
+            phase: name of the phase
+            process: use the process CPU time, for code that runs on
+                more than the calling thread
+        """
+
+        clock = process_time if process else thread_time
+        t0 = perf_counter()
+        c0 = clock()
+        try:
+            yield
+        finally:
+            self.add(phase, perf_counter() - t0, clock() - c0)
+
+    def count(self, counts):
+        """
+        Add to the counters
+
+        Args:
+            counts: dict of counter to value
+        """
+
+        for key, value in counts.items():
+            self.counts[key] = self.counts.get(key, 0) + value
+
+    def merge(self, other):
+        """
+        Add the times and counters of another RunStats or of its as_dict
+        """
+
+        if isinstance(other, dict):
+            other = RunStats.from_dict(other)
+        for phase in other.wall:
+            self.add(phase, other.wall[phase], other.cpu[phase],
+                     other.calls[phase])
+        self.count(other.counts)
+        return self
+
+    def as_dict(self):
+        """
+        Plain dict of the times and counters, e.g. to pass between
+        processes
+        """
+
+        return {'wall': dict(self.wall), 'cpu': dict(self.cpu),
+                'calls': dict(self.calls), 'counts': dict(self.counts)}
+
+    @classmethod
+    def from_dict(cls, d):
+        stats = cls()
+        stats.wall.update(d['wall'])
+        stats.cpu.update(d['cpu'])
+        stats.calls.update(d['calls'])
+        stats.counts.update(d['counts'])
+        return stats
+
+    def summary(self):
+        """
+        Table of the times by phase and the counters
+        """
+
+        lines = ['{:>16s} {:>10s} {:>10s} {:>8s}'.format(
+            'phase', 'wall (s)', 'cpu (s)', 'calls')]
+        phases = [p for p in PHASES if p in self.wall] + \
+            sorted(p for p in self.wall if p not in PHASES)
+        for phase in phases:
+            lines.append('{:>16s} {:10.3f} {:10.3f} {:8d}'.format(
+                phase, self.wall[phase], self.cpu[phase], self.calls[phase]))
+
+        keys = [k for k in COUNTERS if k in self.counts] + \
+            sorted(k for k in self.counts if k not in COUNTERS)
+        for key in keys:
+            lines.append('{:>16s} {:10d}'.format(key, self.counts[key]))
+
+        if self.counts.get('hle1_calls'):
+            lines.append('{:>16s} {:10.2f}'.format(
+                'hle1 iter/call',
+                self.counts['hle1_iter'] / self.counts['hle1_calls']))
+
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return 'RunStats(wall={}, counts={})'.format(
+            {k: round(v, 6) for k, v in self.wall.items()}, self.counts)
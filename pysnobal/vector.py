@@ -0,0 +1,565 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized NumPy version of the Snobal energy balance
+
+The routines in libsnobal work on one pixel at a time. The functions here
+compute the same terms for whole arrays of pixels at once so they can be
+used for prototyping, as a fallback when the C extension can't be built
+and as a cross-check against the C core (see snobal.e_bal).
+
+The function names follow the C routines they are ported from, the
+constants are those in h/envphys.h, h/snow.h and h/radiation.h.
+"""
+
+import numpy as np
+
+# h/envphys.h
+MOL_AIR = 28.9644
+MOL_H2O = 18.0153
+RGAS = 8.31432e3
+FREEZE = 2.7316e2
+BOIL = 3.7315e2
+CP_AIR = 1.005e3
+CP_W0 = 4217.7
+KT_MOISTSAND = 1.65
+SEA_LEVEL = 1.013246e5
+GRAVITY = 9.80665
+DALR = GRAVITY / CP_AIR
+VON_KARMAN = 0.41
+
+# h/snow.h and h/radiation.h
+SNOW_EMISSIVITY = 0.98
+STEF_BOLTZ = 5.67032e-8
+
+# hle1.c
+AH = 1.0
+AV = 1.0
+ITMAX = 50
+PAESCHKE = 7.35
+THRESH = 1.e-5
+SM = 0
+SH = 1
+SV = 2
+BETA_S = 5.2
+BETA_U = 16
+
+# fields of the model state used by e_bal
+E_BAL_INPUTS = ['snowcover', 'layer_count', 'S_n', 'I_lw', 'T_a', 'e_a',
+                'u', 'T_g', 'P_a', 'T_s_0', 'T_s_l', 'rho', 'z_s', 'z_s_0',
+                'z_s_l', 'z_0', 'z_u', 'z_T', 'z_g', 'relative_hts',
+                'precip_now', 'm_rain', 'm_snow', 'T_rain', 'T_snow',
+                'time_step']
+E_BAL_OUTPUTS = ['R_n', 'H', 'L_v_E', 'E', 'G', 'G_0', 'M', 'delta_Q',
+                 'delta_Q_0']
+
+
+def cal_to_j(c):
+    return c * 4.186798188
+
+
+def cp_ice(t):
+    """ specific heat of ice (J/(kg K)), CP_ICE in envphys.h """
+    return cal_to_j(0.024928 + (0.00176 * t)) / 0.001
+
+
+def cp_water(t):
+    """ specific heat of water (J/(kg K)), CP_WATER in envphys.h """
+    return CP_W0 - 2.55 * (t - FREEZE)
+
+
+def lh_vap(t):
+    return 2.5e6 - 2.95573e3 * (t - FREEZE)
+
+
+def lh_fus(t):
+    return 3.336e5 + 1.6667e2 * (FREEZE - t)
+
+
+def lh_sub(t):
+    return lh_vap(t) + lh_fus(t)
+
+
+def kts(rho):
+    """ snow thermal conductivity, KTS in snow.h """
+    return cal_to_j(0.0077 * (rho / 1000.0) * (rho / 1000.0))
+
+
+def spec_hum(e, p):
+    return e * MOL_H2O / (MOL_AIR * p + e * (MOL_H2O - MOL_AIR))
+
+
+def heat_stor(cp, spm, tdif):
+    return cp * spm * tdif
+
+
+def satw(tk):
+    """
+    Saturation vapor pressure over water (Pa)
+
+    Args:
+        tk: air temperature (K)
+
+    Returns:
+        saturation vapor pressure (Pa)
+    """
+
+    tk = np.asarray(tk, dtype=np.float64)
+    if np.any(tk <= 0):
+        raise ValueError('satw: temperature less than zero')
+
+    l10 = np.log(1.e1)
+    x = -7.90298 * (BOIL / tk - 1.) + 5.02808 * np.log(BOIL / tk) / l10 - \
+        1.3816e-7 * (np.power(1.e1, 1.1344e1 * (1. - tk / BOIL)) - 1.) + \
+        8.1328e-3 * (np.power(1.e1, -3.49149 * (BOIL / tk - 1.)) - 1.) + \
+        np.log(SEA_LEVEL) / l10
+
+    return np.power(1.e1, x)
+
+
+def sati(tk):
+    """
+    Saturation vapor pressure over ice (Pa), over water above freezing
+
+    Args:
+        tk: air temperature (K)
+
+    Returns:
+        saturation vapor pressure (Pa)
+    """
+
+    tk = np.asarray(tk, dtype=np.float64)
+    if np.any(tk <= 0):
+        raise ValueError('sati: temperature less than zero')
+
+    l10 = np.log(1.e1)
+    x = np.power(1.e1, -9.09718 * ((FREEZE / tk) - 1.) -
+                 3.56654 * np.log(FREEZE / tk) / l10 +
+                 8.76793e-1 * (1. - (tk / FREEZE)) + np.log(6.1071) / l10)
+
+    return np.where(tk > FREEZE, satw(tk), x * 1.e2)
+
+
+def efcon(k, t, p):
+    """
+    Effective thermal conductivity of a snow or soil layer, including the
+    vapor diffusion (Anderson, 1976, pg. 32)
+
+    Args:
+        k: layer thermal conductivity (J/(m K sec))
+        t: layer temperature (K)
+        p: air pressure (Pa)
+
+    Returns:
+        effective conductivity (J/(m K sec))
+    """
+
+    de = (0.65 * (SEA_LEVEL / p) * np.power(t / FREEZE, 14.0)) * (0.01 * 0.01)
+
+    lh = np.where(t > FREEZE, lh_vap(t),
+                  np.where(t == FREEZE, (lh_vap(t) + lh_sub(t)) / 2.0,
+                           lh_sub(t)))
+
+    e = sati(t)
+    q = (MOL_H2O / MOL_AIR) * e / (p - e)
+
+    return k + (lh * de * q)
+
+
+def ssxfr(k1, k2, t1, t2, d1, d2):
+    """ steady state heat transfer between two layers (W/m^2) """
+    return 2.0 * (k1 * k2 * (t2 - t1)) / ((k2 * d1) + (k1 * d2))
+
+
+def g_soil(rho, tsno, tg, ds, dg, pa):
+    """
+    Heat transfer from the soil to the bottom snow layer (W/m^2)
+
+    Args:
+        rho: snow layer's density (kg/m^3)
+        tsno: snow layer's temperature (K), set to FREEZE if above
+        tg: soil temperature (K)
+        ds: snow layer's thickness (m)
+        dg: depth of soil temperature measurement (m)
+        pa: air pressure (Pa)
+
+    Returns:
+        G (W/m^2)
+    """
+
+    tsno = np.minimum(tsno, FREEZE)
+
+    k_g = efcon(KT_MOISTSAND, tg, pa)
+    k_s = efcon(kts(rho), tsno, pa)
+
+    return ssxfr(k_s, k_g, tsno, tg, ds, dg)
+
+
+def g_snow(rho1, rho2, ts1, ts2, ds1, ds2, pa):
+    """
+    Heat transfer between two snow layers (W/m^2)
+
+    Args:
+        rho1, rho2: upper and lower layer's density (kg/m^3)
+        ts1, ts2: upper and lower layer's temperature (K)
+        ds1, ds2: upper and lower layer's thickness (m)
+        pa: air pressure (Pa)
+
+    Returns:
+        G_0 (W/m^2), 0 where the layers have the same temperature
+    """
+
+    k_s1 = efcon(kts(rho1), ts1, pa)
+    k_s2 = efcon(kts(rho2), ts2, pa)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        g = ssxfr(k_s1, k_s2, ts1, ts2, ds1, ds2)
+
+    return np.where(ts1 == ts2, 0.0, g)
+
+
+def cold_content(temp, mass):
+    """
+    Cold content of a layer (J/m^2), the energy to bring it to freezing
+
+    Args:
+        temp: layer temperature (K)
+        mass: layer specific mass (kg/m^2)
+
+    Returns:
+        cold content, 0 where the layer is at or above freezing
+    """
+
+    return np.where(temp < FREEZE,
+                    heat_stor(cp_ice(temp), mass, (temp - FREEZE)), 0.0)
+
+
+def net_rad(S_n, I_lw, T_s_0):
+    """
+    Net allwave radiation (W/m^2)
+
+    Args:
+        S_n: net solar radiation (W/m^2)
+        I_lw: incoming longwave radiation (W/m^2)
+        T_s_0: active layer temperature (K)
+
+    Returns:
+        R_n (W/m^2)
+    """
+    return S_n + (SNOW_EMISSIVITY * (I_lw - STEF_BOLTZ * np.power(T_s_0, 4)))
+
+
+def advec(precip_now, m_rain, m_snow, T_rain, T_snow, T_s_0, time_step):
+    """
+    Advected energy from precipitation (W/m^2)
+
+    Args:
+        precip_now: precipitation flag
+        m_rain, m_snow: mass of rain and snow (kg/m^2)
+        T_rain, T_snow: temperature of rain and snow (K)
+        T_s_0: active layer temperature (K)
+        time_step: length of the timestep (sec)
+
+    Returns:
+        M (W/m^2)
+    """
+
+    M = (heat_stor(cp_water(T_rain), m_rain, (T_rain - T_s_0)) +
+         heat_stor(cp_ice(T_snow), m_snow, (T_snow - T_s_0))) / time_step
+
+    return np.where(precip_now, M, 0.0)
+
+
+def psi(zeta, code):
+    """
+    psi-functions of hle1
+
+    Args:
+        zeta: z / lo
+        code: SM for momentum, SH for sensible heat and SV for latent heat
+
+    Returns:
+        psi(zeta)
+    """
+
+    stable = -BETA_S * np.minimum(zeta, 1)
+
+    x = np.sqrt(np.sqrt(1 - BETA_U * np.minimum(zeta, 0)))
+    if code == SM:
+        unstable = 2 * np.log((1 + x) / 2) + np.log((1 + x * x) / 2) - \
+            2 * np.arctan(x) + np.pi / 2
+    elif code in (SH, SV):
+        unstable = 2 * np.log((1 + x * x) / 2)
+    else:
+        raise ValueError('psi-function code not of these: SM, SH, SV')
+
+    return np.where(zeta > 0, stable, np.where(zeta < 0, unstable, 0.0))
+
+
+def hle1(press, ta, ts, za, ea, es, zq, u, zu, z0, lo=None,
+         full_output=False):
+    """
+    Sensible and latent heat fluxes by iterating on the Obukhov stability
+    length. The pixels are solved together in lock-step, a pixel is dropped
+    from the working set once it has converged so each iteration only
+    works on the pixels that are still changing.
+
+    The iteration can be warm started from a previous solution, e.g. the
+    pixel's stability length from the previous sub-timestep. The fluxes
+    are then computed from that length before iterating, which gives the
+    same solution as the neutral start to within the convergence
+    threshold in fewer iterations.
+
+    Args:
+        press: air pressure (Pa)
+        ta: air temperature (K) at height za
+        ts: surface temperature (K)
+        za: height of air temp measurement (m)
+        ea: vapor pressure (Pa) at height zq
+        es: vapor pressure (Pa) at surface
+        zq: height of spec hum measurement (m)
+        u: wind speed (m/s) at height zu
+        zu: height of wind speed measurement (m)
+        z0: roughness length (m)
+        lo: starting Obukhov length (m) for each pixel, pixels where it
+            isn't finite start from neutral stability
+        full_output: also return the Obukhov length and the number of
+            iterations for each pixel
+
+    Returns:
+        tuple of h, le, e and status arrays: sensible heat flux (W/m^2),
+        latent heat flux (W/m^2), mass flux (kg/m^2/s), all positive to
+        the surface, and the status, 0 if successful, -1 if it didn't
+        converge and -2 for bad input. The fluxes are 0 for bad input.
+        With full_output the Obukhov length (inf for neutral stability)
+        and the iteration count are added to the tuple.
+    """
+
+    arrays = np.broadcast_arrays(*[np.asarray(a, dtype=np.float64) for a in
+                                   (press, ta, ts, za, ea, es, zq, u, zu, z0)])
+    shape = arrays[0].shape
+    if lo is None:
+        lo = np.inf
+    lo_init = np.broadcast_to(np.asarray(lo, dtype=np.float64), shape)
+
+    status = np.zeros(shape, dtype=np.int32)
+    h = np.zeros(shape)
+    le = np.zeros(shape)
+    e = np.zeros(shape)
+    lo_out = np.full(shape, np.inf)
+    it_out = np.zeros(shape, dtype=np.int32)
+
+    def output():
+        if full_output:
+            return h, le, e, status, lo_out, it_out
+        return h, le, e, status
+
+    press, ta, ts, za, ea, es, zq, u, zu, z0 = arrays
+
+    # check for bad input, the checks in hle1.c
+    bad = (z0 <= 0) | (zq <= z0) | (zu <= z0) | (za <= z0)
+    bad |= (ta <= 0) | (ts <= 0)
+    bad |= (ea <= 0) | (es <= 0) | (press <= 0) | (ea >= press) | \
+        (es >= press)
+    status[bad] = -2
+
+    ok = ~bad
+    if not np.any(ok):
+        return output()
+
+    press, ta, ts, za, ea, es, zq, u, zu, z0, lo_init = [
+        a[ok] for a in (press, ta, ts, za, ea, es, zq, u, zu, z0, lo_init)]
+
+    # vapor pressures can't exceed saturation, if way off stop
+    es_sat = sati(ts)
+    ea_sat = satw(ta)
+    off = ((es - 25.0) > es_sat) | ((ea - 25.0) > ea_sat)
+    es = np.minimum(es, es_sat)
+    ea = np.minimum(ea, ea_sat)
+
+    # displacement plane height, eq. 5.3 & 5.4
+    d0 = 2 * PAESCHKE * z0 / 3
+
+    # constant log expressions
+    ltsm = np.log((zu - d0) / z0)
+    ltsh = np.log((za - d0) / z0)
+    ltsv = np.log((zq - d0) / z0)
+
+    # convert vapor pressures to specific humidities
+    qa = spec_hum(ea, press)
+    qs = spec_hum(es, press)
+
+    # convert temperature to potential temperature
+    ta = ta + DALR * za
+
+    # air density at press, virtual temp of geometric mean of air and
+    # surface
+    tv = np.sqrt(ta * ts) / \
+        (1. - (1. - MOL_H2O / MOL_AIR) * (np.sqrt(ea * es) / press))
+    dens = press * MOL_AIR / (RGAS * tv)
+
+    # starting value, assume neutral stability
+    k = VON_KARMAN
+    ustar = k * u / ltsm
+    factor = k * ustar * dens
+    ev = (qa - qs) * factor * AV / ltsv
+    hv = (ta - ts) * factor * CP_AIR * AH / ltsh
+
+    # if not neutral stability, iterate on the Obukhov stability length
+    # for the working set of pixels that haven't converged
+    it = np.zeros(ta.shape, dtype=np.int32)
+    lo = np.full(ta.shape, np.inf)
+    work = np.flatnonzero(ta != ts)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+
+        # warm start, fluxes from the starting stability length
+        warm = work[np.isfinite(lo_init[work])]
+        if len(warm):
+            lo_w = lo_init[warm]
+            ustar[warm] = k * u[warm] / (ltsm[warm] - psi(zu[warm] / lo_w, SM))
+            factor = k * ustar[warm] * dens[warm]
+            ev[warm] = (qa[warm] - qs[warm]) * factor * AV / \
+                (ltsv[warm] - psi(zq[warm] / lo_w, SV))
+            hv[warm] = (ta[warm] - ts[warm]) * factor * AH * CP_AIR / \
+                (ltsh[warm] - psi(za[warm] / lo_w, SH))
+            lo[warm] = lo_w
+
+        while len(work):
+            w_ustar = ustar[work]
+            w_dens = dens[work]
+            w_ta = ta[work]
+            last = lo[work]
+
+            w_lo = w_ustar * w_ustar * w_ustar * w_dens / \
+                (k * GRAVITY * (hv[work] / (w_ta * CP_AIR) + 0.61 * ev[work]))
+
+            w_ustar = k * u[work] / (ltsm[work] - psi(zu[work] / w_lo, SM))
+            factor = k * w_ustar * w_dens
+            ev[work] = (qa[work] - qs[work]) * factor * AV / \
+                (ltsv[work] - psi(zq[work] / w_lo, SV))
+            hv[work] = (w_ta - ts[work]) * factor * AH * CP_AIR / \
+                (ltsh[work] - psi(za[work] / w_lo, SH))
+            ustar[work] = w_ustar
+            lo[work] = w_lo
+
+            # drop the pixels that have converged
+            diff = last - w_lo
+            more = (np.abs(diff) > THRESH) & (np.abs(diff / w_lo) > THRESH)
+            work = work[more]
+            it[work] += 1
+            work = work[it[work] < ITMAX]
+
+    ier = np.where(it >= ITMAX, -1, 0)
+    ier[off] = -2
+
+    xlh = lh_vap(ts) + np.where(ts <= FREEZE, lh_fus(ts), 0.0)
+
+    h[ok] = np.where(off, 0.0, hv)
+    e[ok] = np.where(off, 0.0, ev)
+    le[ok] = np.where(off, 0.0, xlh * ev)
+    status[ok] = ier
+    lo_out[ok] = lo
+    it_out[ok] = it
+
+    return output()
+
+
+def h_le(P_a, T_a, T_s_0, e_a, u, z_T, z_u, z_s, z_0, relative_hts,
+         lo=None, full_output=False):
+    """
+    Turbulent transfer for a snowcover, _h_le in libsnobal
+
+    Args:
+        P_a: air pressure (Pa)
+        T_a: air temperature (K)
+        T_s_0: active layer temperature (K)
+        e_a: vapor pressure (Pa), limited to saturation
+        u: wind speed (m/s)
+        z_T: height of air temp & vapor pressure measurement (m)
+        z_u: height of wind measurement (m)
+        z_s: snow depth (m)
+        z_0: roughness length (m)
+        relative_hts: True if the heights are relative to the snow surface
+        lo: starting Obukhov length (m), see hle1
+        full_output: see hle1
+
+    Returns:
+        tuple of H, L_v_E, E and status, see hle1
+    """
+
+    e_s = sati(T_s_0)
+    e_a = np.minimum(e_a, sati(T_a))
+
+    rel_z_T = np.where(relative_hts, z_T, z_T - z_s)
+    rel_z_u = np.where(relative_hts, z_u, z_u - z_s)
+
+    return hle1(P_a, T_a, T_s_0, rel_z_T, e_a, e_s, rel_z_T, u, rel_z_u, z_0,
+                lo=lo, full_output=full_output)
+
+
+def e_bal(s, diagnostics=False):
+    """
+    Energy balance terms for every pixel, _e_bal in libsnobal. Only the
+    pixels with a snowcover are computed, the terms are 0 for the others.
+
+    Args:
+        s: dict of the model state with the fields in E_BAL_INPUTS, arrays
+            or scalars that broadcast together. If it has the Obukhov
+            length 'lo', e.g. from the diagnostics of the previous
+            sub-timestep, hle1 is warm started from it.
+        diagnostics: add the Obukhov length 'lo' and the number of hle1
+            iterations 'iterations' for each pixel to the output
+
+    Returns:
+        dict of the fields in E_BAL_OUTPUTS and the hle1 status
+    """
+
+    v = dict(zip(E_BAL_INPUTS, np.broadcast_arrays(
+        *[np.asarray(s[key]) for key in E_BAL_INPUTS])))
+    shape = v['snowcover'].shape
+
+    out = {key: np.zeros(shape) for key in E_BAL_OUTPUTS}
+    out['status'] = np.zeros(shape, dtype=np.int32)
+    if diagnostics:
+        out['lo'] = np.full(shape, np.inf)
+        out['iterations'] = np.zeros(shape, dtype=np.int32)
+
+    idx = np.nonzero(v['snowcover'])
+    if len(idx[0]) == 0:
+        return out
+    a = {key: value[idx].astype(np.float64) for key, value in v.items()}
+
+    lo = None
+    if 'lo' in s:
+        lo = np.broadcast_to(s['lo'], shape)[idx]
+
+    R_n = net_rad(a['S_n'], a['I_lw'], a['T_s_0'])
+
+    H, L_v_E, E, status, lo, iterations = h_le(
+        a['P_a'], a['T_a'], a['T_s_0'], a['e_a'], a['u'], a['z_T'],
+        a['z_u'], a['z_s'], a['z_0'], a['relative_hts'] != 0, lo=lo,
+        full_output=True)
+
+    one = a['layer_count'] == 1
+    G = g_soil(a['rho'], np.where(one, a['T_s_0'], a['T_s_l']), a['T_g'],
+               np.where(one, a['z_s_0'], a['z_s_l']), a['z_g'], a['P_a'])
+    G_0 = np.where(one, G, g_snow(a['rho'], a['rho'], a['T_s_0'],
+                                  a['T_s_l'], a['z_s_0'], a['z_s_l'],
+                                  a['P_a']))
+
+    M = advec(a['precip_now'] != 0, a['m_rain'], a['m_snow'], a['T_rain'],
+              a['T_snow'], a['T_s_0'], a['time_step'])
+
+    # surface and total snowpack energy budget
+    delta_Q_0 = R_n + H + L_v_E + G_0 + M
+    delta_Q = np.where(one, delta_Q_0, delta_Q_0 + G - G_0)
+
+    for key, value in zip(E_BAL_OUTPUTS, [R_n, H, L_v_E, E, G, G_0, M,
+                                          delta_Q, delta_Q_0]):
+        out[key][idx] = value
+    out['status'][idx] = status
+    if diagnostics:
+        out['lo'][idx] = lo
+        out['iterations'][idx] = iterations
+
+    return out
@@ -41,22 +41,54 @@ loc = 'pysnobal/c_snobal/libsnobal'
 cwd = os.getcwd()
 sources = glob.glob(os.path.join(loc, '*.c'))
 
+
+def single_sources(sources, location=os.path.join('build',
+                                                   'libsnobal_single')):
+    """
+    Wrappers that include each of the libsnobal sources, so the single
+    precision build compiles them to its own object files. Both extensions
+    compiling the same paths would share the objects in build_temp, and
+    with build_ext -j they overwrite each other's.
+    """
+
+    if not os.path.isdir(location):
+        os.makedirs(location)
+    wrappers = []
+    for source in sources:
+        wrapper = os.path.join(location, os.path.basename(source))
+        text = '#include "{}"\n'.format(os.path.abspath(source))
+        if not os.path.isfile(wrapper) or open(wrapper).read() != text:
+            with open(wrapper, 'w') as f:
+                f.write(text)
+        wrappers.append(wrapper)
+    return wrappers
+
+
 loc = 'pysnobal/c_snobal'
 extra_cc_args = ['-fopenmp', '-O3', '-L./pysnobal', '-ggdb3']
-sources += [os.path.join(loc, val) for val in ["snobal.pyx"]]
+include_dirs = [
+    numpy.get_include(),
+    'pysnobal/c_snobal',
+    'pysnobal/c_snobal/h'
+]
 extensions = [
     Extension(
         "pysnobal.c_snobal.snobal",
-        sources,
+        sources + [os.path.join(loc, "snobal.pyx")],
         # libraries=["snobal"],
-        include_dirs=[
-            numpy.get_include(),
-            'pysnobal/c_snobal',
-            'pysnobal/c_snobal/h'
-        ],
+        include_dirs=include_dirs,
         # runtime_library_dirs=['{}'.format(os.path.join(cwd,'pysnobal'))],
         extra_compile_args=extra_cc_args,
         extra_link_args=extra_cc_args,
+    ),
+    # the same library in single precision, see real_t in h/types.h
+    Extension(
+        "pysnobal.c_snobal.snobal_single",
+        single_sources(sources) + [os.path.join(loc, "snobal_single.pyx")],
+        include_dirs=include_dirs,
+        define_macros=[('SNOBAL_SINGLE', None)],
+        extra_compile_args=extra_cc_args + ['-fsingle-precision-constant'],
+        extra_link_args=extra_cc_args,
     )
 ]
 
@@ -89,4 +121,7 @@ setup(
         'build_ext': build_ext
     },
     ext_modules=extensions,
+    entry_points={
+        'console_scripts': ['pysnobal=pysnobal.cli:main'],
+    },
 )
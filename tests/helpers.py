@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Shared inputs for the tests, built from the test_data_point forcing with an
+initial snowpack and a synthetic precipitation record so that the snowpack
+builds, ripens and melts out over the run.
+"""
+
+import os
+
+import numpy as np
+
+FREEZE = 273.16
+
+TEST_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         '..', 'test_data_point')
+
+MH = {'z_u': 5.0, 'z_t': 5.0, 'z_g': 0.5}
+
+PARAMS = {'relative_heights': False, 'max_h2o_vol': 0.01, 'max_z_s_0': 0.25}
+
+TSTEP_INFO = [
+    {'level': 0, 'output': 2, 'threshold': None, 'time_step': 3600.0,
+     'intervals': None},
+    {'level': 1, 'output': 0, 'threshold': 60.0, 'time_step': 3600.0,
+     'intervals': 1},
+    {'level': 2, 'output': 0, 'threshold': 10.0, 'time_step': 900.0,
+     'intervals': 4},
+    {'level': 3, 'output': 0, 'threshold': 1.0, 'time_step': 60.0,
+     'intervals': 15},
+]
+
+
+def point_forcing(nsteps):
+    """
+    Forcing for nsteps data timesteps (nsteps + 1 records) as a dict of
+    1-D arrays with the temperatures in Kelvin
+    """
+
+    data = np.loadtxt(os.path.join(TEST_DATA, 'snobal.data.input.short'))
+    data = data[:nsteps + 1]
+    i = np.arange(len(data))
+
+    force = {}
+    for j, key in enumerate(['S_n', 'I_lw', 'T_a', 'e_a', 'u', 'T_g']):
+        force[key] = data[:, j].copy()
+
+    # snow every 50 hours when it's cold and a little rain every 97 hours
+    m_pp = np.zeros(len(data))
+    m_pp[(i % 50 == 0) & (force['T_a'] < 1)] = 5.0
+    m_pp[(i % 97 == 0) & (m_pp == 0)] = 2.0
+    force['m_pp'] = m_pp
+    force['percent_snow'] = np.where(force['T_a'] < 0, 1.0, 0.5)
+    force['rho_snow'] = 100.0 * np.ones(len(data))
+    force['T_pp'] = np.minimum(force['T_a'], 0.5)
+
+    for key in ['T_a', 'T_g', 'T_pp']:
+        force[key] += FREEZE
+
+    return force
+
+
+def grid_record(force, i, shape):
+    """
+    Record i of the point forcing spread over a grid
+    """
+    return {key: value[i] * np.ones(shape) for key, value in force.items()}
+
+
+def init_state(shape=(2, 3)):
+    """
+    Initial conditions with a range of snowpacks, the last pixel is masked
+    """
+
+    nx = int(np.prod(shape))
+    z_s = np.resize([0.0, 0.5, 1.5, 0.1, 2.0, 0.02], nx)
+    rho = np.resize([0.0, 250.0, 300.0, 150.0, 350.0, 200.0], nx)
+    mask = np.ones(nx)
+    mask[-1] = 0
+
+    init = {
+        'elevation': 2061.0 * np.ones(nx),
+        'z_0': 0.005 * np.ones(nx),
+        'z_s': z_s,
+        'rho': rho,
+        'T_s_0': (-3.0 + FREEZE) * np.ones(nx),
+        'T_s_l': (-5.0 + FREEZE) * np.ones(nx),
+        'T_s': (-4.0 + FREEZE) * np.ones(nx),
+        'h2o_sat': np.zeros(nx),
+        'mask': mask,
+    }
+
+    return {key: value.reshape(shape) for key, value in init.items()}
+
+
+def output_rec(shape=(2, 3)):
+    """
+    Full model state dict as created by ipysnobal.initialize
+    """
+
+    from pysnobal.c_snobal import snobal
+
+    s = {key: np.zeros(shape) for key in snobal.STATE_FIELDS}
+    s.update(init_state(shape))
+    return s
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_autotune
+----------------------------------
+
+Tests for `pysnobal.autotune`.
+"""
+
+import unittest
+
+import numpy as np
+
+from pysnobal.autotune import autotune, thread_counts
+from pysnobal.c_snobal import snobal
+
+from tests import helpers
+
+
+class TestAutotune(unittest.TestCase):
+
+    shape = (3, 6)
+
+    def test_thread_counts(self):
+        """ Powers of two up to the most threads """
+
+        self.assertEqual(thread_counts(1), [1])
+        self.assertEqual(thread_counts(4), [1, 2, 4])
+        self.assertEqual(thread_counts(6), [1, 2, 4, 6])
+
+    def test_autotune(self):
+        """ Every combination is timed and the grid isn't changed """
+
+        force = helpers.point_forcing(10)
+        block = {key: np.stack([value[i] * np.ones(self.shape)
+                                for i in range(11)])
+                 for key, value in force.items()}
+        grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS)
+        state = {key: grid[key].copy() for key in snobal.STATE_FIELDS}
+
+        tuning = autotune(grid.output_rec, helpers.TSTEP_INFO, helpers.MH,
+                          helpers.PARAMS, block, threads=[1, 2],
+                          chunk_sizes=(1, 100), nsteps=4)
+
+        # the balanced schedule is only tried with the first chunk size
+        self.assertEqual(len(tuning.results), 10)
+        self.assertIn(tuning.best, tuning.results)
+        self.assertTrue(all(r['time'] > 0 for r in tuning.results))
+        speedup = tuning.speedup()
+        self.assertEqual([n for n, _, _ in speedup], [1, 2])
+        self.assertEqual(speedup[0][2], 1.0)
+        self.assertIn('speedup', tuning.report())
+
+        for key, value in state.items():
+            np.testing.assert_array_equal(grid[key], value, err_msg=key)
+
+        tuning.apply(grid)
+        self.assertEqual(grid.nthreads, tuning.best['nthreads'])
+        self.assertEqual(grid.schedule, tuning.best['schedule'])
+        self.assertEqual(grid.chunk_size, tuning.best['chunk_size'])
+        self.assertEqual(grid.run_block(block, first_step=1), -1)
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(unittest.main())
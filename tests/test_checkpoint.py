@@ -0,0 +1,441 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_checkpoint
+----------------------------------
+
+Tests for `pysnobal.checkpoint`, restarting `ipysnobal.main` and its
+configuration.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import netCDF4 as nc
+import numpy as np
+
+from pysnobal import ipysnobal
+from pysnobal.c_snobal import snobal
+from pysnobal.checkpoint import load_checkpoint, save_checkpoint
+from pysnobal.output import EM_OUT, SNOW_OUT
+
+from tests import helpers
+from tests.test_forcing import write_forcing
+
+# the point forcing and the forcing files they are written to
+FILES = {'S_n': 'net_solar', 'I_lw': 'thermal', 'T_a': 'air_temp',
+         'e_a': 'vapor_pressure', 'u': 'wind_speed', 'm_pp': 'precip_mass',
+         'percent_snow': 'percent_snow', 'rho_snow': 'snow_density',
+         'T_pp': 'precip_temp'}
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_round_trip(self):
+        """ The state and clock are the same after loading """
+
+        s = helpers.output_rec()
+        s = {key: np.asarray(value, dtype=snobal.state_dtype(key))
+             for key, value in s.items()}
+        t = datetime(2017, 1, 2, 5)
+
+        for compress in [False, True]:
+            path = os.path.join(self.tmp, 'checkpoint.npz')
+            save_checkpoint(path, s, 29, t, compress)
+            self.assertEqual(os.listdir(self.tmp), ['checkpoint.npz'])
+
+            state, step, date_time = load_checkpoint(path)
+            self.assertEqual(step, 29)
+            self.assertEqual(date_time, t)
+            self.assertEqual(sorted(state), sorted(snobal.STATE_FIELDS))
+            for key, value in s.items():
+                np.testing.assert_array_equal(state[key], value)
+                self.assertEqual(state[key].dtype, value.dtype)
+
+
+class TestGetArgs(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def get_args(self, **output):
+        path = os.path.join(self.tmp, 'config.ini')
+        with open(path, 'w') as f:
+            f.write('[constants]\n'
+                    '[time]\ntime_step: 60\nstart_date: 2017-01-01\n'
+                    'nsteps: 2\n'
+                    '[inputs]\n'
+                    '[output]\nfrequency: 1\n')
+            for key, value in output.items():
+                f.write('{}: {}\n'.format(key, value))
+        options, _ = ipysnobal.get_args(path)
+        return options['output']
+
+    def test_nthreads(self):
+        """ nthreads is an integer, auto or empty for the OpenMP default """
+
+        self.assertIsNone(self.get_args()['nthreads'])
+        self.assertIsNone(self.get_args(nthreads='')['nthreads'])
+        self.assertEqual(self.get_args(nthreads=4)['nthreads'], 4)
+        self.assertEqual(self.get_args(nthreads='Auto')['nthreads'], 'auto')
+
+        for value in ['fuor', '2.5']:
+            with self.assertRaises(ValueError):
+                self.get_args(nthreads=value)
+
+    def test_sat_table(self):
+        """ sat_table is off by default and passed on in the parameters """
+
+        self.assertFalse(self.get_args()['sat_table'])
+        self.assertTrue(self.get_args(sat_table='True')['sat_table'])
+
+        constants = {'time_step': 60, 'max-h2o': 0.01, 'max_z_s_0': 0.25,
+                     'c': True, 'K': True, 'relative_heights': False}
+        options = {'output': self.get_args(sat_table='true')}
+        params, _ = ipysnobal.get_tstep_info(constants, options)
+        self.assertTrue(params['sat_table'])
+
+    def test_hle1_warm_start(self):
+        """ hle1_warm_start is on by default and passed on in the params """
+
+        self.assertTrue(self.get_args()['hle1_warm_start'])
+        self.assertFalse(
+            self.get_args(hle1_warm_start='False')['hle1_warm_start'])
+
+        constants = {'time_step': 60, 'max-h2o': 0.01, 'max_z_s_0': 0.25,
+                     'c': True, 'K': True, 'relative_heights': False}
+        params, _ = ipysnobal.get_tstep_info(
+            constants, {'output': self.get_args()})
+        self.assertTrue(params['hle1_warm_start'])
+
+
+class TestRestart(unittest.TestCase):
+
+    nsteps = 48
+    shape = (2, 3)
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.start = datetime(2017, 1, 1)
+
+        force = helpers.point_forcing(self.nsteps)
+        for key in ['T_a', 'T_pp']:
+            force[key] -= helpers.FREEZE
+        self.files = {}
+        for key, f in FILES.items():
+            values = force[key][:, None, None] * np.ones(self.shape)
+            self.files[f] = os.path.join(self.tmp, f + '.nc')
+            write_forcing(self.files[f], f, values, self.start)
+
+        self.init = helpers.init_state(self.shape)
+        self.init['x'] = np.arange(self.shape[1])
+        self.init['y'] = np.arange(self.shape[0])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def options(self, name, nsteps, checkpoint_interval=0, ntiles=1,
+                state_layout='full'):
+        location = os.path.join(self.tmp, name)
+        if not os.path.isdir(location):
+            os.mkdir(location)
+
+        constants = {'time_step': 60, 'max-h2o': 0.01, 'max_z_s_0': 0.25,
+                     'c': True, 'K': True, 'relative_heights': False}
+        constants.update(helpers.MH)
+        output = {'location': location, 'frequency': 1, 'block_size': 8,
+                  'buffer_size': 4, 'sync_interval': 0, 'ntiles': ntiles,
+                  'state_layout': state_layout,
+                  'output_mode': 'data', 'out_filename': None,
+                  'checkpoint_interval': checkpoint_interval,
+                  'checkpoint_file': os.path.join(location, 'ckpt.npz'),
+                  'checkpoint_compress': True}
+        date_time = [self.start + timedelta(hours=i)
+                     for i in range(nsteps + 1)]
+        return {'constants': constants, 'output': output,
+                'inputs': {'point': None},
+                'time': {'start_date': self.start, 'time_step': 60,
+                         'date_time': date_time}}
+
+    def run_main(self, options, restart=None, members=None):
+        def forcing(files):
+            force = {f: nc.Dataset(path) for f, path in files.items()}
+            force['soil_temp'] = -2.5 * np.ones(self.shape)
+            return force
+
+        def open_files(options):
+            init = {key: value.copy() for key, value in self.init.items()}
+            if members is not None:
+                return init, [forcing(files) for files in members]
+            return init, forcing(self.files)
+
+        with mock.patch.object(ipysnobal, 'get_args',
+                               return_value=(options, False)), \
+                mock.patch.object(ipysnobal, 'open_files', open_files):
+            return ipysnobal.main('config.ini', restart)
+
+    def read(self, location):
+        out = {}
+        for f, fields in [('em', EM_OUT), ('snow', SNOW_OUT)]:
+            ds = nc.Dataset(os.path.join(location, f + '.nc'))
+            for key in ['time'] + list(fields):
+                out[key] = ds.variables[key][:]
+            ds.close()
+        return out
+
+    def test_restart(self):
+        """ A run restarted from a checkpoint has the same output """
+
+        options = self.options('full', self.nsteps)
+        stats = self.run_main(options)
+        expected = self.read(options['output']['location'])
+        self.assertEqual(len(expected['time']), self.nsteps)
+        self.assertEqual(stats.counts['data_tsteps'], self.nsteps)
+        self.assertEqual(set(stats.wall),
+                         {'read', 'marshal', 'kernel', 'output', 'sync'})
+
+        # the run stops after 30 timesteps, the checkpoint is at the end of
+        # the block at 24 and the output after it is written again
+        options = self.options('restart', 30, checkpoint_interval=20)
+        self.run_main(options)
+        state, step, date_time = load_checkpoint(
+            options['output']['checkpoint_file'])
+        self.assertEqual(step, 24)
+        self.assertEqual(date_time, datetime(2017, 1, 2))
+
+        options = self.options('restart', self.nsteps)
+        self.run_main(options, restart=True)
+        out = self.read(options['output']['location'])
+
+        for key, value in expected.items():
+            np.testing.assert_array_equal(out[key], value, err_msg=key)
+
+    def test_open_files(self):
+        """ main reads the initial conditions and forcing from netCDF """
+
+        options = self.options('full', self.nsteps)
+        self.run_main(options)
+        expected = self.read(options['output']['location'])
+
+        # the temperatures are in C in the initial conditions file
+        path = os.path.join(self.tmp, 'init.nc')
+        ds = nc.Dataset(path, 'w')
+        ds.createDimension('y', self.shape[0])
+        ds.createDimension('x', self.shape[1])
+        for key in ['x', 'y']:
+            ds.createVariable(key, 'f8', (key,))
+            ds.variables[key][:] = self.init[key]
+        for key in ['elevation', 'z_0', 'z_s', 'rho', 'T_s_0', 'T_s_l', 'T_s',
+                    'h2o_sat', 'mask']:
+            value = self.init[key]
+            if key.startswith('T_s'):
+                value = value - helpers.FREEZE
+            name = 'z' if key == 'elevation' else key
+            ds.createVariable(name, 'f8', ('y', 'x'))
+            ds.variables[name][:] = value
+        ds.close()
+
+        options = self.options('files', self.nsteps)
+        options['initial_conditions'] = {'file': path}
+        options['inputs'] = dict(self.files, point=None, soil_temp='-2.5')
+        with mock.patch.object(ipysnobal, 'get_args',
+                               return_value=(options, False)):
+            ipysnobal.main('config.ini')
+        out = self.read(options['output']['location'])
+
+        for key, value in expected.items():
+            np.testing.assert_array_equal(out[key], value, err_msg=key)
+
+    def test_every_step(self):
+        """ The grid zeroes the averages and sums on every data timestep """
+
+        options = self.options('full', self.nsteps)
+        self.run_main(options)
+        expected = self.read(options['output']['location'])
+
+        # as iSnobal, the energy and mass terms at an output are for the
+        # last data timestep whatever the output frequency, with tiles and
+        # after a restart. The averages are still weighted by the time since
+        # the last output, so they are halved.
+        averages = [key for key, field in EM_OUT.items()
+                    if field.endswith('_bar')]
+        for name, ntiles in [('every', 1), ('every_tiles', 2)]:
+            options = self.options(name, 30, checkpoint_interval=20,
+                                   ntiles=ntiles)
+            options['output']['frequency'] = 2
+            self.run_main(options)
+            options = self.options(name, self.nsteps, ntiles=ntiles)
+            options['output']['frequency'] = 2
+            self.run_main(options, restart=True)
+            out = self.read(options['output']['location'])
+
+            self.assertEqual(len(out['time']), self.nsteps // 2)
+            for key, value in expected.items():
+                value = value[1::2]
+                if key in averages:
+                    value = value / 2
+                np.testing.assert_array_equal(out[key], value, err_msg=key)
+
+    def test_tiles(self):
+        """ Tiles in worker processes have the same output and restart """
+
+        options = self.options('full', self.nsteps)
+        self.run_main(options)
+        expected = self.read(options['output']['location'])
+
+        options = self.options('tiles', 30, checkpoint_interval=20,
+                               ntiles=2)
+        self.run_main(options)
+        options = self.options('tiles', self.nsteps, ntiles=2)
+        stats = self.run_main(options, restart=True)
+        out = self.read(options['output']['location'])
+
+        # the timings come back from the workers
+        self.assertEqual(stats.counts['data_tsteps'], 2 * (self.nsteps - 24))
+        for phase in ['read', 'marshal', 'kernel', 'copy_back', 'output',
+                      'sync']:
+            self.assertIn(phase, stats.wall)
+
+        for key, value in expected.items():
+            np.testing.assert_array_equal(out[key], value, err_msg=key)
+
+    def test_compact_layout(self):
+        """ The compact state has the same snowpack, with and without tiles """
+
+        options = self.options('full', self.nsteps)
+        self.run_main(options)
+        expected = self.read(options['output']['location'])
+
+        for ntiles in [1, 2]:
+            name = 'compact_%d' % ntiles
+            options = self.options(name, 30, checkpoint_interval=20,
+                                   ntiles=ntiles, state_layout='compact')
+            self.run_main(options)
+            state, _, _ = load_checkpoint(
+                options['output']['checkpoint_file'])
+            self.assertEqual(state['layer_count'].dtype, np.int8)
+            options = self.options(name, self.nsteps, ntiles=ntiles,
+                                   state_layout='compact')
+            self.run_main(options, restart=True)
+            out = self.read(options['output']['location'])
+
+            for key in ['time'] + list(SNOW_OUT):
+                np.testing.assert_array_equal(out[key], expected[key],
+                                              err_msg=key)
+            for key in EM_OUT:
+                np.testing.assert_allclose(out[key], expected[key],
+                                           rtol=1e-5, atol=1e-4, err_msg=key)
+
+    def test_nthreads(self):
+        """ The threads and schedule of the config don't change the output """
+
+        options = self.options('full', self.nsteps)
+        self.run_main(options)
+        expected = self.read(options['output']['location'])
+
+        for name, nthreads, schedule in [('threads', 3, 'balanced'),
+                                         ('auto', 'auto', 'cost')]:
+            options = self.options(name, self.nsteps)
+            options['output'].update(nthreads=nthreads, schedule=schedule,
+                                     chunk_size=1, autotune_steps=2)
+            self.run_main(options)
+            out = self.read(options['output']['location'])
+            for key, value in expected.items():
+                np.testing.assert_array_equal(out[key], value, err_msg=key)
+
+    def test_precision(self):
+        """ The single precision build is close to double, with tiles """
+
+        options = self.options('full', self.nsteps)
+        self.run_main(options)
+        expected = self.read(options['output']['location'])
+
+        for ntiles in [1, 2]:
+            options = self.options('single_%d' % ntiles, self.nsteps,
+                                   ntiles=ntiles)
+            options['output']['precision'] = 'single'
+            self.run_main(options)
+            out = self.read(options['output']['location'])
+            for key in SNOW_OUT:
+                np.testing.assert_allclose(out[key], expected[key],
+                                           rtol=1e-4, atol=1e-3, err_msg=key)
+            self.assertFalse(np.array_equal(out['specific_mass'],
+                                            expected['specific_mass']))
+
+    def test_ensemble(self):
+        """ Each member of an ensemble run has the output of its own run """
+
+        # the second member has twice the precipitation
+        files = dict(self.files)
+        files['precip_mass'] = os.path.join(self.tmp, 'precip_mass_2.nc')
+        with nc.Dataset(self.files['precip_mass']) as ds:
+            values = 2 * ds.variables['precip_mass'][:]
+        write_forcing(files['precip_mass'], 'precip_mass', values,
+                      self.start)
+
+        expected = []
+        ensemble = [self.files, files]
+        for k, member in enumerate(ensemble):
+            self.files = member
+            options = self.options('member_%d' % k, self.nsteps)
+            self.run_main(options)
+            expected.append(self.read(options['output']['location']))
+        self.files = ensemble[0]
+
+        options = self.options('ensemble', self.nsteps)
+        options['output'].update(nthreads=2)
+        self.run_main(options, members=ensemble)
+        out = self.read(options['output']['location'])
+
+        with nc.Dataset(os.path.join(options['output']['location'],
+                                     'snow.nc')) as ds:
+            self.assertEqual(ds.variables['thickness'].dimensions,
+                             ('time', 'member', 'y', 'x'))
+            self.assertEqual(list(ds.variables['member'][:]), [0, 1])
+        for k in range(2):
+            np.testing.assert_array_equal(out['time'], expected[k]['time'])
+            for key, value in expected[k].items():
+                if key != 'time':
+                    np.testing.assert_array_equal(out[key][:, k], value,
+                                                  err_msg=key)
+        self.assertFalse(np.array_equal(out['thickness'][:, 0],
+                                        out['thickness'][:, 1]))
+
+        with self.assertRaises(ValueError):
+            self.run_main(self.options('tiles', self.nsteps, ntiles=2),
+                          members=ensemble)
+
+    def test_restart_wrong_run(self):
+        """ A checkpoint from outside of the run is an error """
+
+        options = self.options('wrong', 16, checkpoint_interval=8)
+        self.run_main(options)
+        path = options['output']['checkpoint_file']
+        state, step, date_time = load_checkpoint(path)
+        save_checkpoint(path, state, step, date_time + timedelta(hours=1))
+
+        with self.assertRaises(ValueError):
+            self.run_main(self.options('wrong', self.nsteps), restart=path)
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(unittest.main())
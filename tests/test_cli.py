@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_cli
+----------------------------------
+
+Tests for `pysnobal.cli` and the imports the commands need.
+"""
+
+import subprocess
+import sys
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from pysnobal import cli, ipysnobal, sweep
+
+
+class TestCli(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        """ The modules load without pandas and netCDF4 """
+
+        for module in ['pysnobal.c_snobal.snobal', 'pysnobal.pysnobal',
+                       'pysnobal.stations', 'pysnobal.sweep',
+                       'pysnobal.ipysnobal', 'pysnobal.cli']:
+            code = 'import sys, {}; print(sorted(set(sys.modules) & ' \
+                '{{"pandas", "netCDF4"}}))'.format(module)
+            out = subprocess.run([sys.executable, '-c', code], check=True,
+                                 stdout=subprocess.PIPE,
+                                 universal_newlines=True)
+            self.assertEqual(out.stdout.strip(), '[]', msg=module)
+
+    def test_commands(self):
+        """ The arguments after the command go to the command """
+
+        with mock.patch.object(ipysnobal, 'main') as run:
+            cli.main(['run', 'config.ini', '--restart'])
+        run.assert_called_once_with('config.ini', True)
+
+        args = ['sets.csv', '-s', 'snow.properties.input', '-h', 'mh']
+        with mock.patch.object(sweep, 'main', return_value=0) as main:
+            self.assertEqual(cli.main(['sweep'] + args), 0)
+        main.assert_called_once_with(args)
+
+        with self.assertRaises(SystemExit):
+            cli.main(['point'])
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_forcing
+----------------------------------
+
+Tests for `pysnobal.forcing` and the SMRF queue coupling in
+`pysnobal.ipysnobal.QueueIsnobal`.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue
+
+import netCDF4 as nc
+import numpy as np
+
+from pysnobal import ipysnobal
+from pysnobal.c_snobal import snobal
+from pysnobal.forcing import (CELSIUS, FORCING_MAP, EnsembleReader,
+                              ForcingBuffers, ForcingReader)
+from pysnobal.output import EM_OUT, SNOW_OUT
+
+from tests import helpers
+
+
+def write_forcing(path, name, values, start, offset=0):
+    """
+    Write a forcing file with hourly times starting offset hours before
+    start
+    """
+
+    ds = nc.Dataset(path, 'w')
+    ds.createDimension('time', None)
+    ds.createDimension('y', values.shape[1])
+    ds.createDimension('x', values.shape[2])
+    ds.createVariable('time', 'f', ('time',))
+    ds.createVariable('y', 'f', ('y',))
+    ds.createVariable('x', 'f', ('x',))
+    ds.createVariable(name, 'f', ('time', 'y', 'x'))
+    ds.variables['time'].units = 'hours since %s' % start
+    ds.variables['time'].calendar = 'standard'
+    ds.variables['time'][:] = np.arange(len(values)) - offset
+    ds.variables[name][:] = values
+    ds.close()
+
+
+class TestForcingReader(unittest.TestCase):
+
+    nsteps = 30
+    shape = (3, 4)
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        start = datetime(2017, 1, 1)
+        self.date_time = [start + timedelta(hours=i)
+                          for i in range(self.nsteps + 1)]
+
+        rng = np.random.RandomState(0)
+        self.force = {}
+        for k, f in enumerate(sorted(FORCING_MAP)):
+            if f == 'soil_temp':
+                self.force[f] = -2.5 * np.ones(self.shape)
+                continue
+            # the files start a few hours before the model
+            offset = k % 3
+            values = rng.uniform(0, 10, (self.nsteps + 5,) + self.shape)
+            path = os.path.join(self.tmp, f + '.nc')
+            write_forcing(path, f, values, start, offset)
+            self.force[f] = nc.Dataset(path)
+
+    def tearDown(self):
+        ipysnobal.close_files(self.force)
+        shutil.rmtree(self.tmp)
+
+    def check_blocks(self, reader, point=None):
+        expected = [ipysnobal.get_timestep(self.force, t, point)
+                    for t in self.date_time]
+
+        j = 0
+        for start, block in reader:
+            self.assertEqual(start, j)
+            nsteps = len(block['S_n']) - 1
+            self.assertLessEqual(nsteps, reader.block_size)
+            for key, value in block.items():
+                self.assertTrue(value.flags['C_CONTIGUOUS'])
+                # the single precision files are kept as they are
+                self.assertEqual(value.dtype, np.float64 if key in CELSIUS
+                                 else np.float32)
+                np.testing.assert_array_equal(
+                    value, np.stack([r[key] for r in
+                                     expected[j:j + nsteps + 1]]),
+                    err_msg=key)
+            j += nsteps
+
+        self.assertEqual(j, self.nsteps)
+        self.assertEqual(reader.stats()['nblocks'], len(reader.blocks()))
+
+    def test_matches_get_timestep(self):
+        """ The blocks are the records from get_timestep """
+
+        for prefetch in [False, True]:
+            with ForcingReader(self.force, self.date_time, block_size=7,
+                               prefetch=prefetch) as reader:
+                self.check_blocks(reader)
+            self.assertGreater(reader.stats()['read_mb'], 0)
+
+    def test_point(self):
+        """ A point run reads a (1, 1) grid """
+
+        with ForcingReader(self.force, self.date_time, point=(1, 2),
+                           block_size=10) as reader:
+            self.check_blocks(reader, (1, 2))
+
+    def test_tile_and_start(self):
+        """ A tile from a later record is that part of the blocks """
+
+        tile = (slice(1, 3), slice(None))
+        with ForcingReader(self.force, self.date_time, block_size=7,
+                           start=9) as reader:
+            full = list(reader)
+        with ForcingReader(self.force, self.date_time, block_size=7,
+                           start=9, tile=tile) as reader:
+            blocks = list(reader)
+
+        self.assertEqual([j for j, block in blocks], [9, 16, 23])
+        for (j, expected), (k, block) in zip(full, blocks):
+            for key, value in expected.items():
+                np.testing.assert_array_equal(block[key], value[:, 1:3],
+                                              err_msg=key)
+
+    def test_ensemble(self):
+        """ The blocks of an ensemble stack the members """
+
+        with ForcingReader(self.force, self.date_time,
+                           block_size=7) as reader:
+            expected = list(reader)
+        with EnsembleReader([self.force, self.force], self.date_time,
+                            block_size=7) as reader:
+            blocks = list(reader)
+        self.assertGreater(reader.stats()['read_mb'], 0)
+
+        self.assertEqual([j for j, _ in blocks], [j for j, _ in expected])
+        for (_, single), (_, block) in zip(expected, blocks):
+            for key, value in single.items():
+                self.assertEqual(block[key].shape,
+                                 (len(value), 2) + self.shape)
+                for k in range(2):
+                    np.testing.assert_array_equal(block[key][:, k], value,
+                                                  err_msg=key)
+
+    def test_missing_time(self):
+        """ A model time that isn't in a file raises an error """
+
+        date_time = self.date_time + [self.date_time[-1] + timedelta(days=1)]
+        with self.assertRaises(ValueError):
+            ForcingReader(self.force, date_time)
+
+    def test_stop_early(self):
+        """ Stopping part way through stops the read ahead """
+
+        reader = ForcingReader(self.force, self.date_time, block_size=2)
+        with reader:
+            for j, block in reader:
+                break
+        self.assertIsNone(reader._thread)
+        self.assertEqual(reader.stats()['nblocks'], 1)
+
+
+class TestForcingBuffers(unittest.TestCase):
+
+    shape = (2, 3)
+
+    def record(self, i):
+        return {key: i + k + np.arange(6.0).reshape(self.shape)
+                for k, key in enumerate(FORCING_MAP.values())}
+
+    def test_blocks(self):
+        """ The blocks are the records in K, sharing the end records """
+
+        buffers = ForcingBuffers(self.shape, 4, constant={'T_g': -2.5})
+        blocks = []
+        for i in range(11):
+            buffers.put(self.record(i))
+            if buffers.full or i == 10:
+                block = buffers.block()
+                blocks.append({key: value.copy()
+                               for key, value in block.items()})
+                for value in block.values():
+                    self.assertTrue(value.flags['C_CONTIGUOUS'])
+
+        self.assertEqual([len(b['S_n']) for b in blocks], [5, 5, 3])
+        j = 0
+        for block in blocks:
+            for i in range(len(block['S_n'])):
+                expected = self.record(j + i)
+                for key, value in block.items():
+                    if key == 'T_g':
+                        np.testing.assert_array_equal(
+                            value[i], -2.5 + helpers.FREEZE)
+                    elif key in ['T_a', 'T_pp']:
+                        np.testing.assert_array_equal(
+                            value[i], expected[key] + helpers.FREEZE)
+                    else:
+                        np.testing.assert_array_equal(value[i],
+                                                      expected[key])
+            j += len(block['S_n']) - 1
+
+    def test_full(self):
+        """ A full block has to be handed over first """
+
+        buffers = ForcingBuffers(self.shape, 1)
+        buffers.put(self.record(0))
+        with self.assertRaises(ValueError):
+            buffers.block()
+        buffers.put(self.record(1))
+        with self.assertRaises(ValueError):
+            buffers.put(self.record(2))
+
+
+class DateQueue(object):
+    """
+    The part of the smrf queue that QueueIsnobal uses
+    """
+
+    def __init__(self, values, date_time):
+        self.values = dict(zip(date_time, values))
+
+    def get(self, tstep, block=True, timeout=None):
+        return self.values[tstep]
+
+
+class TestQueueIsnobal(unittest.TestCase):
+
+    nsteps = 30
+    shape = (2, 3)
+
+    # the smrf variables
+    VARIABLES = {'air_temp': 'T_a', 'net_solar': 'S_n', 'thermal': 'I_lw',
+                 'vapor_pressure': 'e_a', 'wind_speed': 'u', 'precip': 'm_pp',
+                 'percent_snow': 'percent_snow',
+                 'snow_density': 'rho_snow', 'dew_point': 'T_pp'}
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_matches_run_block(self):
+        """ The output from the queues is the output of the forcing """
+
+        start = datetime(2017, 1, 1)
+        date_time = [start + timedelta(hours=i)
+                     for i in range(self.nsteps + 1)]
+
+        # smrf gives the temperatures in C
+        force = helpers.point_forcing(self.nsteps)
+        force['T_g'][:] = -2.5 + helpers.FREEZE
+        for key in ['T_a', 'T_pp']:
+            force[key] -= helpers.FREEZE
+        grid_force = {key: value[:, None, None] * np.ones(self.shape)
+                      for key, value in force.items()}
+        queue = {v: DateQueue(grid_force[key], date_time)
+                 for v, key in self.VARIABLES.items()}
+        queue['isnobal'] = Queue()
+
+        init = helpers.init_state(self.shape)
+        init['x'] = np.arange(self.shape[1])
+        init['y'] = np.arange(self.shape[0])
+        options = {
+            'constants': helpers.MH,
+            'output': {'location': self.tmp, 'frequency': 1,
+                       'block_size': 8, 'buffer_size': 4,
+                       'sync_interval': 0, 'checkpoint_interval': 0},
+            'time': {'start_date': start, 'time_step': 60}}
+        ipysnobal.output_files(options, init)
+        output_rec = ipysnobal.initialize(helpers.PARAMS,
+                                          helpers.TSTEP_INFO, init)
+
+        model = ipysnobal.QueueIsnobal(
+            queue, date_time, 1, None, None, options, helpers.PARAMS,
+            helpers.TSTEP_INFO, init, output_rec, self.shape[1],
+            self.shape[0])
+        model.start()
+        model.join()
+        options['output']['em'].close()
+        options['output']['snow'].close()
+
+        done = [queue['isnobal'].get() for _ in range(self.nsteps + 1)]
+        self.assertEqual([t for t, _ in done], date_time)
+
+        # the same forcing in one block
+        for key in ['T_a', 'T_pp']:
+            grid_force[key] += helpers.FREEZE
+        grid = snobal.SnobalGrid(helpers.init_state(self.shape),
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS)
+        expected = {key: np.zeros((self.nsteps,) + self.shape,
+                                  dtype=snobal.state_dtype(key))
+                    for key in snobal.OUTPUT_FIELDS}
+        self.assertEqual(grid.run_block(grid_force, expected, 1, 1), -1)
+
+        for f, fields in [('em', EM_OUT), ('snow', SNOW_OUT)]:
+            ds = nc.Dataset(os.path.join(self.tmp, f + '.nc'))
+            self.assertEqual(len(ds.variables['time']), self.nsteps)
+            for name, key in fields.items():
+                value = expected[key]
+                if name.startswith('temp_'):
+                    value = value - helpers.FREEZE
+                np.testing.assert_allclose(ds.variables[name][:], value,
+                                           rtol=1e-6, atol=1e-6,
+                                           err_msg=name)
+            ds.close()
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(unittest.main())
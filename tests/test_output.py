@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_output
+----------------------------------
+
+Tests for `pysnobal.output.OutputWriter`.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import netCDF4 as nc
+import numpy as np
+
+from pysnobal import ipysnobal
+from pysnobal.c_snobal import snobal
+from pysnobal.output import (EM_OUT, PACKED_RANGE, SNOW_OUT, OutputWriter,
+                             chunk_shape, output_encoding)
+
+
+class TestOutputWriter(unittest.TestCase):
+
+    nsteps = 11
+    shape = (12, 15)
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.start = datetime(2017, 1, 1)
+        self.init = {'x': np.arange(self.shape[1]),
+                     'y': np.arange(self.shape[0])}
+
+        rng = np.random.RandomState(0)
+        self.states = [{key: rng.uniform(250, 280, self.shape)
+                        for key in snobal.STATE_FIELDS}
+                       for i in range(self.nsteps)]
+        self.times = [self.start + timedelta(hours=i + 1)
+                      for i in range(self.nsteps)]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def create(self, name, **output):
+        location = os.path.join(self.tmp, name)
+        os.mkdir(location)
+        output['location'] = location
+        options = {'output': output,
+                   'time': {'start_date': self.start}}
+        ipysnobal.output_files(options, self.init)
+        return options
+
+    def read(self, options):
+        out = {}
+        for f in ['em', 'snow']:
+            options['output'][f].close()
+            ds = nc.Dataset(os.path.join(options['output']['location'],
+                                         f + '.nc'))
+            for key in ['time'] + list(EM_OUT if f == 'em' else SNOW_OUT):
+                out[f, key] = ds.variables[key][:]
+            ds.close()
+        return out
+
+    def test_matches_output_timestep(self):
+        """ The files are the same as from output_timestep """
+
+        options = self.create('expected')
+        for s, t in zip(self.states, self.times):
+            ipysnobal.output_timestep(s, t, options)
+        expected = self.read(options)
+
+        for buffer_size, sync_interval in [(1, None), (4, 3), (24, 0)]:
+            options = self.create('writer_%d' % buffer_size)
+            with OutputWriter(options['output']['em'],
+                              options['output']['snow'], buffer_size,
+                              sync_interval) as writer:
+                for s, t in zip(self.states, self.times):
+                    writer.write(s, t)
+            self.assertEqual(writer.nsteps, self.nsteps)
+
+            out = self.read(options)
+            self.assertEqual(sorted(out), sorted(expected))
+            for key, value in expected.items():
+                np.testing.assert_array_equal(out[key], value, err_msg=key)
+
+    def test_start_index(self):
+        """ The output starts at start_index, as for a restart """
+
+        options = self.create('restart')
+        em, snow = options['output']['em'], options['output']['snow']
+        with OutputWriter(em, snow, 5) as writer:
+            for s, t in zip(self.states, self.times):
+                writer.write(s, t)
+        with OutputWriter(em, snow, 5, start_index=4) as writer:
+            for s, t in zip(self.states[4:], self.times[4:]):
+                writer.write(s, t)
+
+        out = self.read(options)
+        self.assertEqual(len(out['snow', 'time']), self.nsteps)
+        np.testing.assert_array_equal(out['snow', 'time'],
+                                      np.arange(1, self.nsteps + 1))
+
+    def test_write_error(self):
+        """ An error in the writer thread is raised by close """
+
+        options = self.create('error')
+        writer = OutputWriter(options['output']['em'],
+                              options['output']['snow'], 2)
+        options['output']['snow'].close()
+        writer.write(self.states[0], self.times[0])
+        writer.write(self.states[1], self.times[1])
+        with self.assertRaises(Exception):
+            writer.close()
+        options['output']['em'].close()
+
+    def test_chunks(self):
+        """ The chunks are a day by a tile that fits the grid """
+
+        self.assertEqual(chunk_shape((3000, 3000)), (24, 104, 104))
+        self.assertEqual(chunk_shape((3000, 3000), 8, 2 ** 22), (8, 334, 334))
+        self.assertEqual(chunk_shape((500, 200)), (24, 100, 100))
+        self.assertEqual(chunk_shape((5, 200)), (24, 5, 100))
+
+        kwargs, packed = output_encoding({'frequency': 3}, (100, 100))
+        self.assertEqual(kwargs, {'chunksizes': (8, 100, 100)})
+        self.assertFalse(packed)
+
+        kwargs, packed = output_encoding(
+            {'chunks': (1, 50, 50), 'compression': 4, 'packing': True},
+            (20, 100))
+        self.assertEqual(kwargs, {'chunksizes': (1, 20, 50), 'zlib': True,
+                                  'complevel': 4, 'shuffle': True})
+        self.assertTrue(packed)
+
+    def test_compressed_packed(self):
+        """ Packed values are within half a step of the floats """
+
+        options = self.create('expected')
+        with OutputWriter(options['output']['em'],
+                          options['output']['snow']) as writer:
+            for s, t in zip(self.states, self.times):
+                writer.write(s, t)
+        expected = self.read(options)
+
+        options = self.create('packed', compression=4, packing=True)
+        var = options['output']['snow'].variables['thickness']
+        self.assertEqual(var.dtype, np.int16)
+        self.assertTrue(var.filters()['zlib'])
+        with OutputWriter(options['output']['em'],
+                          options['output']['snow']) as writer:
+            for s, t in zip(self.states, self.times):
+                writer.write(s, t)
+        out = self.read(options)
+
+        for (f, key), value in expected.items():
+            if key == 'time':
+                np.testing.assert_array_equal(out[f, key], value)
+                continue
+            lo, hi = PACKED_RANGE[key]
+            step = (hi - lo) / (2 ** 16 - 2)
+            np.testing.assert_allclose(out[f, key], np.clip(value, lo, hi),
+                                       rtol=0, atol=step / 2 + 1e-4 * step,
+                                       err_msg=key)
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(unittest.main())
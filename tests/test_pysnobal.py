@@ -8,9 +8,22 @@ test_pysnobal
 Tests for `pysnobal` module.
 """
 
+import io
+import os
+import shutil
+import tempfile
 import unittest
 
+import numpy as np
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 from pysnobal import pysnobal
+from pysnobal.c_snobal import snobal
+from tests import helpers
 
 
 class TestPysnobal(unittest.TestCase):
@@ -25,6 +38,113 @@ class TestPysnobal(unittest.TestCase):
         pass
 
 
+class TestRunPoint(unittest.TestCase):
+
+    nsteps = 400
+
+    def setUp(self):
+        self.force = helpers.point_forcing(self.nsteps)
+        state = helpers.init_state()
+        # the pixel with a two layer snowpack
+        self.init = {key: value[0, 2] for key, value in state.items()
+                     if key != 'mask'}
+
+    def test_matches_grid(self):
+        """ run_point gives the state from stepping the grid """
+
+        out = pysnobal.run_point(self.force, self.init, helpers.PARAMS,
+                                 helpers.TSTEP_INFO, helpers.MH)
+        self.assertEqual(sorted(out), sorted(snobal.OUTPUT_FIELDS))
+
+        init = {key: np.full((1, 1), value)
+                for key, value in self.init.items()}
+        grid = snobal.SnobalGrid(init, helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS)
+        for i in range(self.nsteps):
+            rt = grid.step(helpers.grid_record(self.force, i, (1, 1)),
+                           helpers.grid_record(self.force, i + 1, (1, 1)),
+                           first_step=int(i == 0))
+            self.assertEqual(rt, -1)
+            for key in snobal.OUTPUT_FIELDS:
+                if key != 'time_since_out':
+                    self.assertEqual(out[key][i], grid[key][0, 0], key)
+            grid.output_rec['time_since_out'][:] = 0
+
+        self.assertTrue(np.any(out['m_s'] > 0))
+
+    def test_frequency(self):
+        """ Output at a frequency as a DataFrame """
+
+        out = pysnobal.run_point(self.force, self.init, helpers.PARAMS,
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 output_frequency=24, fields=['z_s', 'm_s'],
+                                 as_dataframe=True)
+        every = pysnobal.run_point(self.force, self.init, helpers.PARAMS,
+                                   helpers.TSTEP_INFO, helpers.MH)
+
+        self.assertEqual(list(out.columns), ['z_s', 'm_s'])
+        self.assertEqual(list(out.index), list(range(24, self.nsteps + 1, 24)))
+        np.testing.assert_array_equal(out['m_s'], every['m_s'][23::24])
+
+    def test_output_point(self):
+        """ The output file is the same as from output_timestep """
+
+        out = pysnobal.run_point(self.force, self.init, helpers.PARAMS,
+                                 helpers.TSTEP_INFO, helpers.MH)
+
+        f = io.StringIO()
+        pysnobal.output_point(out, f)
+
+        expected = io.StringIO()
+        params = {'out_file': expected, 'temps_in_C': True}
+        for i in range(self.nsteps):
+            pysnobal.output_timestep(
+                {key: value[i:i + 1] for key, value in out.items()}, params)
+
+        self.assertEqual(f.getvalue(), expected.getvalue())
+
+
+class TestLoadTable(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp, 'snobal.data.input')
+        shutil.copy(os.path.join(helpers.TEST_DATA,
+                                 'snobal.data.input.short'), self.filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_matches_loadtxt(self):
+        """ The values are the same as np.loadtxt """
+
+        expected = np.loadtxt(self.filename)
+        data = pysnobal.load_table(self.filename, 6, cache=False)
+        np.testing.assert_array_equal(data, expected)
+        self.assertEqual(os.listdir(self.tmp), ['snobal.data.input'])
+
+    def test_cache(self):
+        """ The cache is read until the file changes """
+
+        data = pysnobal.load_table(self.filename, 6)
+        cached = pysnobal.cache_file(self.filename)
+        self.assertTrue(os.path.isfile(cached))
+
+        with mock.patch('pandas.read_csv') as read_csv:
+            np.testing.assert_array_equal(
+                pysnobal.load_table(self.filename, 6), data)
+            read_csv.assert_not_called()
+
+        with open(self.filename, 'a') as f:
+            f.write('1 2 3 4 5 6\n')
+        data = pysnobal.load_table(self.filename, 6)
+        np.testing.assert_array_equal(data[-1], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(sorted(os.listdir(self.tmp)),
+                         sorted(['snobal.data.input',
+                                 os.path.basename(
+                                     pysnobal.cache_file(self.filename))]))
+
+
 if __name__ == '__main__':
     import sys
     sys.exit(unittest.main())
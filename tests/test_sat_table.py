@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_sat_table
+----------------------------------
+
+Tests for the saturation vapor pressures in the C core and the tables
+a grid uses with sat_table in its parameters.
+"""
+
+import unittest
+
+import numpy as np
+
+from pysnobal import vector
+from pysnobal.c_snobal import snobal
+from tests import helpers
+
+
+class TestSatTable(unittest.TestCase):
+
+    nsteps = 400
+    shape = (2, 3)
+
+    def run_block(self, block, sat_table=False):
+        grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 dict(helpers.PARAMS, sat_table=sat_table))
+        rt = grid.run_block(block, first_step=1)
+        return rt, grid
+
+    def forcing_block(self):
+        force = helpers.point_forcing(self.nsteps)
+        return {key: np.stack([value[i] * np.ones(self.shape)
+                               for i in range(self.nsteps + 1)])
+                for key, value in force.items()}
+
+    def test_formulas(self):
+        """ Without the tables sati and satw are the formulas """
+
+        tk = np.linspace(200, 330, 1001)
+        np.testing.assert_allclose(snobal.sati(tk), vector.sati(tk),
+                                   rtol=1e-13)
+        np.testing.assert_allclose(snobal.satw(tk), vector.satw(tk),
+                                   rtol=1e-13)
+
+    def test_accuracy(self):
+        """ The tables are within 1e-9 of the formulas """
+
+        tk = np.linspace(200, 330, 100001)
+        expected = [snobal.sati(tk), snobal.satw(tk)]
+
+        np.testing.assert_allclose(snobal.sati(tk, table=True), expected[0],
+                                   rtol=1e-9)
+        np.testing.assert_allclose(snobal.satw(tk, table=True), expected[1],
+                                   rtol=1e-9)
+
+        # outside of the tables the formulas are used
+        tk = np.array([100.0, 400.0])
+        np.testing.assert_array_equal(snobal.sati(tk, table=True),
+                                      snobal.sati(tk))
+        np.testing.assert_array_equal(snobal.satw(tk, table=True),
+                                      snobal.satw(tk))
+
+    def test_bad_temperature(self):
+        """ A temperature that isn't positive returns 0 """
+
+        for on in [False, True]:
+            np.testing.assert_array_equal(snobal.sati([-1.0, 0.0], on), 0)
+            np.testing.assert_array_equal(snobal.satw([-1.0, 0.0], on), 0)
+
+    def test_bad_pixel(self):
+        """ A bad temperature fails the pixel instead of the process """
+
+        block = self.forcing_block()
+        block['T_a'][:, 0, 1] = -1.0
+        rt, grid = self.run_block(block)
+        self.assertEqual(rt, 1)
+
+        # one data timestep at a time
+        input1 = {key: value[0] for key, value in block.items()}
+        input2 = {key: value[1] for key, value in block.items()}
+        grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS)
+        self.assertEqual(grid.step(input1, input2, first_step=1), 1)
+
+        rt = snobal.do_tstep_grid(input1, input2,
+                                  helpers.output_rec(self.shape),
+                                  helpers.TSTEP_INFO, helpers.MH,
+                                  helpers.PARAMS)
+        self.assertEqual(rt, 1)
+
+    def test_bad_soil_temperature(self):
+        """ A bad soil temperature fails the pixel in the conduction """
+
+        for on in [False, True]:
+            block = self.forcing_block()
+            block['T_g'][:, 1, 0] = -1.0
+            rt, grid = self.run_block(block, sat_table=on)
+            self.assertEqual(rt, 3)
+
+    def test_model(self):
+        """ The model results are close with the tables """
+
+        block = self.forcing_block()
+        rt, expected = self.run_block(block)
+        self.assertEqual(rt, -1)
+
+        rt, grid = self.run_block(block, sat_table=True)
+        self.assertEqual(rt, -1)
+        for key in ['z_s', 'm_s', 'T_s_0', 'melt_sum', 'E_s_sum']:
+            np.testing.assert_allclose(grid[key], expected[key], rtol=1e-5,
+                                       atol=1e-6, err_msg=key)
+
+    def test_per_grid(self):
+        """ The tables of one grid don't change another grid """
+
+        block = self.forcing_block()
+        rt, expected = self.run_block(block)
+        self.assertEqual(rt, -1)
+
+        tables = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                   helpers.TSTEP_INFO, helpers.MH,
+                                   dict(helpers.PARAMS, sat_table=True))
+        self.assertEqual(tables.run_block(block, first_step=1), -1)
+        rt, grid = self.run_block(block)
+        self.assertEqual(rt, -1)
+        for key in snobal.OUTPUT_FIELDS:
+            np.testing.assert_array_equal(grid[key], expected[key],
+                                          err_msg=key)
+        self.assertFalse(np.array_equal(tables['m_s'], expected['m_s']))
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(unittest.main())
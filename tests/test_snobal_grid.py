@@ -0,0 +1,603 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_snobal_grid
+----------------------------------
+
+Tests for the grid engine in `pysnobal.c_snobal.snobal`.
+"""
+
+import threading
+import unittest
+
+import numpy as np
+
+from pysnobal.c_snobal import engine, snobal
+from pysnobal.timing import RunStats
+from tests import helpers
+
+
+class TestSnobalGrid(unittest.TestCase):
+
+    nsteps = 400
+    shape = (2, 3)
+
+    def setUp(self):
+        self.force = helpers.point_forcing(self.nsteps)
+
+    def run_do_tstep_grid(self):
+        s = helpers.output_rec(self.shape)
+        history = []
+        for i in range(self.nsteps):
+            rt = snobal.do_tstep_grid(
+                helpers.grid_record(self.force, i, self.shape),
+                helpers.grid_record(self.force, i + 1, self.shape),
+                s, helpers.TSTEP_INFO, helpers.MH, helpers.PARAMS,
+                first_step=int(i == 0))
+            self.assertEqual(rt, -1)
+            history.append({key: s[key].copy() for key in s})
+            s['time_since_out'][:] = 0
+        return history
+
+    def test_step_matches_do_tstep_grid(self):
+        """ SnobalGrid.step gives the same state as do_tstep_grid """
+
+        expected = self.run_do_tstep_grid()
+
+        grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS)
+        for i in range(self.nsteps):
+            rt = grid.step(helpers.grid_record(self.force, i, self.shape),
+                           helpers.grid_record(self.force, i + 1, self.shape),
+                           first_step=int(i == 0))
+            self.assertEqual(rt, -1)
+            for key in snobal.STATE_FIELDS:
+                np.testing.assert_array_equal(grid[key], expected[i][key],
+                                              err_msg=key)
+            grid.output_rec['time_since_out'][:] = 0
+
+        # the snowpack should have changed over the run
+        self.assertTrue(np.any(grid['m_s'] > 0))
+
+    def test_run_block_matches_step(self):
+        """ SnobalGrid.run_block gives the same results as stepping """
+
+        frequency = 3
+        expected = self.run_do_tstep_grid()
+
+        grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS, nthreads=2)
+        block = {key: np.stack([value[i] * np.ones(self.shape)
+                                for i in range(self.nsteps + 1)])
+                 for key, value in self.force.items()}
+        steps = snobal.output_steps(self.nsteps, frequency)
+        outputs = {key: np.zeros((len(steps),) + self.shape,
+                                 dtype=snobal.state_dtype(key))
+                   for key in ['z_s', 'm_s', 'T_s_0', 'layer_count',
+                               'melt_sum', 'R_n_bar', 'time_since_out']}
+
+        # run in two blocks with the output frequency counted across them
+        half = 150
+        nout = len(snobal.output_steps(half, frequency))
+        rt = grid.run_block({k: v[:half + 1] for k, v in block.items()},
+                            {k: v[:nout] for k, v in outputs.items()},
+                            frequency, first_step=1)
+        self.assertEqual(rt, -1)
+        rt = grid.run_block({k: v[half:] for k, v in block.items()},
+                            {k: v[nout:] for k, v in outputs.items()},
+                            frequency, step_offset=half)
+        self.assertEqual(rt, -1)
+
+        # the time since output is reset at the output timesteps in the
+        # stepped run, so compare the sums and averages at those only
+        for k, t in enumerate(steps):
+            for key, value in outputs.items():
+                if key in ['melt_sum', 'R_n_bar', 'time_since_out']:
+                    continue
+                np.testing.assert_array_equal(value[k], expected[t][key],
+                                              err_msg=key)
+        mask = grid['mask'] == 1
+        self.assertTrue(np.all(outputs['time_since_out'][:, mask] ==
+                               frequency * helpers.TSTEP_INFO[0]['time_step']))
+        np.testing.assert_array_equal(grid['z_s'], expected[-1]['z_s'])
+
+    def test_run_block_every_step(self):
+        """ EVERY_STEP gives the state of stepping with first_step=1 """
+
+        frequency = 3
+        s = helpers.output_rec(self.shape)
+        expected = []
+        for i in range(self.nsteps):
+            rt = snobal.do_tstep_grid(
+                helpers.grid_record(self.force, i, self.shape),
+                helpers.grid_record(self.force, i + 1, self.shape),
+                s, helpers.TSTEP_INFO, helpers.MH, helpers.PARAMS,
+                first_step=1)
+            self.assertEqual(rt, -1)
+            expected.append({key: s[key].copy() for key in s})
+            if (i + 1) % frequency == 0:
+                s['time_since_out'][:] = 0
+
+        grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS)
+        block = {key: np.stack([value[i] * np.ones(self.shape)
+                                for i in range(self.nsteps + 1)])
+                 for key, value in self.force.items()}
+        steps = snobal.output_steps(self.nsteps, frequency)
+        outputs = {key: np.zeros((len(steps),) + self.shape,
+                                 dtype=snobal.state_dtype(key))
+                   for key in snobal.OUTPUT_FIELDS}
+        rt = grid.run_block(block, outputs, frequency, snobal.EVERY_STEP)
+        self.assertEqual(rt, -1)
+
+        for k, t in enumerate(steps):
+            for key, value in outputs.items():
+                np.testing.assert_array_equal(value[k], expected[t][key],
+                                              err_msg=key)
+
+    def test_run_block_outputs(self):
+        """ The output buffers must be writeable state arrays """
+
+        grid = snobal.SnobalGrid(helpers.init_state(self.shape),
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS)
+        block = {key: np.stack([value[i] * np.ones(self.shape)
+                                for i in range(5)])
+                 for key, value in self.force.items()}
+
+        for outputs in [{'z_s': np.zeros((4,) + self.shape, np.float32)},
+                        {'z_s': np.zeros((3,) + self.shape)},
+                        {'elevation': np.zeros((4,) + self.shape)}]:
+            with self.assertRaises(ValueError):
+                grid.run_block(block, outputs)
+
+        outputs = {'z_s': np.full((4,) + self.shape, -1.0)}
+        self.assertEqual(grid.run_block(block, outputs, first_step=1), -1)
+
+        # the masked pixel keeps its initial state
+        self.assertTrue(np.all(outputs['z_s'][:, -1, -1] ==
+                               helpers.init_state(self.shape)['z_s'][-1, -1]))
+        self.assertTrue(np.all(outputs['z_s'] >= 0))
+
+    def test_active_pixels(self):
+        """ Running only the active pixels doesn't change the results """
+
+        # no precipitation on the first row so the bare ground stays bare
+        block = {key: np.stack([value[i] * np.ones(self.shape)
+                                for i in range(self.nsteps + 1)])
+                 for key, value in self.force.items()}
+        block['m_pp'][:, 0, :] = 0
+        steps = snobal.output_steps(self.nsteps, 5)
+
+        results = []
+        for compact in [False, True]:
+            grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                     helpers.TSTEP_INFO, helpers.MH,
+                                     helpers.PARAMS, compact=compact)
+            outputs = {key: np.zeros((len(steps),) + self.shape,
+                                     dtype=snobal.state_dtype(key))
+                       for key in snobal.OUTPUT_FIELDS}
+            n_active = []
+            for i in range(0, self.nsteps, 50):
+                rt = grid.run_block(
+                    {k: v[i:i + 51] for k, v in block.items()},
+                    {k: v[i // 5:(i + 50) // 5] for k, v in outputs.items()},
+                    5, first_step=int(i == 0), step_offset=i)
+                self.assertEqual(rt, -1)
+                n_active.append(grid.n_active)
+            for i in range(self.nsteps):
+                grid.step({k: v[i] for k, v in block.items()},
+                          {k: v[i + 1] for k, v in block.items()})
+            results.append((outputs, grid.output_rec, n_active))
+
+        (full, full_state, full_active), (compact, state, active) = results
+        for key in snobal.OUTPUT_FIELDS:
+            np.testing.assert_array_equal(compact[key], full[key],
+                                          err_msg=key)
+            np.testing.assert_array_equal(state[key], full_state[key],
+                                          err_msg=key)
+
+        self.assertTrue(all(n == 5 for n in full_active))
+        self.assertLess(min(active), 5)
+
+    def test_compact_layout(self):
+        """ The compact state has the same snowpack as the full state """
+
+        # the first row is bare ground for the bookkeeping of bare_ground
+        block = {key: np.stack([value[i] * np.ones(self.shape)
+                                for i in range(self.nsteps + 1)])
+                 for key, value in self.force.items()}
+        block['m_pp'][:, 0, :] = 0
+        steps = snobal.output_steps(self.nsteps, 5)
+
+        results = {}
+        for layout in snobal.LAYOUTS:
+            grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                     helpers.TSTEP_INFO, helpers.MH,
+                                     helpers.PARAMS, layout=layout)
+            outputs = {key: np.zeros((len(steps),) + self.shape,
+                                     dtype=snobal.state_dtype(key, layout))
+                       for key in snobal.OUTPUT_FIELDS}
+            for i in range(0, self.nsteps, 50):
+                rt = grid.run_block(
+                    {k: v[i:i + 51] for k, v in block.items()},
+                    {k: v[i // 5:(i + 50) // 5] for k, v in outputs.items()},
+                    5, first_step=int(i == 0), step_offset=i)
+                self.assertEqual(rt, -1)
+            for i in range(20):
+                grid.step({k: v[i] for k, v in block.items()},
+                          {k: v[i + 1] for k, v in block.items()})
+            results[layout] = (outputs, grid)
+
+        (full, full_grid), (compact, grid) = results['full'], \
+            results['compact']
+        for key in snobal.STATE_FIELDS:
+            self.assertEqual(grid[key].dtype,
+                             snobal.state_dtype(key, 'compact'))
+            if key in snobal.DIAGNOSTIC_FIELDS:
+                np.testing.assert_allclose(compact[key], full[key],
+                                           rtol=1e-5, atol=1e-6, err_msg=key)
+                np.testing.assert_allclose(grid[key], full_grid[key],
+                                           rtol=1e-5, atol=1e-6, err_msg=key)
+            else:
+                if key in compact:
+                    np.testing.assert_array_equal(compact[key], full[key],
+                                                  err_msg=key)
+                np.testing.assert_array_equal(grid[key], full_grid[key],
+                                              err_msg=key)
+        self.assertTrue(np.any(full['melt_sum'] > 0))
+
+        # the memory report matches the arrays
+        for layout, (_, g) in results.items():
+            nbytes = snobal.state_nbytes(self.shape, layout)
+            self.assertEqual(sum(nbytes.values()), g.nbytes)
+            for key, value in nbytes.items():
+                self.assertEqual(value, g[key].nbytes)
+        self.assertLess(grid.nbytes, full_grid.nbytes)
+
+        with self.assertRaises(ValueError):
+            snobal.SnobalGrid(helpers.output_rec(self.shape),
+                              helpers.TSTEP_INFO, helpers.MH,
+                              helpers.PARAMS, layout='half')
+
+    def test_schedules(self):
+        """ The state doesn't depend on the schedule or the threads """
+
+        shape = (4, 9)
+        block = {key: np.stack([value[i] * np.ones(shape)
+                                for i in range(101)])
+                 for key, value in self.force.items()}
+        block['m_pp'][:, 0, :] = 0
+
+        results = []
+        for schedule in snobal.SCHEDULES:
+            for nthreads in [1, 3]:
+                grid = snobal.SnobalGrid(helpers.output_rec(shape),
+                                         helpers.TSTEP_INFO, helpers.MH,
+                                         helpers.PARAMS, nthreads,
+                                         schedule=schedule, chunk_size=2)
+                self.assertEqual(grid.schedule, schedule)
+                cost = []
+                for i in range(0, 100, 25):
+                    rt = grid.run_block(
+                        {k: v[i:i + 26] for k, v in block.items()},
+                        first_step=int(i == 0))
+                    self.assertEqual(rt, -1)
+                    cost.append(grid.cost.copy())
+                z_s = grid['z_s'].copy()
+                for i in range(10):
+                    self.assertEqual(
+                        grid.step({k: v[i] for k, v in block.items()},
+                                  {k: v[i + 1] for k, v in block.items()}),
+                        -1)
+                results.append((grid, cost, z_s))
+
+        expected, expected_cost, z_s = results[0]
+        for grid, cost, _ in results[1:]:
+            for key in snobal.STATE_FIELDS:
+                np.testing.assert_array_equal(grid[key], expected[key],
+                                              err_msg=key)
+            np.testing.assert_array_equal(cost, expected_cost)
+
+        # the pixels with snow take at least one run timestep, the thin
+        # snowpacks more, bare ground and the masked pixels none
+        mask = expected['mask'] == 1
+        cost = expected_cost[-1]
+        self.assertTrue(np.all(cost[mask & (z_s > 0)] >= 1))
+        self.assertTrue(np.all(cost[~mask] == 0))
+        self.assertTrue(np.any(cost[mask] == 0))
+        self.assertGreater(np.max(expected_cost), 1)
+
+        with self.assertRaises(ValueError):
+            expected.schedule = 'static'
+        with self.assertRaises(ValueError):
+            expected.chunk_size = 0
+
+    def test_do_tstep_grid_failure(self):
+        """ The state is copied back when a pixel fails """
+
+        input1 = helpers.grid_record(self.force, 0, self.shape)
+        input2 = helpers.grid_record(self.force, 1, self.shape)
+        input1['T_a'][0, 1] = -1.0
+        states = []
+        for order in ['C', 'F']:
+            s = {key: np.asarray(value, order=order)
+                 for key, value in helpers.output_rec(self.shape).items()}
+            rt = snobal.do_tstep_grid(input1, input2, s, helpers.TSTEP_INFO,
+                                      helpers.MH, helpers.PARAMS)
+            self.assertEqual(rt, 1)
+            states.append(s)
+
+        for key in snobal.STATE_FIELDS:
+            np.testing.assert_array_equal(states[1][key], states[0][key],
+                                          err_msg=key)
+        # the pixels before the failed one did run
+        self.assertGreater(states[1]['current_time'][0, 0], 0)
+
+    def test_stats(self):
+        """ The timings and counters add up over the calls """
+
+        grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS)
+        s = helpers.output_rec(self.shape)
+        stats = RunStats()
+
+        total = RunStats()
+        for i in range(50):
+            input1 = helpers.grid_record(self.force, i, self.shape)
+            input2 = helpers.grid_record(self.force, i + 1, self.shape)
+            grid.step(input1, input2, first_step=int(i == 0))
+            snobal.do_tstep_grid(input1, input2, s, helpers.TSTEP_INFO,
+                                 helpers.MH, helpers.PARAMS,
+                                 first_step=int(i == 0), stats=stats)
+            s['time_since_out'][:] = 0
+            grid.output_rec['time_since_out'][:] = 0
+
+            last = grid.last_stats
+            self.assertEqual(last.calls, {'marshal': 1, 'kernel': 1})
+            self.assertEqual(last.counts['data_tsteps'], 1)
+            # every active pixel divides the data timestep once
+            self.assertEqual(last.counts['divide_tstep_0'], grid.n_active)
+            total.merge(last)
+
+        self.assertEqual(grid.stats.counts, total.counts)
+        self.assertEqual(grid.stats.calls, {'marshal': 50, 'kernel': 50})
+        self.assertEqual(stats.counts, total.counts)
+        self.assertEqual(set(stats.wall), {'marshal', 'kernel', 'copy_back'})
+
+        counts = total.counts
+        self.assertGreater(counts['do_tstep_3'], 0)
+        self.assertGreaterEqual(counts['hle1_iter'], counts['hle1_calls'])
+        self.assertEqual(counts['hle1_fail'], 0)
+
+        # the bare pixels are only skipped between blocks, so check the
+        # block by its counts of data timesteps
+        block = {key: np.stack([value[i] * np.ones(self.shape)
+                                for i in range(51)])
+                 for key, value in self.force.items()}
+        grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS)
+        self.assertEqual(grid.run_block(block, first_step=1), -1)
+        counts = grid.last_stats.counts
+        self.assertEqual(counts['data_tsteps'], 50)
+        self.assertEqual(counts['divide_tstep_0'], 50 * grid.shape[0] *
+                         grid.shape[1] - 50)
+        self.assertGreaterEqual(counts['hle1_iter'], counts['hle1_calls'])
+        self.assertIn('hle1_iter', grid.stats.summary())
+
+    def test_hle1_warm_start(self):
+        """ The warm start of hle1 takes fewer iterations, same results """
+
+        block = {key: np.stack([value[i] * np.ones(self.shape)
+                                for i in range(self.nsteps + 1)])
+                 for key, value in self.force.items()}
+        grids = []
+        for on in [False, True]:
+            grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                     helpers.TSTEP_INFO, helpers.MH,
+                                     dict(helpers.PARAMS, hle1_warm_start=on))
+            self.assertEqual(grid.run_block(block, first_step=1), -1)
+            grids.append(grid)
+
+        expected, grid = grids
+        counts = [g.last_stats.counts for g in grids]
+        self.assertEqual(counts[1]['hle1_calls'], counts[0]['hle1_calls'])
+        self.assertLess(counts[1]['hle1_iter'], counts[0]['hle1_iter'])
+
+        # the iterations of each pixel
+        for g, c in zip(grids, counts):
+            self.assertEqual(g.hle1_iter.shape, self.shape)
+            self.assertEqual(g.hle1_iter.sum(), c['hle1_iter'])
+        self.assertTrue(np.all(grid.hle1_iter <= expected.hle1_iter))
+        self.assertEqual(grid.hle1_iter[-1, -1], 0)     # masked
+
+        for key in ['z_s', 'm_s', 'T_s_0', 'H_bar', 'L_v_E_bar', 'melt_sum',
+                    'E_s_sum']:
+            np.testing.assert_allclose(grid[key], expected[key], rtol=1e-5,
+                                       atol=1e-6, err_msg=key)
+
+    def test_state_views(self):
+        """ The state is exposed as contiguous views that can't be replaced """
+
+        grid = snobal.SnobalGrid(helpers.init_state(self.shape),
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS)
+        for key in snobal.STATE_FIELDS:
+            arr = grid.output_rec[key]
+            self.assertEqual(arr.shape, self.shape)
+            self.assertEqual(arr.dtype, snobal.state_dtype(key))
+            self.assertTrue(arr.flags['C_CONTIGUOUS'])
+            self.assertIs(arr, grid[key])
+
+        with self.assertRaises(TypeError):
+            grid.output_rec['z_s'] = np.zeros(self.shape)
+
+    def test_concurrent_runs(self):
+        """ Grids run in separate threads give the same results """
+
+        block = {key: np.stack([value[i] * np.ones(self.shape)
+                                for i in range(self.nsteps + 1)])
+                 for key, value in self.force.items()}
+        # the second run gets more snow
+        blocks = [block, dict(block, m_pp=2 * block['m_pp'])]
+
+        def run(grids, results, k):
+            results[k] = grids[k].run_block(blocks[k], first_step=1)
+
+        expected = []
+        for b in blocks:
+            grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                     helpers.TSTEP_INFO, helpers.MH,
+                                     helpers.PARAMS)
+            self.assertEqual(grid.run_block(b, first_step=1), -1)
+            expected.append(grid)
+
+        grids = [snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                   helpers.TSTEP_INFO, helpers.MH,
+                                   helpers.PARAMS, nthreads=2)
+                 for b in blocks]
+        results = [None, None]
+        threads = [threading.Thread(target=run, args=(grids, results, k))
+                   for k in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(results, [-1, -1])
+        for grid, exp in zip(grids, expected):
+            for key in snobal.STATE_FIELDS:
+                np.testing.assert_array_equal(grid[key], exp[key],
+                                              err_msg=key)
+        self.assertFalse(np.array_equal(grids[0]['m_s'], grids[1]['m_s']))
+
+    def test_ensemble(self):
+        """ Each member of an ensemble is the same as a run on its own """
+
+        members = 3
+        block = {key: np.stack([value[i] * np.ones(self.shape)
+                                for i in range(101)])
+                 for key, value in self.force.items()}
+        # no snow, the forcing and twice the precipitation
+        scale = [0.0, 1.0, 2.0]
+
+        # the static fields differ between the pixels
+        def init():
+            s = helpers.output_rec(self.shape)
+            s['elevation'] = s['elevation'] + np.reshape(
+                np.arange(s['elevation'].size) * 100.0, self.shape)
+            s['z_0'] = s['z_0'] * np.reshape(
+                np.arange(1, s['z_0'].size + 1), self.shape)
+            return s
+
+        expected = []
+        for k in range(members):
+            grid = snobal.SnobalGrid(init(),
+                                     helpers.TSTEP_INFO, helpers.MH,
+                                     helpers.PARAMS)
+            member = dict(block, m_pp=block['m_pp'] * scale[k])
+            self.assertEqual(grid.run_block(member, first_step=1), -1)
+            expected.append(grid)
+
+        grid = snobal.SnobalGrid(init(), helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS, 2, members=members)
+        self.assertEqual(grid.members, members)
+        self.assertEqual(grid.shape, (members,) + self.shape)
+        ensemble = {key: np.stack([value] * members, axis=1)
+                    for key, value in block.items()}
+        ensemble['m_pp'] *= np.reshape(scale, (1, members, 1, 1))
+        self.assertEqual(grid.run_block(ensemble, first_step=1), -1)
+
+        for key in snobal.STATE_FIELDS:
+            if key in snobal.STATIC_FIELDS:
+                self.assertEqual(grid[key].shape, self.shape)
+                continue
+            for k in range(members):
+                np.testing.assert_array_equal(grid[key][k],
+                                              expected[k][key],
+                                              err_msg=key)
+        self.assertFalse(np.array_equal(grid['m_s'][1], grid['m_s'][2]))
+
+        # the static fields are only stored once
+        single = snobal.state_nbytes(self.shape)
+        nbytes = snobal.state_nbytes(self.shape, members=members)
+        for key, value in nbytes.items():
+            k = 1 if key in snobal.STATIC_FIELDS else members
+            self.assertEqual(value, k * single[key], msg=key)
+
+    def test_float32_forcing(self):
+        """ Single precision forcing is the same as widened to float64 """
+
+        block = {key: np.stack([value[i] * np.ones(self.shape)
+                                for i in range(101)]).astype(np.float32)
+                 for key, value in self.force.items()}
+        # the temperatures stay float64 as in the ForcingReader
+        for key in ['T_a', 'T_g', 'T_pp']:
+            block[key] = block[key].astype(np.float64)
+
+        results = []
+        for forcing in [block, {key: value.astype(np.float64)
+                                for key, value in block.items()}]:
+            grid = snobal.SnobalGrid(helpers.output_rec(self.shape),
+                                     helpers.TSTEP_INFO, helpers.MH,
+                                     helpers.PARAMS)
+            self.assertEqual(grid.run_block(
+                {k: v[:51] for k, v in forcing.items()}, first_step=1), -1)
+            for i in range(50, 100):
+                self.assertEqual(
+                    grid.step({k: v[i] for k, v in forcing.items()},
+                              {k: v[i + 1] for k, v in forcing.items()}),
+                    -1)
+            results.append(grid)
+
+        for key in snobal.STATE_FIELDS:
+            np.testing.assert_array_equal(results[0][key], results[1][key],
+                                          err_msg=key)
+        self.assertTrue(np.any(results[0]['m_s'] > 0))
+
+    def test_forcing_size(self):
+        """ Forcing that doesn't match the grid raises an error """
+
+        grid = snobal.SnobalGrid(helpers.init_state(self.shape),
+                                 helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS)
+        with self.assertRaises(ValueError):
+            grid.step(helpers.grid_record(self.force, 0, (3, 3)),
+                      helpers.grid_record(self.force, 1, (3, 3)))
+
+    def test_single_precision(self):
+        """ The single precision build is close to double """
+
+        block = {key: value[:, None, None] * np.ones(self.shape)
+                 for key, value in self.force.items()}
+        results = []
+        for precision in ['double', 'single']:
+            grid = engine(precision).SnobalGrid(
+                helpers.output_rec(self.shape), helpers.TSTEP_INFO,
+                helpers.MH, helpers.PARAMS)
+            self.assertEqual(grid.run_block(block, first_step=1), -1)
+            results.append(grid)
+
+        double, single = results
+        self.assertIsNot(type(single), snobal.SnobalGrid)
+        for key in ['m_s', 'z_s', 'rho', 'T_s', 'melt_sum', 'ro_pred_sum']:
+            self.assertEqual(single[key].dtype, np.float64)
+            np.testing.assert_allclose(single[key], double[key], rtol=1e-4,
+                                       atol=1e-3, err_msg=key)
+        self.assertFalse(np.array_equal(single['m_s'], double['m_s']))
+        np.testing.assert_array_equal(single['layer_count'],
+                                      double['layer_count'])
+
+        with self.assertRaises(ValueError):
+            engine('half')
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(unittest.main())
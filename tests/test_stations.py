@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_stations
+----------------------------------
+
+Tests for `pysnobal.stations`.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import netCDF4 as nc
+import numpy as np
+import pandas as pd
+
+from pysnobal import pysnobal, stations
+from pysnobal.c_snobal import snobal
+
+from tests import helpers
+
+
+class TestStations(unittest.TestCase):
+
+    nsteps = 200
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.force = helpers.point_forcing(self.nsteps)
+        self.times = pd.date_range('2017-01-01', periods=self.nsteps + 1,
+                                   freq='h')
+
+        # the stations differ in their snowpack, heights and forcing
+        self.sites = pd.DataFrame({
+            'station_id': ['a', 'b', 'c', 'd'],
+            'elevation': [2061.0, 1500.0, 2500.0, 3000.0],
+            'z_0': [0.005, 0.01, 0.001, 0.005],
+            'z_u': [5.0, 3.0, 10.0, 6.0],
+            'z_t': [5.0, 2.0, 4.0, 3.0],
+            'z_g': [0.5, 0.3, 0.2, 0.5],
+            'z_s': [0.0, 0.5, 1.5, 2.0],
+            'rho': [0.0, 250.0, 300.0, 350.0],
+            'T_s_0': [-3.0, -2.0, -5.0, -8.0],
+            'T_s': [-4.0, -3.0, -6.0, -9.0],
+            'h2o_sat': [0.0, 0.0, 0.1, 0.0],
+        })
+        self.offset = {'a': 0.0, 'b': 2.0, 'c': -1.5, 'd': -4.0}
+
+        rows = []
+        for station, dT in self.offset.items():
+            df = pd.DataFrame({key: self.force[key]
+                               for key in snobal.FORCING_FIELDS +
+                               snobal.PRECIP_FIELDS})
+            for key in stations.FORCING_CELSIUS:
+                df[key] += dT - helpers.FREEZE
+            df['station_id'] = station
+            df['time'] = self.times
+            rows.append(df)
+        # the long table doesn't need to be sorted
+        self.forcing = pd.concat(rows, ignore_index=True).sample(
+            frac=1, random_state=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write_tables(self):
+        sites = os.path.join(self.tmp, 'sites.csv')
+        forcing = os.path.join(self.tmp, 'forcing.csv')
+        self.sites.to_csv(sites, index=False)
+        self.forcing.to_csv(forcing, index=False)
+        return sites, forcing
+
+    def test_matches_run_point(self):
+        """ Each station is the same as its own run_point """
+
+        sites_file, forcing_file = self.write_tables()
+        sites = stations.read_sites(sites_file)
+        forcing, times = stations.station_forcing(
+            stations.read_forcing(forcing_file), sites.index)
+        self.assertEqual(forcing['T_a'].shape, (self.nsteps + 1, 4, 1))
+        self.assertEqual(list(times), list(self.times.to_pydatetime()))
+
+        out = stations.run_stations(sites, forcing, helpers.PARAMS,
+                                    helpers.TSTEP_INFO)
+
+        for n, (station, site) in enumerate(sites.iterrows()):
+            init = {key: site[key] for key in stations.SITE_FIELDS}
+            mh = {key: site[key] for key in ['z_u', 'z_t', 'z_g']}
+            force = {key: value[:, n, 0] for key, value in forcing.items()}
+            expected = pysnobal.run_point(force, init, helpers.PARAMS,
+                                          helpers.TSTEP_INFO, mh)
+            for key in snobal.OUTPUT_FIELDS:
+                np.testing.assert_array_equal(out[key][:, n], expected[key],
+                                              err_msg=key)
+
+        # the heights do make a difference
+        self.assertFalse(np.array_equal(out['H_bar'][:, 0],
+                                        out['H_bar'][:, 1]))
+
+    def test_write(self):
+        """ The output file has a time series for each station """
+
+        sites_file, forcing_file = self.write_tables()
+        path = os.path.join(self.tmp, 'out.nc')
+        stations.main([sites_file, forcing_file, path, '-f', '24'])
+
+        sites = stations.read_sites(sites_file)
+        forcing, times = stations.station_forcing(
+            stations.read_forcing(forcing_file), sites.index)
+        out = stations.run_stations(sites, forcing, helpers.PARAMS,
+                                    helpers.TSTEP_INFO, output_frequency=24)
+
+        ds = nc.Dataset(path)
+        self.assertEqual(list(ds.variables['station_id'][:]),
+                         ['a', 'b', 'c', 'd'])
+        t = nc.num2date(ds.variables['time'][:], ds.variables['time'].units)
+        self.assertEqual([d.hour for d in t], [0] * (self.nsteps // 24))
+        np.testing.assert_allclose(ds.variables['m_s'][:], out['m_s'],
+                                   rtol=1e-6)
+        np.testing.assert_allclose(ds.variables['T_s'][:],
+                                   out['T_s'] - helpers.FREEZE, rtol=1e-6)
+        ds.close()
+
+    def test_rain_temp(self):
+        """ Rain below freezing is clamped as in pysnobal.open_files """
+
+        self.forcing['m_pp'] = 1.0
+        self.forcing['percent_snow'] = np.where(
+            np.arange(len(self.forcing)) % 2, 1.0, 0.5)
+        self.forcing['T_pp'] = -2.0
+        _, forcing_file = self.write_tables()
+        forcing = stations.read_forcing(forcing_file)
+
+        rain = forcing['percent_snow'] < 1
+        np.testing.assert_array_equal(forcing['T_pp'][rain], helpers.FREEZE)
+        np.testing.assert_allclose(forcing['T_pp'][~rain],
+                                   helpers.FREEZE - 2.0)
+
+    def test_missing_forcing(self):
+        """ A station missing a time is an error """
+
+        c = self.forcing.index[self.forcing['station_id'] == 'c']
+        forcing = self.forcing.drop(c[:1])
+        with self.assertRaises(ValueError):
+            stations.station_forcing(forcing, ['a', 'b', 'c', 'd'])
+
+    def test_heights_size(self):
+        """ Heights for the wrong number of pixels are an error """
+
+        init = {key: np.zeros((2, 3)) for key in ['elevation', 'z_s', 'rho',
+                                                  'T_s_0', 'T_s']}
+        mh = dict(helpers.MH, z_u=np.ones(5))
+        with self.assertRaises(ValueError):
+            snobal.SnobalGrid(init, helpers.TSTEP_INFO, mh, helpers.PARAMS)
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(unittest.main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_sweep
+----------------------------------
+
+Tests for `pysnobal.sweep`.
+"""
+
+import copy
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from pysnobal import pysnobal, sweep
+from pysnobal.c_snobal import snobal
+from tests import helpers
+
+
+class TestSweep(unittest.TestCase):
+
+    nsteps = 400
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.force = helpers.point_forcing(self.nsteps)
+        state = helpers.init_state()
+        self.init = {key: value[0, 2] for key, value in state.items()
+                     if key != 'mask'}
+        self.sets = {'max_h2o_vol': [0.01, 0.05, 0.01, 0.02, 0.01],
+                     'max_z_s_0': [0.25, 0.1, 0.1, 0.25, 0.25],
+                     'small_threshold': [1.0, 1.0, 1.0, 1.0, 3.0]}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def run_point(self, row):
+        params = dict(helpers.PARAMS, max_h2o_vol=row['max_h2o_vol'],
+                      max_z_s_0=row['max_z_s_0'])
+        tstep_info = copy.deepcopy(helpers.TSTEP_INFO)
+        for key, level in sweep.THRESHOLD_LEVELS.items():
+            tstep_info[level]['threshold'] = row[key]
+        return pysnobal.run_point(self.force, self.init, params, tstep_info,
+                                  helpers.MH)
+
+    def test_matches_run_point(self):
+        """ Each column is the run at the point with its parameters """
+
+        fields = ['m_s', 'z_s', 'h2o']
+        sets, out = sweep.run_sweep(self.force, self.init, helpers.MH,
+                                    helpers.PARAMS, helpers.TSTEP_INFO,
+                                    self.sets, fields, batch_size=2,
+                                    block_size=150)
+        self.assertEqual(list(sets.columns), sweep.SWEEP_FIELDS)
+        self.assertEqual(list(sets['medium_threshold']), [10.0] * 5)
+
+        for k, row in sets.iterrows():
+            expected = self.run_point(row)
+            for key in fields:
+                self.assertEqual(out[key].shape, (self.nsteps, 5))
+                np.testing.assert_array_equal(out[key][:, k], expected[key],
+                                              err_msg=key)
+        self.assertFalse(np.array_equal(out['h2o'][:, 0], out['h2o'][:, 1]))
+
+        # the batches in worker processes
+        _, pool = sweep.run_sweep(self.force, self.init, helpers.MH,
+                                  helpers.PARAMS, helpers.TSTEP_INFO,
+                                  self.sets, fields, batch_size=2, nprocs=2)
+        for key in fields:
+            np.testing.assert_array_equal(pool[key], out[key], err_msg=key)
+
+    def test_metrics(self):
+        """ The peak, melt out and RMSE against a reference output """
+
+        sets, out = sweep.run_sweep(self.force, self.init, helpers.MH,
+                                    helpers.PARAMS, helpers.TSTEP_INFO,
+                                    self.sets, output_frequency=2)
+        steps = snobal.output_steps(self.nsteps, 2) + 1
+
+        # the reference is the output of the first set
+        path = os.path.join(self.tmp, 'snobal.original')
+        with open(path, 'w') as f:
+            pysnobal.output_point(self.run_point(sets.iloc[0]), f)
+        reference = sweep.read_reference(path)
+        self.assertEqual(list(reference.index), list(range(1, 401)))
+
+        metrics = sweep.sweep_metrics(sets, out, steps, reference)
+        self.assertEqual(list(metrics.columns),
+                         sweep.SWEEP_FIELDS + sweep.METRICS)
+
+        swe = out['m_s']
+        np.testing.assert_array_equal(metrics['peak_swe'], swe.max(axis=0))
+        for k, row in metrics.iterrows():
+            peak = list(steps).index(row['peak_step'])
+            self.assertEqual(swe[peak, k], row['peak_swe'])
+            if row['melt_out'] == -1:
+                self.assertTrue(np.all(swe[peak:, k] > 0))
+            else:
+                melt = list(steps).index(row['melt_out'])
+                self.assertEqual(swe[melt, k], 0)
+                self.assertTrue(np.all(swe[peak:melt, k] > 0))
+
+        # the reference is rounded to 3 decimals
+        self.assertLess(metrics['rmse'][0], 1e-3)
+        self.assertGreater(metrics['rmse'][3], metrics['rmse'][0])
+
+        metrics = sweep.sweep_metrics(sets, out, steps)
+        self.assertTrue(metrics['rmse'].isnull().all())
+
+    def test_unknown_parameter(self):
+        """ A parameter that isn't swept is an error """
+
+        with self.assertRaises(ValueError):
+            sweep.parameter_sets({'max_h2o': [0.01]}, helpers.PARAMS,
+                                 helpers.TSTEP_INFO)
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(unittest.main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_tiled
+----------------------------------
+
+Tests for `pysnobal.tiled.TiledSnobal`.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from pysnobal.c_snobal import snobal
+from pysnobal.forcing import ForcingReader
+from pysnobal.tiled import TiledSnobal, tile_rows
+
+from tests import helpers
+from tests.test_checkpoint import FILES
+from tests.test_forcing import write_forcing
+
+
+class TestTiledSnobal(unittest.TestCase):
+
+    nsteps = 40
+    shape = (5, 4)
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        start = datetime(2017, 1, 1)
+        self.date_time = [start + timedelta(hours=i)
+                          for i in range(self.nsteps + 1)]
+
+        # the forcing varies by row so that the tiles differ
+        force = helpers.point_forcing(self.nsteps)
+        for key in ['T_a', 'T_pp']:
+            force[key] -= helpers.FREEZE
+        rows = np.arange(self.shape[0])[:, None] * np.ones(self.shape)
+        self.force = {'soil_temp': -2.5 * np.ones(self.shape)}
+        for key, f in FILES.items():
+            values = force[key][:, None, None] * (1 + 0.05 * rows)
+            self.force[f] = os.path.join(self.tmp, f + '.nc')
+            write_forcing(self.force[f], f, values, start)
+
+        self.init = helpers.init_state(self.shape)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_tile_rows(self):
+        """ The tiles cover the rows """
+
+        self.assertEqual(tile_rows(5, 2), [slice(0, 2), slice(2, 5)])
+        self.assertEqual(tile_rows(2, 4), [slice(0, 1), slice(1, 2)])
+        self.assertEqual(tile_rows(7, 1), [slice(0, 7)])
+
+    def test_matches_grid(self):
+        """ The tiles give the output and state of a single grid """
+
+        import netCDF4 as nc
+
+        fields = ['z_s', 'm_s', 'T_s_0', 'H_bar', 'layer_count']
+        grid = snobal.SnobalGrid(self.init, helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS)
+        force = {f: nc.Dataset(v) if isinstance(v, str) else v
+                 for f, v in self.force.items()}
+        expected = []
+        with ForcingReader(force, self.date_time, block_size=12) as reader:
+            for j, block in reader:
+                nsteps = len(block['S_n']) - 1
+                steps = snobal.output_steps(nsteps, 5, j)
+                out = {key: np.zeros((len(steps),) + self.shape,
+                                     dtype=snobal.state_dtype(key))
+                       for key in fields}
+                self.assertEqual(grid.run_block(block, out, 5, int(j == 0),
+                                                j), -1)
+                expected.append(out)
+        for ds in force.values():
+            if hasattr(ds, 'close'):
+                ds.close()
+
+        with TiledSnobal(self.init, helpers.TSTEP_INFO, helpers.MH,
+                         helpers.PARAMS, self.force, self.date_time,
+                         ntiles=3, block_size=12, frequency=5,
+                         out_fields=fields) as model:
+            n = 0
+            for j, nsteps, steps, outputs, rt in model.blocks():
+                self.assertEqual(rt, -1)
+                for key in fields:
+                    np.testing.assert_array_equal(outputs[key],
+                                                  expected[n][key],
+                                                  err_msg=key)
+                n += 1
+            self.assertEqual(n, len(expected))
+
+        for key in snobal.STATE_FIELDS:
+            np.testing.assert_array_equal(model.output_rec[key], grid[key],
+                                          err_msg=key)
+        self.assertTrue(np.any(grid['m_s'] > 0))
+
+    def test_buffers(self):
+        """ The grid runs in place on the buffers it's given """
+
+        buffers = {key: np.zeros(self.shape, dtype=snobal.state_dtype(key))
+                   for key in snobal.STATE_FIELDS}
+        grid = snobal.SnobalGrid(self.init, helpers.TSTEP_INFO, helpers.MH,
+                                 helpers.PARAMS, buffers=buffers)
+        for key in snobal.STATE_FIELDS:
+            self.assertIs(grid[key], buffers[key])
+        np.testing.assert_array_equal(buffers['z_s'], self.init['z_s'])
+        np.testing.assert_array_equal(buffers['mask'], self.init['mask'])
+
+        buffers['rho'] = np.zeros(self.shape, dtype=np.float32)
+        with self.assertRaises(ValueError):
+            snobal.SnobalGrid(self.init, helpers.TSTEP_INFO, helpers.MH,
+                              helpers.PARAMS, buffers=buffers)
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(unittest.main())
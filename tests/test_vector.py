@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_vector
+----------------------------------
+
+Tests for the NumPy energy balance in `pysnobal.vector` against the C core.
+"""
+
+import unittest
+
+import numpy as np
+
+from pysnobal import vector
+from pysnobal.c_snobal import snobal
+from tests import helpers
+
+
+def random_state(n, seed=0):
+    """
+    n pixels with a range of snowcovers and forcing
+    """
+
+    rng = np.random.RandomState(seed)
+    z_s = rng.uniform(0.05, 2.0, n)
+    z_s_0 = np.minimum(z_s, 0.25)
+    T_a = rng.uniform(250.0, 285.0, n)
+    T_s_0 = np.minimum(rng.uniform(250.0, 275.0, n), helpers.FREEZE)
+    T_s_l = np.where(rng.rand(n) < 0.1, T_s_0, rng.uniform(250.0, 273.0, n))
+
+    s = {
+        'snowcover': (rng.rand(n) < 0.9).astype(int),
+        'layer_count': np.where(z_s > z_s_0, 2, 1),
+        'S_n': rng.uniform(0.0, 600.0, n),
+        'I_lw': rng.uniform(150.0, 350.0, n),
+        'T_a': T_a,
+        'e_a': rng.uniform(0.3, 1.0, n) * vector.satw(T_a),
+        'u': rng.uniform(0.5, 10.0, n),
+        'T_g': rng.uniform(272.0, 276.0, n),
+        'P_a': rng.uniform(70000.0, 90000.0, n),
+        'T_s_0': T_s_0,
+        'T_s_l': T_s_l,
+        'rho': rng.uniform(100.0, 500.0, n),
+        'z_s': z_s,
+        'z_s_0': z_s_0,
+        'z_s_l': z_s - z_s_0,
+        'z_0': 0.005,
+        'z_u': 5.0,
+        'z_T': 5.0,
+        'z_g': 0.5,
+        'relative_hts': 0,
+        'precip_now': (rng.rand(n) < 0.3).astype(int),
+        'm_rain': rng.uniform(0.0, 2.0, n),
+        'm_snow': rng.uniform(0.0, 5.0, n),
+        'T_rain': rng.uniform(273.16, 276.0, n),
+        'T_snow': rng.uniform(260.0, 273.16, n),
+        'time_step': 3600.0,
+    }
+
+    # neutral stability for a few pixels
+    s['T_a'][:5] = s['T_s_0'][:5] - vector.DALR * s['z_T']
+    return s
+
+
+class TestVector(unittest.TestCase):
+
+    def test_e_bal(self):
+        """ The vectorized energy balance matches the C core """
+
+        s = random_state(2000)
+        expected = snobal.e_bal(s)
+        result = vector.e_bal(s)
+
+        np.testing.assert_array_equal(result['status'], expected['status'])
+        for key in vector.E_BAL_OUTPUTS:
+            np.testing.assert_allclose(result[key], expected[key],
+                                       rtol=1e-9, atol=1e-9, err_msg=key)
+
+        self.assertTrue(np.all(result['R_n'][s['snowcover'] == 0] == 0))
+
+    def test_relative_heights(self):
+        """ Heights relative to the snow surface """
+
+        s = random_state(200, seed=1)
+        s['relative_hts'] = 1
+        expected = snobal.e_bal(s)
+        result = vector.e_bal(s)
+        for key in ['H', 'L_v_E', 'E']:
+            np.testing.assert_allclose(result[key], expected[key],
+                                       rtol=1e-9, atol=1e-9, err_msg=key)
+
+    def test_hle1_warm_start(self):
+        """ A warm started hle1 stays within THRESH of the neutral start """
+
+        s = random_state(2000, seed=2)
+        prev = dict(s, T_a=s['T_a'] - 0.3, T_s_0=s['T_s_0'] - 0.2)
+        lo = vector.e_bal(prev, diagnostics=True)['lo']
+
+        cold = vector.e_bal(s, diagnostics=True)
+        warm = vector.e_bal(dict(s, lo=lo), diagnostics=True)
+
+        np.testing.assert_array_equal(warm['status'], cold['status'])
+        finite = np.isfinite(cold['lo'])
+        np.testing.assert_allclose(warm['lo'][finite], cold['lo'][finite],
+                                   rtol=vector.THRESH)
+        for key in ['H', 'L_v_E', 'E']:
+            np.testing.assert_allclose(warm[key], cold[key],
+                                       rtol=vector.THRESH, err_msg=key)
+
+        # the diagnostics count the iterations of each pixel
+        snow = s['snowcover'] == 1
+        self.assertTrue(np.all(cold['iterations'][snow] > 0))
+        self.assertTrue(np.all(cold['iterations'][~snow] == 0))
+        self.assertLess(warm['iterations'].sum(), cold['iterations'].sum())
+
+    def test_hle1_bad_input(self):
+        """ Bad input gives a status of -2 for that pixel only """
+
+        h, le, e, status = vector.hle1(
+            80000.0, [270.0, 270.0, 270.0], [265.0, -1.0, 265.0], 5.0,
+            [300.0, 300.0, 5000.0], 250.0, 5.0, 3.0, 5.0, 0.005)
+        np.testing.assert_array_equal(status, [0, -2, -2])
+        self.assertTrue(h[0] != 0)
+        self.assertTrue(np.all(h[1:] == 0))
+
+    def test_cold_content(self):
+        """ The cold content matches the state from the C core """
+
+        grid = snobal.SnobalGrid(helpers.init_state(), helpers.TSTEP_INFO,
+                                 helpers.MH, helpers.PARAMS)
+        force = helpers.point_forcing(100)
+        for i in range(100):
+            grid.step(helpers.grid_record(force, i, grid.shape),
+                      helpers.grid_record(force, i + 1, grid.shape),
+                      first_step=int(i == 0))
+
+        for layer in ['_0', '_l']:
+            np.testing.assert_allclose(
+                vector.cold_content(grid['T_s' + layer], grid['m_s' + layer]),
+                grid['cc_s' + layer], rtol=1e-12, err_msg=layer)
+
+    def test_sati(self):
+        """ sati is satw above freezing """
+
+        tk = np.array([250.0, vector.FREEZE, 280.0])
+        np.testing.assert_array_equal(vector.sati(tk)[2:],
+                                      vector.satw(tk)[2:])
+        self.assertLess(vector.sati(tk)[0], vector.satw(tk)[0])
+        with self.assertRaises(ValueError):
+            vector.sati(np.array([0.0]))
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(unittest.main())